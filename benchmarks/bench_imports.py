@@ -0,0 +1,126 @@
+"""Per-module import cost of lume-ace3p's entry points.
+
+Runs each statement in a fresh interpreter under ``python -X importtime`` and
+lists the modules it loaded, by cumulative import time (the module plus
+everything it pulled in first):
+
+    python benchmarks/bench_imports.py
+    python benchmarks/bench_imports.py "import lume_ace3p.modes" --top 40
+    python benchmarks/bench_imports.py --check
+
+The default statements are :data:`ENTRY_POINTS`. Those are what
+``run-lume-ace3p --version``, a store-consuming mode (``train_surrogate``,
+``invert_*``) and a workflow-driving mode import before doing any work.
+``tests/test_import_time.py`` holds the first three to a list of packages they
+must not load; ``--check`` holds them to the time budgets in :data:`BUDGETS`,
+which are kept out of the test suite because wall-clock figures vary with the
+machine and its load. Tool wrappers subclass
+``lume.base.CommandWrapper``, and that import alone loads matplotlib and
+scipy. It should therefore only show up under ``lume_ace3p.workflow_graph``.
+
+A module already imported by an earlier line of the same statement costs
+nothing the second time and is listed once. The figures include interpreter
+noise of a few milliseconds, so compare them across runs on one machine only.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ENTRY_POINTS = (
+    'import lume_ace3p',
+    'import lume_ace3p.run_lume_ace3p',
+    'import lume_ace3p.modes; from lume_ace3p.inputs import load_yaml',
+    'import lume_ace3p.workflow_graph',
+)
+
+# Entry point -> import-time budget in seconds, for --check. The budgets leave
+# several-fold headroom over a warm local run (about 0.1 s, 0.1 s and 0.7 s)
+# for a shared filesystem, and stay below the ~2.5 s ``lume.base`` costs.
+BUDGETS = {
+    ENTRY_POINTS[0]: 0.75,
+    ENTRY_POINTS[1]: 0.75,
+    ENTRY_POINTS[2]: 2.0,
+}
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def profile(statement, python=sys.executable):
+    """Import cost of running ``statement`` in a fresh interpreter:
+    ``{module: (self_s, cumulative_s)}`` in import-completion order."""
+    result = subprocess.run([python, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONWARNINGS='ignore'))
+    if result.returncode:
+        raise RuntimeError(f'{statement!r} failed:\n{result.stderr}')
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            own, cumulative, _, name = match.groups()
+            modules[name] = (int(own) / 1e6, int(cumulative) / 1e6)
+    return modules
+
+
+def loaded(modules, package):
+    """True when ``package`` or any submodule of it is in ``modules``."""
+    return any(name == package or name.startswith(package + '.')
+               for name in modules)
+
+
+def report(statement, modules, top=15):
+    """The text ``main`` prints for one statement."""
+    lines = [f'{statement}: {total(modules):.3f} s, {len(modules)} modules']
+    ranked = sorted(modules.items(), key=lambda item: -item[1][1])
+    for name, (own, cumulative) in ranked[:top]:
+        lines.append(f'  {cumulative:8.3f} s cumulative {own:8.3f} s self  '
+                     f'{name}')
+    return '\n'.join(lines)
+
+
+def total(modules):
+    """Total import time of a :func:`profile` (the sum of self times)."""
+    return sum(own for own, _ in modules.values())
+
+
+def over_budget(statement, modules, budgets=BUDGETS):
+    """The budget :func:`profile` ``modules`` of ``statement`` exceeds, or
+    ``None`` when it is within it or has none."""
+    budget = budgets.get(statement)
+    if budget is not None and total(modules) >= budget:
+        return budget
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python benchmarks/bench_imports.py',
+        description='Per-module cumulative import cost of lume-ace3p entry '
+                    'points.')
+    parser.add_argument('statements', nargs='*',
+                        help='statements to profile (default: the entry '
+                             'points)')
+    parser.add_argument('--top', type=int, default=15,
+                        help='modules listed per statement')
+    parser.add_argument('--check', action='store_true',
+                        help='exit 1 if a statement exceeds its budget '
+                             '(default statements: those with one)')
+    args = parser.parse_args(argv)
+
+    failed = False
+    default = list(BUDGETS) if args.check else ENTRY_POINTS
+    for statement in args.statements or default:
+        modules = profile(statement)
+        print(report(statement, modules, top=args.top))
+        budget = over_budget(statement, modules)
+        if args.check and budget is not None:
+            print(f'  over its {budget:g} s budget')
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
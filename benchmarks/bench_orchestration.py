@@ -0,0 +1,284 @@
+"""Per-point orchestration overhead of the workflow modes, measured against
+the stand-in executables of :mod:`fake_tools`.
+
+What lume-ace3p adds to an evaluation happens around the tools: it rewrites
+inputs, stages files into workdirs, parses outputs, writes the table, and
+for a parallel sweep ships the rows between processes. On a cluster the
+solvers hide all of that. Here every tool is a stand-in that sleeps for
+``--delay`` seconds and copies a real output into place, so the rest is
+visible:
+
+    python benchmarks/bench_orchestration.py --points 64
+    python benchmarks/bench_orchestration.py parameter_sweep --points 256 \\
+        --delay 0.5 --workers 8
+
+Each scenario runs a shipped example's chain through the stand-ins, with
+``trace:`` set (:mod:`lume_ace3p.trace`), and reads the overhead from the
+trace:
+
+``single``
+    ``examples/omega3p_sweep``'s cubit → omega3p → acdtool chain, run
+    ``--points`` times as separate ``single`` modes, extracting ``R/Q`` and
+    ``Mode_freq``;
+``parameter_sweep``
+    ``examples/s3p_sweep``'s cubit → s3p chain over ``--points`` values of
+    ``cornercut``, extracting ``S(0,0)``;
+``collect_training_data``
+    ``examples/geant4_beta_surrogate``'s track3p_source → particles → geant4
+    chain over a ``--points``-sample design, on
+    ``examples/assets/test_particles.txt``.
+
+Reported per scenario:
+
+``overhead_ms``
+    mean over points of the point's span minus the subprocess spans inside it
+    — everything lume-ace3p did for that point while no tool was running;
+    ``overhead_max_ms`` is the worst point;
+``parse_ms``
+    the part of that spent in solver output parsers, per point;
+``outside_ms``
+    mode wall time covered by no point span (setup, table rewrites, result
+    collection), per point;
+``tool_s`` / ``wall_s``
+    summed tool time and mode wall time.
+
+``--workers`` runs the sweep on a ``parallel: {workers: N}`` pool and the
+collection with ``max_concurrent: N``; ``--backend async`` switches both to
+the event-loop driver. With ``--delay`` set that makes a realistic local test
+bed for those drivers, without a cluster. Everything is written under
+``--run-dir`` (a fresh temporary directory by default).
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_tools  # noqa: E402
+from lume_ace3p import trace  # noqa: E402
+from lume_ace3p.inputs import load_yaml  # noqa: E402
+from lume_ace3p.modes import run_mode  # noqa: E402
+from lume_ace3p.workflow_graph import Workflow  # noqa: E402
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))), 'examples')
+
+
+@contextlib.contextmanager
+def _cwd(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _example(name, run_dir):
+    """Copy example ``name`` into ``run_dir`` (its inputs are relative paths)
+    and return ``(yaml_data, copy)``."""
+    copy = os.path.join(run_dir, name)
+    shutil.copytree(os.path.join(EXAMPLES, name), copy)
+    data = load_yaml(os.path.join(copy, name + '.yaml'))
+    return data, copy
+
+
+def _run(data, directory):
+    with _cwd(directory):
+        workflow = Workflow.from_config(data)
+        run_mode(data['mode'], workflow,
+                 output_spec=data.get('output_parameters'))
+
+
+def single(run_dir, points, paths, workers=1, backend='process'):
+    """``points`` single-mode runs of the omega3p → acdtool chain; returns
+    the trace files written."""
+    traces = []
+    for index in range(points):
+        data, directory = _example('omega3p_sweep',
+                                   os.path.join(run_dir, f'single_{index:04d}'))
+        traces.append(os.path.join(directory, 'trace.jsonl'))
+        data['workflow_parameters'] = {'workdir': 'workdir', 'paths': paths,
+                                       'trace': traces[-1]}
+        data['input_parameters'] = {'cubit': {
+            'cav_radius': 90.0 + 30.0 * index / max(points - 1, 1),
+            'ellipticity': 1.0}}
+        data['mode'] = {'type': 'single', 'output_file': 'single_output.txt'}
+        # No frozen rfpost.out has a maxFieldsOnSurface block to copy.
+        data['output_parameters'] = {
+            name: spec for name, spec in data['output_parameters'].items()
+            if spec.get('section') != 'maxFieldsOnSurface'}
+        _run(data, directory)
+    return traces
+
+
+def parameter_sweep(run_dir, points, paths, workers=1, backend='process'):
+    """A ``points``-value sweep of the cubit → s3p chain."""
+    data, directory = _example('s3p_sweep', run_dir)
+    path = os.path.join(directory, 'trace.jsonl')
+    data['workflow_parameters'] = {'workdir': 'workdir', 'workdir_mode': 'auto',
+                                   'paths': paths, 'trace': path}
+    data['input_parameters'] = {'cubit': {
+        'cornercut': {'min': 12.0, 'max': 16.0, 'num': points},
+        'rcorner2': 10.0}}
+    data['mode'] = {'type': 'parameter_sweep',
+                    'output_file': 's3p_sweep_output.txt'}
+    data['output_parameters'] = {'S11': {'module': 's3p',
+                                         'quantity': 'S(0,0)'}}
+    if workers > 1 or backend != 'process':
+        data['mode']['parallel'] = {'workers': workers, 'backend': backend}
+    _run(data, directory)
+    return [path]
+
+
+def collect_training_data(run_dir, points, paths, workers=1,
+                          backend='process'):
+    """A ``points``-sample training collection through the stand-in Geant4."""
+    data, directory = _example('geant4_beta_surrogate', run_dir)
+    path = os.path.join(directory, 'trace.jsonl')
+    data['workflow_parameters'] = {'workdir': 'store', 'stage_mode': 'symlink',
+                                   'paths': paths, 'trace': path}
+    for entry in data['workflow']:
+        if entry['module'] == 'track3p_source':
+            entry['file'] = os.path.join(EXAMPLES, 'assets',
+                                         'test_particles.txt')
+        elif entry['module'] == 'geant4':
+            entry['geant4_threads'] = 1
+            entry.pop('geant4_geometry_files', None)
+    data['mode'].update(store='store', num_samples=points,
+                        max_concurrent=workers, backend=backend)
+    _run(data, directory)
+    return [path]
+
+
+SCENARIOS = {'single': single, 'parameter_sweep': parameter_sweep,
+             'collect_training_data': collect_training_data}
+
+
+def _spans(path):
+    """``[(begin_event, duration_us)]`` for every finished span."""
+    events = trace.read_events(path)
+    ends = {e['id']: e['ts'] for e in events if e['ph'] == 'E'}
+    return [(e, ends[e['id']] - e['ts']) for e in events
+            if e['ph'] == 'B' and e['id'] in ends]
+
+
+def _covered(intervals):
+    """Total length of the union of ``[(start, end)]``."""
+    total, reach = 0, None
+    for start, end in sorted(intervals):
+        if reach is None or start > reach:
+            total += end - start
+            reach = end
+        elif end > reach:
+            total += end - reach
+            reach = end
+    return total
+
+
+def analyze(paths):
+    """Fold the traces of one scenario into its overhead figures (see the
+    module docstring)."""
+    overheads, parse, tool, wall, outside = [], 0, 0, 0, 0
+    for path in paths:
+        spans = _spans(path)
+        points = {}
+        for begin, duration in spans:
+            if begin['name'] == 'point':
+                points[begin['args']['point']] = [duration, 0, 0]
+        for begin, duration in spans:
+            point = points.get(begin['args'].get('point'))
+            if point is None:
+                continue
+            if begin['cat'] == 'subprocess':
+                point[1] += duration
+            elif begin['cat'] == 'parse':
+                point[2] += duration
+        for duration, in_tools, in_parse in points.values():
+            overheads.append(duration - in_tools)
+            tool += in_tools
+            parse += in_parse
+        for begin, duration in spans:
+            if begin['cat'] == 'mode':
+                wall += duration
+                outside += duration - _covered(
+                    (b['ts'], b['ts'] + d) for b, d in spans
+                    if b['name'] == 'point')
+    count = max(len(overheads), 1)
+    return {'points': len(overheads),
+            'overhead_ms': sum(overheads) / count / 1e3,
+            'overhead_max_ms': max(overheads, default=0) / 1e3,
+            'parse_ms': parse / count / 1e3,
+            'outside_ms': outside / count / 1e3,
+            'tool_s': tool / 1e6, 'wall_s': wall / 1e6}
+
+
+def run(scenarios=None, points=16, delay=0.0, workers=1, backend='process',
+        run_dir=None):
+    """Run ``scenarios`` (default all of :data:`SCENARIOS`) against freshly
+    installed stand-ins and return ``{'meta': {...}, 'results': {scenario:
+    figures}}``."""
+    run_dir = run_dir or tempfile.mkdtemp(prefix='lume_ace3p_orchestration_')
+    paths = fake_tools.install(run_dir, delay=delay)
+    results = {}
+    for name in scenarios or SCENARIOS:
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}'; expected one of "
+                             f"{', '.join(SCENARIOS)}.")
+        directory = os.path.join(run_dir, name)
+        os.makedirs(directory)
+        traces = SCENARIOS[name](directory, points, paths, workers=workers,
+                                 backend=backend)
+        results[name] = analyze(traces)
+    meta = {'points': points, 'delay': delay, 'workers': workers,
+            'backend': backend, 'run_dir': run_dir,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    return {'meta': meta, 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python benchmarks/bench_orchestration.py',
+        description='Measure lume-ace3p per-point orchestration overhead '
+                    'against stand-in solver executables.')
+    parser.add_argument('scenarios', nargs='*',
+                        help=f"scenarios to run (default all: "
+                             f"{', '.join(SCENARIOS)})")
+    parser.add_argument('--points', type=int, default=16,
+                        help='points / runs / samples per scenario')
+    parser.add_argument('--delay', type=float, default=0.0,
+                        help='simulated run time of every tool, in seconds')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='sweep pool size / samples in flight')
+    parser.add_argument('--backend', default='process',
+                        choices=('process', 'async'))
+    parser.add_argument('--run-dir', help='where to run (default: a new '
+                                          'temporary directory)')
+    parser.add_argument('--output', help='write the report here as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.scenarios, points=args.points, delay=args.delay,
+                 workers=args.workers, backend=args.backend,
+                 run_dir=args.run_dir)
+    print(f"Orchestration overhead ({args.points} point(s), "
+          f"{args.delay} s per tool, run in {report['meta']['run_dir']}):")
+    for name, figures in report['results'].items():
+        print(f"  {name:<22} {figures['overhead_ms']:8.1f} ms/point "
+              f"(max {figures['overhead_max_ms']:.1f}, parse "
+              f"{figures['parse_ms']:.1f}), {figures['outside_ms']:7.1f} ms/point "
+              f"outside points, {figures['wall_s']:.1f} s wall")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Wrote {args.output}.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
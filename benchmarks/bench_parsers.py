@@ -0,0 +1,207 @@
+"""Throughput and peak-memory benchmark for the solver-output parsers.
+
+Times each parser on a production-scale synthetic file from
+:mod:`synthetic` and records MB/s, rows/s and peak memory per case:
+
+    python benchmarks/bench_parsers.py run --output parsers.json
+    python benchmarks/bench_parsers.py compare baseline.json parsers.json
+
+``run`` generates the files on first use under ``--data-dir`` (default
+``benchmarks/data/``, which is not committed; a file is regenerated only when
+``--scale`` or ``--seed`` changes), parses each one ``--repeat`` times and keeps
+the fastest — the least disturbed by the rest of the machine. It then parses
+once more under :mod:`tracemalloc` for the peak, which covers the Python
+objects and numpy buffers a parser allocates. That pass runs separately
+because tracing slows allocation-heavy code several-fold.
+
+``compare`` flags any case whose MB/s fell, or whose peak memory grew, by more
+than ``--tolerance`` (default 0.2) against the stored baseline, and exits 1 when
+one did. A baseline is just an earlier ``run`` output. Record it on the machine
+that will run the comparison, because the figures are not portable between
+hosts.
+
+Cases (parser in brackets):
+
+=================  ===========================================================
+``s3p_sparameter``  20k-frequency ``SParameter.out`` [``parse_sparameters``]
+``s3p_reflection``  20k-frequency ``Reflection.out`` [``parse_sparameters``]
+``t3p_point``       1e6-row Point monitor [``parse_column_file``]
+``t3p_wakefield``   1e6-row wakefield [``parse_wakefield``]
+``t3p_echo``        multi-MB ``t3p.out`` echo [``parse_ace3p`` + monitors]
+``rfpost_modes``    1e5-mode ``rfpost.out`` [``split_output_sections`` +
+                    ``read_mode_table``]
+``dose``            1e6-voxel dose file [``read_dose_file``]
+=================  ===========================================================
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic  # noqa: E402
+from lume_ace3p.acdtool import read_mode_table, split_output_sections  # noqa: E402
+from lume_ace3p.ace3p import (POINT_COLUMNS, parse_ace3p,  # noqa: E402
+                              parse_column_file, parse_sparameters,
+                              parse_wakefield, tree_monitors)
+from lume_ace3p.surrogate_data import read_dose_file  # noqa: E402
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'data')
+
+
+def _t3p_echo(path):
+    # What T3P.echoed_monitors does with its t3p.out.
+    with open(path) as file:
+        return tree_monitors(parse_ace3p(file.read()).find('Input'))
+
+
+def _rfpost_modes(path):
+    # What Acdtool._read_rfpost does, for the one section this file enables.
+    with open(path) as file:
+        sections = split_output_sections(file.readlines())
+    return read_mode_table(sections['RoverQ'], 'RoverQ')
+
+
+CASES = {
+    's3p_sparameter': parse_sparameters,
+    's3p_reflection': parse_sparameters,
+    't3p_point': lambda path: parse_column_file(path, columns=POINT_COLUMNS),
+    't3p_wakefield': parse_wakefield,
+    't3p_echo': _t3p_echo,
+    'rfpost_modes': _rfpost_modes,
+    # Without the sidecar, or every repeat after the first would time np.load.
+    'dose': lambda path: read_dose_file(path, cache=False),
+}
+
+
+def measure(parser, path, rows, repeat=3):
+    """Time ``parser(path)`` (fastest of ``repeat``) and its peak traced
+    memory; return the per-case record ``run`` writes."""
+    size = os.path.getsize(path)
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        parser(path)
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        parser(path)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    seconds = min(times)
+    return {'bytes': size, 'rows': rows, 'seconds': seconds,
+            'mb_per_s': size / 2 ** 20 / seconds, 'rows_per_s': rows / seconds,
+            'peak_mib': peak / 2 ** 20}
+
+
+def run(cases=None, data_dir=DEFAULT_DATA_DIR, scale=1.0, seed=0, repeat=3):
+    """Benchmark ``cases`` (default: all of :data:`CASES`) and return the
+    report ``{'meta': {...}, 'results': {case: record}}``."""
+    results = {}
+    for name in cases or CASES:
+        if name not in CASES:
+            raise ValueError(f"Unknown benchmark case '{name}'; expected one "
+                             f"of {', '.join(CASES)}.")
+        path, rows = synthetic.generate(name, os.path.join(data_dir, name),
+                                        scale=scale, seed=seed)
+        results[name] = measure(CASES[name], path, rows, repeat=repeat)
+        record = results[name]
+        print(f"  {name:<15} {record['mb_per_s']:9.2f} MB/s "
+              f"{record['rows_per_s']:12.0f} rows/s "
+              f"{record['peak_mib']:9.1f} MiB peak")
+    meta = {'scale': scale, 'seed': seed, 'repeat': repeat,
+            'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'node': platform.node(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    return {'meta': meta, 'results': results}
+
+
+def compare(baseline, current, tolerance=0.2):
+    """Regressions of ``current`` against ``baseline`` (two ``run``
+    reports): ``[(case, message)]``, empty when there are none. A case counts
+    as regressed when its MB/s is below ``(1 - tolerance)`` of the baseline's,
+    or its peak memory above ``(1 + tolerance)`` of it."""
+    regressions = []
+    if baseline['meta'].get('scale') != current['meta'].get('scale'):
+        print(f"Warning: baseline scale {baseline['meta'].get('scale')} "
+              f"differs from current scale {current['meta'].get('scale')}; "
+              f"throughput is comparable, peak memory is not.")
+    for name, now in current['results'].items():
+        then = baseline['results'].get(name)
+        if then is None:
+            print(f'  {name:<15} (no baseline)')
+            continue
+        speed = now['mb_per_s'] / then['mb_per_s']
+        memory = now['peak_mib'] / then['peak_mib'] if then['peak_mib'] else 1.0
+        print(f'  {name:<15} {speed:6.2f}x throughput {memory:6.2f}x peak memory')
+        if speed < 1 - tolerance:
+            regressions.append((name, f"throughput {now['mb_per_s']:.2f} MB/s "
+                                      f"vs {then['mb_per_s']:.2f} MB/s"))
+        if memory > 1 + tolerance:
+            regressions.append((name, f"peak memory {now['peak_mib']:.1f} MiB "
+                                      f"vs {then['peak_mib']:.1f} MiB"))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python benchmarks/bench_parsers.py',
+        description='Benchmark the lume-ace3p output parsers on '
+                    'production-scale synthetic files.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='time the parsers')
+    run_parser.add_argument('cases', nargs='*',
+                            help=f"cases to run (default all: {', '.join(CASES)})")
+    run_parser.add_argument('--output', help='write the report here as JSON')
+    run_parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR,
+                            help='where the synthetic files are generated')
+    run_parser.add_argument('--scale', type=float, default=1.0,
+                            help='row-count multiplier (1.0 = production size)')
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--repeat', type=int, default=3,
+                            help='timed parses per case; the fastest is kept')
+
+    compare_parser = commands.add_parser(
+        'compare', help='flag regressions against a stored baseline')
+    compare_parser.add_argument('baseline', help='baseline report (JSON)')
+    compare_parser.add_argument('current', help='report to check (JSON)')
+    compare_parser.add_argument('--tolerance', type=float, default=0.2,
+                                help='allowed fractional slowdown / growth')
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        report = run(args.cases, data_dir=args.data_dir, scale=args.scale,
+                     seed=args.seed, repeat=args.repeat)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f'Wrote {args.output}.')
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, tolerance=args.tolerance)
+    for name, message in regressions:
+        print(f'REGRESSION {name}: {message}')
+    if not regressions:
+        print('No regressions.')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
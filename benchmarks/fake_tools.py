@@ -0,0 +1,254 @@
+"""Stand-in Cubit, ACE3P and Geant4 executables for local end-to-end runs.
+
+The real binaries dominate every timing taken on a cluster, so nothing there
+says what lume-ace3p itself costs per evaluation. These stand-ins take the same
+command lines the wrappers build, sleep for a configurable time, and write the
+files the real tool would, copied from the real outputs frozen under
+``tests/fixtures/acdtool/`` (see its ``SOURCES.md``):
+
+``cubit``
+    writes the file the journal's ``export ... "<name>"`` line names;
+``acdtool``
+    ``meshconvert`` writes the ``.ncdf`` beside the mesh, ``postprocess rf``
+    writes ``rfpost.out`` (the fixture named after the ``.rfpost`` input when
+    there is one), ``postprocess coaxsignal`` and the wake commands write
+    under ``<jobname>/OUTPUT/``; every other command writes nothing;
+``omega3p`` / ``s3p``
+    ``omega3p.out`` / ``Reflection.out``, ``SParameter.out`` and a
+    ``PortRef`` profile under the results directory, resolved as the wrapper
+    resolves it (second argument, then a ``JobName`` leaf, then the default);
+``t3p``
+    one file per ``Monitor`` block in the input under ``<job>/OUTPUT/``, by
+    ``Type``, plus ``Bunch0.out`` and a ``t3p.out`` that echoes the input;
+``geant4``
+    the input's ``output_dose`` / ``output_edep`` grids over its
+    ``mesh_nx × mesh_ny × mesh_nz`` scoring mesh. Every primary in its
+    ``particles`` file scores a fixed, mesh-seeded fraction of its weight (the
+    ``n_electrons`` column) in each voxel, and ``entry`` counts the weighted
+    primaries, so ``total(val^2)`` and ``entry`` are consistent and the grids
+    of runs over disjoint parts of a source sum to the grid of the whole;
+``mpirun``
+    a shell script that drops the rank / core / binding options and runs the
+    rest, so the ``mpi`` path the wrappers prefix works without MPI.
+
+:func:`install` writes a shell shim per tool into ``<directory>/bin`` and
+returns the ``paths`` mapping to give ``workflow_parameters``, the same
+overrides :func:`lume_ace3p.paths.resolve_paths` takes from a YAML. The stand-ins
+import neither numpy nor lume_ace3p, so their own start-up stays well under the
+smallest delay worth simulating.
+"""
+
+import hashlib
+import os
+import random
+import re
+import shlex
+import shutil
+import sys
+import time
+
+TOOLS = ('cubit', 'acdtool', 'omega3p', 's3p', 't3p', 'geant4')
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))), 'tests', 'fixtures', 'acdtool')
+
+# Drops '-n N', '-c N' and any other option before the command, as srun would
+# consume them.
+_MPIRUN = """\
+#!/bin/sh
+while [ $# -gt 0 ]; do
+    case "$1" in
+        -n|-c|-N) shift 2 ;;
+        -*) shift ;;
+        *) break ;;
+    esac
+done
+exec "$@"
+"""
+
+# Template per T3P Monitor Type, relative to t3p_outputs/.
+_T3P_MONITORS = {'WakeField': 'cavity-half.wakefield.out',
+                 'Point': 'BPM.point.out',
+                 'Power': 'BPM.port.out',
+                 'ModeVoltage': 'BPM.modecoeff.out',
+                 'SurfacePowerLoss': 'SIBC.wallossPower.out'}
+
+
+def install(directory, delay=0.0, delays=None, templates=FIXTURES):
+    """Write the stand-ins into ``<directory>/bin`` and return the ``paths``
+    overrides that select them.
+
+    ``delay`` is each tool's simulated run time in seconds; ``delays`` maps a
+    tool name to its own. ``templates`` is a directory laid out like
+    ``tests/fixtures/acdtool/``, to run against larger outputs than the
+    fixtures (e.g. ones written by :mod:`synthetic`)."""
+    delays = dict(delays or {})
+    unknown = set(delays) - set(TOOLS)
+    if unknown:
+        raise ValueError(f"Unknown stand-in tool(s) {sorted(unknown)}; "
+                         f"expected some of {', '.join(TOOLS)}.")
+    bin_dir = os.path.abspath(os.path.join(directory, 'bin'))
+    os.makedirs(bin_dir, exist_ok=True)
+    for tool in TOOLS:
+        command = [sys.executable, os.path.abspath(__file__),
+                   '--delay', str(delays.get(tool, delay)),
+                   '--templates', os.path.abspath(templates), tool]
+        _write_script(os.path.join(bin_dir, tool),
+                      '#!/bin/sh\nexec ' + shlex.join(command) + ' "$@"\n')
+    _write_script(os.path.join(bin_dir, 'mpirun'), _MPIRUN)
+    return {'ace3p': bin_dir + os.sep, 'cubit': bin_dir + os.sep,
+            'mpi': os.path.join(bin_dir, 'mpirun'),
+            'geant4_app_path': bin_dir, 'geant4_app_exe': 'geant4'}
+
+
+def _write_script(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+    os.chmod(path, 0o755)
+
+
+# ---- the tools -------------------------------------------------------------- #
+
+
+def _copy(templates, template, dest):
+    os.makedirs(os.path.dirname(dest) or '.', exist_ok=True)
+    shutil.copyfile(os.path.join(templates, template), dest)
+
+
+def _job_name(input_file, default):
+    """The ACE3P results directory: a top-level ``JobName`` leaf, else the
+    solver's default (see ``ACE3P.job_name``)."""
+    with open(input_file) as f:
+        match = re.search(r'^JobName\s*:\s*(\S+)', f.read(), re.MULTILINE)
+    return match.group(1) if match else default
+
+
+def cubit(args, templates):
+    journal = args[-1]
+    with open(journal) as f:
+        exports = re.findall(r'^\s*export\s+\w+\s+"([^"]+)"', f.read(),
+                             re.MULTILINE)
+    if exports:
+        with open(exports[-1], 'w') as f:
+            f.write(f'stand-in mesh exported by {journal}\n')
+
+
+def acdtool(args, templates):
+    command = ' '.join(args[:2])
+    if args[0] == 'meshconvert':
+        with open(os.path.splitext(args[1])[0] + '.ncdf', 'wb') as f:
+            f.write(b'CDF\x02 stand-in mesh\n')
+    elif command == 'postprocess rf':
+        stem = os.path.basename(args[2]).rsplit('.rfpost', 1)[0]
+        template = os.path.join('rfpost_outputs', stem + '.rfpost.out')
+        if not os.path.isfile(os.path.join(templates, template)):
+            template = os.path.join('rfpost_outputs', 'pillbox-rtop.rfpost.out')
+        _copy(templates, template, 'rfpost.out')
+    elif command == 'postprocess coaxsignal':
+        job = args[2] if len(args) > 2 else 't3p_results'
+        _copy(templates, os.path.join('t3p_outputs', 'BPM.signal.out'),
+              os.path.join(job, 'OUTPUT', 'signal.out'))
+    elif command in ('postprocess wake_new', 'postprocess wake_direct',
+                     'postprocess transwake'):
+        job = args[2] if len(args) > 2 else 't3p_results'
+        _copy(templates, os.path.join('t3p_outputs', 'cavity-half.wakefield.out'),
+              os.path.join(job, 'OUTPUT', 'wakefield.out'))
+
+
+def omega3p(args, templates):
+    results = args[1] if len(args) > 1 else _job_name(args[0], 'omega3p_results')
+    stem = os.path.basename(args[0]).rsplit('.omega3p', 1)[0]
+    template = os.path.join('solver_outputs', 'omega3p', stem + '.omega3p.out')
+    if not os.path.isfile(os.path.join(templates, template)):
+        template = os.path.join('solver_outputs', 'omega3p',
+                                'pillbox.omega3p.out')
+    _copy(templates, template, os.path.join(results, 'omega3p.out'))
+
+
+def s3p(args, templates):
+    results = args[1] if len(args) > 1 else _job_name(args[0], 's3p_results')
+    for name in ('Reflection.out', 'SParameter.out', 'PortRef7_0.out'):
+        _copy(templates, os.path.join('solver_outputs', 's3p_90DegreeBend', name),
+              os.path.join(results, name))
+
+
+def t3p(args, templates):
+    input_file = args[0]
+    with open(input_file) as f:
+        text = f.read()
+    output = os.path.join(_job_name(input_file, 't3p_results'), 'OUTPUT')
+    os.makedirs(output, exist_ok=True)
+    uncommented = re.sub(r'//[^\n]*', '', text)
+    for body in re.findall(r'Monitor\s*:\s*\{([^{}]*)\}', uncommented):
+        kind = re.search(r'Type\s*:\s*(\w+)', body)
+        name = re.search(r'Name\s*:\s*(\S+)', body)
+        if not (kind and name):
+            continue
+        if kind.group(1) == 'Volume':
+            with open(os.path.join(output, name.group(1) + 'ts_t0ps.out'),
+                      'wb') as f:
+                f.write(b'CDF\x02 stand-in field dump\n')
+        elif kind.group(1) in _T3P_MONITORS:
+            _copy(templates, os.path.join('t3p_outputs',
+                                          _T3P_MONITORS[kind.group(1)]),
+                  os.path.join(output, name.group(1) + '.out'))
+    _copy(templates, os.path.join('t3p_outputs', 'BPM.Bunch0.out'),
+          os.path.join(output, 'Bunch0.out'))
+    with open(os.path.join(output, 't3p.out'), 'w') as f:
+        f.write('/* input parameters, KVC syntax */\n\nInput : {\n' + text
+                + '\n}\n')
+
+
+def geant4(args, templates):
+    input_file = args[-1]
+    values = {}
+    with open(input_file) as f:
+        for line in f:
+            key, sep, value = line.partition('=')
+            if sep and not key.strip().startswith('#'):
+                values[key.strip()] = value.split('#')[0].strip()
+    shape = [int(values.get(f'mesh_n{axis}', 10)) for axis in 'xyz']
+    weights = []
+    if os.path.isfile(values.get('particles', '')):
+        with open(values['particles']) as f:
+            for line in f:
+                parts = line.split()
+                if parts and not line.startswith('#'):
+                    weights.append(float(parts[5]) if len(parts) > 5 else 1.0)
+    total = sum(weights)
+    total_sq = sum(w * w for w in weights)
+    rng = random.Random(hashlib.sha256(repr(shape).encode()).hexdigest())
+    for key, unit in (('output_dose', 'Gy'), ('output_edep', 'MeV')):
+        if not values.get(key):
+            continue
+        lines = [f'# mesh name: doseMesh\n',
+                 f'# primitive scorer name: {key[7:]}\n',
+                 f'# iX, iY, iZ, total(value) [{unit}], total(val^2), entry\n']
+        for ix in range(shape[0]):
+            for iy in range(shape[1]):
+                for iz in range(shape[2]):
+                    share = rng.expovariate(1e9)
+                    lines.append(f'{ix},{iy},{iz},{share * total!r},'
+                                 f'{share * share * total_sq!r},'
+                                 f'{round(total)}\n')
+        with open(values[key], 'w') as f:
+            f.writelines(lines)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    delay, templates = 0.0, FIXTURES
+    while argv and argv[0] in ('--delay', '--templates'):
+        option, value = argv.pop(0), argv.pop(0)
+        if option == '--delay':
+            delay = float(value)
+        else:
+            templates = value
+    tool, args = argv[0], argv[1:]
+    if tool not in TOOLS:
+        sys.exit(f'fake_tools: unknown tool {tool!r}')
+    time.sleep(delay)
+    globals()[tool](args, templates)
+
+
+if __name__ == '__main__':
+    main()
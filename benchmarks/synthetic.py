@@ -0,0 +1,269 @@
+"""Production-scale synthetic solver outputs for the parser benchmarks.
+
+The frozen fixtures under ``tests/fixtures/acdtool/`` are a few dozen lines
+each: enough to pin a parser's *answer*, far too small to say anything about
+its speed. Every generator here writes one file in the same layout as its
+fixture, at the size a production run produces, and returns the number of data
+rows it wrote (the denominator of the rows/s figure in ``bench_parsers.py``).
+
+``scale`` multiplies every row count, so ``scale=0.001`` makes the same files
+small enough for the test suite. The numbers are seeded noise — the parsers
+never look at their values — but the *shapes* follow the fixtures exactly:
+
+``s3p_sparameter`` / ``s3p_reflection``
+    ``SParameter.out`` / ``Reflection.out``: a 4-port-mode index map, a
+    ``#Frequency[Hz]`` header and 20k frequency rows of 16 cells
+    (``s3p_90DegreeBend``).
+``t3p_point``
+    a headerless ``(t Hx Hy Hz Ex Ey Ez)`` Point monitor, 1e6 time steps
+    (``BPM.point.out``).
+``t3p_wakefield``
+    a transverse wakefield: the kick-factor header over 1e6 ``(s, W,
+    I_bunch)`` rows (``cavity-half.wakefield.out``).
+``t3p_echo``
+    a multi-MB ``t3p.out``: the KVC input echo with its nested ``AMRLevel``
+    statistics blocks, repeated per level (``BPM.t3p.out``).
+``rfpost_modes``
+    an ``rfpost.out`` whose ``[RoverQ]`` table lists 1e5 modes, between the
+    input-echo blocks that bound it (``pillbox-rtop.rfpost.out``).
+``dose``
+    a 100³ (1e6-voxel) Geant4 scoring dump in the comma-separated ``iX, iY,
+    iZ, total(value), total(val^2), entry`` form.
+"""
+
+import os
+
+import numpy as np
+
+# Row counts at scale 1.0.
+S3P_FREQUENCIES = 20_000
+S3P_MODES = 4
+T3P_STEPS = 1_000_000
+T3P_ECHO_LEVELS = 5_000
+RFPOST_MODES = 100_000
+DOSE_SIDE = 100
+
+
+def _rows(count, scale):
+    return max(1, int(round(count * scale)))
+
+
+def _index_map_header(modes):
+    lines = ['#Index mapping: ']
+    for index in range(modes):
+        port, mode = 7 + index // 2, index % 2
+        cutoff = 6.55719e+09 * (mode + 1)
+        lines.append(f'#          {index} : Port {port}, Mode {mode}, Type: TE '
+                     f'(cutoff: {cutoff:.5e} Hz)')
+    return lines
+
+
+def s3p_sparameter(path, scale=1.0, seed=0):
+    """``SParameter.out``: one ``( real,  imag )`` cell per S-matrix entry."""
+    rows = _rows(S3P_FREQUENCIES, scale)
+    rng = np.random.default_rng(seed)
+    cells = S3P_MODES ** 2
+    names = [f'S({i},{j})' for i in range(S3P_MODES) for j in range(S3P_MODES)]
+    header = _index_map_header(S3P_MODES) + [
+        '#Frequency[Hz]' + ''.join(f'{name:>35}' for name in names)]
+    data = np.empty((rows, 1 + 2 * cells))
+    data[:, 0] = np.linspace(9.424e9, 1.4e10, rows)
+    data[:, 1:] = rng.uniform(-1, 1, (rows, 2 * cells))
+    fmt = '%.8e' + ' (%15.8e, %15.8e)' * cells
+    with open(path, 'w') as f:
+        f.write('\n'.join(header) + '\n')
+        np.savetxt(f, data, fmt=fmt)
+    return rows
+
+
+def s3p_reflection(path, scale=1.0, seed=0):
+    """``Reflection.out``: the same matrix as plain magnitudes."""
+    rows = _rows(S3P_FREQUENCIES, scale)
+    rng = np.random.default_rng(seed)
+    cells = S3P_MODES ** 2
+    names = [f'S({i},{j})' for i in range(S3P_MODES) for j in range(S3P_MODES)]
+    header = _index_map_header(S3P_MODES) + [
+        '#Frequency[Hz]' + ''.join(f'{name:>16}' for name in names)]
+    data = np.empty((rows, 1 + cells))
+    data[:, 0] = np.linspace(9.424e9, 1.4e10, rows)
+    data[:, 1:] = rng.uniform(0, 1, (rows, cells))
+    with open(path, 'w') as f:
+        f.write('\n'.join(header) + '\n')
+        np.savetxt(f, data, fmt='%.8e', delimiter='  ')
+    return rows
+
+
+def t3p_point(path, scale=1.0, seed=0):
+    """A headerless Point monitor, ``t`` plus six field components."""
+    rows = _rows(T3P_STEPS, scale)
+    rng = np.random.default_rng(seed)
+    data = np.empty((rows, 7))
+    data[:, 0] = 5e-13 * np.arange(1, rows + 1)
+    data[:, 1:] = rng.normal(0, 1e-28, (rows, 6))
+    np.savetxt(path, data, fmt='%.9e', delimiter='   ')
+    return rows
+
+
+def t3p_wakefield(path, scale=1.0, seed=0):
+    """A transverse wakefield with its two sampling points and kick factor."""
+    rows = _rows(T3P_STEPS, scale)
+    rng = np.random.default_rng(seed)
+    header = ['# T3P transverse wakefield result using transverse points:',
+              '# (0.00000000000000e+00,0.00000000000000e+00) and ',
+              '# (0.00000000000000e+00,1.25000000000000e-02)',
+              '# with offset 1.25000000000000e-02 m',
+              '# Kick factor = 9.64058337896157e-02 V/pC',
+              '# s[m]    W(s)[V/pC]    I_bunch(s)[C/m]']
+    data = np.empty((rows, 3))
+    data[:, 0] = np.linspace(-0.05, 1.0, rows)
+    data[:, 1:] = rng.normal(0, 1, (rows, 2))
+    with open(path, 'w') as f:
+        f.write('\n'.join(header) + '\n')
+        np.savetxt(f, data, fmt='%.14e', delimiter=' ')
+    return rows
+
+
+_DISTRIBUTION = """\
+                {name} : {{
+                    total : {total}
+                    max : {max}
+                    average : {average}
+                    min : {min}
+                    stddev : {stddev}
+                }}
+"""
+
+
+def t3p_echo(path, scale=1.0, seed=0):
+    """A ``t3p.out`` input echo: one ``AMRLevel`` statistics block per level,
+    then the ``Input`` section T3P reads its monitors back from. Returns the
+    number of lines."""
+    levels = _rows(T3P_ECHO_LEVELS, scale)
+    rng = np.random.default_rng(seed)
+    stats = rng.uniform(1e3, 1e7, (levels, 3, 5))
+    parts = ['/********************************/\n',
+             '/* input parameters, KVC syntax */\n',
+             '/********************************/\n\n\n']
+    for level in range(levels):
+        parts.append('        AMRLevel : { \n            Matrix : { \n')
+        for block, name in enumerate(('RowDistribution',
+                                      'NonlocalelementsDistribution',
+                                      'NonZeroDistribution')):
+            total, high, average, low, stddev = stats[level, block]
+            parts.append(_DISTRIBUTION.format(
+                name=name, total=int(total), max=int(high), average=average,
+                min=int(low), stddev=stddev))
+        parts.append('            }\n        }\n')
+    parts.append("""\
+        Input : {
+            FiniteElement : {
+                Order : 2
+                CurvedSurfaces : on
+            }
+            Monitor : {
+                Name : point
+                Type : Point
+                Location : 0.0, 0.0, 0.0
+            }
+            Monitor : {
+                Name : wakefield
+                Type : WakeField
+            }
+        }
+""")
+    text = ''.join(parts)
+    with open(path, 'w') as f:
+        f.write(text)
+    return text.count('\n')
+
+
+_RFPOST_ECHO = """\
+RoverQ
+{
+   ionoff      =      1
+   modeID1     =     -1
+   modeID2     =     -1
+   x1          =      0.00000
+   x2          =      0.00000
+   y1          =      0.00100
+   y2          =      0.00100
+   z1          =     -0.15000
+   z2          =      0.15000
+}
+
+"""
+
+
+def rfpost_modes(path, scale=1.0, seed=0):
+    """An ``rfpost.out`` with one long ``[RoverQ]`` mode table."""
+    rows = _rows(RFPOST_MODES, scale)
+    rng = np.random.default_rng(seed)
+    data = np.empty((rows, 6))
+    data[:, 0] = np.sort(rng.uniform(1e9, 2e10, rows))
+    data[:, 1] = 0.0
+    data[:, 2:] = rng.normal(0, 1, (rows, 4))
+    with open(path, 'w') as f:
+        f.write(_RFPOST_ECHO)
+        f.write('[RoverQ]\n{  // RoverQ=V^2/(omega*U)\n'
+                '   Integral:  x1  = 0.0000e+00,  y1  = 1.0000e-03,  '
+                'z1  =-1.5000e-01\n'
+                '              x2  = 0.0000e+00,  y2  = 1.0000e-03,  '
+                'z2  = 1.5000e-01\n'
+                ' ModeID   Frequency       Qext              V_r, V_i'
+                '              |V|          RoQ(ohm/cavity)\n')
+        for mode, row in enumerate(data):
+            f.write(f'    {mode}   {row[0]:.7e}  {row[1]:.5e}  {row[2]:.4e}, '
+                    f'{row[3]:.4e}    {row[4]:.5e}      {row[5]:.5e}\n')
+        f.write('}\n\n')
+        f.write(_RFPOST_ECHO)
+    return rows
+
+
+def dose(path, scale=1.0, seed=0):
+    """A Geant4 dose scoring dump over a cubic mesh of ``scale × 1e6``
+    voxels."""
+    side = max(1, int(round(DOSE_SIDE * scale ** (1 / 3))))
+    rng = np.random.default_rng(seed)
+    ix, iy, iz = np.meshgrid(*(np.arange(side),) * 3, indexing='ij')
+    count = side ** 3
+    data = np.empty((count, 6))
+    data[:, 0], data[:, 1], data[:, 2] = ix.ravel(), iy.ravel(), iz.ravel()
+    data[:, 3] = rng.exponential(1e-9, count)
+    data[:, 5] = rng.integers(1, 500, count)
+    data[:, 4] = data[:, 3] ** 2 / data[:, 5]
+    with open(path, 'w') as f:
+        f.write('# mesh name: doseMesh\n'
+                '# primitive scorer name: dose\n'
+                '# iX, iY, iZ, total(value) [Gy], total(val^2), entry\n')
+        np.savetxt(f, data, fmt='%d,%d,%d,%.9g,%.9g,%d')
+    return count
+
+
+GENERATORS = {
+    's3p_sparameter': (s3p_sparameter, 'SParameter.out'),
+    's3p_reflection': (s3p_reflection, 'Reflection.out'),
+    't3p_point': (t3p_point, 'point.out'),
+    't3p_wakefield': (t3p_wakefield, 'wakefield.out'),
+    't3p_echo': (t3p_echo, 't3p.out'),
+    'rfpost_modes': (rfpost_modes, 'rfpost.out'),
+    'dose': (dose, 'doseDeposit.txt'),
+}
+
+
+def generate(name, directory, scale=1.0, seed=0):
+    """Write case ``name``'s file under ``directory`` (reusing one already
+    written at the same scale and seed) and return ``(path, rows)``."""
+    function, filename = GENERATORS[name]
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, filename)
+    stamp = path + '.rows'
+    tag = f'{scale!r} {seed}'
+    if os.path.isfile(path) and os.path.isfile(stamp):
+        with open(stamp) as f:
+            recorded_tag, _, rows = f.read().rpartition(' ')
+        if recorded_tag == tag:
+            return path, int(rows)
+    rows = function(path, scale=scale, seed=seed)
+    with open(stamp, 'w') as f:
+        f.write(f'{tag} {rows}')
+    return path, rows
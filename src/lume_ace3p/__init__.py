@@ -5,11 +5,36 @@ try:
 except PackageNotFoundError:  # running from a source tree that isn't installed
     __version__ = "0.0.0+unknown"
 
-from .cubit import Cubit
-from .ace3p import Omega3P, S3P
-from .acdtool import Acdtool
-from .geant4 import Geant4
-from .particles import Particles
-from .paths import resolve_paths
-from .workflow_graph import Workflow
-from .results import write_table, save_field, load_field
+# Public names and the submodule each lives in. They are imported on first
+# attribute access (PEP 562), not here: the tool wrappers subclass
+# ``lume.base.CommandWrapper``, whose import alone pulls in matplotlib and scipy,
+# so an eager import would charge seconds to ``run-lume-ace3p --version`` and to
+# the store-consuming modes, which never build a tool.
+_LAZY = {
+    'Cubit': 'cubit',
+    'Omega3P': 'ace3p',
+    'S3P': 'ace3p',
+    'Acdtool': 'acdtool',
+    'Geant4': 'geant4',
+    'Particles': 'particles',
+    'resolve_paths': 'paths',
+    'Workflow': 'workflow_graph',
+    'write_table': 'results',
+    'save_field': 'results',
+    'load_field': 'results',
+}
+
+__all__ = ['__version__', *_LAZY]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'{__name__}.{_LAZY[name]}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -68,6 +68,7 @@ from lume.base import CommandWrapper
 # (postprocessor -> solver). Imported here so ``acdtool.parse_column_file``
 # keeps resolving.
 from lume_ace3p.ace3p import parse_column_file
+from lume_ace3p import trace
 
 
 # --------------------------------------------------------------------------- #
@@ -1009,10 +1010,12 @@ class Acdtool(CommandWrapper):
 
         self._spec = spec
         self.output_file = spec.resolve_output(jobname)
-        subprocess.run(self._command_line(name, operands, spec),
-                       shell=True, cwd=self.workdir)
+        command = self._command_line(name, operands, spec)
+        with trace.span('subprocess', 'subprocess', command=command):
+            subprocess.run(command, shell=True, cwd=self.workdir)
         if spec.parses:
-            self.load_output()
+            with trace.span('parse', 'parse', parser=f'acdtool {name}'):
+                self.load_output()
         return self.output_data
 
     def _command_line(self, name, operands, spec):
@@ -1367,9 +1370,11 @@ class Acdtool(CommandWrapper):
         try:
             if os.path.exists(sample):
                 os.remove(sample)
-            subprocess.run(self.ACE3P_PATH + 'acdtool postprocess rf',
-                           shell=True, cwd=self.workdir,
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            command = self.ACE3P_PATH + 'acdtool postprocess rf'
+            with trace.span('subprocess', 'subprocess', command=command):
+                subprocess.run(command, shell=True, cwd=self.workdir,
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
         except OSError:
             return False
         if not os.path.isfile(sample):
@@ -1,53 +1,14 @@
 import glob
 import os, re, shutil
-import subprocess
 import warnings
 
 import numpy as np
 
 from lume.base import CommandWrapper
 
-
-class Section:
-    """An ACE3P input section: ordered list of (name, child) entries.
-
-    A child is either a leaf string or another Section. Same-named siblings
-    are stored as separate entries — order and duplicates are preserved
-    end-to-end through parse / mutate / write.
-    """
-
-    def __init__(self, entries=None):
-        self.entries = list(entries) if entries else []
-
-    def append(self, name, value):
-        self.entries.append((name, value))
-
-    def children(self, name):
-        return [v for k, v in self.entries if k == name]
-
-    def find(self, name, **discriminators):
-        """Return the first child Section matching `name` whose own leaves
-        match every (key, value) pair in `discriminators`. Returns None if
-        nothing matches."""
-        for k, v in self.entries:
-            if k != name or not isinstance(v, Section):
-                continue
-            if all(v.get_leaf(dk) == str(dv) for dk, dv in discriminators.items()):
-                return v
-        return None
-
-    def get_leaf(self, name):
-        for k, v in self.entries:
-            if k == name and not isinstance(v, Section):
-                return v
-        return None
-
-    def set_leaf(self, name, value):
-        for i, (k, v) in enumerate(self.entries):
-            if k == name and not isinstance(v, Section):
-                self.entries[i] = (k, str(value))
-                return
-        self.entries.append((name, str(value)))
+from lume_ace3p import trace
+from lume_ace3p.launchers import run_command, run_command_async
+from lume_ace3p.section import Section
 
 
 def parse_ace3p(text):
@@ -241,8 +202,12 @@ class ACE3P(CommandWrapper):
     accepts_results_dir_arg = False
 
     def __init__(self, *args, ace3p_tasks=1, ace3p_cores=1, ace3p_opts='',
-                 ace3p_path=None, mpi_caller=None, results_dir=None, **kwargs):
+                 ace3p_path=None, mpi_caller=None, results_dir=None,
+                 launcher=None, **kwargs):
         super().__init__(*args, **kwargs)
+        # None runs the solver with a blocking subprocess.run; a launcher from
+        # lume_ace3p.launchers submits it and waits (or is awaited, run_async).
+        self.launcher = launcher
         self.ACE3P_PATH = ace3p_path if ace3p_path is not None else os.environ.get('ACE3P_PATH', '')
         self.MPI_CALLER = mpi_caller if mpi_caller is not None else os.environ.get('MPI_CALLER', '')
         self.ace3p_tasks = ace3p_tasks
@@ -294,8 +259,22 @@ class ACE3P(CommandWrapper):
 
     def run(self):
         self.write_input()
-        subprocess.run(self.solver_command(), shell=True, cwd=self.workdir)
-        self.output_parser()
+        run_command(self.solver_command(), self.workdir, self.launcher)
+        self._parse()
+
+    async def run_async(self):
+        """Awaitable :meth:`run`: submit the solve through the launcher, await
+        its completion, then parse the output exactly as :meth:`run` does."""
+        self.write_input()
+        await run_command_async(self.solver_command(), self.workdir,
+                                self.launcher)
+        self._parse()
+
+    def _parse(self):
+        """Run :meth:`output_parser` as a traced ``parse`` span (see
+        :mod:`lume_ace3p.trace`)."""
+        with trace.span('parse', 'parse', solver=type(self).__name__):
+            self.output_parser()
 
     def load_input_file(self, *args):
         if args:
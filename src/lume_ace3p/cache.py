@@ -0,0 +1,469 @@
+"""Content-addressed on-disk cache of workflow evaluations.
+
+Xopt loops and repeated sweeps regularly revisit an input point that has
+already been solved — a re-seeded random phase, a resumed campaign, two sweep
+grids that overlap. Each revisit would otherwise cost a full Cubit + solver
+run. :class:`EvaluationCache` memoizes :meth:`Workflow.evaluate
+<lume_ace3p.workflow_graph.Workflow.evaluate>` on disk instead.
+
+Enabled from the YAML with a ``cache:`` block in ``workflow_parameters``::
+
+    workflow_parameters:
+      cache:
+        dir: ~/.cache/lume-ace3p/evaluations
+        max_gb: 20            # optional size cap
+        max_age_days: 30      # optional age cap
+
+Design notes
+------------
+* **Key = everything that decides the answer.** :func:`evaluation_key` hashes
+  the *materialized* :class:`~lume_ace3p.inputs.WorkflowInputs` (all four
+  buckets, ACE3P leaves by path), each module's type/name/config, the
+  ``output_parameters`` spec, the dry-run flag, and the **bytes** of every file
+  a module config references (journal, solver input, ``.rfpost``, Geant4 input
+  and geometry, particle/Track3P files). Editing an input file therefore misses
+  the cache even when no YAML value changed. Files an input file names only
+  *internally* (an STL listed inside a Geant4 input, say) are covered by the
+  referencing file's bytes, not their own.
+* **What is stored is what the mode layer reads.** An entry holds the extracted
+  outputs, the field index and the structured field — the three things
+  :class:`~lume_ace3p.workflow_graph.Evaluation` exposes — so a hit is
+  indistinguishable from a run to every mode. Solver output files are *not*
+  kept; the hit's workdir holds only what the mode writes there.
+* **Entries are written atomically.** An entry is assembled in a temporary
+  sibling directory and renamed into place, so parallel workers sharing one
+  cache never read a half-written entry; the first writer of a key wins.
+* **Eviction is least-recently-used.** A hit refreshes the entry's mtime; after
+  each store, entries older than ``max_age_days`` are dropped, then the oldest
+  until the cache fits in ``max_gb``.
+
+Mesh cache
+----------
+A sweep whose axes are all ACE3P leaves still misses the evaluation cache at
+every point, yet the geometry never changes. :class:`MeshCache` covers that
+case one level down: ``workflow_parameters.mesh_cache: <dir>`` keys the
+Cubit export (and its meshconverted ``.ncdf``) on the *parameter-merged*
+journal text — the journal's content with the cubit bucket's values already
+written in — so :class:`~lume_ace3p.modules.CubitModule` can link a mesh it has
+built before into the workdir instead of running Cubit and ``acdtool
+meshconvert`` again. Files the journal only imports (a STEP solid, say) are not
+part of the key; clear the directory after editing one.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from lume_ace3p.inputs import _walk_ace3p
+from lume_ace3p.results import save_field, load_field, _json_default
+
+
+# Bump when the key recipe or the entry layout changes, so old entries miss
+# rather than being misread.
+_FORMAT_VERSION = 1
+
+_META = 'meta.json'
+_ARRAYS = 'outputs.npz'
+_FIELD = 'field.npz'
+
+
+# --------------------------------------------------------------------------- #
+# Key construction
+# --------------------------------------------------------------------------- #
+
+
+def _canonical(value):
+    """A JSON-serializable, order-stable rendering of an input/config value."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(),
+                                                          key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return [_canonical(v) for v in value.tolist()]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _referenced_files(config):
+    """Every existing file path named by a module config value (a string, or
+    a list of strings such as ``geant4_geometry_files``)."""
+    found = []
+    for value in config.values():
+        candidates = value if isinstance(value, (list, tuple)) else [value]
+        for candidate in candidates:
+            if isinstance(candidate, str) and os.path.isfile(candidate):
+                found.append(candidate)
+    return found
+
+
+def _bucket_payload(inputs, bucket):
+    """The canonical rendering of one :class:`WorkflowInputs` bucket (ACE3P
+    leaves by path, the others as mappings)."""
+    if bucket == 'ace3p':
+        return [[_canonical(path), _canonical(value)]
+                for path, value in _walk_ace3p(inputs.ace3p)]
+    return _canonical(getattr(inputs, bucket))
+
+
+def _describe_module(module, files):
+    """The canonical description of ``module`` for a key, recording the digest
+    of every file its config names into ``files``."""
+    for path in _referenced_files(module.config):
+        files[path] = _file_digest(path)
+    return {'type': module.type, 'name': module.name,
+            'config': _canonical(module.config)}
+
+
+def evaluation_key(modules, inputs, output_spec=None, dry_run=False):
+    """Return the hex digest identifying one evaluation of ``modules`` at the
+    materialized ``inputs`` (see the module docstring for what it covers)."""
+    files = {}
+    described = [_describe_module(module, files) for module in modules]
+    payload = {
+        'version': _FORMAT_VERSION,
+        'inputs': {bucket: _bucket_payload(inputs, bucket)
+                   for bucket in ('cubit', 'ace3p', 'macro', 'particles')},
+        'modules': described,
+        'outputs': _canonical(output_spec or {}),
+        'dry_run': bool(dry_run),
+        'files': files,
+    }
+    text = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def module_fingerprint(module, inputs):
+    """Return the hex digest of what decides one module's own run: its
+    type/name/config, the bytes of the files its config names, and the input
+    buckets it declares in :attr:`~lume_ace3p.modules.Module.consumes`. What
+    arrives through its required artifacts is *not* covered — the workflow
+    re-runs a module whose producer re-ran regardless of this digest."""
+    files = {}
+    payload = {
+        'version': _FORMAT_VERSION,
+        'module': _describe_module(module, files),
+        'inputs': {bucket: _bucket_payload(inputs, bucket)
+                   for bucket in sorted(module.consumes)},
+        'files': files,
+    }
+    text = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# --------------------------------------------------------------------------- #
+# Output (de)serialization — outputs are scalars, arrays, or tuples
+# --------------------------------------------------------------------------- #
+
+
+def _encode_outputs(outputs):
+    """Split ``outputs`` into ``(kinds, arrays)`` for ``meta.json`` + ``.npz``.
+    Raises ``TypeError`` on a value this cache cannot round-trip."""
+    kinds, arrays = {}, {}
+    for name, value in outputs.items():
+        if value is None:
+            kinds[name] = ['none', None]
+        elif isinstance(value, str):
+            kinds[name] = ['str', value]
+        elif isinstance(value, dict):
+            kinds[name] = ['json', json.dumps(value, default=_json_default)]
+        elif isinstance(value, tuple):
+            kinds[name] = ['tuple', None]
+            arrays['o:' + name] = np.asarray(value)
+        elif isinstance(value, np.ndarray):
+            kinds[name] = ['array', None]
+            arrays['o:' + name] = value
+        elif isinstance(value, (bool, int, float, np.generic)):
+            kinds[name] = ['scalar', None]
+            arrays['o:' + name] = np.asarray(value)
+        else:
+            raise TypeError(f"output '{name}' of type {type(value).__name__} "
+                            "cannot be cached.")
+    return kinds, arrays
+
+
+def _decode_outputs(kinds, npz):
+    outputs = {}
+    for name, (kind, inline) in kinds.items():
+        if kind == 'none':
+            outputs[name] = None
+        elif kind == 'str':
+            outputs[name] = inline
+        elif kind == 'json':
+            outputs[name] = json.loads(inline)
+        elif kind == 'tuple':
+            outputs[name] = tuple(npz['o:' + name].tolist())
+        elif kind == 'scalar':
+            outputs[name] = npz['o:' + name].item()
+        else:
+            outputs[name] = npz['o:' + name]
+    return outputs
+
+
+# --------------------------------------------------------------------------- #
+# The cache
+# --------------------------------------------------------------------------- #
+
+
+class CachedEvaluation:
+    """What a cache hit hands back: ``outputs``, ``field_index`` (``None`` or
+    ``(label, values)``) and ``field`` (``None`` or the structured dict)."""
+
+    def __init__(self, outputs, field_index, field):
+        self.outputs = outputs
+        self.field_index = field_index
+        self.field = field
+
+
+class EvaluationCache:
+    """An on-disk, content-addressed store of evaluation results under
+    ``directory``, bounded by ``max_gb`` and ``max_age_days`` (either may be
+    ``None`` for no bound).
+
+    ``hits`` / ``misses`` count lookups since construction; :meth:`summary`
+    renders them for the end-of-mode report."""
+
+    def __init__(self, directory, max_gb=None, max_age_days=None):
+        self.directory = os.path.abspath(os.path.expanduser(str(directory)))
+        self.max_bytes = (int(float(max_gb) * 1024 ** 3)
+                          if max_gb is not None else None)
+        self.max_age = (float(max_age_days) * 86400.0
+                        if max_age_days is not None else None)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, block):
+        """Build from a ``workflow_parameters.cache`` block, or return ``None``
+        when the block is absent. A bare string is taken as the ``dir``."""
+        if block is None or block is False:
+            return None
+        if isinstance(block, str):
+            block = {'dir': block}
+        if not isinstance(block, dict) or not block.get('dir'):
+            raise ValueError(
+                "Key: 'cache' must be a mapping with a 'dir' (and optional "
+                f"'max_gb' / 'max_age_days'); got {block!r}.")
+        unknown = set(block) - {'dir', 'max_gb', 'max_age_days'}
+        if unknown:
+            raise ValueError(f"Key: 'cache' has unknown keys {sorted(unknown)}; "
+                             "expected 'dir', 'max_gb', 'max_age_days'.")
+        return cls(block['dir'], max_gb=block.get('max_gb'),
+                   max_age_days=block.get('max_age_days'))
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    # ---- lookup / store ---------------------------------------------------
+
+    def load(self, key):
+        """Return the :class:`CachedEvaluation` stored under ``key``, or
+        ``None`` on a miss. Counts the lookup either way."""
+        entry = self._entry(key)
+        meta_path = os.path.join(entry, _META)
+        if not os.path.isfile(meta_path):
+            self.misses += 1
+            return None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with np.load(os.path.join(entry, _ARRAYS),
+                         allow_pickle=False) as npz:
+                outputs = _decode_outputs(meta['outputs'], npz)
+                index = None
+                if meta.get('index_label') is not None:
+                    index = (meta['index_label'], npz['__index__'])
+            field_path = os.path.join(entry, _FIELD)
+            field = load_field(field_path) if os.path.isfile(field_path) else None
+        except (OSError, ValueError, KeyError) as exc:
+            print(f"Warning: evaluation cache entry {entry} is unreadable "
+                  f"({exc}); re-running.")
+            self.misses += 1
+            return None
+        os.utime(entry)                    # least-recently-used bookkeeping
+        self.hits += 1
+        return CachedEvaluation(outputs, index, field)
+
+    def store(self, key, outputs, field_index=None, field=None):
+        """Persist one evaluation under ``key``. An output or field this cache
+        cannot serialize skips the store with a warning rather than failing
+        the run."""
+        entry = self._entry(key)
+        if os.path.isdir(entry):
+            return
+        try:
+            kinds, arrays = _encode_outputs(outputs)
+        except TypeError as exc:
+            print(f"Warning: not caching this evaluation: {exc}")
+            return
+        meta = {'version': _FORMAT_VERSION, 'created': time.time(),
+                'outputs': kinds, 'index_label': None}
+        if field_index is not None:
+            meta['index_label'] = str(field_index[0])
+            arrays['__index__'] = np.asarray(field_index[1])
+
+        parent = os.path.dirname(entry)
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+        try:
+            np.savez(os.path.join(staging, _ARRAYS), **arrays)
+            if field is not None:
+                save_field(field, os.path.join(staging, _FIELD))
+            with open(os.path.join(staging, _META), 'w') as f:
+                json.dump(meta, f)
+            os.rename(staging, entry)
+        except (OSError, TypeError, ValueError) as exc:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(entry):       # lost a race: someone else won
+                print(f"Warning: not caching this evaluation: {exc}")
+            return
+        self.evict()
+
+    # ---- eviction ---------------------------------------------------------
+
+    def _entries(self):
+        """``[(mtime, size_bytes, path)]`` for every complete entry."""
+        found = []
+        if not os.path.isdir(self.directory):
+            return found
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.is_dir() or entry.name.startswith('.'):
+                    continue
+                size = sum(f.stat().st_size for f in os.scandir(entry.path)
+                           if f.is_file())
+                found.append((entry.stat().st_mtime, size, entry.path))
+        return found
+
+    def evict(self):
+        """Drop entries past ``max_age_days``, then the least recently used
+        until the cache fits in ``max_gb``. Returns the number removed."""
+        if self.max_bytes is None and self.max_age is None:
+            return 0
+        entries = sorted(self._entries())
+        removed = 0
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            while entries and entries[0][0] < cutoff:
+                shutil.rmtree(entries.pop(0)[2], ignore_errors=True)
+                removed += 1
+        if self.max_bytes is not None:
+            total = sum(size for _mtime, size, _path in entries)
+            while entries and total > self.max_bytes:
+                _mtime, size, path = entries.pop(0)
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+                removed += 1
+        return removed
+
+    def summary(self):
+        return (f"Evaluation cache ({self.directory}): {self.hits} hit(s), "
+                f"{self.misses} miss(es).")
+
+
+# --------------------------------------------------------------------------- #
+# Mesh cache
+# --------------------------------------------------------------------------- #
+
+
+def mesh_key(journal_lines, meshconvert=True):
+    """Return the hex digest identifying the mesh a parameter-merged Cubit
+    journal (its lines, as :class:`~lume_ace3p.cubit.Cubit` holds them) builds.
+    ``meshconvert`` is part of the key since it decides which files exist."""
+    digest = hashlib.sha256()
+    digest.update(f'mesh-v{_FORMAT_VERSION};meshconvert={bool(meshconvert)}\n'
+                  .encode('utf-8'))
+    digest.update(''.join(journal_lines).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class MeshCache:
+    """An on-disk store of Cubit meshes under ``directory``, one entry per
+    :func:`mesh_key`. An entry holds the mesh files plus a ``meta.json``
+    recording each file's path relative to the workdir it came from.
+
+    ``hits`` / ``misses`` count lookups since construction."""
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(os.path.expanduser(str(directory)))
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, value):
+        """Build from ``workflow_parameters.mesh_cache`` (a directory), or
+        return ``None`` when it is unset."""
+        if value is None or value is False:
+            return None
+        if not isinstance(value, str) or not value:
+            raise ValueError("Key: 'mesh_cache' must be a directory path; "
+                             f"got {value!r}.")
+        return cls(value)
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def lookup(self, key):
+        """Return ``[(cached_path, relative_path)]`` for the mesh stored under
+        ``key``, or ``None`` on a miss. Counts the lookup either way."""
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, _META)) as f:
+                relpaths = json.load(f)['files']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        files = [(os.path.join(entry, os.path.basename(rel)), rel)
+                 for rel in relpaths]
+        if not all(os.path.isfile(path) for path, _rel in files):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return files
+
+    def store(self, key, workdir, relpaths):
+        """Copy the mesh files ``relpaths`` (relative to ``workdir``) into the
+        entry for ``key``. A missing file — Cubit or meshconvert failed —
+        skips the store so a broken mesh is never served."""
+        entry = self._entry(key)
+        if os.path.isdir(entry):
+            return
+        sources = [os.path.join(workdir, rel) for rel in relpaths]
+        if not sources or not all(os.path.isfile(src) for src in sources):
+            return
+        parent = os.path.dirname(entry)
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+        try:
+            for src in sources:
+                shutil.copy(src, staging)
+            with open(os.path.join(staging, _META), 'w') as f:
+                json.dump({'version': _FORMAT_VERSION, 'files': list(relpaths)},
+                          f)
+            os.rename(staging, entry)
+        except OSError as exc:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(entry):       # lost a race: someone else won
+                print(f"Warning: not caching this mesh: {exc}")
+
+    def summary(self):
+        return (f"Mesh cache ({self.directory}): {self.hits} hit(s), "
+                f"{self.misses} miss(es).")
@@ -1,12 +1,14 @@
 import os, shutil
-import subprocess
 
 from lume.base import CommandWrapper
 
+from lume_ace3p.launchers import run_command, run_command_async
+
 class Cubit(CommandWrapper):
 
-    def __init__(self, *args, ace3p_path=None, cubit_path=None, mpi_caller=None, **kwargs):
+    def __init__(self, *args, ace3p_path=None, cubit_path=None, mpi_caller=None, launcher=None, **kwargs):
         super().__init__(*args, **kwargs)
+        self.launcher = launcher    #None: blocking subprocess.run (see lume_ace3p.launchers)
         self.ACE3P_PATH = ace3p_path if ace3p_path is not None else os.environ.get('ACE3P_PATH', '')
         self.CUBIT_PATH = cubit_path if cubit_path is not None else os.environ.get('CUBIT_PATH', '')
         self.MPI_CALLER = mpi_caller if mpi_caller is not None else os.environ.get('MPI_CALLER', '')
@@ -102,21 +104,36 @@ class Cubit(CommandWrapper):
         with open(os.path.join(self.workdir, self.input_file), 'w') as file:
             file.writelines(self.lines)
                 
+    def cubit_command(self):
+        return self.CUBIT_PATH + 'cubit -nographics -nojournal -noecho ' + self.input_file
+
+    def meshconvert_command(self):
+        return self.MPI_CALLER + ' --nodes=1 --ntasks=1 ' + self.ACE3P_PATH + 'acdtool meshconvert ' + self.exportfile
+
     def run(self, mcflag=True):
         self.write_input()
-        subprocess.run(self.CUBIT_PATH + 'cubit -nographics -nojournal -noecho ' + self.input_file,
-                        shell=True, cwd=self.workdir)
+        run_command(self.cubit_command(), self.workdir, self.launcher)
         if mcflag:
             self.meshconvert()
-                        
-    def meshconvert(self, *args):
+
+    async def run_async(self, mcflag=True):
+        self.write_input()
+        await run_command_async(self.cubit_command(), self.workdir, self.launcher)
+        if mcflag:
+            self._resolve_export()
+            if self.exportfile is not None:
+                await run_command_async(self.meshconvert_command(), self.workdir, self.launcher)
+
+    def _resolve_export(self, *args):
         if args:
             self.exportfile = args[0]
         else:
             self.get_export()
+
+    def meshconvert(self, *args):
+        self._resolve_export(*args)
         if self.exportfile is not None:
-            subprocess.run(self.MPI_CALLER + ' --nodes=1 --ntasks=1 ' + self.ACE3P_PATH + 'acdtool meshconvert ' + self.exportfile,
-                            shell=True, cwd=self.workdir)
+            run_command(self.meshconvert_command(), self.workdir, self.launcher)
         
     def configure(self):
         return 'Not implemented.'
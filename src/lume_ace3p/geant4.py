@@ -1,15 +1,17 @@
 import os, shutil
-import subprocess
 
 from lume.base import CommandWrapper
 
+from lume_ace3p.launchers import run_command, run_command_async
+
 
 class Geant4(CommandWrapper):
 
     def __init__(self, *args, geant4_threads=1, geant4_opts='',
                  mpi_caller=None, geant4_app_path=None, geant4_app_exe=None,
-                 **kwargs):
+                 launcher=None, **kwargs):
         super().__init__(*args, **kwargs)
+        self.launcher = launcher    # None: blocking subprocess.run (see lume_ace3p.launchers)
         self.MPI_CALLER = mpi_caller if mpi_caller is not None else os.environ.get('MPI_CALLER', '')
         self.GEANT4_APP_PATH = geant4_app_path if geant4_app_path is not None else os.environ.get('GEANT4_APP_PATH', '')
         self.GEANT4_APP_EXE = geant4_app_exe if geant4_app_exe is not None else os.environ.get('GEANT4_APP_EXE', '')
@@ -112,13 +114,19 @@ class Geant4(CommandWrapper):
         with open(os.path.join(self.workdir, self.input_file), 'w') as file:
             file.writelines(self.lines)
 
+    def geant4_command(self):
+        exe = os.path.join(self.GEANT4_APP_PATH, self.GEANT4_APP_EXE)
+        return (self.MPI_CALLER + ' -n 1 -c ' + str(self.geant4_threads) + ' '
+                + self.geant4_opts + ' '
+                + exe + ' ' + self.input_file)
+
     def run(self):
         self.write_input()
-        exe = os.path.join(self.GEANT4_APP_PATH, self.GEANT4_APP_EXE)
-        cmd = (self.MPI_CALLER + ' -n 1 -c ' + str(self.geant4_threads) + ' '
-               + self.geant4_opts + ' '
-               + exe + ' ' + self.input_file)
-        subprocess.run(cmd, shell=True, cwd=self.workdir)
+        run_command(self.geant4_command(), self.workdir, self.launcher)
+
+    async def run_async(self):
+        self.write_input()
+        await run_command_async(self.geant4_command(), self.workdir, self.launcher)
 
     def configure(self):
         return 'Not implemented.'
@@ -24,7 +24,7 @@ to the per-iteration `set_value` calls.
 import numpy as np
 from ruamel.yaml import YAML
 
-from lume_ace3p.ace3p import Section
+from lume_ace3p.section import Section
 
 
 class WorkflowInputs:
@@ -0,0 +1,387 @@
+"""Pluggable job launchers for the Cubit / ACE3P / Geant4 command lines.
+
+By default every wrapper runs its command with a blocking
+``subprocess.run(..., shell=True)``, so one Python process drives one solve at
+a time. A *launcher* decouples **starting** a command from **waiting** for it:
+``submit`` hands the command to some executor and returns a :class:`Job`,
+``poll`` asks whether it has finished, and the asyncio coroutine :meth:`Launcher.run`
+loops the two with ``await asyncio.sleep`` in between — so a driver running
+many evaluations on one event loop (``parameter_sweep`` with ``parallel:
+{backend: async}``) keeps every solve in flight at once.
+
+Selected from the YAML with a ``launcher:`` block in ``workflow_parameters``::
+
+    workflow_parameters:
+      launcher:
+        type: batch                 # local | batch | local_scheduler
+        submit: 'sbatch --parsable' # batch only
+        header: ['#SBATCH -N 1', '#SBATCH -t 00:30:00']
+        poll_interval: 30           # seconds between polls
+        timeout: 86400              # batch / local_scheduler: give up after
+
+Three implementations:
+
+``local`` (:class:`LocalLauncher`)
+    An ``asyncio`` subprocess on this host — the default behavior, made
+    awaitable.
+``batch`` (:class:`BatchLauncher`)
+    ``sbatch``-style submission: the command is written to a job script in the
+    workdir that records its exit status in a sidecar file, the script is
+    submitted with ``submit`` (the job id is read from its stdout), and
+    completion is detected by polling for the sidecar. Any scheduler whose
+    submit command takes a script path works the same way.
+``local_scheduler`` (:class:`LocalSchedulerLauncher`)
+    A stand-in for ``batch`` that needs no scheduler: the same job scripts, run
+    on this host by a small queue that starts at most ``slots`` at a time. It
+    exercises exactly the submit/poll path a real queue takes, which is what
+    the tests and a laptop dry-run want.
+
+The wrappers keep their synchronous ``run()`` (which blocks on the launcher
+through :func:`run_command`) and gain an ``async run_async()``; either way the
+solver's ``output_parser`` runs after the job completes, so extraction is
+unchanged.
+"""
+
+import asyncio
+import contextvars
+import os
+import subprocess
+import threading
+import time
+import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from lume_ace3p import trace
+
+
+class Job:
+    """One submitted command: its ``command`` line, working directory ``cwd``,
+    the launcher-assigned ``job_id``, and ``returncode`` once finished."""
+
+    def __init__(self, command, cwd, job_id=None):
+        self.command = command
+        self.cwd = cwd
+        self.job_id = job_id
+        self.returncode = None
+        self.submitted = time.monotonic()
+        self._gone = 0
+        self._process = None
+        self._script = None
+        self._exit_file = None
+
+    def __repr__(self):
+        return f'<Job {self.job_id} rc={self.returncode}>'
+
+
+class Launcher:
+    """Base class: subclasses implement :meth:`submit` and :meth:`poll`.
+
+    ``poll_interval`` is the number of seconds :meth:`wait` sleeps between
+    polls."""
+
+    type = None
+
+    def __init__(self, poll_interval=1.0):
+        self.poll_interval = float(poll_interval)
+
+    async def submit(self, command, cwd):
+        raise NotImplementedError
+
+    async def poll(self, job):
+        """Return the job's exit status once it has finished, else ``None``."""
+        raise NotImplementedError
+
+    async def wait(self, job):
+        while True:
+            returncode = await self.poll(job)
+            if returncode is not None:
+                job.returncode = returncode
+                return returncode
+            await asyncio.sleep(self.poll_interval)
+
+    async def run(self, command, cwd):
+        """Submit ``command`` in ``cwd`` and await its exit status."""
+        job = await self.submit(command, cwd)
+        return await self.wait(job)
+
+    def run_sync(self, command, cwd):
+        """Blocking :meth:`run`, for the synchronous wrapper ``run()`` paths.
+        Safe to call with an event loop already running in this thread (a
+        Jupyter cell); see :func:`run_blocking`."""
+        return run_blocking(self.run(command, cwd))
+
+
+class LocalLauncher(Launcher):
+    """Run the command as an ``asyncio`` subprocess on this host."""
+
+    type = 'local'
+
+    async def submit(self, command, cwd):
+        job = Job(command, cwd)
+        job._process = await asyncio.create_subprocess_shell(command, cwd=cwd)
+        job.job_id = job._process.pid
+        return job
+
+    async def poll(self, job):
+        return job._process.returncode
+
+    async def wait(self, job):
+        # The child is reaped by the event loop; no need to spin on poll().
+        job.returncode = await job._process.wait()
+        return job.returncode
+
+
+class BatchLauncher(Launcher):
+    """Submit the command as a job script through ``submit`` (default
+    ``'sbatch --parsable'``) and poll for its exit-status sidecar file.
+
+    ``header`` lines (``#SBATCH`` directives, module loads) go between the
+    shebang and the command.
+
+    A job the scheduler kills (walltime, preemption, node failure,
+    ``scancel``) never writes its sidecar, so polling alone would wait
+    forever. Two guards raise ``RuntimeError`` instead:
+
+    * ``status`` is a command, formatted with ``{job_id}``, that prints
+      something while the job is queued or running. A job it reports gone on
+      two polls in a row without a sidecar has died. The default ``'auto'``
+      is ``'squeue -h -j {job_id}'`` when ``submit`` is ``sbatch`` and no
+      check otherwise; ``None`` turns it off.
+    * ``timeout`` is the most seconds to wait for a job from its submission
+      (default ``None``: no limit)."""
+
+    type = 'batch'
+
+    def __init__(self, submit='sbatch --parsable', header=None,
+                 poll_interval=30.0, status='auto', timeout=None):
+        super().__init__(poll_interval)
+        self.submit_command = submit
+        self.header = list(header or [])
+        if status == 'auto':
+            status = ('squeue -h -j {job_id}'
+                      if submit and os.path.basename(submit.split()[0]) == 'sbatch'
+                      else None)
+        self.status_command = status
+        if timeout is not None and not float(timeout) > 0:
+            raise ValueError("Key: 'launcher.timeout' must be a positive "
+                             f"number of seconds; got {timeout!r}.")
+        self.timeout = None if timeout is None else float(timeout)
+
+    def _write_script(self, job):
+        """Write ``job``'s script into its workdir; it ``cd``s there (batch
+        jobs may start elsewhere), runs the command, and writes the exit
+        status to a sidecar only after the command is done."""
+        tag = uuid.uuid4().hex[:12]
+        workdir = os.path.abspath(job.cwd)
+        job._script = os.path.join(workdir, f'lume-ace3p-job-{tag}.sh')
+        job._exit_file = os.path.join(workdir, f'lume-ace3p-job-{tag}.exit')
+        lines = ['#!/bin/bash', *self.header,
+                 f'cd {_quote(workdir)}',
+                 job.command,
+                 f'echo $? > {_quote(job._exit_file)}.tmp',
+                 f'mv {_quote(job._exit_file)}.tmp {_quote(job._exit_file)}',
+                 '']
+        with open(job._script, 'w') as f:
+            f.write('\n'.join(lines))
+        os.chmod(job._script, 0o755)
+
+    async def submit(self, command, cwd):
+        job = Job(command, cwd)
+        self._write_script(job)
+        proc = await asyncio.create_subprocess_shell(
+            f'{self.submit_command} {_quote(job._script)}', cwd=cwd,
+            stdout=asyncio.subprocess.PIPE)
+        out, _ = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"job submission '{self.submit_command}' failed "
+                               f"with exit status {proc.returncode} for "
+                               f"{job._script}.")
+        # 'sbatch --parsable' prints '<id>' or '<id>;<cluster>'.
+        text = out.decode(errors='replace').strip()
+        job.job_id = text.split(';')[0] if text else None
+        return job
+
+    async def poll(self, job):
+        returncode = _read_exit_file(job._exit_file)
+        if returncode is not None:
+            return returncode
+        self._check_timeout(job)
+        if self.status_command and job.job_id is not None:
+            if await self._in_queue(job):
+                job._gone = 0
+            else:
+                # Once more before giving up: the sidecar may land (or show
+                # up on a network filesystem) just after the job leaves.
+                job._gone += 1
+                if job._gone >= 2:
+                    raise RuntimeError(
+                        f"batch job {job.job_id} left the queue without "
+                        f"writing its exit status {job._exit_file}; it was "
+                        "probably killed (walltime, preemption, node failure "
+                        "or scancel). Its script is " + str(job._script) + '.')
+        return None
+
+    async def _in_queue(self, job):
+        """True while ``status`` prints anything for ``job``."""
+        proc = await asyncio.create_subprocess_shell(
+            self.status_command.format(job_id=job.job_id), cwd=job.cwd,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+        out, _ = await proc.communicate()
+        return proc.returncode == 0 and bool(out.strip())
+
+    def _check_timeout(self, job):
+        if (self.timeout is not None
+                and time.monotonic() - job.submitted > self.timeout):
+            raise RuntimeError(
+                f"batch job {job.job_id} has not finished within the "
+                f"launcher timeout of {self.timeout:g} s; its script is "
+                f"{job._script}.")
+
+
+class LocalSchedulerLauncher(BatchLauncher):
+    """A local stand-in for :class:`BatchLauncher`: the same job scripts,
+    queued on this host and started at most ``slots`` at a time as earlier ones
+    finish. Job ids count up from 1.
+
+    One instance may be driven from several threads at once — an ``async``
+    sweep runs the modules without a ``run_async`` of their own on worker
+    threads, each blocking in :meth:`Launcher.run_sync` on its own event loop
+    — so the queue is guarded by a lock and ``slots`` bounds them all."""
+
+    type = 'local_scheduler'
+
+    def __init__(self, slots=1, header=None, poll_interval=0.1, timeout=None):
+        super().__init__(submit=None, header=header,
+                         poll_interval=poll_interval, status=None,
+                         timeout=timeout)
+        if isinstance(slots, bool) or not isinstance(slots, int) or slots < 1:
+            raise ValueError("Key: 'launcher.slots' must be a positive "
+                             f"integer; got {slots!r}.")
+        self.slots = slots
+        self._submitted = 0
+        self._pending = []
+        self._running = []
+        self._lock = threading.Lock()
+
+    async def submit(self, command, cwd):
+        with self._lock:
+            self._submitted += 1
+            job = Job(command, cwd, job_id=self._submitted)
+        self._write_script(job)
+        with self._lock:
+            self._pending.append(job)
+        self._schedule()
+        return job
+
+    def _schedule(self):
+        """Reap finished jobs and start pending ones into free slots."""
+        with self._lock:
+            self._running = [job for job in self._running
+                             if job._process.poll() is None]
+            while self._pending and len(self._running) < self.slots:
+                job = self._pending.pop(0)
+                job._process = subprocess.Popen(['bash', job._script],
+                                                cwd=job.cwd)
+                self._running.append(job)
+
+    async def poll(self, job):
+        self._schedule()
+        if job._process is None:                # still queued
+            return None
+        returncode = _read_exit_file(job._exit_file)
+        if returncode is None and job._process.poll() is not None:
+            # The script itself died before writing its status.
+            returncode = job._process.returncode
+        if returncode is None:
+            try:
+                self._check_timeout(job)
+            except RuntimeError:
+                job._process.kill()
+                raise
+        return returncode
+
+
+def run_blocking(coro):
+    """Run ``coro`` to completion and return its result, from synchronous
+    code. Normally that is ``asyncio.run``; but ``asyncio.run`` refuses to
+    start while this thread already runs an event loop (a Jupyter kernel, or
+    a synchronous ``Workflow.evaluate`` called from a coroutine), so there the
+    coroutine gets its own loop on a worker thread, with this thread's
+    context (the :mod:`~lume_ace3p.trace` scope), and the caller blocks on
+    it."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(context.run, asyncio.run, coro).result()
+
+
+def _quote(path):
+    return "'" + str(path).replace("'", "'\\''") + "'"
+
+
+def _read_exit_file(path):
+    try:
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return None
+
+
+LAUNCHERS = {cls.type: cls for cls in (LocalLauncher, BatchLauncher,
+                                       LocalSchedulerLauncher)}
+
+
+def build_launcher(block):
+    """Build a launcher from a ``workflow_parameters.launcher`` block, or
+    return ``None`` when it is absent (commands then run with a plain blocking
+    ``subprocess.run``). A bare string is taken as the ``type``."""
+    if block is None or block is False:
+        return None
+    if isinstance(block, str):
+        block = {'type': block}
+    if not isinstance(block, dict) or block.get('type') not in LAUNCHERS:
+        raise ValueError(
+            "Key: 'launcher' must be a mapping whose 'type' is one of "
+            f"{sorted(LAUNCHERS)}; got {block!r}.")
+    options = dict(block)
+    cls = LAUNCHERS[options.pop('type')]
+    try:
+        return cls(**options)
+    except TypeError as exc:
+        raise ValueError(f"Key: 'launcher' has an option the '{cls.type}' "
+                         f"launcher does not take: {exc}.") from None
+
+
+def run_command(command, cwd, launcher=None):
+    """Run one wrapper command line to completion: through ``launcher`` when
+    one is set, else the historical blocking ``subprocess.run``. Traced as a
+    ``subprocess`` span (see :mod:`lume_ace3p.trace`).
+
+    Returns the launcher's exit status (``None`` without one). A non-zero
+    status issues a :class:`RuntimeWarning` naming the command rather than an
+    error: the wrappers go on to parse whatever the tool wrote, which is where
+    a failed solve has always surfaced."""
+    with trace.span('subprocess', 'subprocess', command=command):
+        if launcher is None:
+            subprocess.run(command, shell=True, cwd=cwd)
+            return None
+        return _check_returncode(launcher.run_sync(command, cwd), command, cwd)
+
+
+async def run_command_async(command, cwd, launcher=None):
+    """Awaitable :func:`run_command`; without a launcher the command runs as a
+    local ``asyncio`` subprocess."""
+    with trace.span('subprocess', 'subprocess', command=command):
+        returncode = await (launcher or LocalLauncher()).run(command, cwd)
+        return _check_returncode(returncode, command, cwd)
+
+
+def _check_returncode(returncode, command, cwd):
+    if returncode:
+        warnings.warn(f"command {command!r} exited with status {returncode} "
+                      f"in {cwd}.", RuntimeWarning, stacklevel=3)
+    return returncode
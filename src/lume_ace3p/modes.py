@@ -5,7 +5,11 @@ A *mode* is how a validated :class:`~lume_ace3p.workflow_graph.Workflow` is
 
 * ``single`` runs it once,
 * ``parameter_sweep`` runs it over a tensor product of the swept input axes,
+* ``adaptive_sweep`` starts from that grid and bisects where the outputs
+  change fastest,
 * ``scalar_optimize`` drives an Xopt optimization loop (Phase 4),
+* ``async_optimize`` drives the same loop steady-state, a fixed number of
+  evaluations always in flight,
 * ``gp_parameter_sweep`` drives an Xopt Bayesian-exploration loop and emits a
   GP-posterior-mean sweep (Phase 4).
 
@@ -47,6 +51,8 @@ dict ``sweep_data`` tuple-keyed structure and the hand-rolled ``tools.py``
 writers have been removed; :mod:`lume_ace3p.results` is the one and only writer.
 """
 
+import itertools
+import json
 import os
 import sys
 
@@ -54,9 +60,19 @@ import numpy as np
 import pandas as pd
 
 from lume_ace3p.results import (
-    write_table, save_field, FIELD_ARTIFACT_COLUMN,
+    write_table, replace_table, append_table_row, append_table_rows,
+    read_table, save_field, TableLog, FIELD_ARTIFACT_COLUMN,
+    REUSED_COLUMN_PREFIX, replace_file,
 )
-from lume_ace3p import surrogate_data
+from lume_ace3p import surrogate_data, trace
+from lume_ace3p.timing import (
+    TIMING_COLUMN_PREFIX, TimingTotals, timing_columns,
+)
+
+# ``lume_ace3p.workflow_graph`` (and with it ``lume.base`` and the tool
+# wrappers) is imported inside the functions that drive a workflow, like the
+# sklearn / torch / xopt imports below: the store-consuming modes never build
+# one, and importing it costs seconds.
 
 
 # Modes that consume an on-disk store / saved model rather than driving the
@@ -109,17 +125,56 @@ def run_mode(mode_cfg, workflow, output_spec=None, vocs=None, xopt=None,
 
     ``output_spec`` is accepted for API symmetry but is informational only — the
     workflow already carries its ``output_parameters`` (``workflow.output_spec``)
-    and does the extraction inside :meth:`Workflow.evaluate`."""
+    and does the extraction inside :meth:`Workflow.evaluate`.
+
+    When the workflow has an evaluation cache (``workflow_parameters.cache``)
+    or a mesh cache (``workflow_parameters.mesh_cache``), their hit/miss counts
+    are printed once the mode finishes; with ``timing: true`` so is the
+    per-module timing summary (see :mod:`lume_ace3p.timing`). With ``trace:
+    <file>`` the whole mode is a traced span around its iterations (see
+    :mod:`lume_ace3p.trace`)."""
+    name = str(mode_cfg.get('type') or mode_cfg.get('mode'))
+    try:
+        with trace.scope(getattr(workflow, 'tracer', None)), \
+                trace.span(name, 'mode'):
+            return _dispatch_mode(mode_cfg, workflow, vocs, xopt, sweep)
+    finally:
+        for attr in _CACHE_ATTRS:
+            cache = getattr(workflow, attr, None)
+            if cache is not None:
+                print(cache.summary())
+        if getattr(workflow, 'timing', False):
+            print(workflow.timing_totals.summary())
+
+
+def _dispatch_mode(mode_cfg, workflow, vocs, xopt, sweep):
+    """The body of :func:`run_mode`."""
     if mode_cfg.get('type') is None and mode_cfg.get('mode') is not None:
         _deprecation_warning(
             "the 'mode:' key inside the mode block is a legacy alias for 'type:'. "
             "Rename it to 'type:' — the 'mode' alias will be removed in a future "
             "release.")
     mode_type = str(mode_cfg.get('type') or mode_cfg.get('mode')).lower()
-    if mode_type == 'single':
-        df = single(workflow)
-    elif mode_type == 'parameter_sweep':
-        df = parameter_sweep(workflow)
+    if mode_type in ('single', 'parameter_sweep', 'adaptive_sweep'):
+        output_file, resume = _table_settings(mode_cfg, mode_type)
+        if mode_type == 'single':
+            df = single(workflow, output_file=output_file, resume=resume)
+        elif mode_type == 'adaptive_sweep':
+            df = adaptive_sweep(workflow,
+                                refine_on=mode_cfg.get('refine_on'),
+                                tolerance=mode_cfg.get('tolerance', 0.01),
+                                max_runs=mode_cfg.get('max_runs'),
+                                output_file=output_file, resume=resume)
+        else:
+            df = parameter_sweep(workflow, parallel=mode_cfg.get('parallel'),
+                                 output_file=output_file, resume=resume,
+                                 design=mode_cfg.get('design'))
+        # The streamed copy is in completion order and its columns were fixed
+        # by the first point; rewrite the finished table in tensor order,
+        # atomically, so a failed rewrite still leaves the streamed copy.
+        if output_file:
+            replace_table(df, output_file)
+        return df
     elif mode_type == 'collect_training_data':
         return collect_training_data(mode_cfg, workflow)
     elif mode_type == 'train_surrogate':
@@ -132,6 +187,10 @@ def run_mode(mode_cfg, workflow, output_spec=None, vocs=None, xopt=None,
         return scalar_optimize(
             workflow, vocs, xopt,
             log_file=mode_cfg.get('output_file') or 'sim_output.txt')
+    elif mode_type == 'async_optimize':
+        return async_optimize(
+            workflow, vocs, xopt,
+            log_file=mode_cfg.get('output_file') or 'sim_output.txt')
     elif mode_type == 'gp_parameter_sweep':
         return gp_parameter_sweep(
             workflow, sweep, vocs, xopt,
@@ -140,13 +199,18 @@ def run_mode(mode_cfg, workflow, output_spec=None, vocs=None, xopt=None,
     else:
         raise ValueError(
             f"mode '{mode_type}' is not handled by the mode layer "
-            "(single | parameter_sweep | collect_training_data | "
+            "(single | parameter_sweep | adaptive_sweep | collect_training_data | "
             "train_surrogate | invert_optimize | invert_bayesian | "
-            "scalar_optimize | gp_parameter_sweep).")
+            "scalar_optimize | async_optimize | gp_parameter_sweep).")
+
 
-    # In the table modes 'sweep_output_file:' is a legacy alias for 'output_file:'
-    # (only the Xopt gp_parameter_sweep mode above, which returned early, uses it
-    # as a distinct key for the GP posterior-mean grid).
+def _table_settings(mode_cfg, mode_type):
+    """``(output_file, resume)`` for the table modes.
+
+    In the table modes 'sweep_output_file:' is a legacy alias for
+    'output_file:' (only the Xopt gp_parameter_sweep mode uses it as a distinct
+    key, for the GP posterior-mean grid). ``resume: true`` picks up a partial
+    table, so it needs one to pick up."""
     if (mode_cfg.get('output_file') is None
             and mode_cfg.get('sweep_output_file') is not None):
         _deprecation_warning(
@@ -154,12 +218,17 @@ def run_mode(mode_cfg, workflow, output_spec=None, vocs=None, xopt=None,
             f"'{mode_type}' mode. Rename it to 'output_file:' — the "
             "'sweep_output_file' alias will be removed in a future release.")
     output_file = mode_cfg.get('output_file') or mode_cfg.get('sweep_output_file')
-    if output_file:
-        write_table(df, output_file)
-    return df
+    resume = mode_cfg.get('resume', False)
+    if not isinstance(resume, bool):
+        raise ValueError(
+            f"Key: 'resume' must be true or false; got {resume!r}.")
+    if resume and not output_file:
+        raise ValueError(
+            "Key: 'resume' needs an 'output_file' to resume from.")
+    return output_file, resume
 
 
-def single(workflow):
+def single(workflow, output_file=None, resume=False):
     """Run the workflow once and return a one-row (or, for a field-indexed
     solver, one-row-per-index) result DataFrame.
 
@@ -167,56 +236,511 @@ def single(workflow):
     columns are the scalar cubit + particles knobs; output columns are the
     extracted ``output_parameters``. When the workflow produces a structured
     field (Geant4 voxel grids, an S3P spectrum in the wide case), it is
-    persisted and referenced by a field-artifact column."""
+    persisted and referenced by a field-artifact column.
+
+    ``output_file`` / ``resume`` stream the row to disk as in
+    :func:`parameter_sweep`; resuming a table that already holds this run's
+    row returns it without evaluating."""
     scalar_inputs = {**workflow.inputs.cubit, **workflow.inputs.particles}
     input_names = list(scalar_inputs.keys())
     scalars = [scalar_inputs[name] for name in input_names]
-    outputs = workflow.evaluate(None)
-    handle = _persist_field(workflow, 0)
-    rows = _rows_for_point(workflow, input_names, scalars, outputs, handle)
-    return _frame(workflow, input_names, rows)
-
-
-def parameter_sweep(workflow):
+    table = _SweepTable(workflow, input_names, output_file, resume)
+    if table.has(scalars):
+        return _frame(workflow, input_names, table.rows(scalars),
+                      table.field_index())
+    with trace.iteration(getattr(workflow, 'tracer', None), 0):
+        result = workflow.evaluate(None)
+        handle = _persist_field(result, 0)
+    rows = _rows_for_point(workflow, input_names, scalars, result, handle)
+    table.add(rows, result.field_index)
+    return _frame(workflow, input_names, rows, result.field_index)
+
+
+def parameter_sweep(workflow, parallel=None, output_file=None, resume=False,
+                    design=None):
     """Run the workflow over the tensor product of its swept axes, one row per
     grid point (or per ``(grid-point, field-index)`` for a field-indexed
     solver). Returns the result DataFrame.
 
+    ``design`` is the mode's optional ``design:`` block choosing some other set
+    of points over the same axes — a Sobol or Latin-hypercube sample, or the
+    axes zipped element-wise (see :func:`_design_points`). The rows are then in
+    design order; everything below applies unchanged.
+
     In the wide/scalar case a per-row field-artifact handle is stored (see
     :func:`_persist_field`) when a module produces a structured field; the
     long-format (S3P) case carries no field-artifact column — its field values
-    already *are* the rows."""
+    already *are* the rows.
+
+    ``parallel`` is the mode's optional ``parallel:`` block. With
+    ``{workers: N}`` (N > 1) the grid points are farmed out to a pool of N
+    worker processes, each holding its own copy of the workflow; every point
+    then runs in its own auto-named workdir (``<workdir>_<scalar>...``) so
+    concurrent points never share files, whatever ``workdir_mode`` says. Rows
+    are reassembled in tensor order, so the frame is identical to a serial
+    run's. ``backend: async`` keeps up to N points in flight on one event loop
+    in this process instead (:meth:`Workflow.evaluate_async`) — the fit for a
+    ``launcher:`` that submits each solve to a batch queue, where the driver
+    only waits.
+
+    With ``output_file`` set, each point's rows are appended to that table (and
+    fsynced) as soon as the point finishes, so an interrupted sweep leaves a
+    table of every point it completed (see :class:`_SweepTable`). ``resume``
+    reads such a partial table back and only evaluates the grid points it does
+    not already hold; their rows are taken from the table as written."""
     axes = workflow.sweep_axes()
     input_names = [label for label, _values, _setter in axes]
-    tensor = _input_tensor(axes)
-
+    tensor = _design_points(axes, design)
+    points = [(i, tensor[i].tolist() if axes else None)
+              for i in range(tensor.shape[0])]
+
+    table = _SweepTable(workflow, input_names, output_file, resume)
+    pending = [(i, scalars) for i, scalars in points
+               if not table.has(scalars or [])]
+    if resume:
+        print(f'Resuming {output_file}: {len(points) - len(pending)} of '
+              f'{len(points)} point(s) already done.')
+
+    workers, backend = _parallel_settings(parallel)
+    if workers > 1 and len(pending) > 1 and backend == 'async':
+        results = _evaluate_points_async(workflow, input_names, pending,
+                                         workers, table.add)
+    elif workers > 1 and len(pending) > 1:
+        results = _evaluate_points_parallel(workflow, input_names, pending,
+                                            workers, table.add)
+    else:
+        results = []
+        for i, scalars in pending:
+            point_rows, index = _evaluate_point(workflow, input_names, i,
+                                                scalars)
+            table.add(point_rows, index)
+            results.append((point_rows, index))
+
+    evaluated = dict(zip((i for i, _scalars in pending), results))
     rows = []
-    for i in range(tensor.shape[0]):
-        scalars = tensor[i].tolist()
-        outputs = workflow.evaluate(scalars if axes else None)
-        handle = _persist_field(workflow, i)
-        rows.extend(_rows_for_point(workflow, input_names, scalars, outputs,
-                                    handle))
-    return _frame(workflow, input_names, rows)
+    for i, scalars in points:
+        if i in evaluated:
+            rows.extend(evaluated[i][0])
+        else:
+            rows.extend(table.rows(scalars or []))
+    index = results[-1][1] if results else table.field_index()
+    return _frame(workflow, input_names, rows, index)
+
+
+class _SweepTable:
+    """The streamed, crash-safe copy of a table mode's result table.
+
+    Each finished point's rows go to ``filename`` through
+    :func:`~lume_ace3p.results.append_table_rows` (one fsynced write per
+    point), under the column layout of the first point written. Without a
+    ``filename`` every method is a no-op, so the modes call it
+    unconditionally.
+
+    A fresh run removes any table left at ``filename``. With ``resume`` the
+    partial table is read back instead: its rows are grouped by their input
+    values, and a point counts as done when its group is complete — one row,
+    or for a field-indexed (long) table as many rows as the largest group. The
+    table is then rewritten with only the complete groups, so re-running an
+    incomplete point never duplicates its rows."""
+
+    def __init__(self, workflow, input_names, filename, resume=False):
+        self.workflow = workflow
+        self.input_names = list(input_names)
+        self.filename = filename
+        self.columns = None
+        self._done = {}
+        if not filename:
+            return
+        previous = read_table(filename) if resume else None
+        if previous is None or previous.empty:
+            if os.path.exists(filename):
+                os.remove(filename)
+            return
+        missing = [n for n in self.input_names if n not in previous.columns]
+        if missing:
+            raise ValueError(
+                f"Key: 'resume' cannot resume '{filename}': its columns do not "
+                f"include the swept input(s) {missing}.")
+        self.columns = list(previous.columns)
+        groups = {}
+        for row in previous.to_dict('records'):
+            key = self._key([row[name] for name in self.input_names])
+            groups.setdefault(key, []).append(row)
+        complete = max(len(group) for group in groups.values())
+        self._done = {key: group for key, group in groups.items()
+                      if len(group) == complete}
+        kept = [row for group in self._done.values() for row in group]
+        replace_table(pd.DataFrame(kept, columns=self.columns), filename)
+
+    @staticmethod
+    def _key(scalars):
+        """A hashable key for a point's input values that matches a value read
+        back from the table (floats written and parsed ``round_trip``)."""
+        key = []
+        for value in scalars:
+            try:
+                key.append(float(value))
+            except (TypeError, ValueError):
+                key.append(str(value))
+        return tuple(key)
+
+    def has(self, scalars):
+        return self._key(scalars) in self._done
+
+    def rows(self, scalars):
+        return [dict(row) for row in self._done[self._key(scalars)]]
+
+    def add(self, rows, index=None):
+        """Append one finished point's ``rows``; ``index`` is its field index,
+        used to lay out the columns on the first write."""
+        if not self.filename:
+            return
+        if self.columns is None:
+            self.columns = list(_frame(self.workflow, self.input_names, rows,
+                                       index).columns)
+        append_table_rows(rows, self.columns, self.filename)
+
+    def done(self):
+        """``{key: rows}`` for every point the resumed table holds, keyed by
+        the point's input values (as floats)."""
+        return {key: [dict(row) for row in rows]
+                for key, rows in self._done.items()}
+
+    def field_index(self):
+        """The ``(label, values)`` field index of a resumed long-format table
+        (its one column that is neither an input, an output, a ``reused_``
+        flag nor the field-artifact column), else ``None``."""
+        if not self._done:
+            return None
+        known = set(self.input_names) | set(self.workflow.output_spec)
+        extra = [c for c in self.columns
+                 if c not in known and c != FIELD_ARTIFACT_COLUMN
+                 and not c.startswith(REUSED_COLUMN_PREFIX)]
+        if len(extra) != 1:
+            return None
+        group = next(iter(self._done.values()))
+        return extra[0], np.asarray([row[extra[0]] for row in group])
+
+
+_PARALLEL_BACKENDS = ('process', 'async')
+
+
+def _parallel_settings(parallel):
+    """``(workers, backend)`` from a ``parallel:`` block (``None`` / absent ->
+    ``(1, 'process')``, i.e. run serially in this process)."""
+    if not parallel:
+        return 1, 'process'
+    if not isinstance(parallel, dict):
+        raise ValueError(
+            "Key: 'parallel' must be a mapping such as {workers: 4}; got "
+            f"{parallel!r}.")
+    return (_concurrency(parallel.get('workers', 1), 'parallel.workers'),
+            _backend(parallel.get('backend', 'process'), 'parallel.backend'))
+
+
+def _concurrency(workers, key):
+    """Validate a positive count (workers, samples in flight, design samples)
+    read from YAML key ``key``."""
+    if isinstance(workers, bool) or not isinstance(workers, (int, np.integer)) \
+            or workers < 1:
+        raise ValueError(
+            f"Key: '{key}' must be a positive integer; got {workers!r}.")
+    return int(workers)
+
+
+def _backend(backend, key):
+    if backend not in _PARALLEL_BACKENDS:
+        raise ValueError(
+            f"Key: '{key}' must be one of {list(_PARALLEL_BACKENDS)}; "
+            f"got {backend!r}.")
+    return backend
+
+
+def _evaluate_point(workflow, input_names, point_index, scalars):
+    """One grid point end to end: evaluate, persist the field, build the rows.
+
+    Returns ``(rows, field_index)`` — the index rides along so a caller that did
+    not run the point itself (the parallel parent) can still shape the frame.
+    Everything it needs is on ``workflow`` and the returned
+    :class:`~lume_ace3p.workflow_graph.Evaluation`, so it runs unchanged in a
+    worker process holding its own copy."""
+    with trace.iteration(getattr(workflow, 'tracer', None), point_index):
+        result = workflow.evaluate(scalars)
+        handle = _persist_field(result, point_index)
+    row_scalars = scalars if scalars is not None else []
+    rows = _rows_for_point(workflow, input_names, row_scalars, result, handle)
+    return rows, result.field_index
+
+
+# The worker process's private copy of the workflow, installed once per process
+# by _init_sweep_worker so it is pickled once per worker rather than per point.
+_WORKER_WORKFLOW = None
+
+
+def _init_sweep_worker(workflow):
+    """Pool initializer: install this worker's copy of the workflow."""
+    global _WORKER_WORKFLOW
+    # Concurrent points must not share a workdir: auto mode suffixes each one
+    # with its swept scalars.
+    workflow.workdir_mode = 'auto'
+    _WORKER_WORKFLOW = workflow
+
+
+# The workflow attributes holding a cache with hits/misses counters.
+_CACHE_ATTRS = ('cache', 'mesh_cache')
+
+
+def _cache_counts(workflow):
+    """``{attr: (hits, misses)}`` for each cache the workflow has."""
+    counts = {}
+    for attr in _CACHE_ATTRS:
+        cache = getattr(workflow, attr, None)
+        if cache is not None:
+            counts[attr] = (cache.hits, cache.misses)
+    return counts
+
+
+def _sweep_worker(input_names, point):
+    """Pool task: one ``(point_index, scalars)`` grid point. Also returns the
+    cache hits/misses and the timing totals the point added, since the
+    worker's counters die with its copy of the workflow."""
+    point_index, scalars = point
+    _WORKER_WORKFLOW.timing_totals = TimingTotals()
+    before = _cache_counts(_WORKER_WORKFLOW)
+    rows, index = _evaluate_point(_WORKER_WORKFLOW, input_names, point_index,
+                                  scalars)
+    after = _cache_counts(_WORKER_WORKFLOW)
+    delta = {attr: (after[attr][0] - hits, after[attr][1] - misses)
+             for attr, (hits, misses) in before.items()}
+    return rows, index, delta, _WORKER_WORKFLOW.timing_totals
+
+
+def _evaluate_points_parallel(workflow, input_names, points, workers,
+                              finish=None):
+    """Evaluate ``points`` on a process pool; results come back in ``points``
+    order, i.e. tensor order. ``finish(rows, field_index)`` (if given) is
+    called in this process as each point completes, in completion order."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from functools import partial
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(points)),
+                             initializer=_init_sweep_worker,
+                             initargs=(workflow,)) as pool:
+        futures = [pool.submit(partial(_sweep_worker, input_names), point)
+                   for point in points]
+        for future in as_completed(futures):
+            rows, index, delta, timing = future.result()
+            for attr, (hits, misses) in delta.items():
+                cache = getattr(workflow, attr)
+                cache.hits += hits
+                cache.misses += misses
+            workflow.timing_totals.merge(timing)
+            if finish is not None:
+                finish(rows, index)
+    return [future.result()[:2] for future in futures]
+
+
+def _evaluate_points_async(workflow, input_names, points, workers,
+                           finish=None):
+    """Evaluate ``points`` concurrently on one event loop, at most ``workers``
+    at a time, each in its own auto-named workdir. Results come back in
+    ``points`` order; ``finish(rows, field_index)`` (if given) is called as
+    each point completes."""
+    import asyncio
+
+    async def one(gate, point_index, scalars):
+        async with gate:
+            with trace.iteration(getattr(workflow, 'tracer', None),
+                                 point_index):
+                result = await workflow.evaluate_async(scalars)
+                handle = _persist_field(result, point_index)
+        rows = _rows_for_point(workflow, input_names,
+                               scalars if scalars is not None else [],
+                               result, handle)
+        if finish is not None:
+            finish(rows, result.field_index)
+        return rows, result.field_index
+
+    async def run_all():
+        gate = asyncio.Semaphore(workers)
+        return await asyncio.gather(*(one(gate, i, scalars)
+                                      for i, scalars in points))
+
+    saved_mode = workflow.workdir_mode
+    workflow.workdir_mode = 'auto'
+    try:
+        return list(asyncio.run(run_all()))
+    finally:
+        workflow.workdir_mode = saved_mode
 
 
-def _persist_field(workflow, point_index):
-    """Persist the just-run evaluation's structured field (if any) to a
-    ``.npz`` under the workflow's workdir and return the stored handle.
+def _persist_field(result, point_index):
+    """Persist an evaluation's structured field (if any) to a ``.npz`` under
+    its workdir and return the stored handle. ``result`` is the
+    :class:`~lume_ace3p.workflow_graph.Evaluation` ``workflow.evaluate``
+    returned.
 
     Returns ``None`` when there is no field (dry-run, or a solver that produces
     none) or in the long-format case — where the field values are exploded into
     the rows via :meth:`Workflow.field_index`, so storing a redundant artifact
     would be wrong. The per-point filename keeps rows distinct even in a shared
     (manual) workdir."""
-    if workflow.field_index() is not None:
+    if result.field_index is not None:
         return None
-    field = workflow.field()
+    field = result.field
     if field is None:
         return None
-    workdir = getattr(workflow, 'workdir', None) or '.'
+    workdir = result.workdir or '.'
     path = os.path.join(workdir, f'field_{point_index}.npz')
-    return save_field(field, path)
+    with result.context.measure('results', 'save_field'):
+        return save_field(field, path)
+
+
+# --------------------------------------------------------------------------- #
+# adaptive_sweep — the swept grid as a coarse start, then bisection where the
+# selected outputs are least linear. Same evaluate seam, same streamed table
+# and resume as parameter_sweep; only the choice of points differs.
+# --------------------------------------------------------------------------- #
+
+
+def adaptive_sweep(workflow, refine_on=None, tolerance=0.01, max_runs=None,
+                   output_file=None, resume=False):
+    """Sweep the swept axes adaptively and return the result DataFrame, rows
+    sorted by input value.
+
+    The tensor product of the swept arrays is the *coarse* grid and is
+    evaluated first. Refinement then works along axis lines (points that
+    differ in one input only): for every three neighbors ``a < b < c`` on a
+    line, the error of linearly interpolating ``b`` from ``a`` and ``c`` is
+    taken over the ``refine_on`` outputs (default: every ``output_parameters``
+    entry; array outputs such as an S3P spectrum contribute their largest
+    deviation), each output normalized by its spread over all points so far.
+    The interval beside ``b`` with that error — the wider of the two — is
+    bisected and the midpoint evaluated, worst first, until the largest error
+    is at most ``tolerance`` or ``max_runs`` points (default four times the
+    coarse grid) have run. Refined points therefore cluster at resonances and
+    mode crossings instead of filling the grid.
+
+    An axis needs at least three swept values to be refined along. Rows stream
+    to ``output_file`` as points finish, exactly as in
+    :func:`parameter_sweep`, and ``resume`` re-reads them: refinement is a
+    deterministic function of the points evaluated, so a resumed run picks
+    the same next midpoints an uninterrupted one would have."""
+    axes = workflow.sweep_axes()
+    if not axes:
+        raise ValueError(
+            "adaptive_sweep needs at least one swept input (an array-valued "
+            "entry in input_parameters) to refine.")
+    input_names = [label for label, _values, _setter in axes]
+    if isinstance(refine_on, str):
+        refine_on = [refine_on]
+    refine_on = list(refine_on or workflow.output_spec)
+    if not refine_on:
+        raise ValueError(
+            "Key: 'refine_on' is empty and the workflow declares no "
+            "output_parameters; adaptive_sweep needs an output to refine on.")
+    unknown = [name for name in refine_on if name not in workflow.output_spec]
+    if unknown:
+        raise ValueError(
+            f"Key: 'refine_on' names {unknown}, which are not output_parameters "
+            f"({list(workflow.output_spec)}).")
+    tolerance = float(tolerance)
+    if not tolerance > 0:
+        raise ValueError(
+            f"Key: 'tolerance' must be positive; got {tolerance!r}.")
+    coarse = _input_tensor(axes).tolist()
+    if max_runs is None:
+        max_runs = 4 * len(coarse)
+    max_runs = _concurrency(max_runs, 'max_runs')
+    if max_runs < len(coarse):
+        raise ValueError(
+            f"Key: 'max_runs' ({max_runs}) is smaller than the coarse grid of "
+            f"{len(coarse)} point(s) it refines.")
+
+    table = _SweepTable(workflow, input_names, output_file, resume)
+    evaluated = table.done()
+    index = table.field_index()
+    if resume:
+        print(f'Resuming {output_file}: {len(evaluated)} point(s) already '
+              'done.')
+
+    def run(scalars):
+        nonlocal index
+        rows, index = _evaluate_point(workflow, input_names, len(evaluated),
+                                      list(scalars))
+        table.add(rows, index)
+        evaluated[_SweepTable._key(scalars)] = rows
+
+    for scalars in coarse:
+        if not table.has(scalars):
+            run(scalars)
+    error, midpoint = _worst_interval(evaluated, refine_on, len(axes))
+    while (midpoint is not None and error > tolerance
+           and len(evaluated) < max_runs):
+        run(midpoint)
+        error, midpoint = _worst_interval(evaluated, refine_on, len(axes))
+
+    print(f'adaptive_sweep: {len(evaluated)} run(s) ({len(coarse)} coarse), '
+          f'largest interpolation error {error:.3g} (tolerance {tolerance:g}).')
+    rows = [row for key in sorted(evaluated) for row in evaluated[key]]
+    return _frame(workflow, input_names, rows, index)
+
+
+def _refine_values(rows, names):
+    """``{output: float array}`` for one point's rows (one entry per row, so a
+    field-indexed point gives its whole spectrum)."""
+    values = {}
+    for name in names:
+        try:
+            values[name] = np.array([row[name] for row in rows], dtype=float)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Key: 'refine_on' output '{name}' is not numeric, so "
+                "adaptive_sweep cannot interpolate it.") from None
+    return values
+
+
+def _worst_interval(evaluated, names, n_axes):
+    """``(error, midpoint)`` of the interval :func:`adaptive_sweep` bisects
+    next — the largest normalized interpolation error over every axis line of
+    ``evaluated`` (``{point key: rows}``) — or ``(0.0, None)`` when no line has
+    three points yet. NaN outputs (a dry run, a failed extraction) count as no
+    error."""
+    values = {key: _refine_values(rows, names)
+              for key, rows in evaluated.items()}
+    scale = {}
+    for name in names:
+        finite = np.concatenate([v[name] for v in values.values()])
+        finite = finite[np.isfinite(finite)]
+        spread = float(np.ptp(finite)) if finite.size else 0.0
+        scale[name] = spread or 1.0
+
+    best_error, best_midpoint = 0.0, None
+    for axis in range(n_axes):
+        lines = {}
+        for key in values:
+            lines.setdefault(key[:axis] + key[axis + 1:], []).append(key)
+        for line in lines.values():
+            line.sort(key=lambda key: key[axis])
+            for a, b, c in zip(line, line[1:], line[2:]):
+                t = (b[axis] - a[axis]) / (c[axis] - a[axis])
+                error = 0.0
+                for name in names:
+                    va, vb, vc = (values[k][name] for k in (a, b, c))
+                    if not va.shape == vb.shape == vc.shape:
+                        continue
+                    deviation = np.abs(vb - (va + t * (vc - va))) / scale[name]
+                    if np.isfinite(deviation).any():
+                        error = max(error, float(np.nanmax(deviation)))
+                if error <= best_error:
+                    continue
+                lo, hi = ((a, b) if b[axis] - a[axis] >= c[axis] - b[axis]
+                          else (b, c))
+                midpoint = list(lo)
+                midpoint[axis] = 0.5 * (lo[axis] + hi[axis])
+                if lo[axis] < midpoint[axis] < hi[axis]:
+                    best_error, best_midpoint = error, midpoint
+    return best_error, best_midpoint
 
 
 # --------------------------------------------------------------------------- #
@@ -288,6 +812,15 @@ def _geant4_input_path(workflow):
     return getattr(geant4[0], 'geant4_input', None)
 
 
+def _geant4_adaptive(workflow):
+    """The geant4 module's validated ``adaptive:`` settings, or ``None`` when
+    it runs the whole source (or the workflow has no geant4 module)."""
+    geant4 = [m for m in workflow.modules if m.type == 'geant4']
+    if not geant4:
+        return None
+    return getattr(geant4[0], 'adaptive', None)
+
+
 def _require_fixed_mesh(workflow):
     """Validate correctness constraint #3 on the resolved ``geant4`` module.
 
@@ -375,8 +908,24 @@ def collect_training_data(mode_cfg, workflow):
     DOE provenance. The mesh is validated up front and re-checked per sample so a
     mid-campaign mesh edit hard-fails rather than misaligning the PCA basis.
 
+    **Adaptive Geant4:** when the geant4 module has an ``adaptive:`` block, each
+    sample runs only as many source shards as its dose needs to reach the
+    target error. Its ``fidelity`` is then the primary count it ran, and a
+    ``relative_error`` column records the error reached; the manifest records
+    the ``adaptive`` settings.
+
     **Resumable:** each sample runs in its own ``<store>/sample_NNNNN`` workdir;
-    a sample whose dose grid was already persisted is skipped on re-run.
+    a sample whose dose grid was already persisted is skipped on re-run. Each
+    ``field.npz`` is written atomically, and each finished sample's row is
+    appended to the store table straight away, so an interrupted campaign
+    leaves a readable table of what it finished; the table is rewritten in
+    sample order at the end.
+
+    **Concurrent:** ``max_concurrent: N`` keeps N samples in flight — on a pool
+    of N worker processes (``backend: process``, the default) or on one event
+    loop through :meth:`Workflow.evaluate_async` (``backend: async``, for a
+    ``launcher:`` that submits each Geant4 run to a queue). The mesh check runs
+    as each sample is dispatched.
 
     Returns the training-store result :class:`pandas.DataFrame`."""
     beta_names, num_bins = _require_fixed_bin_edges(workflow)
@@ -394,61 +943,90 @@ def collect_training_data(mode_cfg, workflow):
     design = surrogate_data.sample_beta_doe(bounds, num_samples,
                                             sampler=sampler, seed=seed)
 
-    # Drive each sample in its own manual workdir. Save/restore the workflow's
-    # own workdir settings so this mutation is contained to the collection loop.
-    saved_mode, saved_base = workflow.workdir_mode, workflow.baseworkdir
-    workflow.workdir_mode = 'manual'
+    workers = _concurrency(mode_cfg.get('max_concurrent', 1), 'max_concurrent')
+    backend = _backend(mode_cfg.get('backend', 'process'), 'backend')
 
-    rows = []
+    adaptive = _geant4_adaptive(workflow)
+    error_columns = ([surrogate_data.EVENTS_COLUMN,
+                      surrogate_data.RELATIVE_ERROR_COLUMN]
+                     if adaptive is not None else [])
+
+    table = os.path.join(store, surrogate_data.TABLE_FILENAME)
+    stream_columns = (list(beta_names) + [surrogate_data.FIDELITY_COLUMN]
+                      + error_columns + [FIELD_ARTIFACT_COLUMN])
+    if os.path.exists(table):
+        # Rows are re-appended as samples finish or resume below.
+        os.remove(table)
+
+    rows = {}
     mesh_shape = None
-    try:
-        for i in range(num_samples):
-            beta_vec = design[i]
-            sample_dir = os.path.join(store, f'sample_{i:05d}')
-            field_path = os.path.join(sample_dir, 'field.npz')
-            overrides = {name: float(v)
-                         for name, v in zip(beta_names, beta_vec)}
-
-            if os.path.isfile(field_path):
-                # Resume: the dose grid for this β was already persisted.
-                handle = field_path
-            else:
-                # Constraint #3: defend against a mid-campaign edit to the
-                # geant4 input file's scoring mesh. Re-read the fingerprint
-                # before each fresh evaluation and hard-fail on drift, so a
-                # partway mesh change is caught here rather than silently
-                # misaligning the PCA basis at train time.
-                if mesh_fingerprint is not None:
-                    current = surrogate_data.read_mesh_fingerprint(
-                        _geant4_input_path(workflow))
-                    if not surrogate_data.mesh_fingerprints_match(
-                            current, mesh_fingerprint):
-                        raise ValueError(
-                            f"dose scoring mesh changed at sample {i} "
-                            f"(was {mesh_fingerprint}, now {current}); the mesh "
-                            "must stay fixed for the whole campaign "
-                            "(constraint #3).")
-                workflow.baseworkdir = sample_dir
-                workflow.evaluate(overrides)
-                handle = save_field(workflow.field(), field_path)
-
-            if handle is not None and mesh_shape is None:
-                mesh_shape = _mesh_shape(handle)
-
-            row = dict(overrides)
-            row[surrogate_data.FIDELITY_COLUMN] = (
-                float(fidelity) if fidelity is not None else np.nan)
-            if handle is not None:
-                row[FIELD_ARTIFACT_COLUMN] = handle
-            rows.append(row)
-    finally:
-        workflow.workdir_mode, workflow.baseworkdir = saved_mode, saved_base
 
-    columns = list(beta_names) + [surrogate_data.FIDELITY_COLUMN]
+    def finish(i, overrides, handle):
+        nonlocal mesh_shape
+        if handle is not None and mesh_shape is None:
+            mesh_shape = _mesh_shape(handle)
+        row = dict(overrides)
+        row[surrogate_data.FIDELITY_COLUMN] = (
+            float(fidelity) if fidelity is not None else np.nan)
+        if adaptive is not None:
+            # The primaries an adaptive Geant4 run ran go in their own column;
+            # fidelity stays the configured value.
+            convergence = _convergence(handle)
+            row[surrogate_data.EVENTS_COLUMN] = float(
+                convergence.get('events', np.nan))
+            row[surrogate_data.RELATIVE_ERROR_COLUMN] = float(
+                convergence.get('relative_error', np.nan))
+        if handle is not None:
+            row[FIELD_ARTIFACT_COLUMN] = handle
+        rows[i] = row
+        append_table_row(row, stream_columns, table)
+
+    def check_mesh(i):
+        # Constraint #3: defend against a mid-campaign edit to the geant4 input
+        # file's scoring mesh. Re-read the fingerprint before each fresh
+        # evaluation and hard-fail on drift, so a partway mesh change is caught
+        # here rather than silently misaligning the PCA basis at train time.
+        if mesh_fingerprint is None:
+            return
+        current = surrogate_data.read_mesh_fingerprint(
+            _geant4_input_path(workflow))
+        if not surrogate_data.mesh_fingerprints_match(current,
+                                                      mesh_fingerprint):
+            raise ValueError(
+                f"dose scoring mesh changed at sample {i} "
+                f"(was {mesh_fingerprint}, now {current}); the mesh "
+                "must stay fixed for the whole campaign "
+                "(constraint #3).")
+
+    pending = []
+    for i in range(num_samples):
+        sample_dir = os.path.join(store, f'sample_{i:05d}')
+        field_path = os.path.join(sample_dir, 'field.npz')
+        overrides = {name: float(v) for name, v in zip(beta_names, design[i])}
+        if os.path.isfile(field_path):
+            # Resume: the dose grid for this β was already persisted.
+            finish(i, overrides, field_path)
+        else:
+            pending.append((i, overrides, sample_dir, field_path))
+
+    if workers > 1 and len(pending) > 1 and backend == 'async':
+        _collect_samples_async(workflow, pending, workers, check_mesh, finish)
+    elif workers > 1 and len(pending) > 1:
+        _collect_samples_pool(workflow, pending, workers, check_mesh, finish)
+    else:
+        for sample in pending:
+            check_mesh(sample[0])
+            finish(sample[0], sample[1], _collect_sample(workflow, sample))
+
+    rows = [rows[i] for i in sorted(rows)]
+    columns = (list(beta_names) + [surrogate_data.FIDELITY_COLUMN]
+               + error_columns)
     if any(FIELD_ARTIFACT_COLUMN in r for r in rows):
         columns.append(FIELD_ARTIFACT_COLUMN)
     df = pd.DataFrame(rows, columns=columns)
-    write_table(df, os.path.join(store, surrogate_data.TABLE_FILENAME))
+    # Atomic: the streamed rows stay in place until the sorted table is whole,
+    # and the manifest below is only written once it is.
+    replace_table(df, table)
 
     surrogate_data.write_manifest(store, {
         'beta_names': beta_names,
@@ -459,6 +1037,7 @@ def collect_training_data(mode_cfg, workflow):
         'seed': seed,
         'bounds': [list(b) for b in bounds],
         'fidelity': fidelity,
+        'adaptive': adaptive,
         'mesh_shape': mesh_shape,
         'mesh': mesh_fingerprint,
         'dry_run': bool(workflow.dry_run),
@@ -466,10 +1045,79 @@ def collect_training_data(mode_cfg, workflow):
     return df
 
 
+def _collect_sample(workflow, sample):
+    """Evaluate one pending ``(i, overrides, sample_dir, field_path)`` sample in
+    its own workdir and persist its field; returns the field handle."""
+    i, overrides, sample_dir, field_path = sample
+    with trace.iteration(getattr(workflow, 'tracer', None), i):
+        result = workflow.evaluate(overrides, workdir=sample_dir)
+        return save_field(result.field, field_path)
+
+
+def _collect_sample_worker(sample):
+    """Pool task: :func:`_collect_sample` on this worker's workflow copy. The
+    field is saved in the worker, so only its handle crosses back."""
+    return _collect_sample(_WORKER_WORKFLOW, sample)
+
+
+def _collect_samples_pool(workflow, pending, workers, check_mesh, finish):
+    """Run ``pending`` samples on a pool of ``workers`` processes, dispatching
+    each (after its mesh check) only when a slot frees, and ``finish``-ing
+    samples in completion order."""
+    from concurrent.futures import (
+        FIRST_COMPLETED, ProcessPoolExecutor, wait,
+    )
+
+    queue = list(pending)
+    running = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(queue)),
+                             initializer=_init_sweep_worker,
+                             initargs=(workflow,)) as pool:
+        while queue or running:
+            while queue and len(running) < workers:
+                sample = queue.pop(0)
+                check_mesh(sample[0])
+                running[pool.submit(_collect_sample_worker, sample)] = sample
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                sample = running.pop(future)
+                finish(sample[0], sample[1], future.result())
+
+
+def _collect_samples_async(workflow, pending, workers, check_mesh, finish):
+    """Run ``pending`` samples on one event loop, at most ``workers`` at once,
+    ``finish``-ing each as it completes."""
+    import asyncio
+
+    async def one(gate, sample):
+        i, overrides, sample_dir, field_path = sample
+        async with gate:
+            check_mesh(i)
+            with trace.iteration(getattr(workflow, 'tracer', None), i):
+                result = await workflow.evaluate_async(overrides,
+                                                       workdir=sample_dir)
+                handle = save_field(result.field, field_path)
+        finish(i, overrides, handle)
+
+    async def run_all():
+        gate = asyncio.Semaphore(workers)
+        await asyncio.gather(*(one(gate, sample) for sample in pending))
+
+    asyncio.run(run_all())
+
+
 def _particles_params(workflow):
     return [m for m in workflow.modules if m.type == 'particles'][0].params
 
 
+def _convergence(handle):
+    """The adaptive Geant4 run's convergence record in a persisted field
+    (``{}`` when there is none, e.g. a dry run)."""
+    from lume_ace3p.results import load_field
+    field = load_field(handle, keys=('convergence',))
+    return (field or {}).get('convergence') or {}
+
+
 def _mesh_shape(handle):
     """Voxel count of a persisted dose/edep field (for the manifest), or
     ``None`` if the artifact has no grid."""
@@ -523,6 +1171,11 @@ def train_surrogate(mode_cfg, workflow=None):
     * ``n_jobs`` (default 1) — parallelize the per-coefficient GP fits over CPU
       cores via joblib (``1`` = serial, ``-1`` = all cores). Result-invariant: the
       saved model is identical regardless of ``n_jobs``.
+    * ``noise`` (default ``'auto'``) — ``'measured'`` gives each GP the samples'
+      measured Monte-Carlo variance (the store's ``dose_variance``, from the
+      Geant4 ``total(val^2)`` column); ``'fitted'`` leaves the noise to the
+      ``WhiteKernel`` alone; ``'auto'`` is ``'measured'`` when the store has the
+      variance.
 
     Returns the fitted :class:`DoseSurrogate` (the saved model)."""
     from lume_ace3p.surrogate import DoseSurrogate
@@ -547,12 +1200,13 @@ def train_surrogate(mode_cfg, workflow=None):
     dose_transform = mode_cfg.get('dose_transform', 'linear')
     floor = mode_cfg.get('floor')
     n_jobs = int(mode_cfg.get('n_jobs', 1))
+    dose_variance = _measured_noise(ts, mode_cfg.get('noise', 'auto'), store)
 
     holdout = mode_cfg.get('holdout')
     if holdout:
         _report_holdout(ts, variance, k, seed, holdout, store,
                         dose_transform=dose_transform, floor=floor,
-                        n_jobs=n_jobs)
+                        n_jobs=n_jobs, dose_variance=dose_variance)
 
     # ts.indices is the voxel order the basis columns correspond to; recording it
     # in the model lets invert_optimize align an arbitrary target dose onto the
@@ -560,16 +1214,35 @@ def train_surrogate(mode_cfg, workflow=None):
     surrogate = DoseSurrogate.fit(ts.beta, ts.dose, variance=variance, k=k,
                                   seed=seed, beta_names=ts.beta_names,
                                   dose_transform=dose_transform, floor=floor,
-                                  n_jobs=n_jobs, voxel_indices=ts.indices)
+                                  n_jobs=n_jobs, voxel_indices=ts.indices,
+                                  dose_variance=dose_variance)
     surrogate.save(model_dir)
     print(f" - trained PCA-GP surrogate: {surrogate.num_components} modes "
           f"({surrogate.kept_energy:.4f} energy, dose_transform="
-          f"{surrogate.dose_transform}) saved to {model_dir}")
+          f"{surrogate.dose_transform}, noise={surrogate.noise}) saved to "
+          f"{model_dir}")
     return surrogate
 
 
+def _measured_noise(ts, noise, store):
+    """The ``dose_variance`` train_surrogate fits with for its ``noise`` key
+    (``None`` for a fitted-only noise model)."""
+    if noise not in ('auto', 'measured', 'fitted'):
+        raise ValueError(
+            f"unknown noise '{noise}'; use 'auto', 'measured' or 'fitted'.")
+    if noise == 'fitted':
+        return None
+    if ts.dose_variance is None and noise == 'measured':
+        raise ValueError(
+            f"training store '{store}' has no measured dose variance: every "
+            "sample's dose grid needs the Geant4 total(val^2) column. Use "
+            "noise: fitted (or auto) for this store.")
+    return ts.dose_variance
+
+
 def _report_holdout(ts, variance, k, seed, holdout, store,
-                    dose_transform='linear', floor=None, n_jobs=1):
+                    dose_transform='linear', floor=None, n_jobs=1,
+                    dose_variance=None):
     """Fit on a train split and report held-out reconstruction accuracy +
     predicted-variance calibration, writing a small ``train_report.txt`` to the
     store. This validates the forward map (Phase-3 bar) before the model saved
@@ -599,7 +1272,9 @@ def _report_holdout(ts, variance, k, seed, holdout, store,
                               variance=variance, k=k, seed=seed,
                               beta_names=ts.beta_names,
                               dose_transform=dose_transform, floor=floor,
-                              n_jobs=n_jobs)
+                              n_jobs=n_jobs,
+                              dose_variance=(None if dose_variance is None
+                                             else dose_variance[train_idx]))
     # Compare in the fit space: prediction is fit-space, so transform the truth
     # with the model's own transform + fitted floor to match.
     from lume_ace3p.surrogate import _apply_transform
@@ -616,7 +1291,7 @@ def _report_holdout(ts, variance, k, seed, holdout, store,
         'relative_l2': rel_l2,
         'space': model.dose_transform,
     })
-    write_table(report, os.path.join(store, 'train_report.txt'))
+    replace_table(report, os.path.join(store, 'train_report.txt'))
     print(f" - held-out relative-L2 ({model.dose_transform} space): "
           f"mean={rel_l2.mean():.4f} max={rel_l2.max():.4f}; "
           f"mean predicted std={mean_pred_std:.4g}")
@@ -756,7 +1431,7 @@ def invert_optimize(mode_cfg, workflow=None):
     df = pd.DataFrame(rows, columns=columns)
     output_file = mode_cfg.get('output_file') or os.path.join(
         store or '.', 'inversion_result.txt')
-    write_table(df, output_file)
+    replace_table(df, output_file)
 
     best = ', '.join(f'{n}={v:.4g}' for n, v in result.beta_dict().items())
     print(f" - inverted target '{target}' against {model_dir}")
@@ -921,8 +1596,8 @@ def invert_bayesian(mode_cfg, workflow=None):
 
     output_file = mode_cfg.get('output_file') or os.path.join(
         store or '.', 'posterior_samples.txt')
-    write_table(pd.DataFrame(posterior.samples, columns=surrogate.beta_names),
-                output_file)
+    replace_table(pd.DataFrame(posterior.samples,
+                               columns=surrogate.beta_names), output_file)
 
     ident = None
     if mode_cfg.get('identifiability', True):
@@ -1060,10 +1735,25 @@ def _rows_for_point(workflow, input_names, scalars, outputs, field_handle=None):
     Long case (a module exposes a field index, e.g. S3P frequency): one row per
     index value, each output array sampled at that index — the tidy
     ``(inputs..., Frequency, S(m,n)...)`` frame the plan calls out (no
-    field-artifact column; the field values already are the rows)."""
+    field-artifact column; the field values already are the rows).
+
+    An ``incremental`` workflow's rows also carry one ``reused_<module>`` flag
+    per module, read off the evaluation's context, and a ``timing: true``
+    workflow's rows the context's ``timing_*`` figures (see
+    :func:`lume_ace3p.timing.timing_columns`)."""
+    from lume_ace3p.workflow_graph import Evaluation
     output_names = list(workflow.output_spec.keys())
     base = dict(zip(input_names, scalars))
-    index = workflow.field_index()
+    if getattr(workflow, 'incremental', False) and isinstance(outputs,
+                                                              Evaluation):
+        for name, reused in outputs.context.reused.items():
+            base[REUSED_COLUMN_PREFIX + name] = reused
+    if getattr(workflow, 'timing', False) and isinstance(outputs, Evaluation):
+        base.update(timing_columns(outputs.context.timing))
+    # An Evaluation knows its own index; a bare outputs dict falls back to the
+    # workflow's most recent run.
+    index = (outputs.field_index if isinstance(outputs, Evaluation)
+             else workflow.field_index())
     if index is None:
         row = dict(base)
         for name in output_names:
@@ -1083,18 +1773,28 @@ def _rows_for_point(workflow, input_names, scalars, outputs, field_handle=None):
     return rows
 
 
-def _frame(workflow, input_names, rows):
+def _frame(workflow, input_names, rows, index=None):
     """Assemble the ordered-column DataFrame. Column order is: swept inputs,
     then the field-index label (long case only), then outputs, then an optional
     field-artifact column — matching the left-to-right layout of the legacy
     sweep tables and appending the field reference last so it never displaces a
-    baseline column."""
+    baseline column. An incremental workflow's ``reused_<module>`` flags, then
+    a timed workflow's ``timing_*`` columns, sit between the outputs and the
+    field reference. ``index`` is the ``(label,
+    values)`` field index the rows were built against (``None`` for the wide
+    case)."""
     output_names = list(workflow.output_spec.keys())
-    index = workflow.field_index()
     columns = list(input_names)
     if index is not None:
         columns.append(index[0])
     columns += output_names
+    if getattr(workflow, 'incremental', False):
+        flags = [REUSED_COLUMN_PREFIX + module.name
+                 for module in workflow.modules]
+        columns += [flag for flag in flags if any(flag in r for r in rows)]
+    if getattr(workflow, 'timing', False):
+        columns += [name for name in dict.fromkeys(k for r in rows for k in r)
+                    if name.startswith(TIMING_COLUMN_PREFIX)]
     if index is None and any(FIELD_ARTIFACT_COLUMN in r for r in rows):
         columns.append(FIELD_ARTIFACT_COLUMN)
     return pd.DataFrame(rows, columns=columns)
@@ -1110,6 +1810,82 @@ def _input_tensor(axes):
     return np.stack([m.ravel() for m in mesh], axis=1)
 
 
+_DESIGN_TYPES = ('tensor', 'sobol', 'lhs', 'zip')
+_DESIGN_KEYS = {'type', 'num_samples', 'seed', 'bounds'}
+
+
+def _design_points(axes, design=None):
+    """The ``(N, n_axes)`` points a ``parameter_sweep`` evaluates, per its
+    ``design:`` block (a mapping, or a bare type string):
+
+    * ``tensor`` (the default, also for an absent block) — the full tensor
+      product, :func:`_input_tensor`.
+    * ``sobol`` / ``lhs`` — ``num_samples`` scattered points drawn with
+      :func:`lume_ace3p.surrogate_data.sample_beta_doe` (``seed``, default 0,
+      makes the design reproducible, so a resumed sweep redraws the same
+      points). Each axis is sampled between the min and max of its values
+      unless ``bounds: {name: [lo, hi]}`` says otherwise; only the range of a
+      swept array matters here, not its spacing.
+    * ``zip`` — the axes paired element-wise (point ``i`` takes the ``i``-th
+      value of every axis), so all swept arrays must have the same length.
+
+    The tensor product of five 5-point axes is 3125 runs; a ``sobol`` design
+    covers the same box with as many as ``num_samples`` says."""
+    if design is None:
+        return _input_tensor(axes)
+    if isinstance(design, str):
+        design = {'type': design}
+    if not isinstance(design, dict):
+        raise ValueError(
+            "Key: 'design' must be a mapping such as {type: sobol, "
+            f"num_samples: 128}}; got {design!r}.")
+    kind = str(design.get('type', 'tensor')).lower()
+    if kind not in _DESIGN_TYPES:
+        raise ValueError(f"Key: 'design.type' must be one of "
+                         f"{list(_DESIGN_TYPES)}; got {design.get('type')!r}.")
+    unknown = sorted(set(design) - _DESIGN_KEYS)
+    if unknown:
+        raise ValueError(f"Key: 'design' has unknown keys {unknown}.")
+    if kind == 'tensor' or not axes:
+        return _input_tensor(axes)
+
+    grids = [np.asarray(values, dtype=float).ravel()
+             for _label, values, _setter in axes]
+    if kind == 'zip':
+        lengths = {label: len(grid)
+                   for (label, _values, _setter), grid in zip(axes, grids)}
+        if len(set(lengths.values())) != 1:
+            raise ValueError(
+                "Key: 'design' type 'zip' pairs the swept axes element-wise, so "
+                f"they must all have the same length; got {lengths}.")
+        return np.stack(grids, axis=1)
+
+    num_samples = _concurrency(design.get('num_samples'), 'design.num_samples')
+    bounds = dict(design.get('bounds') or {})
+    labels = [label for label, _values, _setter in axes]
+    extra = [name for name in bounds if name not in labels]
+    if extra:
+        raise ValueError(
+            f"Key: 'design.bounds' has entries {extra} that are not swept "
+            f"inputs ({labels}); check for a typo.")
+    box = []
+    for label, grid in zip(labels, grids):
+        spec = bounds.get(label)
+        if spec is None:
+            box.append((float(grid.min()), float(grid.max())))
+        elif isinstance(spec, dict):
+            box.append((float(spec['min']), float(spec['max'])))
+        else:
+            box.append((float(spec[0]), float(spec[1])))
+        if box[-1][1] <= box[-1][0]:
+            raise ValueError(
+                f"Key: 'design' cannot sample swept input '{label}' over "
+                f"{list(box[-1])}: it needs lo < hi (give it more than one "
+                "value, or a 'bounds' entry).")
+    return surrogate_data.sample_beta_doe(box, num_samples, sampler=kind,
+                                          seed=int(design.get('seed', 0)))
+
+
 def _sample(value, j):
     """Sample the j-th element of a field-indexed output array; pass a scalar
     through unchanged (so a mis-declared scalar output still lands in the row
@@ -1129,12 +1905,133 @@ def _sample(value, j):
 # --------------------------------------------------------------------------- #
 
 
-def _log_xopt(filename, xopt_obj):
+def _log_xopt(log, xopt_obj):
     """Log an Xopt run's data table through the shared result writer. ``X.data``
-    is already a pandas DataFrame, so this routes straight to
-    :func:`lume_ace3p.results.write_table` — the same code path the sweep modes
-    use. Overwrites each call so the file always holds the full trajectory."""
-    write_table(xopt_obj.data, filename)
+    is already a pandas DataFrame; ``log`` is the run's
+    :class:`~lume_ace3p.results.TableLog`, which appends only the rows added
+    since the previous call (rewriting atomically when the columns change), so
+    the file always holds the full trajectory without being rewritten every
+    step. A plain filename writes the whole table once."""
+    if not isinstance(log, TableLog):
+        log = TableLog(log)
+    log.update(xopt_obj.data)
+
+
+class _XoptCheckpoint:
+    """Periodic checkpoint / resume for the Xopt loops (:func:`scalar_optimize`,
+    :func:`gp_parameter_sweep`), configured from ``xopt_parameters``:
+
+    ``checkpoint: <path>``
+        A small JSON file rewritten atomically (temp file + ``os.replace``)
+        every ``checkpoint_every`` logged steps (default 1) and once more at
+        the end. It holds the mode, the generator name, the loop counters, the
+        cost-budget spend when the data has an ``xopt_runtime`` column, and —
+        for the sequential generators (NelderMead) — the generator's own
+        serialized state. The evaluated data (``X.data``) is not copied into
+        it: the checkpoint records the run's log table (``log``, the
+        :class:`~lume_ace3p.results.TableLog` that already appends each new
+        row) and how many of its rows it covers, so a checkpoint costs the
+        same at step 1000 as at step 1.
+    ``resume_from: <path>``
+        A checkpoint written by an earlier run of the same mode and generator.
+        The previous evaluations are read back from its log table (rows
+        logged after the checkpoint are dropped) before the loop starts and
+        the counters pick up where they stopped, so a job killed at its
+        wall-clock limit spends no solver time re-running points it already
+        had. The log table must still be in place.
+
+    How the data goes back in depends on the generator. The Bayesian ones
+    rebuild their model from the data alone, so it is fed through
+    ``X.add_data``. A sequential generator carries a trajectory (the simplex)
+    that ``add_data`` would treat as foreign points and restart from, so its
+    saved state is restored and the data assigned directly; the resumed run
+    then proposes exactly the points the uninterrupted run would have."""
+
+    def __init__(self, xopt_dict, mode, log):
+        self.path = xopt_dict.get('checkpoint')
+        self.every = _concurrency(xopt_dict.get('checkpoint_every', 1),
+                                  'xopt_parameters.checkpoint_every')
+        self.resume_from = xopt_dict.get('resume_from')
+        self.mode = mode
+        self.log = log
+        self._pending = 0
+
+    def restore(self, X, counters):
+        """Load ``resume_from`` (when set) into ``X`` and return ``counters``
+        updated with the saved values. Returns ``counters`` unchanged for a
+        fresh run."""
+        if not self.resume_from:
+            return counters
+        if not os.path.isfile(self.resume_from):
+            raise ValueError(f"Key: 'xopt_parameters.resume_from' must name an "
+                             f"existing checkpoint file; got "
+                             f"{self.resume_from!r}.")
+        with open(self.resume_from) as f:
+            saved = json.load(f)
+        generator = type(X.generator).__name__
+        if (saved.get('mode'), saved.get('generator')) != (self.mode, generator):
+            raise ValueError(
+                f"Key: 'xopt_parameters.resume_from' must be a checkpoint of a "
+                f"{self.mode} run with the {generator}; {self.resume_from!r} "
+                f"is from a {saved.get('mode')} run with the "
+                f"{saved.get('generator')}.")
+        rows = saved['rows']
+        table = read_table(saved['table']) if rows else None
+        if rows and (table is None or len(table) < rows):
+            raise ValueError(
+                f"Key: 'xopt_parameters.resume_from' must be a checkpoint "
+                f"whose log table is intact; {self.resume_from!r} covers "
+                f"{rows} row(s) of {saved['table']!r}, which is missing or "
+                f"shorter.")
+        data = table.iloc[:rows] if rows else pd.DataFrame()
+        if saved.get('generator_state') is not None:
+            state = dict(saved['generator_state'], vocs=X.vocs)
+            X.generator = type(X.generator).model_validate(state)
+            X.generator.data = data.copy()
+            X.data = data
+        elif len(data):
+            X.add_data(data)
+        counters = dict(counters, **saved.get('counters', {}))
+        print(f" - Resumed {self.mode} from '{self.resume_from}': "
+              f"{len(data)} evaluation(s) reloaded.")
+        return counters
+
+    def save(self, X, counters, force=False):
+        """Write the checkpoint every ``checkpoint_every`` calls, or now when
+        ``force`` is set. A no-op without a ``checkpoint`` path."""
+        if not self.path:
+            return
+        self._pending += 1
+        if not force and self._pending < self.every:
+            return
+        self._pending = 0
+        from xopt.generators.sequential import SequentialGenerator
+
+        self.log.update(X.data)
+        data = X.data if X.data is not None else pd.DataFrame()
+        counters = dict(counters)
+        if 'xopt_runtime' in data:
+            counters['cost_spent'] = float(data['xopt_runtime'].sum())
+        generator_state = None
+        if isinstance(X.generator, SequentialGenerator):
+            generator_state = json.loads(X.generator.to_json())
+            generator_state.pop('vocs', None)
+            generator_state.pop('data', None)
+        payload = {'mode': self.mode,
+                   'generator': type(X.generator).__name__,
+                   'counters': counters,
+                   'generator_state': generator_state,
+                   'table': os.path.abspath(self.log.filename),
+                   'rows': len(data)}
+        replace_file(self.path, lambda f: json.dump(payload, f,
+                                                     default=_json_scalar))
+
+
+def _json_scalar(value):
+    """``json.dump`` fallback for the numpy scalars an Xopt data table holds."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
 
 
 def _mc_noise_guards(xopt_dict):
@@ -1231,7 +2128,7 @@ def _make_vocs(vocs_dict):
     return VOCS(**kwargs)
 
 
-def _objective_from_workflow(workflow, vocs, xopt_dict):
+def _objective_from_workflow(workflow, vocs, xopt_dict, isolate=False):
     """Return an Xopt evaluator function that drives ``workflow.evaluate`` and
     returns the VOCS output scalars, generically.
 
@@ -1239,21 +2136,43 @@ def _objective_from_workflow(workflow, vocs, xopt_dict):
     observables) out of the workflow's returned outputs — no solver-specific
     parsing. When a fidelity variable is configured (MultiFidelity), the Xopt
     fidelity axis ``s`` is renamed to the user's variable name before being
-    handed to the workflow (unchanged from the legacy driver)."""
+    handed to the workflow (unchanged from the legacy driver).
+
+    With ``isolate`` every call runs in a fresh workdir of its own,
+    ``<workdir>_candidate_<n>``, so candidates evaluated concurrently never
+    share files whatever ``workdir_mode`` says.
+
+    For a ``timing: true`` workflow the evaluation's ``timing_*`` figures are
+    returned too, so Xopt logs them beside the VOCS outputs."""
+    from lume_ace3p.workflow_graph import Evaluation
     output_names = list(vocs.output_names)
     fidelity_variable = xopt_dict.get('fidelity_variable')
+    base = getattr(workflow, 'baseworkdir', None) or 'lume-ace3p_workflow_output'
+    # next() on a count is atomic under the GIL, so pool threads draw distinct
+    # candidate numbers.
+    candidates = itertools.count()
 
     def sim_function(input_dict):
         input_dict = dict(input_dict)
         if fidelity_variable is not None and 's' in input_dict:
             input_dict[fidelity_variable] = input_dict.pop('s')
-        outputs = workflow.evaluate(input_dict)
+        n = next(candidates)
+        with trace.iteration(getattr(workflow, 'tracer', None), n):
+            if isolate:
+                outputs = workflow.evaluate(input_dict,
+                                            workdir=f'{base}_candidate_{n:05d}')
+            else:
+                outputs = workflow.evaluate(input_dict)
         missing = [n for n in output_names if n not in outputs]
         if missing:
             raise KeyError(
                 f"workflow.evaluate did not return VOCS output(s) {missing}; "
                 f"declare them in output_parameters. Got {list(outputs)}.")
-        return {n: outputs[n] for n in output_names}
+        result = {n: outputs[n] for n in output_names}
+        if getattr(workflow, 'timing', False) and isinstance(outputs,
+                                                             Evaluation):
+            result.update(timing_columns(outputs.context.timing))
+        return result
 
     return sim_function
 
@@ -1272,6 +2191,40 @@ def _tolerances(xopt_dict, targets):
     return {t: tol for t in targets}
 
 
+def _batch_settings(xopt_dict):
+    """``(n_candidates, max_workers)`` from ``xopt_parameters``: how many
+    points the generator proposes per step, and how many of them are solved
+    at once. Either defaults to the other; neither given is ``(1, 1)``, the
+    one-point-per-step loop."""
+    n_candidates = xopt_dict.get('n_candidates')
+    max_workers = xopt_dict.get('max_workers')
+    if n_candidates is None and max_workers is None:
+        return 1, 1
+    if n_candidates is not None:
+        n_candidates = _concurrency(n_candidates,
+                                    'xopt_parameters.n_candidates')
+    if max_workers is not None:
+        max_workers = _concurrency(max_workers, 'xopt_parameters.max_workers')
+    return (n_candidates or max_workers), (max_workers or n_candidates)
+
+
+def _make_evaluator(sim_function, n_candidates, max_workers):
+    """``(evaluator, pool)`` for the Xopt loop. Serially (both settings 1)
+    that is the plain ``Evaluator`` and no pool. Otherwise the evaluator asks
+    for ``n_candidates`` points per ``X.step()`` (Xopt sizes each step by
+    ``Evaluator.max_workers``) and maps them over a pool of ``max_workers``
+    threads — threads, because ``sim_function`` closes over the workflow and
+    each candidate's time is spent waiting on its solver subprocess. The
+    caller shuts the pool down."""
+    from xopt.evaluator import Evaluator
+    if n_candidates == 1 and max_workers == 1:
+        return Evaluator(function=sim_function), None
+    from concurrent.futures import ThreadPoolExecutor
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    return Evaluator(function=sim_function, executor=pool,
+                     max_workers=n_candidates), pool
+
+
 def scalar_optimize(workflow, vocs_dict, xopt_dict, log_file='sim_output.txt'):
     """Drive an Xopt scalar optimization of ``workflow`` (Phase 4).
 
@@ -1284,60 +2237,105 @@ def scalar_optimize(workflow, vocs_dict, xopt_dict, log_file='sim_output.txt'):
     Supports all six generators with their fidelity-variable rename,
     cost-function logic, and termination criteria; the objective is extracted
     generically from the workflow outputs and logged via the shared result
-    writer. Returns the :class:`xopt.Xopt` object."""
-    import torch
-    from xopt.vocs import random_inputs as vocs_random_inputs
-    from xopt.evaluator import Evaluator
-    from xopt import Xopt
-
+    writer. Returns the :class:`xopt.Xopt` object.
+
+    ``n_candidates`` / ``max_workers`` in ``xopt_dict`` batch the loop: each
+    step the generator proposes ``n_candidates`` points (a q-batch for the
+    Bayesian generators) and up to ``max_workers`` of them are solved at once,
+    each in its own workdir (see :func:`_make_evaluator`). The random seeding
+    is drawn in batches of the same size. Step counts (``num_step``,
+    ``max_iterations``) then count batches, so ``num_step: 10`` with
+    ``n_candidates: 6`` evaluates 60 points in 10 rounds. NelderMead proposes
+    one point at a time and cannot be batched.
+
+    ``checkpoint`` / ``resume_from`` in ``xopt_dict`` save the run's progress
+    and pick it up again after an interruption (see :class:`_XoptCheckpoint`):
+    the random seeding, ``num_step`` / ``max_iterations`` counters, and the
+    multi-fidelity cost spend all continue from the saved values."""
     mc_noisy = _mc_noise_guards(xopt_dict)
+    n_candidates, max_workers = _batch_settings(xopt_dict)
+    if n_candidates > 1 and xopt_dict.get('generator') == 'NelderMeadGenerator':
+        raise ValueError(
+            "Key: 'xopt_parameters.n_candidates' must be 1 for the "
+            "NelderMeadGenerator, which proposes one point at a time.")
     vocs = _make_vocs(vocs_dict)
-    targets = list(vocs.objective_names)
-    tols = _tolerances(xopt_dict, targets)
-
-    sim_function = _objective_from_workflow(workflow, vocs, xopt_dict)
+    sim_function = _objective_from_workflow(workflow, vocs, xopt_dict,
+                                            isolate=max_workers > 1)
     generator = _build_generator(vocs, vocs_dict, xopt_dict, mc_noisy)
     if generator is None:
         return None
-    evaluator = Evaluator(function=sim_function)
-    X = Xopt(evaluator=evaluator, generator=generator, vocs=vocs)
+    evaluator, pool = _make_evaluator(sim_function, n_candidates, max_workers)
+    try:
+        return _drive_scalar_optimize(vocs, generator, evaluator, xopt_dict,
+                                      log_file, n_candidates)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
-    iteration_index = 0
-    tol_achieved = False
 
-    def check_tols():
-        # All objectives must meet their tolerance for termination.
-        if not tols:
-            return False
-        achieved = True
-        for t in targets:
-            if t in tols and not (X.data[t].iloc[-1] <= tols[t]):
-                achieved = False
-        return achieved
+def _drive_scalar_optimize(vocs, generator, evaluator, xopt_dict, log_file,
+                           n_candidates=1):
+    """The :func:`scalar_optimize` loop: random seeding, then steps until the
+    configured termination criterion. Returns the :class:`xopt.Xopt` object,
+    or ``None`` for an unusable configuration."""
+    import torch
+    from xopt.vocs import random_inputs as vocs_random_inputs
+    from xopt import Xopt
+
+    targets = list(vocs.objective_names)
+    tols = _tolerances(xopt_dict, targets)
+    X = Xopt(evaluator=evaluator, generator=generator, vocs=vocs)
+    log = TableLog(log_file)
+    checkpoint = _XoptCheckpoint(xopt_dict, 'scalar_optimize', log)
+    # Loop progress, saved with each checkpoint so a resumed run skips the
+    # seeding and steps it has already done.
+    state = checkpoint.restore(X, {'random_done': 0, 'steps_done': 0,
+                                   'iteration_index': 0,
+                                   'fidelity_seeded': False})
+    if X.data is not None and len(X.data):
+        _log_xopt(log, X)
+
+    def check_tols(n_before=0):
+        # Termination once any evaluation since row ``n_before`` (a step adds
+        # n_candidates of them) meets every objective's tolerance.
+        return bool(tols) and _tolerances_met(X.data.iloc[n_before:], tols)
+
+    tol_achieved = X.data is not None and len(X.data) > 0 and check_tols()
+
+    def advance(**counts):
+        for key, n in counts.items():
+            state[key] += n
+        _log_xopt(log, X)
+        checkpoint.save(X, state)
 
     # Initial random evaluations to seed the model.
     if 'num_random' in xopt_dict:
-        for _ in range(xopt_dict['num_random']):
-            X.random_evaluate()
-            _log_xopt(log_file, X)
-            iteration_index += 1
+        remaining = xopt_dict['num_random'] - state['random_done']
+        while remaining > 0:
+            batch = min(n_candidates, remaining)
+            if n_candidates == 1:
+                X.random_evaluate()
+            else:
+                X.random_evaluate(batch)
+            advance(random_done=batch, iteration_index=batch)
+            remaining -= batch
 
     if 'num_step' in xopt_dict:
-        for _ in range(xopt_dict['num_step']):
+        while state['steps_done'] < xopt_dict['num_step']:
             X.step()
-            _log_xopt(log_file, X)
-            iteration_index += 1
+            advance(steps_done=1, iteration_index=1)
         if 'max_iterations' in xopt_dict:
-            while iteration_index < xopt_dict['max_iterations'] and not tol_achieved:
+            while (state['iteration_index'] < xopt_dict['max_iterations']
+                   and not tol_achieved):
+                n_before = len(X.data) if X.data is not None else 0
                 X.step()
-                if tols:
-                    tol_achieved = check_tols()
-                _log_xopt(log_file, X)
-                iteration_index += 1
+                tol_achieved = check_tols(n_before)
+                advance(iteration_index=1)
 
     # Cost-limited (multi-fidelity) termination: run until a cost budget or the
     # tolerance is reached. The fidelity axis ('s') + cost-function logic is
-    # generic to MultiFidelity and preserved unchanged.
+    # generic to MultiFidelity and preserved unchanged. The spend is the sum of
+    # the logged runtimes, so a resumed run counts what it already used.
     elif 'cost_budget' in xopt_dict or 'alotted_time' in xopt_dict:
         if 'cost_budget' in xopt_dict:
             cost_budget = xopt_dict.get('cost_budget')
@@ -1346,12 +2344,14 @@ def scalar_optimize(workflow, vocs_dict, xopt_dict, log_file='sim_output.txt'):
             cost_budget = float(hours) * 3600 + float(minutes) * 60 + float(seconds)
 
         num_random = xopt_dict.get('num_random', 2)
-        random_pts = vocs_random_inputs(vocs, num_random)
-        init_fidelity = np.linspace(0, 1, num_random)
-        for it in range(len(random_pts)):
-            random_pts[it]['s'] = init_fidelity[it]
-        X.evaluate_data(pd.DataFrame(random_pts))
-        _log_xopt(log_file, X)
+        if not state['fidelity_seeded']:
+            random_pts = vocs_random_inputs(vocs, num_random)
+            init_fidelity = np.linspace(0, 1, num_random)
+            for it in range(len(random_pts)):
+                random_pts[it]['s'] = init_fidelity[it]
+            X.evaluate_data(pd.DataFrame(random_pts))
+            state['fidelity_seeded'] = True
+            advance(iteration_index=num_random)
 
         cost_function = xopt_dict.get('cost_function', 'exponential')
         if cost_function.lower() == 'exponential':
@@ -1383,23 +2383,115 @@ def scalar_optimize(workflow, vocs_dict, xopt_dict, log_file='sim_output.txt'):
             print("Cost function type: '" + cost_function + "' not supported.")
             return None
 
-        iteration_index += num_random
         while X.data['xopt_runtime'].sum() < cost_budget and not tol_achieved:
+            n_before = len(X.data)
             X.step()
-            if tols:
-                tol_achieved = check_tols()
-            _log_xopt(log_file, X)
-            iteration_index += 1
+            tol_achieved = check_tols(n_before)
+            advance(iteration_index=1)
     else:
         print("No termination criteria specified for Xopt. Provide a criterion "
               "such as 'num_step', 'tolerance', or 'cost_budget' (for "
               "multi-fidelity).")
         return None
 
+    checkpoint.save(X, state, force=True)
     _save_model(X, xopt_dict)
     return X
 
 
+def async_optimize(workflow, vocs_dict, xopt_dict, log_file='sim_output.txt'):
+    """Drive an Xopt optimization of ``workflow`` steady-state: ``max_workers``
+    evaluations (default 4) are always in flight, and the moment any of them
+    finishes its result is ingested, the log is rewritten, and the generator
+    is asked for one replacement point. Nothing waits for the slowest member
+    of a batch, which is what idles workers in :func:`scalar_optimize`'s
+    batched loop when solve times vary with the mesh.
+
+    Same plumbing as :func:`scalar_optimize` — :func:`_make_vocs`,
+    :func:`_build_generator`, and :func:`_objective_from_workflow` with every
+    candidate in its own ``<workdir>_candidate_<n>`` — driven through Xopt's
+    ``AsynchronousXopt`` on a thread pool. The first ``num_random`` points
+    (default ``max_workers``) are random, then the generator takes over.
+    ``max_evaluations`` is the total budget (required); a ``tolerance`` met by
+    a completed evaluation stops new submissions, and the evaluations still in
+    flight finish and are logged. NelderMead proposes from a sequential
+    simplex and needs ``max_workers: 1``. Returns the Xopt object."""
+    from concurrent.futures import ThreadPoolExecutor
+    from xopt.evaluator import Evaluator
+    from xopt.vocs import random_inputs as vocs_random_inputs
+    from xopt import AsynchronousXopt
+
+    mc_noisy = _mc_noise_guards(xopt_dict)
+    max_workers = _concurrency(xopt_dict.get('max_workers', 4),
+                               'xopt_parameters.max_workers')
+    if max_workers > 1 and xopt_dict.get('generator') == 'NelderMeadGenerator':
+        raise ValueError(
+            "Key: 'xopt_parameters.max_workers' must be 1 for the "
+            "NelderMeadGenerator, which proposes one point at a time.")
+    if 'max_evaluations' not in xopt_dict:
+        print("No evaluation budget specified for async_optimize. Provide "
+              "'max_evaluations' in xopt_parameters.")
+        return None
+    budget = _concurrency(xopt_dict['max_evaluations'],
+                          'xopt_parameters.max_evaluations')
+    num_random = int(xopt_dict.get('num_random', max_workers))
+
+    vocs = _make_vocs(vocs_dict)
+    targets = list(vocs.objective_names)
+    tols = _tolerances(xopt_dict, targets)
+    sim_function = _objective_from_workflow(workflow, vocs, xopt_dict,
+                                            isolate=True)
+    generator = _build_generator(vocs, vocs_dict, xopt_dict, mc_noisy)
+    if generator is None:
+        return None
+
+    log = TableLog(log_file)
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        X = AsynchronousXopt(
+            evaluator=Evaluator(function=sim_function, executor=pool,
+                                max_workers=max_workers),
+            generator=generator, vocs=vocs)
+        submitted = in_flight = 0
+        stop = False
+        while True:
+            n_new = 0 if stop else min(max_workers - in_flight,
+                                       budget - submitted)
+            if n_new > 0:
+                n_random = min(n_new, max(num_random - submitted, 0))
+                points = []
+                if n_random:
+                    points.extend(vocs_random_inputs(vocs, n_random))
+                if n_new > n_random:
+                    points.extend(pd.DataFrame(
+                        X.generator.generate(n_new - n_random)
+                    ).to_dict('records'))
+                X.submit_data(pd.DataFrame(points))
+                submitted += n_new
+                in_flight += n_new
+            if in_flight == 0:
+                break
+            before = len(X.data) if X.data is not None else 0
+            in_flight = X.process_futures()
+            _log_xopt(log, X)
+            if tols and not stop:
+                stop = _tolerances_met(X.data.iloc[before:], tols)
+    finally:
+        pool.shutdown()
+
+    _save_model(X, xopt_dict)
+    return X
+
+
+def _tolerances_met(completed, tols):
+    """Whether any one of the ``completed`` evaluations (rows of ``X.data``)
+    meets every objective tolerance in ``tols``."""
+    for _index, row in completed.iterrows():
+        if all(row[t] <= tol for t, tol in tols.items()):
+            return True
+    return False
+
+
 def gp_parameter_sweep(workflow, sweep_dict, vocs_dict, xopt_dict,
                        log_file='sim_output.txt',
                        sweep_file='sweep_output.txt'):
@@ -1408,8 +2500,18 @@ def gp_parameter_sweep(workflow, sweep_dict, vocs_dict, xopt_dict,
 
     Workflow-agnostic in the same way as :func:`scalar_optimize`: the explored
     quantities are the VOCS objectives (declared 'explore'), pulled from
-    ``workflow.evaluate``. Returns the :class:`xopt.Xopt` object."""
-    import torch
+    ``workflow.evaluate``. Returns the :class:`xopt.Xopt` object.
+
+    Takes the same ``checkpoint`` / ``resume_from`` keys as
+    :func:`scalar_optimize`; a resumed run keeps its random-seed count, step
+    count and patience history, and one resumed from a converged checkpoint
+    goes straight to the posterior sweep.
+
+    The posterior grid is evaluated in batches of ``posterior_chunk_size``
+    points (default 4096) through :func:`_posterior_grid`, so a dense 2-D or
+    3-D grid takes a few batched calls rather than one call per point.
+    ``posterior_variance: true`` adds a ``<target>_variance`` column per
+    target after the means."""
     from xopt.evaluator import Evaluator
     from xopt import Xopt
     from xopt.generators.bayesian import BayesianExplorationGenerator
@@ -1432,29 +2534,36 @@ def gp_parameter_sweep(workflow, sweep_dict, vocs_dict, xopt_dict,
     sim_function = _objective_from_workflow(workflow, vocs, xopt_dict)
     evaluator = Evaluator(function=sim_function)
     X = Xopt(evaluator=evaluator, generator=generator, vocs=vocs)
+    log = TableLog(log_file)
+    checkpoint = _XoptCheckpoint(xopt_dict, 'gp_parameter_sweep', log)
+    state = checkpoint.restore(X, {'random_done': 0, 'steps': 0,
+                                   'prev_bests': [], 'converged': False})
+    if X.data is not None and len(X.data):
+        _log_xopt(log, X)
 
     num_random = xopt_dict.get('num_random', 5)
-    for _ in range(num_random):
+    while state['random_done'] < num_random:
         X.random_evaluate()
+        state['random_done'] += 1
+        checkpoint.save(X, state)
 
     improvement = xopt_dict.get('improvement_threshold', 0.01)
     patience = xopt_dict.get('patience', 5)
-    prev_bests = []
-    steps = 0
-    hit_max_steps = False
-    while not hit_max_steps:
+    prev_bests = state['prev_bests']
+    while not state['converged']:
         X.step()
-        _log_xopt(log_file, X)
-        steps += 1
-        if 'max_steps' in xopt_dict and steps > xopt_dict['max_steps']:
-            hit_max_steps = True
+        _log_xopt(log, X)
+        state['steps'] += 1
+        if 'max_steps' in xopt_dict and state['steps'] > xopt_dict['max_steps']:
+            state['converged'] = True
         current_best = sum(X.data[o].min() for o in targets) / len(targets)
-        prev_bests.append(current_best)
+        prev_bests.append(float(current_best))
         if len(prev_bests) > patience:
             old = prev_bests[-(patience + 1)]
             new = prev_bests[-1]
             if np.abs(old - new) / old < improvement:
-                break
+                state['converged'] = True
+        checkpoint.save(X, state, force=state['converged'])
 
     # GP posterior-mean sweep over the sweep_parameters tensor product.
     param_grid = {p: np.linspace(sweep_dict[p]['min'], sweep_dict[p]['max'],
@@ -1467,27 +2576,62 @@ def gp_parameter_sweep(workflow, sweep_dict, vocs_dict, xopt_dict,
     input_tensor = np.stack(_legacy_meshorder(grids), axis=1)
 
     # Build the GP posterior-mean sweep as a DataFrame (columns = swept inputs +
-    # explored targets) and write it through the shared result writer — the same
-    # code path the scalar sweep modes and the Xopt log use.
-    sweep_rows = []
-    for i in range(input_tensor.shape[0]):
-        row = {input_varname[j]: input_tensor[i][j]
-               for j in range(len(input_varname))}
-        test_points = torch.tensor(pd.DataFrame([row]).values,
-                                   dtype=torch.double)
-        posterior = X.generator.model.posterior(test_points).mean
-        # One point in -> posterior mean shape (1, n_targets); pull each target.
-        means = posterior[0]
-        for k, obj in enumerate(targets):
-            row[obj] = float(means[k])
-        sweep_rows.append(row)
-    sweep_df = pd.DataFrame(sweep_rows, columns=input_varname + targets)
-    write_table(sweep_df, sweep_file)
+    # explored targets, then the optional variances) and write it through the
+    # shared result writer — the same code path the scalar sweep modes and the
+    # Xopt log use.
+    chunk_size = _concurrency(xopt_dict.get('posterior_chunk_size', 4096),
+                              'xopt_parameters.posterior_chunk_size')
+    variance = xopt_dict.get('posterior_variance', False)
+    if not isinstance(variance, bool):
+        raise ValueError("Key: 'xopt_parameters.posterior_variance' must be "
+                         f"true or false; got {variance!r}.")
+    sweep_df = pd.DataFrame(input_tensor, columns=input_varname)
+    for name, values in _posterior_grid(X.generator.model, input_tensor,
+                                        targets, chunk_size,
+                                        variance).items():
+        sweep_df[name] = values
+    replace_table(sweep_df, sweep_file)
 
     _save_model(X, xopt_dict)
     return X
 
 
+def _posterior_grid(model, points, targets, chunk_size=4096, variance=False):
+    """Evaluate ``model``'s posterior at every row of ``points`` (an
+    ``(n_points, n_inputs)`` array), ``chunk_size`` rows per batched
+    ``posterior`` call. Returns ``{target: means}`` in ``targets`` order, then
+    ``{target + '_variance': variances}`` for each target when ``variance`` is
+    set.
+
+    One call per chunk replaces the former one call per grid point. The GP's
+    marginals do not depend on which other points share the batch, so the
+    values match the per-point ones. The chunk bounds the ``(chunk,
+    n_train)`` cross-covariance held in memory at once."""
+    import torch
+
+    means, variances = [], []
+    with torch.no_grad():
+        for start in range(0, len(points), chunk_size):
+            test_points = torch.as_tensor(points[start:start + chunk_size],
+                                          dtype=torch.double)
+            posterior = model.posterior(test_points)
+            # n points in -> mean shape (n, n_targets).
+            means.append(posterior.mean.detach().cpu().numpy()
+                         .reshape(len(test_points), -1))
+            if variance:
+                variances.append(posterior.variance.detach().cpu().numpy()
+                                 .reshape(len(test_points), -1))
+    width = len(targets)
+    means = np.concatenate(means) if means else np.empty((0, width))
+    columns = {obj: means[:, k] for k, obj in enumerate(targets)}
+    if variance:
+        variances = (np.concatenate(variances) if variances
+                     else np.empty((0, width)))
+        columns.update({f'{obj}_variance': variances[:, k]
+                        for k, obj in enumerate(targets)})
+    return columns
+
+
 def _legacy_meshorder(grids):
     """Reproduce the legacy ``run_lf_sweep`` tensor-product ordering (tile the
     running tensor, repeat the next axis) so the GP-sweep rows land in the same
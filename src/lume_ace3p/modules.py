@@ -24,9 +24,12 @@ sub-step *inside* :class:`CubitModule` and stays a per-module ``meshconvert``
 bool.
 """
 
+import asyncio
+import json
 import os
 import shutil
 import warnings
+from contextlib import contextmanager
 
 import numpy as np
 
@@ -45,6 +48,8 @@ from lume_ace3p.acdtool import (
 from lume_ace3p.geant4 import Geant4
 from lume_ace3p.particles import Particles
 from lume_ace3p.inputs import WorkflowInputs, _walk_ace3p
+from lume_ace3p.cache import mesh_key
+from lume_ace3p import timing as _timing, trace
 
 
 # --------------------------------------------------------------------------- #
@@ -104,10 +109,41 @@ class RunContext:
         consumer that **overwrites** its producer's output file in place calls the
         hook so the producer re-reads it — see :class:`AcdtoolModule` for why
         ``postprocess transwake`` needs this.
+
+    Per-run tool state lives here too, never on the module instances:
+
+    ``handles``
+        ``{module name: handle}`` — whatever a module's :meth:`Module.run` built
+        and its :meth:`Module.extract`/:meth:`Module.field` later read (the
+        parsed solver wrapper, the :class:`Acdtool` or :class:`Geant4` object,
+        the filtered particle frame). Keeping it on the context is what makes a
+        module reentrant: two evaluations in flight through the same module
+        each carry their own handle, so neither sees the other's results.
+
+    ``mesh_cache`` is the workflow's :class:`~lume_ace3p.cache.MeshCache` (or
+    ``None``); :class:`CubitModule` consults it before meshing. ``launcher`` is
+    the workflow's job launcher (:mod:`lume_ace3p.launchers`), handed to every
+    Cubit / solver / Geant4 wrapper; ``None`` keeps the blocking
+    ``subprocess.run``.
+
+    ``reused``
+        ``{module name: bool}``, filled in by the workflow as it walks the
+        chain — ``True`` for a module whose previous run was carried over
+        instead of re-running it (see ``incremental`` in
+        :class:`~lume_ace3p.workflow_graph.Workflow`), ``False`` for one that ran.
+
+    ``timing``
+        ``{module name: {phase: {metric: value}}}`` — wall time, child CPU
+        time, peak RSS and bytes read/written for each module's ``run``,
+        ``extract`` and ``field`` call, recorded by :meth:`measure` (see
+        :mod:`lume_ace3p.timing`). ``timing_totals`` is the workflow's
+        :class:`~lume_ace3p.timing.TimingTotals` that each measurement is also
+        added to, or ``None``.
     """
 
     def __init__(self, workdir, inputs=None, artifacts=None, outputs=None,
-                 dry_run=False, paths=None, stage_mode='copy'):
+                 dry_run=False, paths=None, stage_mode='copy', mesh_cache=None,
+                 launcher=None, timing_totals=None):
         self.workdir = workdir
         self.inputs = inputs if inputs is not None else WorkflowInputs()
         self.artifacts = dict(artifacts) if artifacts else {}
@@ -115,8 +151,30 @@ class RunContext:
         self.dry_run = dry_run
         self.paths = dict(paths) if paths else {}
         self.stage_mode = stage_mode
+        self.mesh_cache = mesh_cache
+        self.launcher = launcher
         self.job_names = {}
         self.reparse = {}
+        self.handles = {}
+        self.reused = {}
+        self.timing = {}
+        self.timing_totals = timing_totals
+
+    @contextmanager
+    def measure(self, name, phase):
+        """Record the body's wall time and resource use as ``phase`` of module
+        ``name`` (repeated calls accumulate), and trace it as a
+        ``<name>.<phase>`` span."""
+        record = {}
+        try:
+            with trace.span(f'{name}.{phase}', phase, module=name), \
+                    _timing.measure(record):
+                yield
+        finally:
+            _timing.accumulate(
+                self.timing.setdefault(name, {}).setdefault(phase, {}), record)
+            if self.timing_totals is not None:
+                self.timing_totals.add(name, phase, record)
 
     def ensure_workdir(self):
         if self.workdir and not os.path.exists(self.workdir):
@@ -196,7 +254,11 @@ class Module:
     """Base class for a pipeline step.
 
     Subclasses set ``type`` (registry key), ``requires`` and ``provides``
-    (artifact-kind sets), and implement :meth:`run`. :meth:`extract` pulls a
+    (artifact-kind sets), and implement :meth:`run`. ``consumes`` names the
+    :class:`WorkflowInputs` buckets (``cubit`` / ``ace3p`` / ``macro`` /
+    ``particles``) :meth:`run` reads, and ``mutates`` the artifact kinds it
+    rewrites in place; an incremental workflow uses both to decide what must
+    re-run when an input changes. :meth:`extract` pulls a
     scalar/structured quantity out of the module's own artifacts for the
     ``output_parameters`` spec; the default raises for modules with no
     extractable quantities.
@@ -205,6 +267,8 @@ class Module:
     type = None
     requires = frozenset()
     provides = frozenset()
+    consumes = frozenset()
+    mutates = frozenset()
 
     def __init__(self, config=None, name=None):
         self.config = dict(config) if config else {}
@@ -213,6 +277,23 @@ class Module:
     def run(self, ctx):
         raise NotImplementedError
 
+    async def run_async(self, ctx):
+        """Awaitable :meth:`run`, used by :meth:`Workflow.evaluate_async
+        <lume_ace3p.workflow_graph.Workflow.evaluate_async>`. The default runs
+        :meth:`run` on a worker thread so a blocking step does not stall the
+        event loop; the modules that launch tools (Cubit, the solvers, Geant4)
+        override it to await their jobs directly."""
+        await asyncio.to_thread(self.run, ctx)
+
+    def handle(self, ctx):
+        """This module's per-run handle on ``ctx`` (see
+        :attr:`RunContext.handles`), or ``None`` when it has not run there or
+        built nothing (dry-run)."""
+        return ctx.handles.get(self.name)
+
+    def _set_handle(self, ctx, handle):
+        ctx.handles[self.name] = handle
+
     def extract(self, ctx, spec):
         raise NotImplementedError(
             f"module '{self.type}' exposes no extractable quantities")
@@ -304,10 +385,16 @@ class ParticleSourceModule(Module):
 
 class CubitModule(Module):
     """Provide a ``mesh`` from a Cubit ``journal``. Runs meshconvert unless
-    ``meshconvert: false``."""
+    ``meshconvert: false``.
+
+    With a ``mesh_cache`` on the context, the parameter-merged journal is
+    looked up first: a mesh built before from the same journal text is placed
+    in the workdir with the workflow's ``stage_mode`` and Cubit/meshconvert are
+    skipped; otherwise the freshly built mesh is stored for the next point."""
 
     type = 'cubit'
     provides = frozenset({MESH})
+    consumes = frozenset({'cubit'})
 
     def __init__(self, config=None, name=None):
         super().__init__(config, name)
@@ -315,6 +402,30 @@ class CubitModule(Module):
         self.meshconvert = self.config.get('meshconvert', True)
 
     def run(self, ctx):
+        cubit = self._prepare(ctx)
+        if cubit is None:
+            return
+        plan = self._before_run(ctx, cubit)
+        if plan is not None:
+            cubit.run(mcflag=self.meshconvert)
+            self._after_run(ctx, *plan)
+        self._finish(ctx, cubit)
+
+    async def run_async(self, ctx):
+        """Await Cubit and meshconvert through ``ctx.launcher`` rather than
+        blocking a worker thread on them (see :meth:`Module.run_async`)."""
+        cubit = self._prepare(ctx)
+        if cubit is None:
+            return
+        plan = self._before_run(ctx, cubit)
+        if plan is not None:
+            await cubit.run_async(mcflag=self.meshconvert)
+            self._after_run(ctx, *plan)
+        self._finish(ctx, cubit)
+
+    def _prepare(self, ctx):
+        """Record the dry-run stand-in mesh (returning ``None``), or build the
+        Cubit wrapper with this point's journal values."""
         if self.journal is None:
             raise ValueError("cubit module requires a 'journal'.")
         if ctx.dry_run:
@@ -325,16 +436,19 @@ class CubitModule(Module):
             _append_marker(ctx, 'Dry run mode: Cubit step skipped.\n'
                                 f'Cubit journal: {self.journal}\n'
                                 f'Cubit inputs: {ctx.inputs.cubit}\n')
-            return
+            return None
         ctx.ensure_workdir()
         cubit = Cubit(self.journal, workdir=ctx.workdir,
                       ace3p_path=ctx.paths.get('ace3p', ''),
                       cubit_path=ctx.paths.get('cubit', ''),
-                      mpi_caller=ctx.paths.get('mpi', ''))
+                      mpi_caller=ctx.paths.get('mpi', ''),
+                      launcher=ctx.launcher)
         if ctx.inputs.cubit:
             cubit.set_value(ctx.inputs.cubit)
-        cubit.run(mcflag=self.meshconvert)
-        self._cubit = cubit
+        self._set_handle(ctx, cubit)
+        return cubit
+
+    def _finish(self, ctx, cubit):
         mesh = getattr(cubit, 'exportfile', None)
         if mesh is None:
             cubit.get_export()
@@ -342,6 +456,45 @@ class CubitModule(Module):
         ctx.artifacts[MESH] = (os.path.join(ctx.workdir, mesh) if mesh
                                else ctx.workdir)
 
+    def _before_run(self, ctx, cubit):
+        """Mesh through ``ctx.mesh_cache``: place a cached mesh and return
+        ``None`` (nothing to run), or clear the way for Cubit and return the
+        ``(key, files)`` :meth:`_after_run` stores once it has run. Without a
+        cache, ``(None, [])``."""
+        if ctx.mesh_cache is None:
+            return None, []
+        key = mesh_key(cubit.lines, self.meshconvert)
+        cached = ctx.mesh_cache.lookup(key)
+        if cached is not None:
+            # Leave the merged journal in the workdir as a real run would.
+            cubit.write_input()
+            for src, rel in cached:
+                dest = os.path.join(ctx.workdir, rel)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                if os.path.lexists(dest):      # a previous point's mesh
+                    os.remove(dest)
+                _link_or_copy(ctx.stage_mode, src, dest)
+            cubit.get_export()
+            return None
+        cubit.get_export()
+        mesh = getattr(cubit, 'exportfile', None)
+        files = []
+        if mesh:
+            files.append(mesh)
+            if self.meshconvert:
+                files.append(os.path.splitext(mesh)[0] + '.ncdf')
+        # A mesh linked in from the cache at an earlier point shares bytes
+        # with the entry; unlink it so Cubit writes a new file, not the entry.
+        for rel in files:
+            dest = os.path.join(ctx.workdir, rel)
+            if os.path.lexists(dest):
+                os.remove(dest)
+        return key, files
+
+    def _after_run(self, ctx, key, files):
+        if key is not None and files:
+            ctx.mesh_cache.store(key, ctx.workdir, files)
+
 
 # --------------------------------------------------------------------------- #
 # EM solvers
@@ -360,6 +513,7 @@ class _SolverModule(Module):
 
     requires = frozenset({MESH})
     provides = frozenset({EM_SOLUTION})
+    consumes = frozenset({'ace3p'})
     _wrapper = None
     _label = ''
     _artifact = EM_SOLUTION
@@ -375,13 +529,28 @@ class _SolverModule(Module):
         # solver reference documents a 'JobName' input container). Unset means
         # the per-solver default ('omega3p_results', 't3p_results', ...).
         self.results_dir = self.config.get('results_dir')
-        self._solver = None
 
     def run(self, ctx):
+        solver = self._prepare(ctx)
+        if solver is not None:
+            solver.run()
+            self._finish(ctx, solver)
+
+    async def run_async(self, ctx):
+        """Submit the solve through ``ctx.launcher`` and await it, so many
+        evaluations on one event loop keep their solves in flight together."""
+        solver = self._prepare(ctx)
+        if solver is not None:
+            await solver.run_async()
+            self._finish(ctx, solver)
+
+    def _prepare(self, ctx):
+        """Check the mesh, then either record the dry-run stand-ins (returning
+        ``None``) or build the solver wrapper with this point's ACE3P values."""
         if MESH not in ctx.artifacts:
             raise ValueError(f"module '{self.type}' requires a mesh artifact.")
         if ctx.dry_run:
-            self._solver = None
+            self._set_handle(ctx, None)
             leaves = _ace3p_leaf_pairs(ctx.inputs.ace3p)
             _append_marker(ctx, f'Dry run mode: {self._label} step skipped.\n'
                                 f'Cubit: {ctx.inputs.cubit}\n'
@@ -392,7 +561,7 @@ class _SolverModule(Module):
             # builds its command line from this.
             ctx.job_names[self._artifact] = (self.results_dir
                                              or self._wrapper.default_job_name)
-            return
+            return None
         ctx.ensure_workdir()
         solver = self._wrapper(self.input_file,
                                ace3p_tasks=self.tasks,
@@ -401,10 +570,14 @@ class _SolverModule(Module):
                                results_dir=self.results_dir,
                                workdir=ctx.workdir,
                                ace3p_path=ctx.paths.get('ace3p', ''),
-                               mpi_caller=ctx.paths.get('mpi', ''))
+                               mpi_caller=ctx.paths.get('mpi', ''),
+                               launcher=ctx.launcher)
         solver.set_value(ctx.inputs.ace3p)
-        solver.run()
-        self._solver = solver
+        return solver
+
+    def _finish(self, ctx, solver):
+        """Record the parsed solver and its artifact once the solve is done."""
+        self._set_handle(ctx, solver)
         ctx.artifacts[self._artifact] = ctx.workdir
         ctx.job_names[self._artifact] = solver.job_name()
         # Let a consumer that rewrites this solver's output in place ask for a
@@ -444,7 +617,7 @@ class Omega3PModule(_SolverModule):
           * a mapping ``{'quantity': 'Frequency', 'at': {'mode': 0}}`` — the
             scalar for one mode (the same ``at:`` narrowing S3P and T3P use).
         """
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None:
             # Dry-run / no solver. A scalar NaN, not S3P's ``array([nan])``:
             # Omega3P has no dry-run index axis (see :meth:`field_index`), so
@@ -497,7 +670,7 @@ class Omega3PModule(_SolverModule):
         known to exist before the run, while Omega3P's mode count is a *result*
         of the eigensolve. Emitting a sentinel axis would also silently reshape
         the existing wide ``omega3p -> acdtool`` sweep tables under dry-run."""
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None or not solver.output_data.get('Modes'):
             return None
         return 'ModeID', np.asarray(solver.output_data['ModeID'])
@@ -510,7 +683,7 @@ class Omega3PModule(_SolverModule):
         Drops ``'Modes'`` — the readable list of per-mode dicts cannot ride
         inside a field-artifact ``.npz`` without pickling, and it carries no
         information the arrays do not."""
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None or not solver.output_data.get('Modes'):
             return None
         return {key: value for key, value in solver.output_data.items()
@@ -540,7 +713,7 @@ class S3PModule(_SolverModule):
         The port mode profiles and the ``IndexMap`` are *not* extractable: they
         are not indexed by frequency, so they come back through :meth:`field`.
         """
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None:
             # Dry-run / no solver: mirror the legacy evaluate NaN sentinel.
             return np.array([float('nan')])
@@ -585,7 +758,7 @@ class S3PModule(_SolverModule):
         ``('Frequency', array)``; under dry-run (no solver) return a single-row
         ``[0.0]`` sentinel so a swept long-format table still has one row per
         grid point."""
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None:
             return 'Frequency', np.array([0.0])
         return 'Frequency', np.asarray(solver.output_data['Frequency'])
@@ -606,7 +779,7 @@ class S3PModule(_SolverModule):
         decision 4 of ``plans/acdtool_rework_plan.md``). They survive
         :func:`lume_ace3p.results.save_field` as nested dicts, the way
         ``IndexMap`` already does."""
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None:
             return None
         return dict(solver.output_data)
@@ -699,7 +872,7 @@ class T3PModule(_SolverModule):
         :meth:`field_index` chose, because an off-axis array cannot be a column of
         a table indexed on the other.
         """
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None:
             # Dry-run / no solver: same NaN sentinel S3PModule returns.
             return np.array([float('nan')])
@@ -905,7 +1078,7 @@ class T3PModule(_SolverModule):
         :meth:`S3PModule.field_index`. Its *label* comes from the input file (see
         :meth:`_dry_run_axis`), so a dry run of a wake-less workflow reports ``t``
         rather than an ``s`` it will never have."""
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None:
             return self._dry_run_axis(), np.array([0.0])
         return self._field_axis(solver)
@@ -922,7 +1095,7 @@ class T3PModule(_SolverModule):
         that is *not* on the chosen index axis lives: a ``Point`` monitor's
         thousands of timesteps cannot be columns of an ``s``-indexed table, but
         they are not discarded either."""
-        solver = self._solver
+        solver = self.handle(ctx)
         if solver is None or not solver.output_data:
             return None
         return dict(solver.output_data)
@@ -1092,7 +1265,8 @@ class AcdtoolModule(Module):
         self.command, self.spec = self._resolve_command()
         self.requires = (frozenset({self.spec.requires}) if self.spec.requires
                          else frozenset())
-        self._acdtool = None
+        self.mutates = (frozenset({self.spec.mutates}) if self.spec.mutates
+                        else frozenset())
         # Deprecated positional output specs already warned about, so a sweep of
         # N points warns once per spec rather than N times.
         self._warned = set()
@@ -1146,7 +1320,7 @@ class AcdtoolModule(Module):
                              f"{required} artifact.")
         jobname = self._resolve_jobname(ctx)
         if ctx.dry_run:
-            self._acdtool = None
+            self._set_handle(ctx, None)
             marker = ('Dry run mode: Acdtool step skipped.\n'
                       f'Acdtool command: {self.command}\n'
                       f'Acdtool input: {self.input_file}\n')
@@ -1168,7 +1342,7 @@ class AcdtoolModule(Module):
                           ace3p_path=ctx.paths.get('ace3p', ''),
                           mpi_caller=ctx.paths.get('mpi', ''))
         acdtool.run()
-        self._acdtool = acdtool
+        self._set_handle(ctx, acdtool)
         ctx.artifacts[RF_POST] = ctx.workdir
         # This command rewrote its producer's output in place; have the producer
         # re-read it so downstream extraction sees the new result, not the one
@@ -1245,13 +1419,14 @@ class AcdtoolModule(Module):
                 'indexable rfpost.out section: a curve is a per-position array '
                 'and a field map a grid, so both ride as a field artifact '
                 'through field() rather than as a result-table column.')
-        if self._acdtool is None:
+        acdtool = self.handle(ctx)
+        if acdtool is None:
             return float('nan')
-        data = self._acdtool.output_data
+        data = acdtool.output_data
         if section not in data:
             raise ValueError(
                 "acdtool reported no '" + section + "' section. Sections read "
-                'from ' + str(self._acdtool.output_file) + ': '
+                'from ' + str(acdtool.output_file) + ': '
                 + str(sorted(data)) + ". A block is reported only when its "
                 ".rfpost input sets 'ionoff = 1'.")
         values = data[section]
@@ -1348,9 +1523,10 @@ class AcdtoolModule(Module):
         for the reason :meth:`Omega3PModule.field_index` records: the mode count
         is a *result* of the solve rather than something the input declares, and a
         sentinel would reshape the existing dry-run sweep tables."""
-        if self._acdtool is None:
+        acdtool = self.handle(ctx)
+        if acdtool is None:
             return None
-        ids = table_mode_ids(self._acdtool.output_data)
+        ids = table_mode_ids(acdtool.output_data)
         if not ids:
             return None
         return 'ModeID', np.asarray(ids)
@@ -1381,10 +1557,11 @@ class AcdtoolModule(Module):
         pre-existing one-field-per-workflow limitation of the framework, not a
         property of these outputs.
         """
-        if self._acdtool is None:
+        acdtool = self.handle(ctx)
+        if acdtool is None:
             return None
-        field = dict(field_sections(self._acdtool.output_data))
-        field.update(mode_table_arrays(self._acdtool.output_data))
+        field = dict(field_sections(acdtool.output_data))
+        field.update(mode_table_arrays(acdtool.output_data))
         return field or None
 
 
@@ -1404,13 +1581,14 @@ class ParticlesModule(Module):
     type = 'particles'
     requires = frozenset({TRACK3P_PARTICLES})
     provides = frozenset({PARTICLE_SOURCE})
+    # β may still be declared under cubit by legacy configs (_resolve_beta).
+    consumes = frozenset({'particles', 'cubit'})
 
     def __init__(self, config=None, name=None):
         super().__init__(config, name)
         self.params = dict(self.config)
         self.output_file = self.params.pop('output', None) \
             or self.params.pop('particle_output', None)
-        self._filtered = None
 
     def _resolve_beta(self, inputs):
         """Return the particle params for this run. When ``beta_input``
@@ -1463,7 +1641,7 @@ class ParticlesModule(Module):
         params.setdefault('output_format', 'geant4')
         particles = Particles(base, params, output_file=self.output_file,
                               workdir=ctx.workdir)
-        self._filtered = particles.run()
+        self._set_handle(ctx, particles.run())
         ctx.artifacts[PARTICLE_SOURCE] = os.path.join(ctx.workdir,
                                                       particles.output_file)
 
@@ -1478,12 +1656,13 @@ class ParticlesModule(Module):
             spec = spec.get('quantity')
         if isinstance(spec, list):
             spec = spec[0]
-        if self._filtered is None:
+        filtered = self.handle(ctx)
+        if filtered is None:
             return float('nan')
         if spec == 'count':
-            return int(len(self._filtered))
+            return int(len(filtered))
         if spec == 'total_weight':
-            return float(self._filtered['ParticleWeight'].sum())
+            return float(filtered['ParticleWeight'].sum())
         raise ValueError("Unknown particles quantity '" + str(spec) + "'.")
 
 
@@ -1492,14 +1671,87 @@ class ParticlesModule(Module):
 # --------------------------------------------------------------------------- #
 
 
+# ``adaptive:`` keys of a geant4 module and their defaults (``None``: required;
+# ``max_shards`` defaults to ``shards``).
+_ADAPTIVE_DEFAULTS = {'target_error': None, 'shards': 10, 'max_shards': None,
+                      'section': 'dose', 'threshold': 0.1, 'seed': 0}
+
+
+def _adaptive_config(block):
+    """Validate a geant4 module's ``adaptive:`` mapping and fill its defaults.
+    Returns ``None`` when the block is absent."""
+    if block is None or block is False:
+        return None
+    if not isinstance(block, dict):
+        raise ValueError("Key: 'adaptive' must be a mapping with a "
+                         "'target_error'; got " + repr(block) + '.')
+    unknown = sorted(set(block) - set(_ADAPTIVE_DEFAULTS))
+    if unknown:
+        raise ValueError(f"Key: 'adaptive' has unknown keys {unknown}; "
+                         f"expected {sorted(_ADAPTIVE_DEFAULTS)}.")
+    config = dict(_ADAPTIVE_DEFAULTS, **block)
+    try:
+        target = float(config['target_error'])
+    except (TypeError, ValueError):
+        target = float('nan')
+    if not target > 0:
+        raise ValueError("Key: 'adaptive.target_error' must be a positive "
+                         "relative error (e.g. 0.05); got "
+                         + repr(config['target_error']) + '.')
+    shards = config['shards']
+    max_shards = shards if config['max_shards'] is None else config['max_shards']
+    for key, value in (('shards', shards), ('max_shards', max_shards),
+                       ('seed', config['seed'])):
+        if isinstance(value, bool) or not isinstance(value, int) or value < (
+                0 if key == 'seed' else 1):
+            raise ValueError(f"Key: 'adaptive.{key}' must be a "
+                             + ('non-negative' if key == 'seed' else 'positive')
+                             + f" integer; got {value!r}.")
+    if max_shards > shards:
+        raise ValueError(f"Key: 'adaptive.max_shards' ({max_shards}) cannot "
+                         f"exceed 'shards' ({shards}): the source is only "
+                         f"split {shards} ways.")
+    if config['section'] not in ('dose', 'edep'):
+        raise ValueError("Key: 'adaptive.section' must be 'dose' or 'edep'; "
+                         "got " + repr(config['section']) + '.')
+    threshold = float(config['threshold'])
+    if not 0 <= threshold <= 1:
+        raise ValueError("Key: 'adaptive.threshold' must be a fraction of the "
+                         f"peak in [0, 1]; got {threshold!r}.")
+    config.update(target_error=target, max_shards=max_shards,
+                  threshold=threshold)
+    return config
+
+
+def _read_source_rows(path):
+    """The primary rows of a Geant4 source file, verbatim, and their weights
+    (the ``n_electrons`` column, or 1 for a row without one)."""
+    with open(path) as f:
+        rows = [line if line.endswith('\n') else line + '\n'
+                for line in f if line.strip() and not line.startswith('#')]
+    weights = np.ones(len(rows))
+    for i, row in enumerate(rows):
+        parts = row.split()
+        if len(parts) > 5:
+            weights[i] = float(parts[5])
+    return rows, weights
+
+
 class Geant4Module(Module):
     """Requires a ``particle_source``, provides ``dose_grid`` / ``edep_grid``.
 
-    Owns ``_geometry_files``, ``_output_files`` and ``_read_scoring_output``."""
+    Owns ``_geometry_files``, ``_output_files`` and ``_read_scoring_output``.
+
+    With ``geant4_shards: N`` the particle source is split into N row shards
+    run as N concurrent Geant4 processes, and their grids are summed into the
+    output files a single run would write (:meth:`_run_shards`). With an
+    ``adaptive:`` block the source is run in shards until the scored grid's
+    relative error reaches ``target_error`` (:meth:`_run_adaptive`)."""
 
     type = 'geant4'
     requires = frozenset({PARTICLE_SOURCE})
     provides = frozenset({DOSE_GRID, EDEP_GRID})
+    consumes = frozenset({'macro'})
 
     def __init__(self, config=None, name=None):
         super().__init__(config, name)
@@ -1514,9 +1766,47 @@ class Geant4Module(Module):
         self.geant4_dose_output = (self.config.get('geant4_dose_output')
                                    or self.config.get('geant4_scoring_output'))
         self.geant4_edep_output = self.config.get('geant4_edep_output')
-        self.geant4_obj = None
+        self.geant4_shards = self.config.get('geant4_shards', 1)
+        if (isinstance(self.geant4_shards, bool)
+                or not isinstance(self.geant4_shards, int)
+                or self.geant4_shards < 1):
+            raise ValueError("Key: 'geant4_shards' must be a positive integer "
+                             f"(Geant4 processes per run); got "
+                             f"{self.geant4_shards!r}.")
+        self.adaptive = _adaptive_config(self.config.get('adaptive'))
+
+    # Written beside the scoring files by an adaptive run; read back by field().
+    CONVERGENCE_FILENAME = 'geant4_convergence.json'
 
     def run(self, ctx):
+        plan = self._prepare(ctx)
+        if plan is None:
+            return
+        if self.adaptive is not None or self.geant4_shards > 1:
+            from lume_ace3p.launchers import run_blocking
+            # Not asyncio.run: that refuses to start from a thread already
+            # running a loop (a Jupyter cell calling Workflow.evaluate).
+            run_blocking(self._run_sharded(ctx, *plan))
+        else:
+            plan[0].run()
+        self._record_grid_artifacts(ctx)
+
+    async def run_async(self, ctx):
+        """Await the Geant4 process(es) through ``ctx.launcher`` rather than
+        blocking a worker thread on them (see :meth:`Module.run_async`)."""
+        plan = self._prepare(ctx)
+        if plan is None:
+            return
+        if self.adaptive is not None or self.geant4_shards > 1:
+            await self._run_sharded(ctx, *plan)
+        else:
+            await plan[0].run_async()
+        self._record_grid_artifacts(ctx)
+
+    def _prepare(self, ctx):
+        """Build the Geant4 wrapper and stage its geometry files. Under
+        dry-run, record the marker and grid artifacts and return ``None``;
+        otherwise return ``(geant4_obj, particle_file_path, geom_files)``."""
         if PARTICLE_SOURCE not in ctx.artifacts:
             raise ValueError("module 'geant4' requires a particle_source "
                              "artifact.")
@@ -1526,25 +1816,26 @@ class Geant4Module(Module):
 
         # Build the Geant4 object first so we can read the input file's own
         # settings (STL geometry names, output filenames) before copying files.
-        self.geant4_obj = None
+        geant4_obj = None
         if self.geant4_input is not None:
-            self.geant4_obj = Geant4(self.geant4_input,
-                                     geant4_threads=self.geant4_threads or 1,
-                                     geant4_opts=self.geant4_opts,
-                                     workdir=ctx.workdir,
-                                     mpi_caller=ctx.paths.get('mpi', ''),
-                                     geant4_app_path=ctx.paths.get('geant4_app_path', ''),
-                                     geant4_app_exe=ctx.paths.get('geant4_app_exe', ''))
+            geant4_obj = Geant4(self.geant4_input,
+                                geant4_threads=self.geant4_threads or 1,
+                                geant4_opts=self.geant4_opts,
+                                workdir=ctx.workdir,
+                                mpi_caller=ctx.paths.get('mpi', ''),
+                                geant4_app_path=ctx.paths.get('geant4_app_path', ''),
+                                geant4_app_exe=ctx.paths.get('geant4_app_exe', ''),
+                                launcher=ctx.launcher)
             # Threads default is owned by the input file; only override when set.
             if self.geant4_threads is not None:
-                self.geant4_obj.set_value({'nthreads': self.geant4_threads})
+                geant4_obj.set_value({'nthreads': self.geant4_threads})
             else:
                 # 'geant4_threads' drives the srun '-c' (CPUs reserved for the
                 # step); when it is unset srun reserves only 1 CPU, but Geant4
                 # still spawns the input file's 'nthreads' threads. If those
                 # threads exceed the reserved CPU they contend for one core and
                 # the run is slow. Warn when the two disagree.
-                file_nthreads = self.geant4_obj.get_value('nthreads')
+                file_nthreads = geant4_obj.get_value('nthreads')
                 try:
                     file_nthreads = int(file_nthreads)
                 except (TypeError, ValueError):
@@ -1562,16 +1853,17 @@ class Geant4Module(Module):
                           "CPU. Set 'geant4_threads' in the geant4 module to "
                           "match 'nthreads'.")
             if particle_file_path is not None:
-                self.geant4_obj.set_particle_file(
+                geant4_obj.set_particle_file(
                     particle_file_path,
                     macro_value=os.path.basename(particle_file_path),
                     particle_cmd=self.geant4_particle_cmd)
             if macro_inputs:
-                self.geant4_obj.set_value(macro_inputs)
+                geant4_obj.set_value(macro_inputs)
+        self._set_handle(ctx, geant4_obj)
 
         # Geometry files: union of any '*_stl' values named in the input file
         # and the explicit geant4_geometry_files list, de-duplicated by basename.
-        geom_files = self._geometry_files()
+        geom_files = self._geometry_files(geant4_obj)
         for geom in geom_files:
             _stage_file(ctx, geom)
 
@@ -1580,26 +1872,188 @@ class Geant4Module(Module):
                                 f'Input file: {self.geant4_input}\n'
                                 f'Particle file: {particle_file_path}\n'
                                 f'Geometry files: {geom_files}\n'
-                                f'Output files: {self._output_files()}\n'
+                                f'Output files: {self._output_files(geant4_obj)}\n'
                                 f'Threads: {self.geant4_threads}\n'
                                 f'Particles: {ctx.inputs.particles}\n'
                                 f'Input overrides: {macro_inputs}\n')
-            if self.geant4_obj is not None:
-                self.geant4_obj.write_input()
+            if geant4_obj is not None:
+                geant4_obj.write_input()
             self._record_grid_artifacts(ctx)
-            return
+            return None
 
-        self.geant4_obj.run()
-        self._record_grid_artifacts(ctx)
+        convergence = os.path.join(ctx.workdir, self.CONVERGENCE_FILENAME)
+        if os.path.exists(convergence):
+            os.remove(convergence)
+        return geant4_obj, particle_file_path, geom_files
+
+    async def _run_sharded(self, ctx, geant4_obj, particle_file_path,
+                           geom_files):
+        """The ``geant4_shards`` / ``adaptive`` run of the whole source."""
+        rows = None
+        if particle_file_path is not None:
+            rows, weights = _read_source_rows(particle_file_path)
+        if not rows:
+            await geant4_obj.run_async()
+            return
+        geant4_obj.write_input()
+        if self.adaptive is not None:
+            await self._run_adaptive(ctx, geant4_obj, particle_file_path, rows,
+                                     weights, geom_files)
+        else:
+            grids = await self._run_shards(
+                ctx, geant4_obj, particle_file_path, geom_files,
+                [[rows[i] for i in block] for block in np.array_split(
+                    np.arange(len(rows)), self.geant4_shards)])
+            self._write_grids(ctx, geant4_obj, grids)
+
+    async def _run_shards(self, ctx, geant4_obj, particle_file_path,
+                          geom_files, shards):
+        """Run Geant4 once per list of source rows in ``shards``, all at once,
+        and return the summed ``{section: grid}``.
+
+        Each shard runs in its own ``shard_NNN`` subdirectory of the workdir,
+        holding the input file, links to the geometry files (per
+        ``stage_mode``) and the shard's rows under the source's name, so the
+        input file needs no change. The command lines go through
+        ``ctx.launcher`` like a single run's: a ``batch`` launcher submits one
+        job per shard, so a sample can span nodes. Each shard's dose and edep
+        grids are read and summed voxel by voxel
+        (:func:`~lume_ace3p.surrogate_data.merge_dose_grids`), and the
+        subdirectories are removed. A shard that wrote no grid raises
+        ``RuntimeError`` and keeps its subdirectory for inspection."""
+        from lume_ace3p.launchers import run_command_async
+        from lume_ace3p.surrogate_data import merge_dose_grids, read_dose_file
+        shards = [rows for rows in shards if rows]
+        command = geant4_obj.geant4_command()
+        source = os.path.basename(particle_file_path)
+        subdirs = []
+        for k, rows in enumerate(shards):
+            subdir = os.path.join(ctx.workdir, f'shard_{k:03d}')
+            if os.path.isdir(subdir):
+                shutil.rmtree(subdir)
+            os.makedirs(subdir)
+            with open(os.path.join(subdir, geant4_obj.input_file), 'w') as f:
+                f.writelines(geant4_obj.lines)
+            with open(os.path.join(subdir, source), 'w') as f:
+                f.writelines(rows)
+            for geom in geom_files:
+                _link_or_copy(ctx.stage_mode,
+                              os.path.join(ctx.workdir, os.path.basename(geom)),
+                              os.path.join(subdir, os.path.basename(geom)))
+            subdirs.append(subdir)
+
+        await asyncio.gather(*(run_command_async(command, subdir,
+                                                 ctx.launcher)
+                               for subdir in subdirs))
+
+        files = self._output_files(geant4_obj)
+        grids = {}
+        for section, filename in files.items():
+            if not filename:
+                continue
+            parts = []
+            for k, subdir in enumerate(subdirs):
+                grid = read_dose_file(os.path.join(subdir, filename),
+                                      cache=False)
+                if grid is None:
+                    raise RuntimeError(
+                        f"Geant4 shard {k + 1}/{len(subdirs)} wrote no "
+                        f"'{filename}'; see the run in {subdir}.")
+                parts.append(grid)
+            grids[section] = merge_dose_grids(parts)
+        for subdir in subdirs:
+            shutil.rmtree(subdir)
+        return grids
+
+    def _write_grids(self, ctx, geant4_obj, grids):
+        """Write merged ``{section: grid}`` over the workdir's output files,
+        where a single run would have left them."""
+        from lume_ace3p.surrogate_data import write_dose_file
+        files = self._output_files(geant4_obj)
+        for section, grid in grids.items():
+            write_dose_file(os.path.join(ctx.workdir, files[section]), grid)
+
+    async def _run_adaptive(self, ctx, geant4_obj, particle_file_path, rows,
+                            weights, geom_files):
+        """Run the particle source in shards until the scored grid converges.
+
+        The source ``rows`` are shuffled (``seed``) and split into ``shards``
+        row shards. Each shard is one round of :meth:`_run_shards`, itself
+        split ``geant4_shards`` ways; its dose and edep grids are summed voxel
+        by voxel into the running totals. After each shard the relative error
+        of the ``section`` grid over its voxels of interest
+        (:func:`~lume_ace3p.surrogate_data.scoring_relative_error`) is
+        compared with ``target_error``; the loop stops once it is met or
+        ``max_shards`` have run. The scorer must write the ``total(val^2)``
+        column, which the error is computed from.
+
+        A source row stands for its ``weights`` (``n_electrons``) primaries,
+        so the event count the error is computed with is the summed weight of
+        the rows run, not their number; it is the scorer's ``entry`` count.
+        The totals cover only those primaries, so they are scaled by the
+        ratio of the whole source's weight to theirs (``sum_sq`` by its
+        square) and written over the output files. A converged sample thus
+        scores the same dose as a full run, within its error. The primaries
+        and rows run, the error reached and the scale go into
+        :attr:`CONVERGENCE_FILENAME`, which :meth:`field` carries along."""
+        from lume_ace3p.surrogate_data import (
+            merge_dose_grids, scoring_relative_error)
+        cfg = self.adaptive
+        order = np.random.default_rng(cfg['seed']).permutation(len(rows))
+        shards = [s for s in np.array_split(order, cfg['shards']) if len(s)]
+        totals, used, events, error = {}, [], 0.0, float('inf')
+        for count, shard in enumerate(shards[:cfg['max_shards']], start=1):
+            grids = await self._run_shards(
+                ctx, geant4_obj, particle_file_path, geom_files,
+                [[rows[i] for i in block]
+                 for block in np.array_split(shard, self.geant4_shards)])
+            used.extend(shard.tolist())
+            events = float(weights[used].sum())
+            for section, grid in grids.items():
+                totals[section] = (merge_dose_grids([totals[section], grid])
+                                   if section in totals else grid)
+            grid = totals.get(cfg['section'])
+            if grid is None or 'sum_sq' not in grid:
+                raise ValueError(
+                    "Key: 'adaptive' needs the Geant4 '" + cfg['section']
+                    + "' scorer to write the total(val^2) and entry columns, "
+                    "which the relative error is computed from; '"
+                    + str(self._output_files(geant4_obj).get(cfg['section']))
+                    + "' has none.")
+            error = scoring_relative_error(grid['values'], grid['sum_sq'],
+                                           events, cfg['threshold'])
+            print(f'Geant4 shard {count}/{len(shards)}: {events:g} of '
+                  f'{weights.sum():g} primaries ({len(used)} of {len(rows)} '
+                  f"rows), relative error {error:.3g} "
+                  f"(target {cfg['target_error']:g}).")
+            if error <= cfg['target_error']:
+                break
+
+        scale = float(weights.sum()) / events if events > 0 else 1.0
+        for grid in totals.values():
+            grid['values'] = grid['values'] * scale
+            if 'sum_sq' in grid:
+                grid['sum_sq'] = grid['sum_sq'] * scale ** 2
+        self._write_grids(ctx, geant4_obj, totals)
+        with open(os.path.join(ctx.workdir, self.CONVERGENCE_FILENAME),
+                  'w') as f:
+            json.dump({'events': events,
+                       'source_events': float(weights.sum()),
+                       'rows': len(used), 'source_rows': len(rows),
+                       'shards': count, 'total_shards': len(shards),
+                       'scale': scale, 'relative_error': error,
+                       'target_error': cfg['target_error'],
+                       'converged': bool(error <= cfg['target_error'])},
+                      f, indent=1)
 
     def _record_grid_artifacts(self, ctx):
-        files = self._output_files()
+        files = self._output_files(self.handle(ctx))
         if files['dose']:
             ctx.artifacts[DOSE_GRID] = os.path.join(ctx.workdir, files['dose'])
         if files['edep']:
             ctx.artifacts[EDEP_GRID] = os.path.join(ctx.workdir, files['edep'])
 
-    def _geometry_files(self):
+    def _geometry_files(self, geant4_obj):
         """Union of STL files named in the Geant4 input file ('*_stl' keys)
         and the explicit geant4_geometry_files list. Input-file names are
         resolved relative to the directory of geant4_input. De-duplicated by
@@ -1613,9 +2067,9 @@ class Geant4Module(Module):
                 seen.add(base)
                 files.append(path)
 
-        if self.geant4_obj is not None:
+        if geant4_obj is not None:
             input_dir = os.path.dirname(self.geant4_input)
-            for key, value in self.geant4_obj.get_values().items():
+            for key, value in geant4_obj.get_values().items():
                 if key.endswith('_stl') and value:
                     candidate = os.path.join(input_dir, value) if input_dir else value
                     if os.path.isfile(candidate):
@@ -1626,11 +2080,11 @@ class Geant4Module(Module):
             add(geom)
         return files
 
-    def _output_files(self):
+    def _output_files(self, geant4_obj):
         """Resolve the dose / edep output filenames, preferring explicit YAML
         overrides and otherwise reading output_dose / output_edep from the
-        Geant4 input file."""
-        values = self.geant4_obj.get_values() if self.geant4_obj is not None else {}
+        Geant4 input file (``geant4_obj``, this run's handle)."""
+        values = geant4_obj.get_values() if geant4_obj is not None else {}
         dose = self.geant4_dose_output or values.get('output_dose')
         edep = self.geant4_edep_output or values.get('output_edep')
         return {'dose': dose, 'edep': edep}
@@ -1642,11 +2096,12 @@ class Geant4Module(Module):
         Delegates to :func:`lume_ace3p.surrogate_data.read_dose_file`, the single
         canonical dose parser — the surrogate/inversion path reads target dose
         files through the same code, so a target lines up bin-for-bin with the
-        stored training grids."""
+        stored training grids. ``extract`` and ``field`` read the same output
+        repeatedly, so a large one is cached in a binary sidecar."""
         if not filename:
             return None
         from lume_ace3p.surrogate_data import read_dose_file
-        return read_dose_file(os.path.join(ctx.workdir, filename))
+        return read_dose_file(os.path.join(ctx.workdir, filename), cache=True)
 
     # The scoring grids this module can be asked for. ``scoring`` is a
     # back-compat alias for ``dose``; the router in workflow_graph keys on this
@@ -1686,7 +2141,7 @@ class Geant4Module(Module):
         ``['dose', 'total']``, with section in {dose, edep, scoring}
         (``scoring`` is a back-compat alias for dose) and entry in
         {total, peak, peak_index}."""
-        files = self._output_files()
+        files = self._output_files(self.handle(ctx))
         grids = {
             'dose': self._read_scoring_output(ctx, files['dose']),
             'edep': self._read_scoring_output(ctx, files['edep']),
@@ -1721,17 +2176,28 @@ class Geant4Module(Module):
         evaluation as ``{'dose': {indices, values}, 'edep': {...}}``, or
         ``None`` when neither scoring file is present (e.g. dry-run).
 
+        A grid scored with the ``total(val^2)`` and ``entry`` columns also
+        carries them as ``sum_sq`` / ``entries``; the training store turns them
+        into per-sample Monte-Carlo variances
+        (:func:`lume_ace3p.surrogate_data.scoring_variance`). An adaptive run
+        adds its ``'convergence'`` record (primaries run, relative error
+        reached; see :meth:`_run_adaptive`).
+
         These are the ragged 3-D grids the hybrid model keeps out of the flat
         table; the mode layer persists them per row and reloads on demand."""
-        files = self._output_files()
+        files = self._output_files(self.handle(ctx))
         grids = {}
         for section in ('dose', 'edep'):
             grid = self._read_scoring_output(ctx, files[section])
             if grid is not None:
-                # 'indices' is already a 2-D (M,3) array, so the field artifact
-                # round-trips without pickling.
-                grids[section] = {'indices': grid['indices'],
-                                  'values': grid['values']}
+                # Every entry is a plain numeric array ('indices' already a
+                # 2-D (M,3) one), so the field artifact round-trips without
+                # pickling.
+                grids[section] = dict(grid)
+        convergence = os.path.join(ctx.workdir, self.CONVERGENCE_FILENAME)
+        if grids and os.path.isfile(convergence):
+            with open(convergence) as f:
+                grids['convergence'] = json.load(f)
         return grids or None
 
 
@@ -1,26 +1,131 @@
-import os, glob, shutil
+import os, json, shutil, socket, time
+from collections import deque
 
 from .site_defaults import SITE_DEFAULTS, detect_site
 
 _MISSING = ''
+# What _search_home returns when it ran out of time: not a miss, so it is
+# never cached.
+_INCOMPLETE = None
 
-def _autodetect_ace3p():
+# Bounds of the $HOME fallback search: directory levels below $HOME, and
+# seconds before it gives up. A network home full of conda envs and run
+# directories can otherwise take minutes to walk.
+SEARCH_DEPTH = 6
+SEARCH_SECONDS = 10.0
+# How long a cached miss is trusted: long enough that back-to-back runs on a
+# host without the tool skip the search, short enough that one installed
+# afterwards is found without --detect-paths.
+MISS_SECONDS = 600.0
+
+
+def paths_cache_file():
+    """Per-user file the $HOME search results are kept in."""
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(root, 'lume-ace3p', 'paths.json')
+
+
+def _cache_key():
+    # The search result depends on the host (home directories are shared
+    # across clusters whose installs differ), the search root and PATH.
+    return '|'.join((socket.gethostname(), os.path.expanduser('~'),
+                     os.environ.get('PATH', '')))
+
+
+def _read_cache():
+    try:
+        with open(paths_cache_file()) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(tool, value):
+    from .results import replace_file
+    cache = _read_cache()
+    cache.setdefault(_cache_key(), {})[tool] = value
+    try:
+        replace_file(paths_cache_file(),
+                      lambda f: json.dump(cache, f, indent=1))
+    except OSError:
+        pass  # a read-only home only costs the search next time
+
+
+def _search_home(matches, depth=SEARCH_DEPTH, seconds=SEARCH_SECONDS):
+    """Shallowest directory under $HOME for which ``matches(path)`` is true,
+    or ``_MISSING``. Breadth-first, skipping hidden directories and symlinks,
+    at most ``depth`` levels down and for at most ``seconds`` (``None``: no
+    time limit); a search cut short by the time limit returns
+    ``_INCOMPLETE``."""
+    home = os.path.expanduser('~')
+    deadline = None if seconds is None else time.monotonic() + seconds
+    queue = deque([(home, 0)])
+    while queue:
+        directory, level = queue.popleft()
+        if deadline is not None and time.monotonic() > deadline:
+            print(f"Stopped searching {home} for tools after {seconds:g} s; "
+                  f"set the path explicitly or run 'run-lume-ace3p "
+                  f"--detect-paths'.")
+            return _INCOMPLETE
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_dir(
+                    follow_symlinks=False):
+                continue
+            if matches(entry.path):
+                return entry.path + os.sep
+            if level + 1 < depth:
+                queue.append((entry.path, level + 1))
+    return _MISSING
+
+
+def _cached_search(tool, matches, refresh=False, seconds=SEARCH_SECONDS):
+    """``_search_home(matches)``, remembered in :func:`paths_cache_file` per
+    host, $HOME and PATH. A remembered directory is re-checked with a stat.
+    A miss is remembered as ``{'missing': <time>}`` and trusted for
+    ``MISS_SECONDS`` only, so a tool installed since is found by a later
+    resolution. ``refresh`` ignores both. A search that timed out is a miss
+    for this call only: nothing is remembered, so the next resolution
+    searches again."""
+    if not refresh:
+        cached = _read_cache().get(_cache_key(), {}).get(tool)
+        if isinstance(cached, str) and cached and os.path.isdir(cached):
+            return cached
+        if (isinstance(cached, dict) and isinstance(cached.get('missing'),
+                                                    (int, float))
+                and 0 <= time.time() - cached['missing'] < MISS_SECONDS):
+            return _MISSING
+    found = _search_home(matches, seconds=seconds)
+    if found is _INCOMPLETE:
+        return _MISSING
+    _write_cache(tool, found if found else {'missing': time.time()})
+    return found
+
+
+def _is_ace3p_bin(path):
+    head, tail = os.path.split(path)
+    return tail == 'bin' and os.path.basename(head) == 'ace3p'
+
+
+def _is_cubit_dir(path):
+    return os.path.basename(path).startswith('Cubit')
+
+
+def _autodetect_ace3p(refresh=False, seconds=SEARCH_SECONDS):
     found = shutil.which('omega3p')
     if found:
         return os.path.dirname(found) + os.sep
-    matches = glob.glob('**/ace3p/bin', root_dir=os.path.expanduser('~'), recursive=True)
-    if matches:
-        return os.path.join(os.path.expanduser('~'), matches[0]) + os.sep
-    return _MISSING
+    return _cached_search('ace3p', _is_ace3p_bin, refresh, seconds)
 
-def _autodetect_cubit():
+def _autodetect_cubit(refresh=False, seconds=SEARCH_SECONDS):
     found = shutil.which('cubit')
     if found:
         return os.path.dirname(found) + os.sep
-    matches = glob.glob('**/Cubit*', root_dir=os.path.expanduser('~'), recursive=True)
-    if matches:
-        return os.path.join(os.path.expanduser('~'), matches[0]) + os.sep
-    return _MISSING
+    return _cached_search('cubit', _is_cubit_dir, refresh, seconds)
 
 def _autodetect_mpi():
     return shutil.which('mpirun') or _MISSING
@@ -42,6 +147,11 @@ def resolve_paths(yaml_overrides=None):
     Precedence (highest first): YAML override > environment variable
     > site default (matched by hostname) > autodetect on PATH/$HOME.
 
+    The $HOME search is bounded by ``SEARCH_DEPTH`` / ``SEARCH_SECONDS`` and
+    its result cached in :func:`paths_cache_file` (a miss for
+    ``MISS_SECONDS``), so only the first resolution on a host pays for it;
+    :func:`detect_paths` refreshes it.
+
     Returns a dict with keys: ace3p, cubit, mpi, geant4_app_path,
     geant4_app_exe. Missing entries are returned as empty strings so
     callers can do truthiness checks (used by dry_run auto-enable).
@@ -55,3 +165,11 @@ def resolve_paths(yaml_overrides=None):
                          or site_paths.get(key)
                          or autodetect())
     return resolved
+
+def detect_paths():
+    """Redo the ACE3P and Cubit autodetection, with no time limit on the $HOME
+    search, store it in :func:`paths_cache_file`, and return
+    :func:`resolve_paths` (``run-lume-ace3p --detect-paths``)."""
+    _autodetect_ace3p(refresh=True, seconds=None)
+    _autodetect_cubit(refresh=True, seconds=None)
+    return resolve_paths()
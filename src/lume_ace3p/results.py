@@ -28,6 +28,7 @@ DataFrame-ified — they stay structured objects, per the plan.
 
 import json
 import os
+import tempfile
 
 import numpy as np
 
@@ -38,6 +39,11 @@ import numpy as np
 # (e.g. Geant4 voxel grids); absent for the S3P long-format table.
 FIELD_ARTIFACT_COLUMN = 'field_artifact'
 
+# Prefix of the per-module ``reused_<module name>`` columns a sweep table gains
+# when the workflow is ``incremental``: ``True`` where that module's previous
+# run was carried over rather than re-run (``RunContext.reused``).
+REUSED_COLUMN_PREFIX = 'reused_'
+
 
 # --------------------------------------------------------------------------- #
 # The single shared result-table writer.
@@ -56,6 +62,139 @@ def write_table(df, filename):
     df.to_csv(filename, sep='\t', index=False, na_rep='nan')
 
 
+def replace_table(df, filename):
+    """:func:`write_table`, atomically (see :func:`replace_file`): a reader
+    (or a crash) sees either the old table or the new one, never a truncated
+    file."""
+    replace_file(filename, lambda f: write_table(df, f))
+
+
+def replace_file(path, writer, binary=False):
+    """Replace ``path`` atomically: ``writer(f)`` fills a hidden temporary
+    file beside it (opened ``'wb'`` when ``binary``, else ``'w'``), which is
+    fsynced and renamed over ``path``. A reader, or a crash, sees the old
+    contents or the new, never a partial file. The parent directory is
+    created if need be; if ``writer`` raises, the temporary file is removed
+    and ``path`` is left alone.
+
+    Every on-disk artifact that is replaced rather than appended to goes
+    through here: result tables (through :func:`replace_table`) and their
+    headers, field artifacts, Geant4 dose files and their sidecars, Xopt
+    checkpoints and the tool-path cache."""
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=os.path.splitext(path)[1] or '.tmp',
+                               prefix='.tmp-', dir=parent)
+    try:
+        with (os.fdopen(fd, 'wb') if binary
+              else os.fdopen(fd, 'w', newline='')) as f:
+            writer(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class TableLog:
+    """An on-disk log of a table that only ever grows — an Xopt run's
+    ``X.data``, one row per evaluation.
+
+    Rewriting the whole table after every step costs O(n) per step, O(n²)
+    over a run, and truncates the file while it is rewritten. Instead,
+    :meth:`update` appends (and fsyncs) only the rows added since the last
+    call. The table is rewritten in full — through :func:`replace_table`, so
+    atomically — only on the first call, when a column appears or disappears
+    (e.g. Xopt's ``xopt_error_str`` after a first failed evaluation), or when
+    the table shrank. A column reordering alone is absorbed by writing in the
+    logged order. Read the log back with :func:`read_table`.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.columns = None
+        self.rows_written = 0
+
+    def update(self, df):
+        """Bring the log up to date with ``df``, the full table so far."""
+        if df is None:
+            return
+        columns = [str(c) for c in df.columns]
+        if (self.columns is None or set(columns) != set(self.columns)
+                or len(df) < self.rows_written):
+            replace_table(df, self.filename)
+            self.columns = columns
+        elif len(df) > self.rows_written:
+            _append_frame(df.iloc[self.rows_written:][self.columns],
+                          self.filename)
+        self.rows_written = len(df)
+
+
+def append_table_rows(rows, columns, filename):
+    """Append result rows (``{column: value}`` dicts laid out by ``columns``)
+    to the tab-delimited table at ``filename``, in the :func:`write_table`
+    format, and ``fsync`` them before returning — so a sweep that streams each
+    finished point through here loses at most the point in flight when the
+    node dies.
+
+    A missing (or empty) file first gets its header line, written to a
+    temporary file beside it and renamed into place, so the table on disk
+    always starts with a complete header. The rows for one call go out in a
+    single write; a crash part-way through leaves at most a torn final line,
+    which :func:`read_table` drops."""
+    import pandas as pd
+    if not os.path.isfile(filename) or os.path.getsize(filename) == 0:
+        _write_header(columns, filename)
+    _append_frame(pd.DataFrame(list(rows), columns=columns), filename)
+
+
+def _append_frame(df, filename):
+    """Append ``df``'s rows (no header) to ``filename`` in one fsynced
+    write."""
+    text = df.to_csv(sep='\t', index=False, na_rep='nan', header=False)
+    with open(filename, 'a') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def append_table_row(row, columns, filename):
+    """Append one result row to the table at ``filename``; see
+    :func:`append_table_rows`."""
+    append_table_rows([row], columns, filename)
+
+
+def _write_header(columns, filename):
+    """Atomically create ``filename`` holding just the tab-delimited header."""
+    replace_file(filename, lambda f: f.write(
+        '\t'.join(str(c) for c in columns) + '\n'))
+
+
+def read_table(filename):
+    """Read a table written by :func:`write_table` / :func:`append_table_rows`
+    / :class:`TableLog` back into a :class:`pandas.DataFrame`, or ``None``
+    when the file is absent or empty.
+
+    Meant for picking up a partial table or log after an interrupted run (a
+    sweep's streamed table, an Xopt run's evaluations): a final line
+    without its newline (a write cut short) is dropped, and floats are parsed
+    ``round_trip`` so a swept value reads back equal to the one written."""
+    import io
+    import pandas as pd
+    if not os.path.isfile(filename):
+        return None
+    with open(filename) as f:
+        text = f.read()
+    if not text.endswith('\n'):
+        text = text[:text.rfind('\n') + 1]
+    if not text:
+        return None
+    return pd.read_csv(io.StringIO(text), sep='\t',
+                       float_precision='round_trip')
+
+
 # --------------------------------------------------------------------------- #
 # Field-artifact accessors — persist/load a row's structured field output.
 # --------------------------------------------------------------------------- #
@@ -86,10 +225,6 @@ def save_field(field, path):
         return None
     if not path.endswith('.npz'):
         path = path + '.npz'
-    parent = os.path.dirname(os.path.abspath(path))
-    if parent and not os.path.isdir(parent):
-        os.makedirs(parent, exist_ok=True)
-
     arrays = {}
     kinds = {}
     for key, value in field.items():
@@ -100,14 +235,18 @@ def save_field(field, path):
             kinds[key] = 'array'
             arrays['v:' + key] = np.asarray(value)
     arrays['__kinds__'] = _encode_str(json.dumps(kinds))
-    np.savez(path, **arrays)
+    # Written atomically, so a reader (or a resumed collection checking for
+    # the file) never sees a half-written artifact.
+    replace_file(path, lambda f: np.savez(f, **arrays), binary=True)
     return path
 
 
-def load_field(handle):
+def load_field(handle, keys=None):
     """Load a field artifact saved by :func:`save_field` back to the same
     arrays. Returns ``None`` for an empty/absent handle (``None``, ``''`` or a
-    NaN placeholder), so a row with no stored field loads cleanly."""
+    NaN placeholder), so a row with no stored field loads cleanly. ``keys``
+    limits the load to those top-level keys (any of them the artifact lacks
+    are left out), without reading the others' arrays."""
     if handle is None or handle == '':
         return None
     if isinstance(handle, float) and np.isnan(handle):
@@ -116,6 +255,8 @@ def load_field(handle):
         kinds = json.loads(_decode_str(npz['__kinds__']))
         field = {}
         for key, kind in kinds.items():
+            if keys is not None and key not in keys:
+                continue
             arr = npz['v:' + key]
             if kind == 'json':
                 field[key] = _rehydrate(json.loads(_decode_str(arr)))
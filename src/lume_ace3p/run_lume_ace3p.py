@@ -1,9 +1,10 @@
 import sys
 
 from lume_ace3p import __version__
-from lume_ace3p.inputs import load_yaml
-from lume_ace3p.workflow_graph import Workflow
-from lume_ace3p.modes import run_mode, is_store_consuming, mode_type_of
+
+# Everything else is imported once it is needed, so ``--version`` / ``--help``
+# answer without loading numpy or pandas, and a store-consuming mode never
+# loads ``lume.base`` and the tool wrappers (which ``workflow_graph`` does).
 
 
 def _run_declarative(lume_ace3p_data):
@@ -12,8 +13,8 @@ def _run_declarative(lume_ace3p_data):
 
     The pipeline is a declarative ``workflow:`` list of modules (validated into a
     runnable DAG by artifact dependencies); the ``mode:`` block selects how it is
-    driven — ``single`` / ``parameter_sweep`` / ``scalar_optimize`` /
-    ``gp_parameter_sweep``. Output extraction is declared per-module in
+    driven — ``single`` / ``parameter_sweep`` / ``adaptive_sweep`` /
+    ``scalar_optimize`` / ``async_optimize`` / ``gp_parameter_sweep``. Output extraction is declared per-module in
     ``output_parameters`` and performed inside :meth:`Workflow.evaluate`, so no
     solver-specific parsing lives in the driver.
 
@@ -21,19 +22,25 @@ def _run_declarative(lume_ace3p_data):
     :data:`lume_ace3p.modes.STORE_CONSUMING_MODES`) read an on-disk store or saved
     model and never drive the module chain, so no ``workflow:`` block is built (or
     required) for them — their config declares only what they actually read."""
+    from lume_ace3p.modes import run_mode, is_store_consuming, mode_type_of
+
     mode_cfg = lume_ace3p_data.get('mode') or {}
     mode_type = mode_type_of(mode_cfg)
-    if mode_type not in ('single', 'parameter_sweep', 'collect_training_data',
-                         'train_surrogate', 'invert_optimize',
-                         'invert_bayesian', 'scalar_optimize',
+    if mode_type not in ('single', 'parameter_sweep', 'adaptive_sweep',
+                         'collect_training_data', 'train_surrogate',
+                         'invert_optimize', 'invert_bayesian',
+                         'scalar_optimize', 'async_optimize',
                          'gp_parameter_sweep'):
         raise ValueError(
             f"workflow mode '{mode_type}' is not handled "
-            "(single | parameter_sweep | collect_training_data | "
-            "train_surrogate | invert_optimize | invert_bayesian | "
-            "scalar_optimize | gp_parameter_sweep).")
-    workflow = (None if is_store_consuming(mode_cfg)
-                else Workflow.from_config(lume_ace3p_data))
+            "(single | parameter_sweep | adaptive_sweep | collect_training_data "
+            "| train_surrogate | invert_optimize | invert_bayesian | "
+            "scalar_optimize | async_optimize | gp_parameter_sweep).")
+    if is_store_consuming(mode_cfg):
+        workflow = None
+    else:
+        from lume_ace3p.workflow_graph import Workflow
+        workflow = Workflow.from_config(lume_ace3p_data)
     return run_mode(mode_cfg, workflow,
                     output_spec=lume_ace3p_data.get('output_parameters'),
                     vocs=lume_ace3p_data.get('vocs_parameters'),
@@ -65,21 +72,38 @@ def _legacy_removal_notice():
         "examples/ directory and docs/yaml_reference.md for the current schema.")
 
 
+def _detect_paths():
+    """Re-run tool autodetection, refreshing its per-user cache, and print what
+    each path now resolves to."""
+    from lume_ace3p.paths import detect_paths, paths_cache_file
+
+    for key, value in detect_paths().items():
+        print(f"{key:<16} {value or '(not found)'}")
+    print(f"Autodetection cache: {paths_cache_file()}")
+
+
 def main():
     args = sys.argv[1:]
 
     if args and args[0] in ('--version', '-V'):
         print(f"lume-ace3p {__version__}")
         return
+    if args and args[0] == '--detect-paths':
+        _detect_paths()
+        return
     if not args or args[0] in ('--help', '-h'):
         print("usage: run-lume-ace3p <input.yaml>\n"
-              "       run-lume-ace3p --version\n\n"
+              "       run-lume-ace3p --version\n"
+              "       run-lume-ace3p --detect-paths\n\n"
               "Runs a LUME-ACE3P workflow from a declarative YAML config (a "
               "'workflow:' list of modules plus a 'mode:' block). See the "
               "examples/ directory and docs/yaml_reference.md.")
         # Exit non-zero when no input file was given (a usage error), zero for -h.
         sys.exit(0 if args else 1)
 
+    from lume_ace3p.inputs import load_yaml
+    from lume_ace3p.modes import is_store_consuming
+
     input_file = args[0]
     print(f"lume-ace3p {__version__}", file=sys.stderr)
 
@@ -0,0 +1,49 @@
+"""The :class:`Section` tree an ACE3P input file parses into.
+
+Kept apart from :mod:`lume_ace3p.ace3p`, which also defines the
+``lume.base`` tool wrappers, so that :mod:`lume_ace3p.inputs` can build and
+walk ACE3P trees without paying for that import. ``lume_ace3p.ace3p`` still
+exports it.
+"""
+
+
+class Section:
+    """An ACE3P input section: ordered list of (name, child) entries.
+
+    A child is either a leaf string or another Section. Same-named siblings
+    are stored as separate entries — order and duplicates are preserved
+    end-to-end through parse / mutate / write.
+    """
+
+    def __init__(self, entries=None):
+        self.entries = list(entries) if entries else []
+
+    def append(self, name, value):
+        self.entries.append((name, value))
+
+    def children(self, name):
+        return [v for k, v in self.entries if k == name]
+
+    def find(self, name, **discriminators):
+        """Return the first child Section matching `name` whose own leaves
+        match every (key, value) pair in `discriminators`. Returns None if
+        nothing matches."""
+        for k, v in self.entries:
+            if k != name or not isinstance(v, Section):
+                continue
+            if all(v.get_leaf(dk) == str(dv) for dk, dv in discriminators.items()):
+                return v
+        return None
+
+    def get_leaf(self, name):
+        for k, v in self.entries:
+            if k == name and not isinstance(v, Section):
+                return v
+        return None
+
+    def set_leaf(self, name, value):
+        for i, (k, v) in enumerate(self.entries):
+            if k == name and not isinstance(v, Section):
+                self.entries[i] = (k, str(value))
+                return
+        self.entries.append((name, str(value)))
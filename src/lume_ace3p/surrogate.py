@@ -20,7 +20,11 @@ surrogate:
    carries a genuine fitted ``WhiteKernel`` noise term — Geant4 dose is
    Monte-Carlo noisy, so we must NOT use a low-noise / interpolating prior
    (**correctness constraint #2**). The predicted coefficient variance flows
-   through to a non-zero, calibrated dose-grid variance.
+   through to a non-zero, calibrated dose-grid variance. When the training
+   store carries the Geant4 ``total(val^2)`` column, each sample's *measured*
+   Monte-Carlo variance is propagated onto the coefficients and given to the
+   GPs as known per-sample noise; the ``WhiteKernel`` then fits only what the
+   measurement does not explain.
 
 The single object :class:`DoseSurrogate` exposes:
 
@@ -88,7 +92,7 @@ def _invert_transform(fit_values, dose_transform, floor):
         f"unknown dose_transform '{dose_transform}'; use one of {DOSE_TRANSFORMS}.")
 
 
-def _build_gp(input_dim, seed):
+def _build_gp(input_dim, seed, alpha=1e-10):
     """Construct one per-coefficient :class:`GaussianProcessRegressor`.
 
     Kernel = ``ConstantKernel * RBF(ARD) + WhiteKernel``. The ``WhiteKernel`` is
@@ -97,7 +101,14 @@ def _build_gp(input_dim, seed):
     would reinstate the interpolating prior the constraint forbids. ARD (one
     length scale per β dimension) lets irrelevant bins grow long length scales.
     ``normalize_y`` handles the per-coefficient scale (leading modes are far
-    larger than trailing ones)."""
+    larger than trailing ones).
+
+    ``alpha`` is added to the kernel diagonal at the training points only:
+    sklearn's jitter by default, or an ``(N,)`` array of *measured* per-sample
+    noise variances (in ``normalize_y`` units, see :func:`_coefficient_noise`).
+    With it the ``WhiteKernel`` fits the noise left over — truncation and model
+    error — rather than the whole Monte-Carlo noise at one level for every
+    sample."""
     from sklearn.gaussian_process import GaussianProcessRegressor
     from sklearn.gaussian_process.kernels import (
         RBF, ConstantKernel, WhiteKernel)
@@ -107,10 +118,26 @@ def _build_gp(input_dim, seed):
                     length_scale_bounds=(1e-2, 1e2))
               + WhiteKernel(noise_level=1.0, noise_level_bounds=(1e-8, 1e3)))
     return GaussianProcessRegressor(
-        kernel=kernel, normalize_y=True, n_restarts_optimizer=3,
+        kernel=kernel, alpha=alpha, normalize_y=True, n_restarts_optimizer=3,
         random_state=seed)
 
 
+def _coefficient_noise(dose_variance, dose, basis, dose_transform, floor):
+    """Measured noise variance of each training sample's POD coefficients.
+
+    ``dose_variance (N, M)`` is the Monte-Carlo variance of the raw ``dose
+    (N, M)`` (:attr:`lume_ace3p.surrogate_data.TrainingStore.dose_variance`).
+    It is mapped into the fit space — for ``'log10'`` by the delta method,
+    ``var / ((dose + floor)·ln 10)²`` — and, voxels being scored
+    independently, onto each coefficient ``c_j = Σ_m φ_jm·y_m`` as
+    ``Σ_m φ_jm²·var_m``. Returns ``(N, k)``."""
+    variance = np.asarray(dose_variance, dtype=float)
+    if dose_transform == 'log10':
+        variance = variance / ((np.asarray(dose, dtype=float) + floor)
+                               * np.log(10.0)) ** 2
+    return variance @ (basis ** 2).T
+
+
 def _choose_k(singular_values, variance, k):
     """Pick the number of retained modes.
 
@@ -148,11 +175,15 @@ class DoseSurrogate:
       recorded. Inversion needs it to reorder a target dose onto the basis
       (correctness constraint #3); see
       :func:`lume_ace3p.surrogate_data.align_to_indices`.
+    * ``noise`` — ``'measured'`` when the GPs were given each sample's measured
+      Monte-Carlo variance (``dose_variance`` in :meth:`fit`), ``'fitted'``
+      when the ``WhiteKernel`` alone models the noise.
     """
 
     def __init__(self, mean, basis, singular_values, gps, beta_lo, beta_hi,
                  beta_names, kept_energy, variance_target=None,
-                 dose_transform='linear', floor=0.0, voxel_indices=None):
+                 dose_transform='linear', floor=0.0, voxel_indices=None,
+                 noise='fitted'):
         self.mean = np.asarray(mean, dtype=float)
         self.basis = np.asarray(basis, dtype=float)
         self.singular_values = np.asarray(singular_values, dtype=float)
@@ -170,13 +201,14 @@ class DoseSurrogate:
         self.floor = float(floor)
         self.voxel_indices = (None if voxel_indices is None
                               else np.asarray(voxel_indices, dtype=int))
+        self.noise = noise
 
     # ---- construction -------------------------------------------------- #
 
     @classmethod
     def fit(cls, beta, dose, *, variance=0.99, k=None, seed=0,
             beta_names=None, dose_transform='linear', floor=None, n_jobs=1,
-            voxel_indices=None):
+            voxel_indices=None, dose_variance=None):
         """Fit the surrogate from aligned ``β (N, D)`` and ``dose (N, M)``.
 
         ``variance`` is the cumulative-energy target for choosing the number of
@@ -204,7 +236,14 @@ class DoseSurrogate:
         ``voxel_indices`` is the ``(M, 3)`` voxel order the ``dose`` columns are
         in (a training store's ``indices``). Recording it lets the inversion phase
         reorder an arbitrary target dose onto this basis; without it, inversion
-        must be told the order some other way (constraint #3 — it never guesses)."""
+        must be told the order some other way (constraint #3 — it never guesses).
+
+        ``dose_variance`` is the ``(N, M)`` measured Monte-Carlo variance of each
+        ``dose`` value (a training store's ``dose_variance``). When given, it is
+        propagated onto every sample's coefficients (:func:`_coefficient_noise`)
+        and passed to that coefficient's GP as known per-sample noise, so a
+        sample run with few primaries weighs less than a converged one. The
+        ``WhiteKernel`` stays and fits the remaining noise (constraint #2)."""
         beta = np.asarray(beta, dtype=float)
         dose = np.asarray(dose, dtype=float)
         if beta.ndim != 2 or dose.ndim != 2:
@@ -217,6 +256,19 @@ class DoseSurrogate:
         if n_samples < 2:
             raise ValueError(
                 "need at least 2 training samples to fit the surrogate.")
+        if dose_variance is not None:
+            dose_variance = np.asarray(dose_variance, dtype=float)
+            if dose_variance.shape != dose.shape:
+                raise ValueError(
+                    f"dose_variance has shape {dose_variance.shape} but dose "
+                    f"has {dose.shape}; they must be aligned voxel-for-voxel.")
+            if not np.all(np.isfinite(dose_variance)) or np.any(
+                    dose_variance < 0.0):
+                raise ValueError(
+                    "dose_variance must be finite and non-negative; a sample "
+                    "scored without the total(val^2) column has no measured "
+                    "noise — fit without dose_variance instead.")
+        raw_dose = dose
 
         if dose_transform not in DOSE_TRANSFORMS:
             raise ValueError(
@@ -249,6 +301,17 @@ class DoseSurrogate:
         # Coefficients C = centered @ Φ^T  (k independent scalar targets).
         coeffs = centered @ basis.T             # (N, k)
 
+        # Per-sample GP noise (alpha). normalize_y divides each target by its
+        # std before fitting, so the measured variances are scaled the same way.
+        alphas = [1e-10] * n_modes
+        if dose_variance is not None:
+            noise = _coefficient_noise(dose_variance, raw_dose, basis,
+                                       dose_transform, floor)
+            scale = np.std(coeffs, axis=0)
+            scale = np.where(scale > 0.0, scale, 1.0)
+            alphas = [noise[:, j] / scale[j] ** 2 + 1e-10
+                      for j in range(n_modes)]
+
         beta_lo = beta.min(axis=0)
         beta_hi = beta.max(axis=0)
         beta_unit = cls._to_unit(beta, beta_lo, beta_hi)
@@ -257,7 +320,7 @@ class DoseSurrogate:
         # so joblib parallelizes them cleanly; a fixed seed keeps each GP's
         # restart search reproducible regardless of n_jobs (result-invariant).
         def _fit_one(j):
-            gp = _build_gp(beta.shape[1], seed)
+            gp = _build_gp(beta.shape[1], seed, alphas[j])
             gp.fit(beta_unit, coeffs[:, j])
             return gp
 
@@ -273,7 +336,8 @@ class DoseSurrogate:
         return cls(mean, basis, singular_values, gps, beta_lo, beta_hi,
                    beta_names, kept_energy, variance_target=variance,
                    dose_transform=dose_transform, floor=floor,
-                   voxel_indices=voxel_indices)
+                   voxel_indices=voxel_indices,
+                   noise='fitted' if dose_variance is None else 'measured')
 
     # ---- normalization helpers ---------------------------------------- #
 
@@ -603,7 +667,7 @@ class DoseSurrogate:
         fitted sklearn GPs to ``gps.joblib`` (a *trusted local* artifact — unlike
         the untrusted field ``.npz`` which stays ``allow_pickle=False``), and a
         human-readable ``surrogate.json`` provenance dump (k, variance target,
-        kept energy, per-GP fitted kernel) — the hyperparameter dump the plan
+        kept energy, noise model, per-GP fitted kernel) — the hyperparameter dump the plan
         calls for, analogous to ``modes._save_model``'s ``gp_parameters.txt``."""
         import joblib
 
@@ -629,6 +693,7 @@ class DoseSurrogate:
             'beta_names': self.beta_names,
             'dose_transform': self.dose_transform,
             'floor': self.floor,
+            'noise': self.noise,
             'singular_values': self.singular_values.tolist(),
             'kernels': [str(gp.kernel_) for gp in self.gps],
         }
@@ -663,16 +728,18 @@ class DoseSurrogate:
 
         kept_energy = 1.0
         variance_target = None
+        noise = 'fitted'
         prov_path = os.path.join(model_dir, PROVENANCE_FILENAME)
         if os.path.isfile(prov_path):
             with open(prov_path) as f:
                 prov = json.load(f)
             kept_energy = prov.get('kept_energy', 1.0)
             variance_target = prov.get('variance_target')
+            noise = prov.get('noise', 'fitted')
         return cls(mean, basis, singular_values, gps, beta_lo, beta_hi,
                    beta_names, kept_energy, variance_target=variance_target,
                    dose_transform=dose_transform, floor=floor,
-                   voxel_indices=voxel_indices)
+                   voxel_indices=voxel_indices, noise=noise)
 
 
 class Identifiability:
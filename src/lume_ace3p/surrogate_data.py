@@ -25,6 +25,8 @@ The design-of-experiments sampler (:func:`sample_beta_doe`) is a scattered
 grid, which is combinatorially infeasible in 8-D.
 """
 
+import glob
+import io
 import json
 import os
 import warnings
@@ -32,6 +34,8 @@ import warnings
 import numpy as np
 import pandas as pd
 
+from lume_ace3p.results import replace_file
+
 
 # Canonical filenames inside a training store directory.
 TABLE_FILENAME = 'training_table.txt'
@@ -40,6 +44,12 @@ MANIFEST_FILENAME = 'manifest.json'
 # Column name recording each sample's fidelity (Geant4 primary count). Kept as
 # an explicit column so Phase 5 multi-fidelity training can filter on it.
 FIDELITY_COLUMN = 'fidelity'
+# Primaries an adaptive Geant4 run actually ran (``Geant4Module``
+# ``adaptive:``) and the relative error it reached; the columns are present
+# only in stores collected with one. The fidelity column keeps the configured
+# value, so it means the same in every store.
+EVENTS_COLUMN = 'events'
+RELATIVE_ERROR_COLUMN = 'relative_error'
 
 
 # --------------------------------------------------------------------------- #
@@ -194,42 +204,342 @@ def sample_beta_doe(bounds, num_samples, sampler='sobol', seed=0):
 # --------------------------------------------------------------------------- #
 
 
-def read_dose_file(path):
+# Bytes of dose file parsed per chunk: bounds the parser's working memory on a
+# 200^3 mesh to a few hundred MB whatever the file size.
+DOSE_CHUNK_BYTES = 32 << 20
+
+# Source files at least this large get a binary sidecar next to them (see
+# :func:`read_dose_file`); smaller ones parse in milliseconds anyway.
+DOSE_CACHE_MIN_BYTES = 1 << 20
+
+# One voxel: the parsed chunks, the sidecar and the returned views share it.
+# ``sum_sq`` / ``entries`` hold the scorer's ``total(val^2)`` / ``entry``
+# columns, or NaN / -1 for a file without them.
+_DOSE_RECORD = np.dtype([('indices', '<i8', (3,)), ('values', '<f8'),
+                         ('sum_sq', '<f8'), ('entries', '<i8')])
+_DOSE_BASIC = np.dtype([('indices', '<i8', (3,)), ('values', '<f8')])
+_NONBLANK = np.ones(256, dtype=bool)
+_NONBLANK[list(b' \t\n\r\v\f')] = False
+
+
+def _parse_dose_lines(lines):
+    """Row-at-a-time reference parser: a list of
+    ``((ix, iy, iz), value, sum_sq, entries)`` tuples.
+
+    Skips blank lines, ``#`` comment lines and rows with fewer than four
+    fields or a non-integer index / non-float value. ``sum_sq`` and
+    ``entries`` come from the fifth and sixth fields when both parse (a float
+    and an integer), else they are NaN and -1; further columns are ignored.
+    :func:`_parse_dose_chunk` falls back to it for any chunk its vectorized
+    parse rejects, so the two always agree."""
+    rows = []
+    for line in lines:
+        text = line.strip()
+        if not text or text.startswith('#'):
+            continue
+        parts = text.replace(',', ' ').split()
+        if len(parts) < 4:
+            continue
+        try:
+            ix, iy, iz = int(parts[0]), int(parts[1]), int(parts[2])
+            value = float(parts[3])
+        except ValueError:
+            continue
+        try:
+            sum_sq, entries = float(parts[4]), int(parts[5])
+        except (IndexError, ValueError):
+            sum_sq, entries = float('nan'), -1
+        rows.append(((ix, iy, iz), value, sum_sq, entries))
+    return rows
+
+
+def _comments_are_whole_lines(chunk):
+    """True when every ``#`` in ``chunk`` starts its line (after whitespace),
+    i.e. when ``loadtxt``'s comment stripping drops exactly the rows the
+    reference parser does."""
+    position = chunk.find(b'#')
+    while position != -1:
+        start = chunk.rfind(b'\n', 0, position) + 1
+        if chunk[start:position].strip():
+            return False
+        end = chunk.find(b'\n', position)
+        if end == -1:
+            return True
+        position = chunk.find(b'#', end)
+    return True
+
+
+def _field_count(text):
+    """Number of whitespace-separated fields in ``text`` outside its (whole
+    line) ``#`` comments, counted as the starts of non-blank runs."""
+    nonblank = _NONBLANK[np.frombuffer(text, dtype=np.uint8)]
+    count = int(np.count_nonzero(nonblank[1:] & ~nonblank[:-1]))
+    count += int(nonblank[:1].sum())
+    position = text.find(b'#')
+    while position != -1:
+        end = text.find(b'\n', position)
+        end = len(text) if end == -1 else end
+        count -= len(text[position:end].split())
+        position = text.find(b'#', end)
+    return count
+
+
+def _loadtxt_records(chunk, dtype, usecols):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)  # no data rows
+        return np.loadtxt(io.BytesIO(chunk), dtype=dtype, usecols=usecols,
+                          comments='#', ndmin=1)
+
+
+def _parse_dose_chunk(chunk):
+    """Parse a run of whole lines (``bytes``) into a :data:`_DOSE_RECORD`
+    array.
+
+    Commas become spaces and ``numpy.loadtxt`` reads the first six columns
+    in one C-level pass, straight into the record layout; a chunk without
+    the ``total(val^2)`` / ``entry`` columns is read again as four. It parses
+    floats exactly as ``float()`` does and raises on a short row or a token
+    that is not an integer index / float value, which is when the reference
+    parser would skip a row (or, in the fifth and sixth columns, leave them
+    unset). Such a chunk, or one with a ``#`` after data on a line, goes
+    through :func:`_parse_dose_lines` instead. It parses the same way as
+    always, just more slowly."""
+    if _comments_are_whole_lines(chunk):
+        text = chunk.replace(b',', b' ')
+        try:
+            return _loadtxt_records(text, _DOSE_RECORD, (0, 1, 2, 3, 4, 5))
+        except ValueError:
+            pass
+        try:
+            basic = _loadtxt_records(text, _DOSE_BASIC, (0, 1, 2, 3))
+        except ValueError:
+            basic = None
+        # Only a chunk of exactly four-column rows: where some rows carry the
+        # extra columns, the reference parser keeps them row by row.
+        if basic is not None and _field_count(text) == 4 * len(basic):
+            records = np.empty(len(basic), dtype=_DOSE_RECORD)
+            records['indices'] = basic['indices']
+            records['values'] = basic['values']
+            records['sum_sq'] = np.nan
+            records['entries'] = -1
+            return records
+    rows = _parse_dose_lines(chunk.decode().splitlines())
+    records = np.empty(len(rows), dtype=_DOSE_RECORD)
+    if rows:
+        indices, values, sum_sq, entries = zip(*rows)
+        records['indices'] = indices
+        records['values'] = values
+        records['sum_sq'] = sum_sq
+        records['entries'] = entries
+    return records
+
+
+def _iter_dose_records(path, chunk_bytes):
+    with open(path, 'rb') as f:
+        carry = b''
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                chunk, carry = carry, b''
+            else:
+                cut = block.rfind(b'\n') + 1
+                if not cut:
+                    carry += block
+                    continue
+                chunk, carry = carry + block[:cut], block[cut:]
+            if chunk:
+                records = _parse_dose_chunk(chunk)
+                if len(records):
+                    yield records
+            if not block:
+                return
+
+
+def _grid(records):
+    """The ``read_dose_file`` dict for a record array: ``sum_sq`` / ``entries``
+    are included when any voxel carries them."""
+    grid = {'indices': records['indices'], 'values': records['values']}
+    if len(records) and records['entries'].max() >= 0:
+        grid['sum_sq'] = records['sum_sq']
+        grid['entries'] = records['entries']
+    return grid
+
+
+def iter_dose_file(path, chunk_bytes=DOSE_CHUNK_BYTES):
+    """Stream a Geant4 scoring file as ``{'indices', 'values', 'sum_sq',
+    'entries'}`` chunks of about ``chunk_bytes`` of source each (always whole
+    lines), skipping chunks that hold no data rows. ``sum_sq`` / ``entries``
+    are always present here, NaN / -1 where a row lacks them. Concatenated,
+    the chunks are exactly what :func:`read_dose_file` returns."""
+    for records in _iter_dose_records(path, chunk_bytes):
+        yield {name: records[name] for name in _DOSE_RECORD.names}
+
+
+def _dose_sidecar(path, stat):
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory,
+                        f'.{name}.{stat.st_size}-{stat.st_mtime_ns}.dose.npy')
+
+
+def _write_dose_sidecar(path, sidecar, records):
+    """Store ``records`` in ``sidecar`` (atomically) and drop the sidecars of
+    earlier versions of ``path``. Best effort: an unwritable directory only
+    means the next read parses again."""
+    try:
+        replace_file(sidecar, lambda f: np.save(f, records), binary=True)
+    except OSError:
+        return
+    _remove_dose_sidecars(path, keep=sidecar)
+
+
+def _remove_dose_sidecars(path, keep=None):
+    """Delete every sidecar of ``path`` but ``keep`` (best effort)."""
+    directory, name = os.path.split(os.path.abspath(path))
+    for stale in glob.glob(os.path.join(glob.escape(directory),
+                                        f'.{glob.escape(name)}.*.dose.npy')):
+        if stale != keep:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+
+def read_dose_file(path, cache=False):
     """Parse a Geant4 dose/edep scoring file into ``{'indices', 'values'}``.
 
     Reads the whitespace-or-comma ``ix iy iz value [...]`` voxel format, skipping
     blank lines, ``#`` comments and short rows — so it handles both the plain
     scoring dump and the comma-separated
-    ``iX, iY, iZ, total(value), total(val^2), entry`` variant (extra columns are
-    ignored). Returns ``{'indices': (M,3) int array, 'values': (M,) float array}``,
-    or ``None`` if the file is missing or holds no data rows.
+    ``iX, iY, iZ, total(value), total(val^2), entry`` variant. Returns
+    ``{'indices': (M,3) int array, 'values': (M,) float array}``, or ``None``
+    if the file is missing or holds no data rows. When the file has the
+    ``total(val^2)`` and ``entry`` columns the dict also carries them as
+    ``'sum_sq'`` (M,) float and ``'entries'`` (M,) int arrays (NaN / -1 on a
+    row without them); :func:`scoring_variance` turns them into the per-voxel
+    Monte-Carlo variance.
+
+    The file is parsed in :data:`DOSE_CHUNK_BYTES` chunks (see
+    :func:`iter_dose_file`), each with one vectorized parse. With ``cache``
+    (for a file read again and again, such as a run's own scoring output), a
+    source of at least :data:`DOSE_CACHE_MIN_BYTES` leaves a hidden binary
+    sidecar beside it, ``.<name>.<size>-<mtime_ns>.dose.npy``. Later cached
+    reads of the same bytes copy the arrays out of that file instead of
+    parsing; like a parsed grid, they are the caller's to modify. A rewritten
+    source has a new size or mtime, so it gets a new sidecar and the old one
+    is removed (as it is when :func:`write_dose_file` replaces the source).
 
     This is the canonical parser for training and inversion: the returned shape is
     exactly what ``save_field`` persists, so a target parsed here lines up with the
     stored training grids (after :func:`align_to_indices`)."""
     if not path or not os.path.isfile(path):
         return None
-    indices = []
-    values = []
-    with open(path) as f:
-        for line in f:
-            text = line.strip()
-            if not text or text.startswith('#'):
-                continue
-            parts = text.replace(',', ' ').split()
-            if len(parts) < 4:
-                continue
-            try:
-                ix, iy, iz = int(parts[0]), int(parts[1]), int(parts[2])
-                value = float(parts[3])
-            except ValueError:
-                continue
-            indices.append((ix, iy, iz))
-            values.append(value)
-    if not values:
+    stat = os.stat(path)
+    sidecar = (_dose_sidecar(path, stat)
+               if cache and stat.st_size >= DOSE_CACHE_MIN_BYTES else None)
+    if sidecar and os.path.isfile(sidecar):
+        try:
+            records = np.load(sidecar, mmap_mode='r')
+        except (OSError, ValueError):
+            records = None
+        if records is not None and records.dtype == _DOSE_RECORD:
+            return {key: np.array(value)
+                    for key, value in _grid(records).items()}
+    chunks = list(_iter_dose_records(path, DOSE_CHUNK_BYTES))
+    if not chunks:
         return None
-    return {'indices': np.asarray(indices, dtype=int),
-            'values': np.asarray(values, dtype=float)}
+    records = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+    if sidecar:
+        _write_dose_sidecar(path, sidecar, records)
+    elif cache:
+        _remove_dose_sidecars(path)     # shrank below DOSE_CACHE_MIN_BYTES
+    return _grid(records)
+
+
+def scoring_variance(values, sum_sq, events=None):
+    """Per-voxel Monte-Carlo variance of a Geant4 scored total.
+
+    ``values`` and ``sum_sq`` are a voxel's ``total(value)`` and
+    ``total(val^2)``, the sums of the scored quantity and of its square over
+    the run. With the run's primary count ``events`` (the store's events
+    column, else its fidelity) the variance of the total is
+    ``sum_sq - values**2 / events``. Without it, ``sum_sq`` is returned. That
+    is the limit for many events and an upper bound otherwise. Negative
+    round-off is clipped to 0. A voxel without ``sum_sq`` (NaN) keeps NaN."""
+    values = np.asarray(values, dtype=float)
+    variance = np.array(sum_sq, dtype=float)
+    if events is not None and np.isfinite(events) and events > 0:
+        variance -= values ** 2 / float(events)
+    return np.where(np.isnan(variance), np.nan, np.maximum(variance, 0.0))
+
+
+def scoring_relative_error(values, sum_sq, events=None, threshold=0.1):
+    """Statistical precision of a Geant4 scored grid: the largest relative
+    error ``sqrt(variance) / value`` (:func:`scoring_variance`) over the voxels
+    of interest, those holding at least ``threshold`` of the peak value.
+    Returns ``inf`` for a grid with no positive value yet."""
+    values = np.asarray(values, dtype=float)
+    peak = values.max() if values.size else 0.0
+    if not peak > 0.0:
+        return float('inf')
+    mask = values >= threshold * peak
+    variance = scoring_variance(values[mask], np.asarray(sum_sq)[mask], events)
+    return float(np.max(np.sqrt(variance) / values[mask]))
+
+
+def merge_dose_grids(grids):
+    """Sum :func:`read_dose_file` grids of runs over the same scoring mesh,
+    voxel by voxel: ``values``, ``sum_sq`` and ``entries`` all add. The grids
+    may list the voxels in any order; the result follows the first one's.
+
+    ``sum_sq`` / ``entries`` are kept only when every grid has them. Raises
+    ``ValueError`` (from :func:`align_to_indices`) when the grids cover
+    different voxels."""
+    grids = list(grids)
+    indices = np.asarray(grids[0]['indices'])
+    keys = ['values']
+    if all('sum_sq' in grid for grid in grids):
+        keys += ['sum_sq', 'entries']
+    merged = {'indices': indices}
+    for key in keys:
+        merged[key] = np.array(grids[0][key],
+                               dtype=np.int64 if key == 'entries' else float)
+    for grid in grids[1:]:
+        these = np.asarray(grid['indices'])
+        same = np.array_equal(these, indices)
+        for key in keys:
+            column = (np.asarray(grid[key]) if same else
+                      align_to_indices(grid[key], these, indices))
+            merged[key] += column.astype(merged[key].dtype)
+    return merged
+
+
+def write_dose_file(path, grid):
+    """Write a :func:`read_dose_file` grid back out in the Geant4 scorer's
+    comma-separated format, ``iX, iY, iZ, total(value)`` plus
+    ``total(val^2), entry`` when the grid has them. Floats are written with
+    ``repr``, so reading the file back returns the same arrays. The file is
+    replaced atomically, and any :func:`read_dose_file` sidecar of the old
+    contents is removed."""
+    indices = np.asarray(grid['indices'], dtype=np.int64)
+    columns = [indices[:, 0].tolist(), indices[:, 1].tolist(),
+               indices[:, 2].tolist(),
+               np.asarray(grid['values'], dtype=float).tolist()]
+    header = '# iX, iY, iZ, total(value)'
+    fmt = '%d,%d,%d,%r'
+    if 'sum_sq' in grid:
+        columns += [np.asarray(grid['sum_sq'], dtype=float).tolist(),
+                    np.asarray(grid['entries'], dtype=np.int64).tolist()]
+        header += ', total(val^2), entry'
+        fmt += ',%r,%d'
+
+    def write(f):
+        f.write(header + '\n')
+        for row in zip(*columns):
+            f.write(fmt % row + '\n')
+
+    replace_file(path, write)
+    _remove_dose_sidecars(path)
+    return path
 
 
 def load_target_dose(target):
@@ -374,10 +684,16 @@ class TrainingStore:
     * ``fidelity`` — ``(N,)`` recorded fidelity per sample.
     * ``table`` — the raw result :class:`pandas.DataFrame`.
     * ``manifest`` — the parsed manifest dict.
+    * ``dose_variance`` — ``(N, M)`` Monte-Carlo variance of each ``dose``
+      value (:func:`scoring_variance` of the stored ``total(val^2)`` column,
+      with the primaries the sample ran — its events column, else its
+      fidelity — as the count), or ``None`` unless
+      every stored dose grid carries that column.
+    * ``edep_variance`` — the same for ``edep``, or ``None``.
     """
 
     def __init__(self, beta, beta_names, dose, edep, indices, fidelity,
-                 table, manifest):
+                 table, manifest, dose_variance=None, edep_variance=None):
         self.beta = beta
         self.beta_names = beta_names
         self.dose = dose
@@ -386,6 +702,8 @@ class TrainingStore:
         self.fidelity = fidelity
         self.table = table
         self.manifest = manifest
+        self.dose_variance = dose_variance
+        self.edep_variance = edep_variance
 
     def __len__(self):
         return int(self.beta.shape[0])
@@ -425,27 +743,38 @@ def load_training_store(store_path):
     fidelity = (table[FIDELITY_COLUMN].to_numpy()
                 if FIDELITY_COLUMN in table.columns
                 else np.full(len(table), np.nan))
+    events = fidelity
+    if EVENTS_COLUMN in table.columns:
+        ran = table[EVENTS_COLUMN].to_numpy(dtype=float)
+        events = np.where(np.isnan(ran), fidelity, ran)
 
     dose_rows, edep_rows = [], []
+    dose_var_rows, edep_var_rows = [], []
     indices = None
     have_any_field = False
-    for handle in table.get(FIELD_ARTIFACT_COLUMN, pd.Series([None] * len(table))):
+    handles = table.get(FIELD_ARTIFACT_COLUMN, pd.Series([None] * len(table)))
+    for handle, count in zip(handles, events):
         field = load_field(handle) if _is_handle(handle) else None
         if field is None:
-            dose_rows.append(None)
-            edep_rows.append(None)
+            for rows in (dose_rows, edep_rows, dose_var_rows, edep_var_rows):
+                rows.append(None)
             continue
         have_any_field = True
         indices = _check_indices(indices, field)
         dose_rows.append(_values(field, 'dose'))
         edep_rows.append(_values(field, 'edep'))
+        dose_var_rows.append(_variance(field, 'dose', count))
+        edep_var_rows.append(_variance(field, 'edep', count))
 
     dose = _stack_rows(dose_rows) if have_any_field else None
     edep = _stack_rows(edep_rows) if have_any_field else None
+    dose_variance = _stack_variance(dose_var_rows, dose_rows)
+    edep_variance = _stack_variance(edep_var_rows, edep_rows)
     if indices is not None:
         _check_indices_against_manifest(indices, manifest)
     return TrainingStore(beta, list(beta_names), dose, edep, indices, fidelity,
-                         table, manifest)
+                         table, manifest, dose_variance=dose_variance,
+                         edep_variance=edep_variance)
 
 
 def _is_handle(handle):
@@ -463,6 +792,30 @@ def _values(field, section):
     return np.asarray(section_dict['values'], dtype=float)
 
 
+def _variance(field, section, events):
+    section_dict = field.get(section)
+    if section_dict is None or 'sum_sq' not in section_dict:
+        return None
+    try:
+        events = float(events)
+    except (TypeError, ValueError):
+        events = None
+    return scoring_variance(section_dict['values'], section_dict['sum_sq'],
+                            events)
+
+
+def _stack_variance(variance_rows, value_rows):
+    """Stack the per-sample variances like :func:`_stack_rows`, or ``None``
+    when any sample with a grid lacks the ``total(val^2)`` column: a partly
+    measured noise model is not one the surrogate can use."""
+    if any(v is None and r is not None
+           for v, r in zip(variance_rows, value_rows)):
+        return None
+    if all(v is None for v in variance_rows):
+        return None
+    return _stack_rows(variance_rows)
+
+
 def _check_indices(indices, field):
     """Return the shared voxel index array, verifying every sample's grid uses
     the same voxel layout (a moving layout would break the PCA basis).
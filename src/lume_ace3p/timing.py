@@ -0,0 +1,167 @@
+"""Per-module timing and resource accounting for workflow evaluations.
+
+Nothing else says where an evaluation's time goes: Cubit and meshconvert, the
+solve, output parsing, acdtool, particle weighting, Geant4 and the field
+written beside the table all look the same from the mode. Every module's
+``run``, ``extract`` and ``field`` call therefore runs under
+:meth:`RunContext.measure <lume_ace3p.modules.RunContext.measure>`, which
+records on the context:
+
+``wall``
+    elapsed seconds (``time.perf_counter``);
+``child_cpu``
+    user + system CPU seconds of the child processes reaped during the call —
+    the Cubit / ACE3P / Geant4 executables;
+``peak_rss``
+    bytes: the larger of this process's and its largest child's peak
+    resident set size at the end of the call. It is a high-water mark, so a
+    call reports at least the peak of any call before it;
+``read_bytes`` / ``written_bytes``
+    block-level input/output of this process and its reaped children during
+    the call (``getrusage`` block counts × 512). Reads served from the page
+    cache are not counted.
+
+Enabled from the YAML with ``timing: true`` in ``workflow_parameters``; the
+table modes then add a ``timing_<module>_<phase>_<metric>`` column per
+measurement, the Xopt modes log the same columns beside the VOCS outputs, and
+:func:`~lume_ace3p.modes.run_mode` prints a per-module summary when it
+finishes. Measurement itself is always on and costs two ``getrusage`` calls.
+
+``getrusage`` is per process. The figures are exact for serial evaluations and
+for ``parallel: {workers: N}`` sweeps (each point runs alone in its worker
+process). Under the thread- or event-loop-concurrent drivers (``max_workers``
+in the Xopt modes, ``backend: async``) the CPU and I/O figures of overlapping
+calls include each other's work; wall time stays per call. ``resource`` does
+not exist on Windows, where only ``wall`` is recorded.
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:                     # Windows
+    resource = None
+
+TIMING_COLUMN_PREFIX = 'timing_'
+METRICS = ('wall', 'child_cpu', 'peak_rss', 'read_bytes', 'written_bytes')
+
+# Linux reports ru_maxrss in kilobytes, macOS in bytes.
+_RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+_BLOCK = 512
+
+
+def _snapshot():
+    """``(wall, child_cpu, blocks_in, blocks_out)`` counters now."""
+    if resource is None:
+        return time.perf_counter(), 0.0, 0, 0
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return (time.perf_counter(), children.ru_utime + children.ru_stime,
+            own.ru_inblock + children.ru_inblock,
+            own.ru_oublock + children.ru_oublock)
+
+
+def _peak_rss():
+    if resource is None:
+        return 0
+    return _RSS_UNIT * max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                           resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+
+@contextmanager
+def measure(record):
+    """Time the body and write its figures into the ``record`` mapping, even
+    when the body raises."""
+    start = _snapshot()
+    try:
+        yield record
+    finally:
+        end = _snapshot()
+        record.update(wall=end[0] - start[0], child_cpu=end[1] - start[1],
+                      peak_rss=_peak_rss(),
+                      read_bytes=_BLOCK * (end[2] - start[2]),
+                      written_bytes=_BLOCK * (end[3] - start[3]))
+
+
+def accumulate(total, record):
+    """Add ``record``'s figures onto ``total`` in place: wall, CPU and I/O
+    are summed, ``peak_rss`` keeps the maximum."""
+    for metric in METRICS:
+        if metric not in record:
+            continue
+        if metric == 'peak_rss':
+            total[metric] = max(total.get(metric, 0), record[metric])
+        else:
+            total[metric] = total.get(metric, 0) + record[metric]
+
+
+def timing_columns(timing):
+    """Flatten a :attr:`RunContext.timing` mapping, ``{module: {phase:
+    {metric: value}}}``, into ``{'timing_<module>_<phase>_<metric>': value}``
+    in measurement order."""
+    return {f'{TIMING_COLUMN_PREFIX}{module}_{phase}_{metric}': record[metric]
+            for module, phases in timing.items()
+            for phase, record in phases.items()
+            for metric in METRICS if metric in record}
+
+
+class TimingTotals:
+    """Running per-``(module, phase)`` totals across a mode's evaluations:
+    call count, summed wall / child CPU / I/O, and the largest ``peak_rss``.
+
+    Shared by every context a :class:`~lume_ace3p.workflow_graph.Workflow`
+    opens, so :meth:`add` takes a lock for the thread-pool drivers; a
+    process-pool worker's totals come back with each point and are folded in
+    with :meth:`merge`."""
+
+    def __init__(self):
+        self.totals = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'totals': self.totals}
+
+    def __setstate__(self, state):
+        self.totals = state['totals']
+        self._lock = threading.Lock()
+
+    def add(self, module, phase, record):
+        with self._lock:
+            total = self.totals.setdefault((module, phase), _empty_total())
+            total['calls'] += 1
+            accumulate(total, record)
+
+    def merge(self, other):
+        """Fold another :class:`TimingTotals` (a worker's) into this one."""
+        with self._lock:
+            for key, theirs in other.totals.items():
+                ours = self.totals.setdefault(key, _empty_total())
+                ours['calls'] += theirs['calls']
+                accumulate(ours, theirs)
+
+    def summary(self):
+        """A printable table, one line per ``module.phase`` in first-seen
+        order."""
+        if not self.totals:
+            return 'Timing: no module calls were measured.'
+        lines = ['Timing (module.phase: calls, wall, child CPU, peak RSS, '
+                 'read, written):']
+        for (module, phase), total in self.totals.items():
+            lines.append(
+                f"  {module}.{phase}: {total['calls']} call(s), "
+                f"{total['wall']:.3f} s wall, {total['child_cpu']:.3f} s CPU, "
+                f"{_megabytes(total['peak_rss'])} peak, "
+                f"{_megabytes(total['read_bytes'])} read, "
+                f"{_megabytes(total['written_bytes'])} written")
+        return '\n'.join(lines)
+
+
+def _empty_total():
+    return dict(dict.fromkeys(METRICS, 0), calls=0)
+
+
+def _megabytes(n):
+    return f'{n / 2 ** 20:.1f} MiB'
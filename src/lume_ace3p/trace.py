@@ -0,0 +1,193 @@
+"""Structured begin/end event stream for whole-campaign profiling.
+
+:mod:`lume_ace3p.timing` says how much time each module took in total; a
+trace says *when*. With ``trace: <file>`` in ``workflow_parameters`` every
+mode run, mode iteration (sweep point, Xopt candidate, training sample),
+workflow evaluation, module call (``run`` / ``extract`` / ``field``),
+subprocess launch and solver output parse writes a begin and an end event to
+``<file>`` as one JSON object per line::
+
+    workflow_parameters:
+      trace: campaign.trace.jsonl
+
+Each event has Chrome's trace-event fields — ``ph`` (``'B'`` / ``'E'``),
+``name``, ``cat``, ``ts`` (microseconds since the epoch), ``pid``, ``tid`` —
+plus an ``id`` pairing a begin with its end. Its ``args`` carry whatever the
+enclosing scopes set: the mode iteration's ``point`` index (the row's sweep
+index, Xopt candidate number or training-sample index) and the evaluation's
+``workdir``, so a slow span can be matched to its result row. The file is
+appended to, one ``os.write`` per event, so a resumed campaign extends the
+same timeline and the worker processes of a parallel sweep share it.
+
+:func:`to_chrome_trace` (also ``python -m lume_ace3p.trace in.jsonl
+out.json``) pairs the events into Chrome "complete" events for
+``chrome://tracing`` or Perfetto. Each mode iteration gets its own lane, so
+concurrent points do not overlap; a begin with no end (a killed job) is
+closed at the last timestamp and flagged ``unfinished``.
+
+Scopes travel in a :mod:`contextvars` variable: spans opened under
+``asyncio`` tasks or ``asyncio.to_thread`` keep their point and workdir, and
+the launchers and wrappers emit events without being handed anything.
+Without a ``trace:`` key nothing is written and a span costs one context
+lookup.
+"""
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# (tracer, {field: value}) of the innermost active scope.
+_SCOPE = contextvars.ContextVar('lume_ace3p_trace_scope', default=(None, {}))
+
+
+class Tracer:
+    """Append trace events to ``path``. The file descriptor is opened lazily
+    in each process (a pickled copy reopens it), so a tracer handed to a
+    worker process writes to the same file."""
+
+    def __init__(self, path):
+        self.path = os.path.abspath(os.path.expanduser(str(path)))
+        self._fd = None
+        self._pid = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, value):
+        """Build from a ``workflow_parameters.trace`` value: ``None`` (no
+        tracing) or a file path."""
+        if value is None or value is False:
+            return None
+        if not isinstance(value, (str, os.PathLike)) or not str(value):
+            raise ValueError(
+                f"Key: 'trace' must be a file path; got {value!r}.")
+        return cls(value)
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def emit(self, event):
+        """Write one event as a JSON line."""
+        line = (json.dumps(event, default=str) + '\n').encode()
+        with self._lock:
+            if self._fd is None or self._pid != os.getpid():
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._fd = os.open(self.path,
+                                   os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._pid = os.getpid()
+            os.write(self._fd, line)
+
+    def next_id(self):
+        return f'{os.getpid()}-{next(self._ids)}'
+
+
+@contextmanager
+def scope(tracer=None, **fields):
+    """Make ``tracer`` (or the enclosing one) current for the body, with
+    ``fields`` added to every event's ``args``. A no-op when there is no
+    tracer."""
+    current, outer = _SCOPE.get()
+    tracer = tracer or current
+    if tracer is None:
+        yield
+        return
+    token = _SCOPE.set((tracer, {**outer, **fields}))
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
+@contextmanager
+def span(name, cat, **args):
+    """Emit a begin event, run the body, and emit the matching end event
+    (also when the body raises), under the current :func:`scope`."""
+    tracer, fields = _SCOPE.get()
+    if tracer is None:
+        yield
+        return
+    event = {'name': name, 'cat': cat, 'pid': os.getpid(),
+             'tid': threading.get_ident(), 'id': tracer.next_id(),
+             'args': {**fields, **args}}
+    tracer.emit(dict(event, ph='B', ts=time.time_ns() // 1000))
+    try:
+        yield
+    finally:
+        tracer.emit(dict(event, ph='E', ts=time.time_ns() // 1000))
+
+
+@contextmanager
+def iteration(tracer, point, **args):
+    """One mode iteration: a :func:`scope` setting ``point`` around a
+    ``point`` span. ``tracer`` may be ``None`` (the enclosing one is used)."""
+    with scope(tracer, point=point), span('point', 'iteration', **args):
+        yield
+
+
+def read_events(path):
+    """The events of a JSONL trace, skipping a torn final line."""
+    events = []
+    with open(path) as f:
+        for line in f:
+            if not line.endswith('\n'):
+                break
+            events.append(json.loads(line))
+    return events
+
+
+def to_chrome_trace(path, output=None):
+    """Convert the JSONL trace at ``path`` to Chrome's trace-event format:
+    ``{'traceEvents': [...]}`` of complete (``'X'``) events with a duration,
+    plus a ``thread_name`` entry naming each lane. Events carrying a ``point``
+    are drawn on a lane per point (``tid`` = ``'point <n>'``); the rest keep
+    their thread. Written to ``output`` as JSON when given; returned either
+    way."""
+    events = read_events(path)
+    last = max((e['ts'] for e in events), default=0)
+    ends = {e['id']: e for e in events if e.get('ph') == 'E'}
+    complete, lanes = [], {}
+    for begin in events:
+        if begin.get('ph') != 'B':
+            continue
+        end = ends.get(begin['id'])
+        args = dict(begin.get('args', {}))
+        if end is None:
+            args['unfinished'] = True
+        lane = (f"point {args['point']}" if 'point' in args
+                else f"thread {begin['tid']}")
+        tid = lanes.setdefault((begin['pid'], lane), len(lanes) + 1)
+        complete.append({'name': begin['name'], 'cat': begin['cat'],
+                         'ph': 'X', 'ts': begin['ts'],
+                         'dur': (end['ts'] if end else last) - begin['ts'],
+                         'pid': begin['pid'], 'tid': tid, 'args': args})
+    names = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+              'args': {'name': lane}}
+             for (pid, lane), tid in lanes.items()]
+    trace = {'traceEvents': names + complete, 'displayTimeUnit': 'ms'}
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(trace, f)
+    return trace
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='python -m lume_ace3p.trace',
+        description='Convert a lume-ace3p JSONL trace to Chrome trace format.')
+    parser.add_argument('trace', help='JSONL trace written by trace: <file>')
+    parser.add_argument('output', help='Chrome trace JSON to write')
+    args = parser.parse_args(argv)
+    trace = to_chrome_trace(args.trace, args.output)
+    print(f"Wrote {len(trace['traceEvents'])} event(s) to {args.output}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -27,17 +27,54 @@ Design notes
 * **Decoupled from modes.** :meth:`Workflow.evaluate` runs the chain once for one
   input point and returns the structured output dict. Sweep / Xopt loops (the
   mode layer) are Phase 3+; they call ``evaluate``/``sweep_axes`` from outside.
+* **Reentrant evaluation.** Everything one evaluation produces — artifacts,
+  outputs, and each module's per-run tool handle (``RunContext.handles``) —
+  lives on that evaluation's :class:`RunContext`, never on the modules, and
+  ``evaluate`` returns it bundled in an :class:`Evaluation`. Two evaluations in
+  flight through one :class:`Workflow` therefore cannot see each other's
+  results; ``Workflow.last_context``/``workdir``/``field()`` remain only as a
+  convenience for serial callers.
+* **Incremental re-execution.** With ``incremental: true`` in
+  ``workflow_parameters``, consecutive evaluations in the *same* workdir re-run
+  only what an input change can reach. Each module is fingerprinted over its
+  config, the bytes of the files it names and the input buckets it
+  ``consumes`` (:func:`lume_ace3p.cache.module_fingerprint`); a module re-runs
+  when its fingerprint changed or a producer of one of its ``requires`` re-ran,
+  and a module that rewrites its producer's output in place (``mutates``)
+  drags that producer along. Everything else is carried over from the previous
+  run's context — its artifacts, job names, re-parse hooks and handle — and
+  flagged in ``RunContext.reused``. Those point into the previous workdir,
+  so nothing is carried into a different one: with ``workdir_mode: auto``
+  (one workdir per sweep point) only a repeated point is reused, and the
+  workflow warns when built that way. A particles-only change in
+  ``track3p_source -> particles -> geant4`` therefore leaves the Track3P dump
+  alone, and editing only the ``.rfpost`` re-runs ``acdtool`` but not
+  Omega3P.
+* **Instrumented calls.** Each module's ``run``, ``extract`` and ``field``
+  call runs under :meth:`RunContext.measure`, so ``RunContext.timing`` says
+  where the evaluation's time, CPU, memory and I/O went (see
+  :mod:`lume_ace3p.timing`). ``timing: true`` in ``workflow_parameters`` puts
+  those figures in the mode's result table and prints their totals, and
+  ``trace: <file>`` streams each call's begin/end events to a timeline (see
+  :mod:`lume_ace3p.trace`).
 """
 
 import os
+import warnings
 
 import numpy as np
 
+from lume_ace3p.cache import (
+    EvaluationCache, MeshCache, evaluation_key, module_fingerprint,
+)
 from lume_ace3p.modules import (
     Geant4Module, RunContext, acdtool_spec, build_module, STAGE_MODES, T3PModule,
 )
 from lume_ace3p.inputs import WorkflowInputs
+from lume_ace3p.launchers import build_launcher
 from lume_ace3p.paths import resolve_paths
+from lume_ace3p import trace
+from lume_ace3p.timing import TimingTotals
 
 
 class WorkflowValidationError(ValueError):
@@ -135,7 +172,8 @@ def _resolve_order(modules):
     """Validate the module list and return it topologically ordered.
 
     Raises :class:`WorkflowValidationError` (with the offending artifact/module
-    named) on a duplicate producer, an unmet requirement, or a cycle."""
+    named) on a duplicate producer, a duplicate module name, an unmet
+    requirement, or a cycle."""
     if not modules:
         raise WorkflowValidationError('workflow contains no modules.')
 
@@ -152,6 +190,16 @@ def _resolve_order(modules):
                     f"only one source for each artifact.")
             producer[kind] = i
 
+    # Per-run handles are keyed by module name on the RunContext, so two modules
+    # sharing one would read each other's results.
+    names = set()
+    for m in modules:
+        if m.name in names:
+            raise WorkflowValidationError(
+                f"more than one module is named '{m.name}'; give each a "
+                f"distinct 'name:'.")
+        names.add(m.name)
+
     # Every requirement must have a producer somewhere in the list.
     for m in modules:
         for kind in m.requires:
@@ -181,6 +229,79 @@ def _resolve_order(modules):
     return [modules[i] for i in ordered]
 
 
+class Evaluation(dict):
+    """The self-contained result of one :meth:`Workflow.evaluate`.
+
+    It *is* the ``{output_name: extracted_value}`` dict ``evaluate`` has always
+    returned, so existing callers index it unchanged, and it also carries
+    everything else about the run:
+
+    ``context``
+        the populated :class:`RunContext` (artifacts, per-module handles),
+    ``workdir``
+        the directory the chain ran in,
+    ``outputs``
+        the extracted outputs as a plain dict,
+    ``field_index`` / ``field``
+        the run's shared index and structured field — see
+        :meth:`Workflow.field_index` / :meth:`Workflow.field`. Both are read from
+        ``context`` on first access and cached, so a caller that never asks for
+        the (potentially large) field never parses it.
+    ``from_cache``
+        ``True`` when the result was served by the workflow's evaluation cache
+        (see :mod:`lume_ace3p.cache`) rather than by running the chain.
+
+    Nothing here refers back to mutable workflow state, so results of
+    concurrent evaluations stay independent."""
+
+    def __init__(self, outputs, context, modules):
+        super().__init__(outputs)
+        self.context = context
+        self.workdir = context.workdir
+        self._modules = tuple(modules)
+        self._memo = {}
+        self.from_cache = False
+
+    @classmethod
+    def restored(cls, cached, context):
+        """An Evaluation rebuilt from a cache hit: no modules to ask, so the
+        stored field index and field are preset."""
+        result = cls(cached.outputs, context, ())
+        result._memo = {'field_index': cached.field_index,
+                         'field': cached.field}
+        result.from_cache = True
+        return result
+
+    @property
+    def outputs(self):
+        return dict(self)
+
+    @property
+    def field_index(self):
+        if 'field_index' not in self._memo:
+            self._memo['field_index'] = self._first('field_index')
+        return self._memo['field_index']
+
+    @property
+    def field(self):
+        if 'field' not in self._memo:
+            self._memo['field'] = self._first('field')
+        return self._memo['field']
+
+    def _first(self, seam):
+        """The first non-``None`` answer to ``module.<seam>(context)`` in
+        resolved DAG order."""
+        for module in self._modules:
+            if seam == 'field':
+                with self.context.measure(module.name, 'field'):
+                    value = module.field(self.context)
+            else:
+                value = getattr(module, seam)(self.context)
+            if value is not None:
+                return value
+        return None
+
+
 class Workflow:
     """A validated, ordered chain of modules with a single ``evaluate`` seam.
 
@@ -207,8 +328,30 @@ class Workflow:
         self.baseworkdir = self.workflow_params.get('workdir', os.getcwd())
         self.paths = resolve_paths(self.workflow_params.get('paths'))
         self.dry_run = self._resolve_dry_run()
+        self.cache = EvaluationCache.from_config(self.workflow_params.get('cache'))
+        self.mesh_cache = MeshCache.from_config(
+            self.workflow_params.get('mesh_cache'))
+        self.launcher = build_launcher(self.workflow_params.get('launcher'))
+        self.incremental = bool(self.workflow_params.get('incremental', False))
+        if self.incremental and self.workdir_mode == 'auto':
+            warnings.warn(
+                "Key: 'incremental' only carries a module over from the "
+                "previous evaluation in the same workdir, and with "
+                "workdir_mode 'auto' every sweep point gets its own; only a "
+                "repeat of the same point will reuse anything. Use "
+                "workdir_mode 'manual' to re-run just what changed between "
+                "points.", stacklevel=2)
+        # Per-call measurements are always taken (RunContext.measure); 'timing'
+        # only decides whether they reach the result tables and the summary.
+        self.timing = bool(self.workflow_params.get('timing', False))
+        self.timing_totals = TimingTotals()
+        self.tracer = trace.Tracer.from_config(self.workflow_params.get('trace'))
+        # (context, {module name: fingerprint}) of the last completed run, the
+        # baseline an incremental evaluation diffs against.
+        self._previous = None
         self.workdir = None
         self.last_context = None
+        self.last_evaluation = None
 
     # ---- construction ----------------------------------------------------
 
@@ -268,7 +411,7 @@ class Workflow:
 
     # ---- the single seam the modes call ----------------------------------
 
-    def evaluate(self, input_scalars=None):
+    def evaluate(self, input_scalars=None, workdir=None):
         """Run the ordered module chain once for one input point.
 
         ``input_scalars`` selects the input point:
@@ -278,25 +421,171 @@ class Workflow:
           * a mapping — treated as cubit-parameter overrides (the shape Xopt's
             objective function passes).
 
-        Returns ``{output_name: extracted_value}`` for the ``output_parameters``
-        spec. The populated :class:`RunContext` is kept on ``self.last_context``
-        so callers can reach ``artifacts``/``outputs`` after the run."""
+        ``workdir`` runs the point in that directory instead of the one
+        ``workdir_mode`` would pick — how a caller that names its own
+        per-sample directories (``collect_training_data``) keeps concurrent
+        evaluations apart without mutating the workflow.
+
+        Returns an :class:`Evaluation` — the ``{output_name: extracted_value}``
+        dict for the ``output_parameters`` spec, also carrying the run's
+        :class:`RunContext`, workdir, field index and field. The evaluation
+        itself touches no workflow or module state, so concurrent calls are
+        safe as long as their workdirs differ. Afterwards the result is also
+        recorded on ``self.last_evaluation`` (and its context and workdir on
+        ``self.last_context`` / ``self.workdir``) for serial callers; those
+        attributes are last-writer-wins under concurrency.
+
+        With a ``cache:`` block in ``workflow_parameters`` an input point that
+        was already evaluated (same inputs, module configs and input-file bytes)
+        is served from :attr:`cache` without running any module; the returned
+        :class:`Evaluation` then has ``from_cache`` set.
+
+        With ``incremental: true`` only the modules an input change reaches
+        re-run (see the module docstring); ``result.context.reused`` says which
+        were carried over. A cache hit runs nothing and flags every module.
+
+        With ``trace: <file>`` the evaluation and each module call inside it
+        are written to the trace, tagged with the workdir (see
+        :mod:`lume_ace3p.trace`)."""
+        ctx, key, cached = self._begin(input_scalars, workdir)
+        with trace.scope(self.tracer, workdir=ctx.workdir), \
+                trace.span('evaluate', 'evaluation', cached=cached is not None):
+            if cached is not None:
+                result = self._restore(ctx, cached)
+            else:
+                result = self._run_chain(ctx)
+            return self._record(ctx, result, key)
+
+    async def evaluate_async(self, input_scalars=None, workdir=None):
+        """Awaitable :meth:`evaluate`: each module's :meth:`run_async
+        <lume_ace3p.modules.Module.run_async>` is awaited in turn, so with a
+        ``launcher:`` in ``workflow_parameters`` the solves of many concurrent
+        evaluations (distinct workdirs) are in flight on one event loop."""
+        ctx, key, cached = self._begin(input_scalars, workdir)
+        with trace.scope(self.tracer, workdir=ctx.workdir), \
+                trace.span('evaluate', 'evaluation', cached=cached is not None):
+            if cached is not None:
+                result = self._restore(ctx, cached)
+            else:
+                steps, prints = self._plan(ctx)
+                for module, previous in steps:
+                    if previous is None:
+                        with ctx.measure(module.name, 'run'):
+                            await module.run_async(ctx)
+                    self._step_done(module, previous, ctx)
+                result = self._conclude(ctx, prints)
+            return self._record(ctx, result, key)
+
+    # ---- the pieces both evaluate paths share ----------------------------
+
+    def _begin(self, input_scalars, workdir=None):
+        """Materialize the point, open its context, and look it up in the
+        evaluation cache: ``(ctx, cache key or None, cached or None)``."""
         inputs, sweep_scalars = self._materialize(input_scalars)
-        self.workdir = self._getworkdir(inputs, sweep_scalars)
-        ctx = RunContext(self.workdir, inputs=inputs, dry_run=self.dry_run,
-                         paths=self.paths, stage_mode=self.stage_mode)
+        if workdir is None:
+            workdir = self._getworkdir(inputs, sweep_scalars)
+        ctx = RunContext(workdir, inputs=inputs, dry_run=self.dry_run,
+                         paths=self.paths, stage_mode=self.stage_mode,
+                         mesh_cache=self.mesh_cache, launcher=self.launcher,
+                         timing_totals=self.timing_totals)
         ctx.ensure_workdir()
 
-        for module in self.modules:
-            module.run(ctx)
-
+        key = cached = None
+        if self.cache is not None:
+            key = evaluation_key(self.modules, inputs, self.output_spec,
+                                 self.dry_run)
+            cached = self.cache.load(key)
+        return ctx, key, cached
+
+    def _restore(self, ctx, cached):
+        ctx.outputs = dict(cached.outputs)
+        ctx.reused = {module.name: True for module in self.modules}
+        return Evaluation.restored(cached, ctx)
+
+    def _record(self, ctx, result, key):
+        """Store a fresh result in the cache and note it as the latest run."""
+        if key is not None and not result.from_cache:
+            self.cache.store(key, result.outputs, result.field_index,
+                             result.field)
+        self.workdir = ctx.workdir
+        self.last_context = ctx
+        self.last_evaluation = result
+        return result
+
+    def _run_chain(self, ctx):
+        """Run every module against ``ctx`` (carrying over the ones an
+        incremental evaluation may reuse) and extract the declared outputs."""
+        steps, prints = self._plan(ctx)
+        for module, previous in steps:
+            if previous is None:
+                with ctx.measure(module.name, 'run'):
+                    module.run(ctx)
+            self._step_done(module, previous, ctx)
+        return self._conclude(ctx, prints)
+
+    def _plan(self, ctx):
+        """``([(module, previous context or None)], fingerprints)``: each module
+        in DAG order, paired with the context to carry it over from when an
+        incremental evaluation can reuse it (``None``: run it)."""
+        if not self.incremental:
+            return [(module, None) for module in self.modules], None
+        prints = {module.name: module_fingerprint(module, ctx.inputs)
+                  for module in self.modules}
+        reuse = self._reusable(ctx, prints)
+        # The workdir is about to change under the baseline; should this run
+        # fail part-way, the next one must not trust it.
+        previous, self._previous = self._previous, None
+        return [(module, previous[0] if module.name in reuse else None)
+                for module in self.modules], prints
+
+    @staticmethod
+    def _step_done(module, previous, ctx):
+        if previous is not None:
+            _carry_over(module, previous, ctx)
+        ctx.reused[module.name] = previous is not None
+
+    def _conclude(self, ctx, prints):
+        """Remember the run as the incremental baseline and extract the
+        declared outputs into an :class:`Evaluation`."""
+        if self.incremental:
+            self._previous = (ctx, prints)
         outputs = {}
         for name, spec in self.output_spec.items():
             module, cleaned = self._route_output(name, spec)
-            outputs[name] = module.extract(ctx, cleaned)
+            with ctx.measure(module.name, 'extract'):
+                outputs[name] = module.extract(ctx, cleaned)
         ctx.outputs = outputs
-        self.last_context = ctx
-        return outputs
+        return Evaluation(outputs, ctx, self.modules)
+
+    def _reusable(self, ctx, prints):
+        """Names of the modules whose previous run ``ctx`` can carry over, given
+        this run's fingerprints ``prints``. Nothing is reusable without a
+        previous run in the same workdir and dry-run state."""
+        if self._previous is None:
+            return set()
+        previous, previous_prints = self._previous
+        if (os.path.abspath(previous.workdir) != os.path.abspath(ctx.workdir)
+                or previous.dry_run != ctx.dry_run):
+            return set()
+        rerun = {name for name, digest in prints.items()
+                 if previous_prints.get(name) != digest}
+        producer = {kind: module.name for module in self.modules
+                    for kind in module.provides}
+        grew = True
+        while grew:
+            grew = False
+            for module in self.modules:          # DAG order: one pass downstream
+                if module.name in rerun:
+                    needed = {producer[kind] for kind in module.mutates
+                              if kind in producer}
+                else:
+                    needed = ({module.name} if any(producer.get(kind) in rerun
+                                                   for kind in module.requires)
+                              else set())
+                if needed - rerun:
+                    rerun |= needed
+                    grew = True
+        return {module.name for module in self.modules} - rerun
 
     def sweep_axes(self):
         """Delegate to the input model — the swept axes a mode iterates over."""
@@ -315,29 +604,23 @@ class Workflow:
         module exposes one. Scans all modules — the field index is a property of
         the solver in the chain, independent of which ``output_parameters`` were
         requested (so an S3P sweep with no declared outputs still goes
-        long-format). Reads from ``self.last_context``."""
-        if self.last_context is None:
+        long-format). Reads from ``self.last_evaluation``; a concurrent caller
+        asks its own :attr:`Evaluation.field_index` instead."""
+        if self.last_evaluation is None:
             return None
-        for module in self.modules:
-            idx = module.field_index(self.last_context)
-            if idx is not None:
-                return idx
-        return None
+        return self.last_evaluation.field_index
 
     def field(self):
         """Return the structured *field* output of the just-run evaluation
         (:meth:`Module.field`), or ``None`` if no module in the chain produces
         one. Scans the modules like :meth:`field_index`; reads from
-        ``self.last_context``. The mode layer persists this per row as a field
-        artifact (see :mod:`lume_ace3p.results`) — the hybrid model's structured
-        half — instead of flattening it into the scalar table."""
-        if self.last_context is None:
+        ``self.last_evaluation`` (:attr:`Evaluation.field` for a concurrent
+        caller). The mode layer persists this per row as a field artifact (see
+        :mod:`lume_ace3p.results`) — the hybrid model's structured half —
+        instead of flattening it into the scalar table."""
+        if self.last_evaluation is None:
             return None
-        for module in self.modules:
-            fld = module.field(self.last_context)
-            if fld is not None:
-                return fld
-        return None
+        return self.last_evaluation.field
 
     # ---- helpers ---------------------------------------------------------
 
@@ -372,6 +655,19 @@ class Workflow:
         return candidates[-1], cleaned
 
 
+def _carry_over(module, previous, ctx):
+    """Copy what ``module`` left on the ``previous`` context — the artifacts it
+    provides, their job names and re-parse hooks, and its handle — onto
+    ``ctx`` in place of running it."""
+    for kind in module.provides:
+        for table in ('artifacts', 'job_names', 'reparse'):
+            source = getattr(previous, table)
+            if kind in source:
+                getattr(ctx, table)[kind] = source[kind]
+    if module.name in previous.handles:
+        ctx.handles[module.name] = previous.handles[module.name]
+
+
 def _build_entry(entry):
     """Instantiate one ``workflow:`` list entry into a Module.
 
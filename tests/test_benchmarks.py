@@ -0,0 +1,111 @@
+"""Tests for the benchmarks under ``benchmarks/``.
+
+* Every synthetic generator writes a file its parser reads back whole, at the
+  row count the generator reports.
+* ``bench_parsers.run`` records throughput and peak memory per case;
+  ``compare`` flags a slowdown or memory growth beyond the tolerance and
+  nothing within it.
+* The stand-in executables run a real (non-dry) sweep whose table holds the
+  values of the frozen outputs they copy, and the orchestration benchmark reads
+  per-point overhead from its trace.
+"""
+
+import copy
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'benchmarks'))
+
+import bench_orchestration  # noqa: E402
+import bench_parsers  # noqa: E402
+import fake_tools  # noqa: E402
+import synthetic  # noqa: E402
+
+SCALE = 0.001
+
+
+@pytest.fixture(scope='module')
+def report(tmp_path_factory):
+    return bench_parsers.run(data_dir=str(tmp_path_factory.mktemp('data')),
+                             scale=SCALE, repeat=1)
+
+
+def test_generated_files_parse_at_the_reported_size(tmp_path):
+    parsed = {}
+    for name, parser in bench_parsers.CASES.items():
+        path, rows = synthetic.generate(name, str(tmp_path / name), scale=SCALE)
+        parsed[name] = (parser(path), rows)
+
+    index_map, frequency, columns = parsed['s3p_sparameter'][0]
+    assert len(index_map) == 4 and len(columns) == 16
+    assert len(frequency) == parsed['s3p_sparameter'][1]
+    assert np.iscomplexobj(columns['S(3,3)'])
+    _, frequency, columns = parsed['s3p_reflection'][0]
+    assert len(columns['S(0,1)']) == len(frequency) == 20
+
+    point, rows = parsed['t3p_point']
+    assert list(point) == ['t', 'Hx', 'Hy', 'Hz', 'Ex', 'Ey', 'Ez']
+    assert len(point['Ez']) == rows == 1000
+    wake, rows = parsed['t3p_wakefield']
+    assert wake['WakeType'] == 'transverse' and len(wake['W']) == rows
+
+    assert parsed['t3p_echo'][0] == [('Point', 'point'),
+                                     ('WakeField', 'wakefield')]
+    modes, rows = parsed['rfpost_modes']
+    assert len(modes['ModeIDs']) == rows == 100
+    assert set(modes['99']) == {'Frequency', 'Qext', 'V_r', 'V_i', 'absV',
+                                'RoQ'}
+    dose, rows = parsed['dose']
+    assert dose['indices'].shape == (rows, 3) and rows == 1000
+
+
+def test_run_records_throughput_and_compare_flags_regressions(report):
+    assert list(report['results']) == list(bench_parsers.CASES)
+    for record in report['results'].values():
+        assert record['mb_per_s'] > 0 and record['rows_per_s'] > 0
+        assert record['peak_mib'] > 0
+    assert bench_parsers.compare(report, report) == []
+
+    slower = copy.deepcopy(report)
+    slower['results']['dose']['mb_per_s'] *= 0.5
+    slower['results']['t3p_point']['peak_mib'] *= 1.1
+    assert [name for name, _ in bench_parsers.compare(report, slower)] == [
+        'dose']
+    assert [name for name, _ in
+            bench_parsers.compare(report, slower, tolerance=0.05)] == [
+        't3p_point', 'dose']
+
+
+def test_unknown_case_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="'nope'"):
+        bench_parsers.run(['nope'], data_dir=str(tmp_path))
+
+
+def test_stand_in_tools_drive_a_real_sweep_and_report_overhead(tmp_path):
+    report = bench_orchestration.run(['single', 'parameter_sweep'], points=2,
+                                     delay=0.05, run_dir=str(tmp_path))
+    for figures in report['results'].values():
+        assert figures['points'] == 2
+        assert 0 < figures['overhead_ms'] <= figures['overhead_max_ms']
+        assert figures['tool_s'] >= 2 * 0.05
+        assert figures['wall_s'] > figures['tool_s'] / 2
+
+    table = pd.read_csv(tmp_path / 'parameter_sweep' / 's3p_sweep'
+                        / 's3p_sweep_output.txt', sep='\t')
+    assert list(table['cornercut'].unique()) == [12.0, 16.0]
+    # The first row of the frozen s3p_90DegreeBend Reflection.out.
+    assert table['S11'].iloc[0] == pytest.approx(3.23077414e-02)
+    # Real runs, not dry ones: Cubit's export and meshconvert's output exist.
+    workdir = tmp_path / 'parameter_sweep' / 's3p_sweep' / 'workdir_12.0'
+    assert {'bend-90degree.gen', 'bend-90degree.ncdf'} <= set(
+        os.listdir(workdir))
+
+
+def test_install_rejects_an_unknown_tool(tmp_path):
+    with pytest.raises(ValueError, match='track3p'):
+        fake_tools.install(str(tmp_path), delays={'track3p': 1.0})
@@ -0,0 +1,131 @@
+"""Tests for the content-addressed evaluation cache (:mod:`lume_ace3p.cache`).
+
+* A revisited input point is served from the cache — outputs, field index and
+  field — without running the chain, and the hit/miss counters say so.
+* The key covers the bytes of referenced input files, so editing one misses.
+* Entries round-trip every output shape the modules produce, and size-bounded
+  eviction drops the least recently used entry first.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from lume_ace3p.cache import EvaluationCache, evaluation_key
+from lume_ace3p.inputs import WorkflowInputs
+from lume_ace3p.modes import run_mode
+from lume_ace3p.modules import build_module
+from lume_ace3p.workflow_graph import Workflow
+
+
+def _s3p_workflow(tmp_path, cache):
+    """cubit -> s3p, dry-run, with the journal and solver input as real files so
+    their bytes feed the cache key."""
+    jou = tmp_path / 'x.jou'
+    s3p = tmp_path / 'x.s3p'
+    if not jou.exists():
+        jou.write_text('create brick x 1\n')
+        s3p.write_text('ModelInfo: {}\n')
+    entries = [{'module': 'cubit', 'journal': str(jou)},
+               {'module': 's3p', 'input': str(s3p)}]
+    return Workflow(entries,
+                    workflow_params={'workdir': str(tmp_path / 'wd'),
+                                     'workdir_mode': 'auto', 'dry_run': True,
+                                     'cache': cache},
+                    inputs=WorkflowInputs(cubit={'r': np.array([1.0, 2.0])}),
+                    output_spec={'refl': {'module': 's3p',
+                                          'quantity': 'S(0,0)'}})
+
+
+def test_revisited_point_is_served_from_the_cache(tmp_path):
+    wf = _s3p_workflow(tmp_path, {'dir': str(tmp_path / 'cache')})
+    first = wf.evaluate([1.0])
+    again = wf.evaluate([1.0])
+    other = wf.evaluate([2.0])
+
+    assert not first.from_cache
+    assert again.from_cache
+    assert not other.from_cache
+    assert (wf.cache.hits, wf.cache.misses) == (1, 2)
+    assert np.isnan(again['refl']).all()
+    label, values = again.field_index
+    assert label == 'Frequency' and list(values) == [0.0]
+    # A hit runs no module, so no per-run handle was recorded.
+    assert again.context.handles == {}
+
+    # A fresh Workflow over the same directory shares the stored entries.
+    assert _s3p_workflow(tmp_path, str(tmp_path / 'cache')).evaluate(
+        [2.0]).from_cache
+
+
+def test_editing_a_referenced_input_file_misses(tmp_path):
+    wf = _s3p_workflow(tmp_path, {'dir': str(tmp_path / 'cache')})
+    wf.evaluate([1.0])
+    (tmp_path / 'x.s3p').write_text('ModelInfo: {Mesh: other.ncdf}\n')
+    assert not wf.evaluate([1.0]).from_cache
+    assert wf.cache.misses == 2
+
+
+def test_key_depends_on_inputs_and_config(tmp_path):
+    modules = [build_module('cubit', {'journal': 'x.jou'})]
+    base = evaluation_key(modules, WorkflowInputs(cubit={'r': 1.0}))
+    assert base == evaluation_key(modules, WorkflowInputs(cubit={'r': 1.0}))
+    assert base != evaluation_key(modules, WorkflowInputs(cubit={'r': 2.0}))
+    assert base != evaluation_key(
+        [build_module('cubit', {'journal': 'x.jou', 'meshconvert': False})],
+        WorkflowInputs(cubit={'r': 1.0}))
+    assert base != evaluation_key(modules, WorkflowInputs(cubit={'r': 1.0}),
+                                  dry_run=True)
+
+
+def test_entry_round_trips_every_output_shape(tmp_path):
+    cache = EvaluationCache(str(tmp_path / 'cache'))
+    outputs = {'total': 3.5, 'count': 7, 'peak_index': (1, 2, 3),
+               'spectrum': np.array([0.1, 0.2]), 'missing': float('nan')}
+    field = {'dose': {'indices': [[0, 0, 0]], 'values': [1.0]},
+             'W': np.array([1.0, 2.0])}
+    cache.store('ab' * 32, outputs, ('s', np.array([0.0, 0.1])), field)
+
+    hit = cache.load('ab' * 32)
+    assert hit.outputs['total'] == 3.5
+    assert hit.outputs['count'] == 7
+    assert hit.outputs['peak_index'] == (1, 2, 3)
+    assert np.allclose(hit.outputs['spectrum'], [0.1, 0.2])
+    assert np.isnan(hit.outputs['missing'])
+    assert hit.field_index[0] == 's'
+    assert np.allclose(hit.field_index[1], [0.0, 0.1])
+    assert np.allclose(hit.field['dose']['values'], [1.0])
+    assert np.allclose(hit.field['W'], [1.0, 2.0])
+    assert cache.load('cd' * 32) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    cache = EvaluationCache(str(tmp_path / 'cache'))
+    big = {'v': np.zeros(4096)}                    # ~32 kB per entry
+    for i, key in enumerate(('a' * 64, 'b' * 64, 'c' * 64)):
+        cache.store(key, big)
+        os.utime(cache._entry(key), (1000.0 + i, 1000.0 + i))
+    cache.load('a' * 64)                           # now the most recent
+
+    cache.max_bytes = 80 * 1024                    # room for two entries
+    assert cache.evict() == 1
+    assert cache.load('b' * 64) is None            # the oldest went first
+    assert cache.load('a' * 64) is not None
+    assert cache.load('c' * 64) is not None
+
+
+def test_bad_cache_block_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="'dir'"):
+        _s3p_workflow(tmp_path, {'max_gb': 1})
+    with pytest.raises(ValueError, match='unknown keys'):
+        _s3p_workflow(tmp_path, {'dir': 'c', 'size': 1})
+
+
+def test_run_mode_reports_hits_and_misses(tmp_path, capsys):
+    wf = _s3p_workflow(tmp_path, {'dir': str(tmp_path / 'cache')})
+    run_mode({'type': 'parameter_sweep'}, wf)
+    run_mode({'type': 'parameter_sweep'}, wf)
+    report = capsys.readouterr().out.strip().splitlines()
+    assert report[-1].endswith('2 hit(s), 2 miss(es).')
@@ -0,0 +1,74 @@
+"""Import footprint of the lume-ace3p entry points
+(``benchmarks/bench_imports.py``).
+
+Each statement runs in a fresh interpreter under ``python -X importtime``:
+
+* ``import lume_ace3p`` and the ``run-lume-ace3p`` module (all that
+  ``--version`` / ``--help`` load) import no numpy, pandas or tool wrapper;
+* the store-consuming path (``modes`` + ``load_yaml``) loads pandas but not
+  ``lume.base`` (and with it matplotlib and scipy), sklearn, torch or xopt;
+* the names ``lume_ace3p`` exports still resolve on first access.
+
+Which modules load does not depend on the machine, so it is checked here. The
+wall-clock budgets do, and would make the suite flaky on a loaded runner; they
+live in ``bench_imports.BUDGETS`` and are checked with
+``python benchmarks/bench_imports.py --check``.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'benchmarks'))
+
+import bench_imports  # noqa: E402
+
+WORKFLOW_ONLY = ('lume', 'matplotlib', 'scipy', 'sklearn', 'torch', 'xopt',
+                 'jax', 'joblib')
+
+# statement -> packages it must not load.
+FORBIDDEN = {
+    'import lume_ace3p': ('numpy', 'pandas') + WORKFLOW_ONLY,
+    'import lume_ace3p.run_lume_ace3p': ('numpy', 'pandas') + WORKFLOW_ONLY,
+    'import lume_ace3p.modes; from lume_ace3p.inputs import load_yaml':
+        WORKFLOW_ONLY,
+}
+
+
+@pytest.mark.parametrize('statement', list(FORBIDDEN))
+def test_entry_point_loads_no_heavy_package(statement):
+    modules = bench_imports.profile(statement)
+    assert modules, statement
+    assert [p for p in FORBIDDEN[statement]
+            if bench_imports.loaded(modules, p)] == [], bench_imports.report(
+        statement, modules)
+
+
+def test_every_checked_entry_point_has_a_budget():
+    assert set(bench_imports.BUDGETS) == set(FORBIDDEN)
+    modules = {'lume_ace3p': (0.5, 0.5), 'lume_ace3p.modes': (0.5, 0.5)}
+    assert bench_imports.over_budget('import lume_ace3p', modules) == 0.75
+    assert bench_imports.over_budget(
+        'import lume_ace3p.modes; from lume_ace3p.inputs import load_yaml',
+        modules) is None
+    assert bench_imports.over_budget('import os', modules) is None
+
+
+def test_workflow_import_still_loads_the_tool_wrappers():
+    modules = bench_imports.profile('import lume_ace3p.workflow_graph')
+    assert bench_imports.loaded(modules, 'lume.base')
+    assert bench_imports.loaded(modules, 'lume_ace3p.cubit')
+
+
+def test_package_exports_resolve_lazily():
+    import lume_ace3p
+    from lume_ace3p.ace3p import S3P
+    from lume_ace3p.results import load_field
+
+    assert lume_ace3p.S3P is S3P
+    assert lume_ace3p.load_field is load_field
+    assert {'Workflow', 'Geant4', '__version__'} <= set(dir(lume_ace3p))
+    with pytest.raises(AttributeError, match='no_such_name'):
+        lume_ace3p.no_such_name
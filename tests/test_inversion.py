@@ -110,6 +110,111 @@ def test_read_dose_file_missing_or_empty(tmp_path):
     assert surrogate_data.read_dose_file(str(empty)) is None
 
 
+# Every row shape the reference parser skips or keeps, in one file.
+_AWKWARD_DOSE = """\
+# mesh name: doseMesh
+  # iX, iY, iZ, total(value) [Gy], total(val^2), entry
+
+0,0,0,1.25e-09,1.5625e-18,3
+0 0 1 2.5 extra columns, ignored
+0 0 2
+0 0 0.5 7.0
+NA 0 3 1.0
+0 0 4 4.5 # trailing note
+0 0 5 6.5#glued
+1_0 , 0 , 6 , nan
+0 0 7 -inf
+0 0 8 1
+0 0 9 2.0 0.5 2 trailing
+0 0 10 3.0 0.5 2.0"""
+
+
+@pytest.mark.parametrize('chunk_bytes', [1, 16, 1 << 20])
+def test_read_dose_file_matches_reference_parser(tmp_path, chunk_bytes):
+    path = tmp_path / 'awkward.txt'
+    path.write_bytes(_AWKWARD_DOSE.encode())
+    indices, values, sum_sq, entries = zip(*surrogate_data._parse_dose_lines(
+        _AWKWARD_DOSE.splitlines()))
+    assert [i[2] for i in indices] == [0, 1, 4, 6, 7, 8, 9, 10]
+    # Only rows whose 5th / 6th fields parse as a float / an integer keep them.
+    assert list(entries) == [3, -1, -1, -1, -1, -1, 2, -1]
+    assert sum_sq[0] == 1.5625e-18 and sum_sq[6] == 0.5
+
+    chunks = list(surrogate_data.iter_dose_file(str(path), chunk_bytes))
+    for key, expected in (('indices', indices), ('values', values),
+                          ('sum_sq', sum_sq), ('entries', entries)):
+        assert np.array_equal(np.concatenate([c[key] for c in chunks]),
+                              expected, equal_nan=True), key
+    grid = surrogate_data.read_dose_file(str(path))
+    assert grid['indices'].dtype == np.int64 and grid['values'].dtype == float
+    assert np.array_equal(grid['values'], values, equal_nan=True)
+    assert np.array_equal(grid['sum_sq'], sum_sq, equal_nan=True)
+    assert grid['entries'].dtype == np.int64
+    assert np.array_equal(grid['entries'], entries)
+
+
+def test_read_dose_file_scorer_columns(tmp_path, monkeypatch):
+    """``sum_sq`` / ``entries`` come back for the six-column scorer dump (also
+    from the sidecar) and are absent for a plain four-column one."""
+    values = np.linspace(1.0, 2.0, _NZ)
+    plain = surrogate_data.read_dose_file(
+        _write_dose_file(tmp_path / 'plain.txt', values, VOXEL_INDICES))
+    assert set(plain) == {'indices', 'values'}
+
+    path = tmp_path / 'scorer.txt'
+    path.write_text('# iX, iY, iZ, total(value) [Gy], total(val^2), entry\n'
+                    + ''.join(f'0,0,{j},{v!r},{v * v / 4!r},{j + 1}\n'
+                              for j, v in enumerate(values.tolist())))
+    monkeypatch.setattr(surrogate_data, 'DOSE_CACHE_MIN_BYTES', 0)
+    for _ in range(2):  # parsed, then read from the sidecar
+        grid = surrogate_data.read_dose_file(str(path), cache=True)
+        assert np.array_equal(grid['values'], values)
+        assert np.array_equal(grid['sum_sq'], values * values / 4)
+        assert np.array_equal(grid['entries'], np.arange(1, _NZ + 1))
+    assert any(n.endswith('.dose.npy') for n in os.listdir(tmp_path))
+
+
+def test_read_dose_file_binary_sidecar(tmp_path, monkeypatch):
+    monkeypatch.setattr(surrogate_data, 'DOSE_CACHE_MIN_BYTES', 0)
+    values = np.linspace(1.0, 2.0, _NZ)
+    path = _write_dose_file(tmp_path / 'dose.txt', values, VOXEL_INDICES,
+                            comma=True)
+    first = surrogate_data.read_dose_file(path, cache=True)
+    sidecar, = [n for n in os.listdir(tmp_path) if n.endswith('.dose.npy')]
+    assert sidecar.startswith('.dose.txt.')
+
+    # The second read loads the sidecar instead of parsing, into arrays the
+    # caller owns.
+    def no_parse(*args):
+        raise AssertionError('parsed again')
+    monkeypatch.setattr(surrogate_data, '_iter_dose_records', no_parse)
+    again = surrogate_data.read_dose_file(path, cache=True)
+    assert np.array_equal(again['indices'], first['indices'])
+    assert np.array_equal(again['values'], values)
+    again['values'] *= 2
+    assert np.array_equal(surrogate_data.read_dose_file(path, cache=True)[
+        'values'], values)
+    monkeypatch.undo()
+    monkeypatch.setattr(surrogate_data, 'DOSE_CACHE_MIN_BYTES', 0)
+
+    # A rewritten source (new size / mtime) is parsed, and replaces the sidecar.
+    _write_dose_file(tmp_path / 'dose.txt', 2 * values, VOXEL_INDICES)
+    assert np.allclose(surrogate_data.read_dose_file(path, cache=True)[
+        'values'], 2 * values)
+    sidecars = [n for n in os.listdir(tmp_path) if n.endswith('.dose.npy')]
+    assert len(sidecars) == 1 and sidecars != [sidecar]
+
+    # write_dose_file drops the sidecar of the contents it replaces.
+    surrogate_data.write_dose_file(path, first)
+    assert not any(n.endswith('.dose.npy') for n in os.listdir(tmp_path))
+
+    # Reads leave no sidecar unless asked to (a target is read once).
+    other = _write_dose_file(tmp_path / 'other.txt', values, VOXEL_INDICES)
+    surrogate_data.read_dose_file(other)
+    surrogate_data.load_target_dose(other)
+    assert not any(n.startswith('.other.txt') for n in os.listdir(tmp_path))
+
+
 def test_align_reorders_shuffled_target(tmp_path):
     values = np.linspace(1.0, 2.0, _NZ)
     path = _write_dose_file(tmp_path / 'shuffled.txt', values, VOXEL_INDICES,
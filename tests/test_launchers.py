@@ -0,0 +1,268 @@
+"""Tests for the pluggable job launchers (:mod:`lume_ace3p.launchers`).
+
+* Each launcher runs a command in its workdir and reports the exit status; the
+  batch launcher goes through a stand-in ``sbatch`` and polls the sidecar. A
+  non-zero status from :func:`run_command` warns.
+* A batch job that leaves the queue without its sidecar, or outlives the
+  launcher's ``timeout``, raises rather than being polled forever.
+* The local stand-in scheduler never runs more than ``slots`` jobs at once,
+  even when driven from several threads.
+* A solver module awaited through a launcher still parses its output, and an
+  ``async`` sweep matches a serial one.
+* The Cubit and Geant4 modules await their jobs too, never parking a worker
+  thread on them.
+"""
+
+import asyncio
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from test_modules import S3P_REFLECTION, _stage_adaptive_geant4
+import fake_tools  # noqa: E402  (on sys.path once test_modules is imported)
+from lume_ace3p.inputs import WorkflowInputs
+from lume_ace3p.launchers import (
+    BatchLauncher, LocalLauncher, LocalSchedulerLauncher, build_launcher,
+    run_command, run_command_async,
+)
+from lume_ace3p.modes import run_mode
+from lume_ace3p.modules import (
+    DOSE_GRID, MESH, EM_SOLUTION, PARTICLE_SOURCE, CubitModule, Geant4Module,
+    RunContext, S3PModule,
+)
+from lume_ace3p.workflow_graph import Workflow
+
+
+def test_local_launcher_runs_in_the_workdir(tmp_path):
+    launcher = LocalLauncher()
+    assert launcher.run_sync('pwd > where.txt; exit 3', str(tmp_path)) == 3
+    assert (tmp_path / 'where.txt').read_text().strip() == str(tmp_path)
+
+
+def test_batch_launcher_submits_a_script_and_polls_its_status(tmp_path):
+    # A stand-in for 'sbatch --parsable': start the script, print a job id.
+    sbatch = tmp_path / 'fake_sbatch'
+    sbatch.write_text('#!/bin/bash\nbash "$1" > /dev/null 2>&1 &\n'
+                      'echo "4242;cluster"\n')
+    sbatch.chmod(0o755)
+    launcher = BatchLauncher(submit=str(sbatch), header=['#SBATCH -N 1'],
+                             poll_interval=0.05)
+
+    async def go():
+        job = await launcher.submit('echo done > out.txt', str(tmp_path))
+        return job, await launcher.wait(job)
+
+    job, returncode = asyncio.run(go())
+    assert (job.job_id, returncode) == ('4242', 0)
+    assert (tmp_path / 'out.txt').read_text() == 'done\n'
+    assert '#SBATCH -N 1' in open(job._script).read()
+
+    launcher.submit_command = 'false'
+    with pytest.raises(RuntimeError, match='submission'):
+        launcher.run_sync('true', str(tmp_path))
+
+
+def test_local_scheduler_bounds_concurrency(tmp_path):
+    launcher = LocalSchedulerLauncher(slots=2, poll_interval=0.02)
+    # Each job records how many jobs were running when it started.
+    command = ('touch running.$$; ls running.* | wc -l >> seen; sleep 0.2; '
+               'rm running.$$; exit {}')
+
+    async def go():
+        return await asyncio.gather(*(launcher.run(command.format(i),
+                                                   str(tmp_path))
+                                      for i in range(5)))
+
+    assert asyncio.run(go()) == [0, 1, 2, 3, 4]
+    seen = [int(n) for n in (tmp_path / 'seen').read_text().split()]
+    assert len(seen) == 5 and max(seen) <= 2
+
+
+def test_local_scheduler_is_shared_safely_across_threads(tmp_path):
+    """Blocking ``run_sync`` calls from worker threads (each on its own event
+    loop) draw unique job ids from one queue and still respect ``slots``."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    launcher = LocalSchedulerLauncher(slots=2, poll_interval=0.02)
+    command = ('touch running.$$; ls running.* | wc -l >> seen; sleep 0.1; '
+               'rm running.$$')
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        codes = list(pool.map(lambda _: launcher.run_sync(command,
+                                                          str(tmp_path)),
+                              range(6)))
+    assert codes == [0] * 6 and launcher._submitted == 6
+    assert len(list(tmp_path.glob('lume-ace3p-job-*.sh'))) == 6
+    seen = [int(n) for n in (tmp_path / 'seen').read_text().split()]
+    assert len(seen) == 6 and max(seen) <= 2
+
+
+def test_build_launcher_validates_the_block():
+    assert build_launcher(None) is None
+    assert isinstance(build_launcher('local'), LocalLauncher)
+    scheduler = build_launcher({'type': 'local_scheduler', 'slots': 3})
+    assert scheduler.slots == 3
+    with pytest.raises(ValueError, match="'type'"):
+        build_launcher({'type': 'pbs'})
+    with pytest.raises(ValueError, match='does not take'):
+        build_launcher({'type': 'local', 'slots': 2})
+    with pytest.raises(ValueError, match='slots'):
+        build_launcher({'type': 'local_scheduler', 'slots': 0})
+
+
+def test_run_command_without_a_launcher_blocks_on_subprocess(tmp_path,
+                                                           monkeypatch):
+    seen = []
+    monkeypatch.setattr('subprocess.run',
+                        lambda cmd, shell, cwd: seen.append((cmd, cwd)))
+    run_command('cubit x.jou', str(tmp_path))
+    assert seen == [('cubit x.jou', str(tmp_path))]
+
+
+def test_run_command_inside_a_running_event_loop(tmp_path):
+    """A synchronous wrapper run from a coroutine (a Jupyter cell) still
+    completes through its launcher instead of tripping asyncio.run."""
+    launcher = LocalSchedulerLauncher(poll_interval=0.02)
+
+    async def cell():
+        run_command('echo ok > out.txt', str(tmp_path), launcher)
+        return LocalLauncher().run_sync('exit 5', str(tmp_path))
+
+    assert asyncio.run(cell()) == 5
+    assert (tmp_path / 'out.txt').read_text() == 'ok\n'
+
+
+def test_run_command_warns_on_a_failed_launcher_job(tmp_path):
+    launcher = LocalSchedulerLauncher(poll_interval=0.02)
+    with pytest.warns(RuntimeWarning, match="'exit 3' exited with status 3"):
+        assert run_command('exit 3', str(tmp_path), launcher) == 3
+    with pytest.warns(RuntimeWarning, match='status 4'):
+        assert asyncio.run(run_command_async('exit 4', str(tmp_path))) == 4
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert run_command('true', str(tmp_path), launcher) == 0
+
+
+def test_solver_module_awaits_its_job_then_parses(tmp_path):
+    """``mpi: 'true'`` turns the solver line into a no-op job; the module
+    submits it through the scheduler, awaits it, then parses the results the
+    test left behind."""
+    workdir = tmp_path / 'wd'
+    (workdir / 's3p_results').mkdir(parents=True)
+    (workdir / 's3p_results' / 'Reflection.out').write_text(S3P_REFLECTION)
+    (tmp_path / 'x.s3p').write_text('ModelInfo: {}\n')
+    ctx = RunContext(str(workdir), artifacts={MESH: str(workdir / 'm.ncdf')},
+                     paths={'ace3p': '', 'mpi': 'true'},
+                     launcher=LocalSchedulerLauncher(poll_interval=0.02))
+    module = S3PModule({'input': str(tmp_path / 'x.s3p')})
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')       # no SParameter.out: magnitudes only
+        asyncio.run(module.run_async(ctx))
+
+    assert ctx.artifacts[EM_SOLUTION] == str(workdir)
+    assert len(module.field_index(ctx)[1]) == 3
+    assert list(workdir.glob('lume-ace3p-job-*.exit'))
+
+
+class _RecordingLauncher(LocalLauncher):
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    async def run(self, command, cwd):
+        self.commands.append(command)
+        return await super().run(command, cwd)
+
+
+def test_cubit_and_geant4_modules_await_their_jobs(tmp_path, monkeypatch):
+    async def no_thread(*args, **kwargs):
+        raise AssertionError('run_async fell back to a worker thread')
+
+    monkeypatch.setattr(asyncio, 'to_thread', no_thread)
+    paths = fake_tools.install(str(tmp_path / 'tools'))
+
+    (tmp_path / 'cav.jou').write_text('export genesis "cav.gen" overwrite\n')
+    launcher = _RecordingLauncher()
+    ctx = RunContext(str(tmp_path / 'cubit'), paths=paths, launcher=launcher)
+    asyncio.run(CubitModule({'journal': str(tmp_path / 'cav.jou')})
+                .run_async(ctx))
+    assert [c.split()[0].rsplit('/', 1)[-1] for c in launcher.commands] == [
+        'cubit', 'mpirun']
+    assert 'meshconvert' in launcher.commands[1]
+    assert ctx.artifacts[MESH].endswith('cav.gen')
+
+    for name, config in [('plain', {}), ('sharded', {'geant4_shards': 2})]:
+        input_path, psrc = _stage_adaptive_geant4(str(tmp_path / name))
+        launcher = _RecordingLauncher()
+        ctx = RunContext(str(tmp_path / name), inputs=WorkflowInputs(),
+                         artifacts={PARTICLE_SOURCE: psrc}, paths=paths,
+                         launcher=launcher)
+        module = Geant4Module(dict(config, geant4_input=input_path))
+        asyncio.run(module.run_async(ctx))
+        assert len(launcher.commands) == config.get('geant4_shards', 1)
+        assert DOSE_GRID in ctx.artifacts
+        assert module.field(ctx)['dose']['values'].size
+
+
+def test_async_sweep_matches_serial(tmp_path):
+    entries = [{'module': 'cubit', 'journal': 'x.jou'},
+               {'module': 's3p', 'input': 'x.s3p'}]
+
+    def build(name):
+        return Workflow(entries,
+                        workflow_params={'workdir': str(tmp_path / name),
+                                         'dry_run': True},
+                        inputs=WorkflowInputs(cubit={'r': np.array([1.0, 2.0,
+                                                                    3.0])}),
+                        output_spec={'refl': {'module': 's3p',
+                                              'quantity': 'S(0,0)'}})
+
+    serial = run_mode({'type': 'parameter_sweep'}, build('serial'))
+    concurrent = run_mode({'type': 'parameter_sweep',
+                           'parallel': {'workers': 2, 'backend': 'async'}},
+                          build('async'))
+    pd.testing.assert_frame_equal(concurrent, serial)
+    for r in ('1.0', '2.0', '3.0'):
+        assert os.path.isdir(tmp_path / f'async_{r}')
+    with pytest.raises(ValueError, match='backend'):
+        run_mode({'type': 'parameter_sweep',
+                  'parallel': {'workers': 2, 'backend': 'threads'}},
+                 build('bad'))
+
+
+def _sbatch_and_squeue(tmp_path, body):
+    """A stand-in 'sbatch' that runs ``body`` instead of the job script (so
+    the script never writes its sidecar) and a 'squeue' that reports the job
+    only while the ``queued`` file exists."""
+    sbatch = tmp_path / 'fake_sbatch'
+    sbatch.write_text(f'#!/bin/bash\n({body}) > /dev/null 2>&1 &\necho 7\n')
+    sbatch.chmod(0o755)
+    return str(sbatch), f'test -e {tmp_path}/queued && echo {{job_id}}'
+
+
+def test_batch_job_killed_by_the_scheduler_raises(tmp_path):
+    sbatch, squeue = _sbatch_and_squeue(
+        tmp_path, f'touch {tmp_path}/queued; sleep 0.2; rm {tmp_path}/queued')
+    launcher = BatchLauncher(submit=sbatch, status=squeue, poll_interval=0.05)
+    with pytest.raises(RuntimeError, match='batch job 7 left the queue'):
+        launcher.run_sync('true', str(tmp_path))
+
+    # The status check defaults on for sbatch only.
+    assert BatchLauncher().status_command == 'squeue -h -j {job_id}'
+    assert BatchLauncher(submit='qsub').status_command is None
+
+
+def test_batch_and_local_scheduler_timeouts(tmp_path):
+    sbatch, _ = _sbatch_and_squeue(tmp_path, 'true')
+    launcher = BatchLauncher(submit=sbatch, poll_interval=0.05, timeout=0.2)
+    with pytest.raises(RuntimeError, match='timeout of 0.2 s'):
+        launcher.run_sync('true', str(tmp_path))
+
+    local = build_launcher({'type': 'local_scheduler', 'timeout': 0.2,
+                            'poll_interval': 0.02})
+    with pytest.raises(RuntimeError, match='timeout'):
+        local.run_sync('sleep 5', str(tmp_path))
+    with pytest.raises(ValueError, match='timeout'):
+        BatchLauncher(timeout=0)
@@ -26,8 +26,11 @@ import pytest
 
 import baseline_utils as bu
 from lume_ace3p.inputs import build_inputs, load_yaml, WorkflowInputs
-from lume_ace3p.workflow_graph import Workflow
-from lume_ace3p.modes import run_mode, single, parameter_sweep, write_table
+from lume_ace3p.modules import RunContext
+from lume_ace3p.workflow_graph import Evaluation, Workflow
+from lume_ace3p.modes import (
+    run_mode, single, parameter_sweep, adaptive_sweep, write_table,
+)
 
 
 # --------------------------------------------------------------------------- #
@@ -192,6 +195,38 @@ def test_geant4_beta_broadcast_sweep(tmp_path):
         os.chdir(cwd)
 
 
+def test_parallel_sweep_matches_serial(tmp_path):
+    """``parallel: {workers: N}`` farms the grid out to worker processes but
+    reassembles the rows in tensor order, so the frame is identical to a serial
+    run's — and each point still lands in its own auto workdir."""
+    cwd = os.getcwd()
+    try:
+        data, inputs = _staged('omega3p_sweep', 'omega3p_sweep.yaml')
+        entries = [
+            {'module': 'cubit', 'journal': 'pillbox-rtop.jou'},
+            {'module': 'omega3p', 'input': 'pillbox-rtop.omega3p'},
+            {'module': 'acdtool', 'input': 'pillbox-rtop.rfpost'},
+        ]
+        spec = data.get('output_parameters')
+        serial = parameter_sweep(
+            _build(entries, inputs, 'serial_workdir', output_spec=spec))
+        parallel = run_mode(
+            {'type': 'parameter_sweep', 'parallel': {'workers': 3}},
+            _build(entries, inputs, 'parallel_workdir', output_spec=spec))
+
+        pd.testing.assert_frame_equal(parallel, serial)
+        for radius, ellipticity in zip(serial['cav_radius'],
+                                       serial['ellipticity']):
+            assert os.path.isdir(
+                f'parallel_workdir_{radius}_{ellipticity}')
+
+        with pytest.raises(ValueError, match='parallel.workers'):
+            parameter_sweep(_build(entries, inputs, 'bad_workdir'),
+                            parallel={'workers': 0})
+    finally:
+        os.chdir(cwd)
+
+
 # --------------------------------------------------------------------------- #
 # single — one evaluation round-trips
 # --------------------------------------------------------------------------- #
@@ -279,6 +314,230 @@ def test_run_mode_dispatch_and_write(tmp_path):
         os.chdir(cwd)
 
 
+def _omega3p_chain(tmp_path):
+    data, inputs = _staged('omega3p_sweep', 'omega3p_sweep.yaml')
+    entries = [
+        {'module': 'cubit', 'journal': 'pillbox-rtop.jou'},
+        {'module': 'omega3p', 'input': 'pillbox-rtop.omega3p'},
+        {'module': 'acdtool', 'input': 'pillbox-rtop.rfpost'},
+    ]
+    return entries, inputs, data.get('output_parameters')
+
+
+def test_sweep_streams_rows_and_resumes_after_a_crash(tmp_path):
+    """With an ``output_file`` every finished point is on disk before the next
+    one starts; a sweep that dies part-way leaves those rows, and ``resume:
+    true`` evaluates only the points they do not cover — ending with the same
+    table a clean run writes."""
+    cwd = os.getcwd()
+    try:
+        entries, inputs, spec = _omega3p_chain(tmp_path)
+        out = str(tmp_path / 'sweep.txt')
+        wf = _build(entries, inputs, 'crash_workdir', output_spec=spec)
+        calls = []
+        real = wf.evaluate
+
+        def evaluate(scalars=None, workdir=None):
+            if len(calls) == 3:
+                raise RuntimeError('node lost')
+            calls.append(scalars)
+            return real(scalars, workdir)
+
+        wf.evaluate = evaluate
+        with pytest.raises(RuntimeError, match='node lost'):
+            run_mode({'type': 'parameter_sweep', 'output_file': out}, wf)
+        assert len(pd.read_csv(out, sep='\t')) == 3
+
+        wf = _build(entries, inputs, 'crash_workdir', output_spec=spec)
+        resumed_calls = []
+        real = wf.evaluate
+        wf.evaluate = lambda scalars=None, workdir=None: (
+            resumed_calls.append(scalars) or real(scalars, workdir))
+        resumed = run_mode({'type': 'parameter_sweep', 'output_file': out,
+                            'resume': True}, wf)
+        assert not any(point in resumed_calls for point in calls)
+        assert len(calls) + len(resumed_calls) == len(resumed)
+
+        clean = parameter_sweep(_build(entries, inputs, 'clean_workdir',
+                                       output_spec=spec))
+        pd.testing.assert_frame_equal(resumed, clean)
+        pd.testing.assert_frame_equal(pd.read_csv(out, sep='\t'), clean)
+    finally:
+        os.chdir(cwd)
+
+
+def test_failed_final_rewrite_keeps_the_streamed_table(tmp_path, monkeypatch):
+    """The finished sweep is rewritten in tensor order through a temporary
+    file; a rewrite that dies part-way (a full disk) leaves every streamed
+    row in place."""
+    from lume_ace3p import modes, results
+
+    cwd = os.getcwd()
+    try:
+        entries, inputs, spec = _omega3p_chain(tmp_path)
+        out = str(tmp_path / 'sweep.txt')
+        wf = _build(entries, inputs, 'wd', output_spec=spec)
+
+        def disk_full(df, filename):
+            df.iloc[:1].to_csv(filename, sep='\t', index=False)
+            raise OSError('No space left on device')
+
+        monkeypatch.setattr(results, 'write_table', disk_full)
+        monkeypatch.setattr(modes, 'write_table', disk_full)
+        with pytest.raises(OSError, match='No space'):
+            run_mode({'type': 'parameter_sweep', 'output_file': out}, wf)
+        monkeypatch.undo()
+
+        streamed = pd.read_csv(out, sep='\t')
+        clean = parameter_sweep(_build(entries, inputs, 'clean',
+                                       output_spec=spec))
+        assert len(streamed) == len(clean) > 1
+        assert not [p for p in os.listdir(tmp_path) if p.startswith('.tmp-')]
+    finally:
+        os.chdir(cwd)
+
+
+def test_resume_drops_a_torn_row_and_reruns_its_point(tmp_path):
+    """A row cut off mid-write is not counted as done, and resuming a table
+    that already holds every point evaluates nothing."""
+    cwd = os.getcwd()
+    try:
+        entries, inputs, spec = _omega3p_chain(tmp_path)
+        out = str(tmp_path / 'sweep.txt')
+        full = run_mode({'type': 'parameter_sweep', 'output_file': out},
+                        _build(entries, inputs, 'wd', output_spec=spec))
+        with open(out) as f:
+            text = f.read()
+        with open(out, 'w') as f:
+            f.write(text[:-5])                  # tear the last row
+
+        wf = _build(entries, inputs, 'wd', output_spec=spec)
+        calls = []
+        real = wf.evaluate
+        wf.evaluate = lambda scalars=None, workdir=None: (
+            calls.append(scalars) or real(scalars, workdir))
+        again = run_mode({'type': 'parameter_sweep', 'output_file': out,
+                          'resume': True}, wf)
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(again, full)
+
+        calls.clear()
+        run_mode({'type': 'parameter_sweep', 'output_file': out,
+                  'resume': True}, wf)
+        assert calls == []
+        with pytest.raises(ValueError, match="'resume' needs"):
+            run_mode({'type': 'parameter_sweep', 'resume': True}, wf)
+    finally:
+        os.chdir(cwd)
+
+
+def test_sweep_design_samples_or_zips_the_axes(tmp_path):
+    """``design:`` replaces the 4x4 tensor grid over (cav_radius, ellipticity)
+    with a reproducible Sobol/LHS sample inside the axes' range, or with the
+    axes zipped element-wise."""
+    cwd = os.getcwd()
+    try:
+        entries, inputs, spec = _omega3p_chain(tmp_path)
+
+        def sweep(design, name):
+            return run_mode({'type': 'parameter_sweep', 'design': design},
+                            _build(entries, inputs, name, output_spec=spec))
+
+        sobol = sweep({'type': 'sobol', 'num_samples': 6, 'seed': 3}, 'sobol')
+        assert len(sobol) == 6
+        assert sobol['cav_radius'].between(90.0, 120.0).all()
+        assert sobol['ellipticity'].between(0.5, 1.25).all()
+        pd.testing.assert_frame_equal(
+            sweep({'type': 'sobol', 'num_samples': 6, 'seed': 3}, 'again'),
+            sobol)
+
+        lhs = sweep({'type': 'lhs', 'num_samples': 5,
+                     'bounds': {'cav_radius': [100.0, 101.0]}}, 'lhs')
+        assert len(lhs) == 5 and lhs['cav_radius'].between(100.0, 101.0).all()
+
+        zipped = sweep('zip', 'zip')
+        assert list(zipped['cav_radius']) == [90.0, 100.0, 110.0, 120.0]
+        assert list(zipped['ellipticity']) == [0.5, 0.75, 1.0, 1.25]
+        assert len(sweep({'type': 'tensor'}, 'tensor')) == 16
+
+        with pytest.raises(ValueError, match='design.type'):
+            sweep({'type': 'grid'}, 'bad')
+        with pytest.raises(ValueError, match='design.num_samples'):
+            sweep({'type': 'sobol'}, 'bad')
+        with pytest.raises(ValueError, match='not swept'):
+            sweep({'type': 'lhs', 'num_samples': 2,
+                   'bounds': {'radius': [1, 2]}}, 'bad')
+        inputs.cubit['ellipticity'] = np.array([0.5, 1.0])
+        with pytest.raises(ValueError, match='same length'):
+            sweep('zip', 'bad')
+    finally:
+        os.chdir(cwd)
+
+
+class _ResonanceWorkflow:
+    """The Workflow surface the sweep modes drive, over one swept axis ``x``
+    whose single output is a narrow resonance at x = 0.3 on a flat
+    background."""
+
+    output_spec = {'peak': {}}
+
+    def __init__(self, tmp_path, grid):
+        self.tmp_path = tmp_path
+        self.grid = np.asarray(grid, dtype=float)
+        self.calls = []
+
+    def sweep_axes(self):
+        return [('x', self.grid, lambda materialized, scalar: None)]
+
+    def evaluate(self, scalars):
+        x = scalars[0]
+        self.calls.append(x)
+        peak = 1.0 / (1.0 + ((x - 0.3) / 0.02) ** 2)
+        return Evaluation({'peak': peak}, RunContext(str(self.tmp_path)), [])
+
+
+def test_adaptive_sweep_refines_near_the_resonance(tmp_path):
+    """Starting from a 5-point grid, the inserted points go where the output
+    bends: most of them land within 0.1 of the resonance."""
+    wf = _ResonanceWorkflow(tmp_path, np.linspace(0.0, 1.0, 5))
+    df = adaptive_sweep(wf, tolerance=0.01, max_runs=25)
+
+    assert len(df) == 25 and list(df['x']) == sorted(df['x'])
+    refined = [x for x in wf.calls[5:]]
+    near = [x for x in refined if abs(x - 0.3) < 0.1]
+    assert len(near) > len(refined) / 2
+    assert df['peak'].max() > 0.9            # the coarse grid missed the peak
+
+    tail = _ResonanceWorkflow(tmp_path, [0.6, 0.8, 1.0])
+    assert len(adaptive_sweep(tail, tolerance=0.5, max_runs=10)) == 3
+
+    with pytest.raises(ValueError, match="'refine_on'"):
+        adaptive_sweep(wf, refine_on=['dose'])
+    with pytest.raises(ValueError, match="'max_runs'"):
+        adaptive_sweep(wf, max_runs=3)
+
+
+def test_adaptive_sweep_resumes_from_its_table(tmp_path):
+    """Stopping at a smaller budget and resuming with a larger one evaluates
+    only the new points and reaches the same table as one uninterrupted run."""
+    out = str(tmp_path / 'adaptive.txt')
+    first = _ResonanceWorkflow(tmp_path, np.linspace(0.0, 1.0, 5))
+    run_mode({'type': 'adaptive_sweep', 'output_file': out, 'max_runs': 12},
+             first)
+
+    resumed = _ResonanceWorkflow(tmp_path, np.linspace(0.0, 1.0, 5))
+    df = run_mode({'type': 'adaptive_sweep', 'output_file': out,
+                   'max_runs': 20, 'resume': True}, resumed)
+    assert len(resumed.calls) == 8
+    assert not set(resumed.calls) & set(first.calls)
+
+    straight = adaptive_sweep(_ResonanceWorkflow(tmp_path,
+                                                 np.linspace(0.0, 1.0, 5)),
+                              max_runs=20)
+    pd.testing.assert_frame_equal(df, straight)
+    pd.testing.assert_frame_equal(pd.read_csv(out, sep='\t'), straight)
+
+
 def test_run_mode_rejects_unknown_mode(tmp_path):
     """All four modes (single | parameter_sweep | scalar_optimize |
     gp_parameter_sweep) are handled after Phase 4; an unrecognized mode is a
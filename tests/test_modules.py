@@ -13,11 +13,15 @@ Two things are verified for every module:
 
 No ACE3P / Geant4 binary is needed: solver objects are constructed pointing at
 synthetic output files and their ``output_parser`` is driven directly, or the
-scoring files are pre-placed in the workdir.
+scoring files are pre-placed in the workdir. The sharded and adaptive Geant4
+runs are the exception: they run for real on the stand-in executable from
+``benchmarks/fake_tools.py``.
 """
 
 import os
 import shutil
+import sys
+import time
 import warnings
 
 import numpy as np
@@ -46,6 +50,11 @@ from lume_ace3p.geant4 import Geant4
 from lume_ace3p.particles import Particles, TRACK3P_COLUMNS
 from lume_ace3p.inputs import WorkflowInputs
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'benchmarks'))
+
+import fake_tools  # noqa: E402
+
 
 # --------------------------------------------------------------------------- #
 # Synthetic fixtures
@@ -307,6 +316,47 @@ def test_cubit_module_requires_journal(tmp_path):
         CubitModule().run(ctx)
 
 
+def test_cubit_module_reuses_cached_mesh(tmp_path, monkeypatch):
+    """A repeated journal + cubit values links the cached mesh into the new
+    workdir instead of running Cubit/meshconvert; a new value re-meshes."""
+    from lume_ace3p.cache import MeshCache
+
+    jou = tmp_path / 'cav.jou'
+    jou.write_text('#{r = 1.0}\ncreate sphere radius {r}\n'
+                   'export genesis "cav.gen" overwrite\n')
+    calls = []
+
+    def fake_run(cmd, shell=True, cwd=None, **kw):
+        calls.append(cmd.split()[-1])
+        if 'meshconvert' in cmd:
+            (tmp_path / cwd / 'cav.ncdf').write_text(f'ncdf {cwd}')
+        else:
+            (tmp_path / cwd / 'cav.gen').write_text(f'gen {cwd}')
+
+    monkeypatch.setattr('subprocess.run', fake_run)
+    monkeypatch.chdir(tmp_path)
+    cache = MeshCache(str(tmp_path / 'meshes'))
+
+    def run(workdir, r):
+        ctx = RunContext(workdir, inputs=WorkflowInputs(cubit={'r': r}),
+                         stage_mode='symlink', mesh_cache=cache)
+        CubitModule({'journal': 'cav.jou'}).run(ctx)
+        return ctx
+
+    run('wd1', 1.0)
+    assert calls == ['cav.jou', 'cav.gen']
+    ctx = run('wd2', 1.0)
+    assert len(calls) == 2                          # nothing re-run
+    assert ctx.artifacts[MESH] == os.path.join('wd2', 'cav.gen')
+    ncdf = tmp_path / 'wd2' / 'cav.ncdf'
+    assert ncdf.is_symlink() and ncdf.read_text() == 'ncdf wd1'
+    assert (tmp_path / 'wd2' / 'cav.jou').is_file()  # merged journal written
+    run('wd2', 2.0)
+    assert len(calls) == 4
+    assert not ncdf.is_symlink() and ncdf.read_text() == 'ncdf wd2'
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
 # --------------------------------------------------------------------------- #
 # EM solvers (dry-run + require mesh)
 # --------------------------------------------------------------------------- #
@@ -342,7 +392,7 @@ def test_s3p_extract(tmp_path):
 
     ctx = RunContext(wd, paths=_paths())
     module = S3PModule({'input': 'dummy.s3p'})
-    module._solver = s3p  # inject the parsed solver (no binary run)
+    ctx.handles[module.name] = s3p  # inject the parsed solver (no binary run)
 
     # Full frequency-indexed array (string spec / list spec) — the three
     # S(0,0) values from S3P_REFLECTION.
@@ -358,7 +408,6 @@ def test_s3p_extract(tmp_path):
 def test_s3p_extract_dry_run_is_nan(tmp_path):
     ctx = RunContext(str(tmp_path / 'wd'))
     module = S3PModule({'input': 'x.s3p'})
-    module._solver = None
     assert np.isnan(module.extract(ctx, 'S(0,0)')).all()
 
 
@@ -368,8 +417,9 @@ def _s3p_module(tmp_path, complete=True):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = S3PModule({'input': 'dummy.s3p'})
-    module._solver = _make_s3p_solver(wd, complete=complete)
-    return module, RunContext(wd, paths=_paths())
+    ctx = RunContext(wd, paths=_paths())
+    ctx.handles[module.name] = _make_s3p_solver(wd, complete=complete)
+    return module, ctx
 
 
 def test_s3p_extract_complex_quantities(tmp_path):
@@ -511,8 +561,8 @@ def test_omega3p_extract(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = Omega3PModule({'input': 'dummy.omega3p'})
-    module._solver = _make_omega3p_solver(wd)
     ctx = RunContext(wd, paths=_paths())
+    ctx.handles[module.name] = _make_omega3p_solver(wd)
 
     # Full mode-indexed arrays (string spec / list spec).
     assert np.allclose(module.extract(ctx, 'Frequency'), [1.1e9, 2.2e9])
@@ -535,8 +585,8 @@ def test_omega3p_extract_complex_eigenvalue(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = Omega3PModule({'input': 'dummy.omega3p'})
-    module._solver = _make_omega3p_solver(wd, output=OMEGA3P_OUTPUT_COMPLEX)
     ctx = RunContext(wd, paths=_paths())
+    ctx.handles[module.name] = _make_omega3p_solver(wd, output=OMEGA3P_OUTPUT_COMPLEX)
 
     at_mode_0 = {'at': {'mode': 0}}
     assert module.extract(ctx, {'quantity': 'Frequency', **at_mode_0}) \
@@ -554,8 +604,9 @@ def test_omega3p_extract_honors_results_dir_config(tmp_path):
     os.makedirs(wd, exist_ok=True)
     module = Omega3PModule({'input': 'dummy.omega3p', 'results_dir': 'run17'})
     assert module.results_dir == 'run17'
-    module._solver = _make_omega3p_solver(wd, results_dir='run17')
-    assert np.allclose(module.extract(RunContext(wd), 'Frequency'),
+    ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_omega3p_solver(wd, results_dir='run17')
+    assert np.allclose(module.extract(ctx, 'Frequency'),
                        [1.1e9, 2.2e9])
 
 
@@ -563,21 +614,23 @@ def test_omega3p_extract_unknown_quantity(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = Omega3PModule({'input': 'dummy.omega3p'})
-    module._solver = _make_omega3p_solver(wd)
+    ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_omega3p_solver(wd)
     with pytest.raises(ValueError, match='Unknown quantity'):
-        module.extract(RunContext(wd), 'RoQ')
+        module.extract(ctx, 'RoQ')
     # 'Modes' is the readable per-mode list, not an extractable column.
     with pytest.raises(ValueError, match='Unknown quantity'):
-        module.extract(RunContext(wd), 'Modes')
+        module.extract(ctx, 'Modes')
 
 
 def test_omega3p_extract_unknown_mode_names_what_exists(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = Omega3PModule({'input': 'dummy.omega3p'})
-    module._solver = _make_omega3p_solver(wd)
+    ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_omega3p_solver(wd)
     with pytest.raises(ValueError, match='no mode 5'):
-        module.extract(RunContext(wd),
+        module.extract(ctx,
                        {'quantity': 'Frequency', 'at': {'mode': 5}})
 
 
@@ -588,9 +641,10 @@ def test_omega3p_extract_without_output_file_explains_why(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = Omega3PModule({'input': 'dummy.omega3p'})
-    module._solver = _make_omega3p_solver(wd, output=None)
+    ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_omega3p_solver(wd, output=None)
     with pytest.raises(ValueError, match='omega3p_results'):
-        module.extract(RunContext(wd), 'Frequency')
+        module.extract(ctx, 'Frequency')
 
 
 def test_omega3p_extract_dry_run_is_nan(tmp_path):
@@ -598,7 +652,6 @@ def test_omega3p_extract_dry_run_is_nan(tmp_path):
     axis, so the value lands in a wide table cell as-is."""
     ctx = RunContext(str(tmp_path / 'wd'))
     module = Omega3PModule({'input': 'x.omega3p'})
-    module._solver = None
     assert np.isnan(module.extract(ctx, 'Frequency'))
 
 
@@ -607,8 +660,8 @@ def test_omega3p_field_index_and_field(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = Omega3PModule({'input': 'dummy.omega3p'})
-    module._solver = _make_omega3p_solver(wd)
     ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_omega3p_solver(wd)
 
     label, values = module.field_index(ctx)
     assert label == 'ModeID'
@@ -631,12 +684,11 @@ def test_omega3p_field_index_is_none_without_modes(tmp_path):
     ctx = RunContext(wd)
 
     module = Omega3PModule({'input': 'x.omega3p'})
-    module._solver = None
     assert module.field_index(ctx) is None
     assert module.field(ctx) is None
 
     # Same when the run produced no output file at all.
-    module._solver = _make_omega3p_solver(wd, output=None)
+    ctx.handles[module.name] = _make_omega3p_solver(wd, output=None)
     assert module.field_index(ctx) is None
     assert module.field(ctx) is None
 
@@ -704,8 +756,8 @@ def test_t3p_extract(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = T3PModule({'input': 'model.t3p'})
-    module._solver = _make_t3p_solver(wd)
     ctx = RunContext(wd, paths=_paths())
+    ctx.handles[module.name] = _make_t3p_solver(wd)
 
     # The per-run scalar figure of merit.
     assert module.extract(ctx, 'loss_factor') == pytest.approx(-3.88576373282202e-01)
@@ -728,8 +780,8 @@ def test_t3p_extract_transverse_reports_kick_factor(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = T3PModule({'input': 'model.t3p'})
-    module._solver = _make_t3p_solver(wd, wakefield=T3P_WAKEFIELD_TRANSVERSE)
     ctx = RunContext(wd, paths=_paths())
+    ctx.handles[module.name] = _make_t3p_solver(wd, wakefield=T3P_WAKEFIELD_TRANSVERSE)
 
     assert module.extract(ctx, 'kick_factor') == pytest.approx(9.64058337896157e-02)
 
@@ -743,9 +795,10 @@ def test_t3p_extract_unknown_quantity(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = T3PModule({'input': 'model.t3p'})
-    module._solver = _make_t3p_solver(wd)
+    ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_t3p_solver(wd)
     with pytest.raises(ValueError, match='Unknown quantity'):
-        module.extract(RunContext(wd), 'impedance')
+        module.extract(ctx, 'impedance')
 
 
 def test_t3p_extract_without_wake_monitor_explains_why(tmp_path):
@@ -754,15 +807,15 @@ def test_t3p_extract_without_wake_monitor_explains_why(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = T3PModule({'input': 'model.t3p'})
-    module._solver = _make_t3p_solver(wd, wakefield=None)
+    ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_t3p_solver(wd, wakefield=None)
     with pytest.raises(ValueError, match='WakeField monitor'):
-        module.extract(RunContext(wd), 'loss_factor')
+        module.extract(ctx, 'loss_factor')
 
 
 def test_t3p_extract_dry_run_is_nan(tmp_path):
     ctx = RunContext(str(tmp_path / 'wd'))
     module = T3PModule({'input': 'x.t3p'})
-    module._solver = None
     assert np.isnan(module.extract(ctx, 'loss_factor')).all()
 
 
@@ -772,8 +825,8 @@ def test_t3p_field_index_and_field(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = T3PModule({'input': 'model.t3p'})
-    module._solver = _make_t3p_solver(wd)
     ctx = RunContext(wd)
+    ctx.handles[module.name] = _make_t3p_solver(wd)
 
     label, values = module.field_index(ctx)
     assert label == 's'
@@ -788,7 +841,6 @@ def test_t3p_field_index_dry_run_sentinel(tmp_path):
     """Under dry-run the index is a single-row sentinel so a swept long-format
     table still gets one row per grid point (same contract as S3P)."""
     module = T3PModule({'input': 'x.t3p'})
-    module._solver = None
     label, values = module.field_index(RunContext(str(tmp_path / 'wd')))
     assert label == 's'
     assert np.allclose(values, [0.0])
@@ -849,8 +901,9 @@ def _monitor_module(tmp_path, input_fixture, staged=(), touch=(), wake=None):
         warnings.simplefilter('ignore', T3POutputWarning)
         solver.output_parser()
     module = T3PModule({'input': input_fixture})
-    module._solver = solver
-    return module, RunContext(wd, paths=_paths())
+    ctx = RunContext(wd, paths=_paths())
+    ctx.handles[module.name] = solver
+    return module, ctx
 
 
 def test_t3p_extracts_three_power_monitors_by_name(tmp_path):
@@ -1067,7 +1120,7 @@ def test_t3p_field_index_is_none_when_nothing_was_read(tmp_path):
     (The dry-run sentinel is a different case — see
     ``test_t3p_field_index_dry_run_sentinel``.)"""
     module, ctx = _monitor_module(tmp_path, 'SIBC.t3p')
-    assert module._solver.output_data == {}
+    assert module.handle(ctx).output_data == {}
     assert module.field_index(ctx) is None
     assert module.field(ctx) is None
 
@@ -1081,7 +1134,6 @@ def test_t3p_dry_run_axis_is_read_from_the_input_file(tmp_path):
     wake = os.path.join(str(tmp_path), 'wake.t3p')
     _write(wake, T3P_INPUT)
     module = T3PModule({'input': wake})
-    module._solver = None
     label, values = module.field_index(RunContext(str(tmp_path)))
     assert label == 's'
     assert np.allclose(values, [0.0])
@@ -1089,7 +1141,6 @@ def test_t3p_dry_run_axis_is_read_from_the_input_file(tmp_path):
     powers = os.path.join(str(tmp_path), 'powers.t3p')
     shutil.copy(os.path.join(T3P_FIXTURES, 'SIBC.t3p'), powers)
     module = T3PModule({'input': powers})
-    module._solver = None
     label, values = module.field_index(RunContext(str(tmp_path)))
     assert label == 't'
     assert np.allclose(values, [0.0])
@@ -1102,7 +1153,6 @@ def test_t3p_dry_run_axis_falls_back_to_s_when_the_input_is_unreadable(tmp_path)
     for config in [{}, {'input': str(tmp_path / 'absent.t3p')},
                    {'input': str(tmp_path)}]:
         module = T3PModule(config)
-        module._solver = None
         assert module.field_index(RunContext(str(tmp_path)))[0] == 's', config
 
 
@@ -1147,8 +1197,8 @@ def test_acdtool_extract(tmp_path):
     acd = _make_acdtool(wd)
 
     module = AcdtoolModule({'input': 'test.rfpost'})
-    module._acdtool = acd
     ctx = RunContext(wd)
+    ctx.handles[module.name] = acd
 
     # Values parsed from RFPOST_OUTPUT.
     expected = {
@@ -1205,8 +1255,9 @@ def _acdtool_over(workdir, input_text, output_text, name='point.rfpost'):
 
 def _acdtool_module(workdir):
     module = AcdtoolModule({'input': 'test.rfpost'})
-    module._acdtool = _make_acdtool(workdir)
-    return module, RunContext(workdir)
+    ctx = RunContext(workdir)
+    ctx.handles[module.name] = _make_acdtool(workdir)
+    return module, ctx
 
 
 def test_acdtool_mapping_and_list_forms_agree(tmp_path):
@@ -1318,8 +1369,8 @@ def test_acdtool_unindexed_sections_resolve_to_scalars(tmp_path):
     wd = str(tmp_path / 'wd')
     os.makedirs(wd, exist_ok=True)
     module = AcdtoolModule({'input': 'point.rfpost'})
-    module._acdtool = _acdtool_over(wd, POINT_RFPOST_INPUT, POINT_RFPOST_OUTPUT)
     ctx = RunContext(wd)
+    ctx.handles[module.name] = _acdtool_over(wd, POINT_RFPOST_INPUT, POINT_RFPOST_OUTPUT)
 
     assert module.extract(ctx, {'section': 'FieldAtPoint',
                                 'quantity': 'Ez'}) == pytest.approx(1.25e6)
@@ -1375,7 +1426,7 @@ def test_acdtool_field_index_is_none_without_a_mode_section(tmp_path):
         module.extract(ctx, {'section': 'RoverQ', 'quantity': 'RoQ'})  # NaN
 
     surface_only = AcdtoolModule({'input': 'surface.rfpost'})
-    surface_only._acdtool = _acdtool_over(
+    ctx.handles[surface_only.name] = _acdtool_over(
         wd, 'maxFieldsOnSurface\n{\n   ionoff = 1\n}\n',
         '[maxFieldsOnSurface]\nsurfaceID : 6\nEmax = 1.0e6 at (0.1, 0.2, 0.3)\n}\n',
         name='surface.rfpost')
@@ -1409,7 +1460,7 @@ def test_acdtool_field_returns_curves_not_table_columns(tmp_path):
     ctx = RunContext(wd)
 
     module = AcdtoolModule({'input': 'test.rfpost'})
-    module._acdtool = _make_acdtool(wd)
+    ctx.handles[module.name] = _make_acdtool(wd)
     # RFPOST_OUTPUT declares no curve files, so the only thing riding here is
     # the Phase-4 mode-table view (see
     # test_acdtool_field_carries_the_mode_arrays); the surface block does not,
@@ -1426,7 +1477,7 @@ def test_acdtool_field_returns_curves_not_table_columns(tmp_path):
     acd = Acdtool(os.path.join(wd, 'curve.rfpost'), workdir=wd)
     acd.output_file = 'rfpost.out'
     acd.load_output()
-    module._acdtool = acd
+    ctx.handles[module.name] = acd
 
     field = module.field(ctx)
     assert list(field) == ['ALLFieldOnLine']
@@ -1435,7 +1486,7 @@ def test_acdtool_field_returns_curves_not_table_columns(tmp_path):
     assert curve['Ez'][1] == pytest.approx(-8.9748e-01)
 
     # Dry-run: no wrapper, no field.
-    module._acdtool = None
+    ctx.handles[module.name] = None
     assert module.field(ctx) is None
 
 
@@ -1574,7 +1625,7 @@ def test_transwake_reparses_the_producer(tmp_path, monkeypatch):
     t3p.run(ctx)
 
     # Before acdtool: the longitudinal result T3P's own monitor produced.
-    assert t3p._solver.output_data['WakeType'] == 'longitudinal'
+    assert t3p.handle(ctx).output_data['WakeType'] == 'longitudinal'
     assert t3p.extract(ctx, 'loss_factor') == pytest.approx(-3.88576373282202e-01)
 
     acdtool = AcdtoolModule({'command': 'postprocess transwake',
@@ -1582,10 +1633,10 @@ def test_transwake_reparses_the_producer(tmp_path, monkeypatch):
     acdtool.run(ctx)
 
     # After acdtool: the transverse result, read by T3PModule -- not by acdtool.
-    assert t3p._solver.output_data['WakeType'] == 'transverse'
+    assert t3p.handle(ctx).output_data['WakeType'] == 'transverse'
     assert t3p.extract(ctx, 'kick_factor') == pytest.approx(9.64058337896157e-02)
-    assert acdtool._acdtool.output_data == {}    # acdtool parses nothing here
-    assert acdtool._acdtool.output_file == 't3p_results/OUTPUT/wakefield.out'
+    assert acdtool.handle(ctx).output_data == {}    # acdtool parses nothing here
+    assert acdtool.handle(ctx).output_file == 't3p_results/OUTPUT/wakefield.out'
 
 
 def test_coaxsignal_does_not_reparse_the_producer(tmp_path, monkeypatch):
@@ -1824,6 +1875,171 @@ def test_geant4_mapping_form_without_a_section_names_the_sections(tmp_path):
     assert np.isnan(module.extract(ctx, ['dose']))     # unchanged list behavior
 
 
+def _stage_adaptive_geant4(workdir, rows=400):
+    """A real (non-dry) Geant4 run on the stand-in executable: a 4x3x2 scoring
+    mesh and a source whose weights alternate 1 and 3, so every voxel's
+    relative error after n rows (about 2n primaries) is about
+    sqrt(3) / (2 sqrt(n))."""
+    os.makedirs(workdir, exist_ok=True)
+    _write(os.path.join(workdir, 'input.geant4'),
+           GEANT4_INPUT + 'mesh_nx = 4\nmesh_ny = 3\nmesh_nz = 2\n')
+    psrc = os.path.join(workdir, 'particles.data')
+    _write(psrc, ''.join(f'0.0 0.0 0.0 0.0 1.0 {1 + 2 * (i % 2)} 0 0 1 6\n'
+                         for i in range(rows)))
+    return os.path.join(workdir, 'input.geant4'), psrc
+
+
+def _run_geant4(tmp_path, name, config, delay=0.0, paths=None):
+    wd = str(tmp_path / name)
+    input_path, psrc = _stage_adaptive_geant4(wd)
+    paths = dict(fake_tools.install(str(tmp_path / 'tools'), delay=delay),
+                 **(paths or {}))
+    ctx = RunContext(wd, inputs=WorkflowInputs(),
+                     artifacts={PARTICLE_SOURCE: psrc}, paths=paths)
+    module = Geant4Module(dict(config, geant4_input=input_path))
+    module.run(ctx)
+    return module, ctx
+
+
+def test_geant4_adaptive_run_stops_at_the_target_error(tmp_path, capsys):
+    full, full_ctx = _run_geant4(tmp_path, 'full', {})
+    expected = full.field(full_ctx)
+    assert 'convergence' not in expected
+
+    module, ctx = _run_geant4(tmp_path, 'adaptive',
+                              {'adaptive': {'target_error': 0.05}})
+    field = module.field(ctx)
+    convergence = field['convergence']
+    assert convergence['converged'] and convergence['total_shards'] == 10
+    assert 1 < convergence['shards'] < 10
+    assert convergence['rows'] == 40 * convergence['shards']
+    assert (convergence['source_rows'], convergence['source_events']) == (400,
+                                                                          800)
+    # The event count is the weight run (n_electrons), not the rows.
+    assert convergence['rows'] < convergence['events'] < 3 * convergence['rows']
+    assert convergence['relative_error'] <= 0.05
+    assert f"Geant4 shard {convergence['shards']}/10" in capsys.readouterr().out
+
+    # Scaled to the whole source's weight, the partial run scores the full
+    # run's dose; the grid the module reads back has the merged columns.
+    for section in ('dose', 'edep'):
+        np.testing.assert_array_equal(field[section]['indices'],
+                                      expected[section]['indices'])
+        np.testing.assert_allclose(field[section]['values'],
+                                   expected[section]['values'], rtol=1e-12)
+        assert (field[section]['entries'] == convergence['events']).all()
+    assert module.extract(ctx, ['dose', 'total']) == pytest.approx(
+        full.extract(full_ctx, ['dose', 'total']))
+    assert not [f for f in os.listdir(ctx.workdir) if f.startswith('shard_')]
+    assert module.handle(ctx).get_value('particles') == 'particles.data'
+
+
+def test_geant4_adaptive_run_stops_at_the_shard_budget(tmp_path):
+    module, ctx = _run_geant4(
+        tmp_path, 'budget', {'adaptive': {'target_error': 1e-6, 'shards': 8,
+                                          'max_shards': 2}})
+    convergence = module.field(ctx)['convergence']
+    assert not convergence['converged']
+    assert (convergence['shards'], convergence['rows']) == (2, 100)
+    assert convergence['relative_error'] > 1e-6
+
+    # A later plain run in the same workdir drops the stale record.
+    module.adaptive = None
+    module.run(ctx)
+    assert 'convergence' not in module.field(ctx)
+
+
+def test_geant4_shards_run_concurrently_and_merge_to_the_full_run(tmp_path):
+    full, full_ctx = _run_geant4(tmp_path, 'full', {})
+    expected = full.field(full_ctx)
+
+    start = time.perf_counter()
+    module, ctx = _run_geant4(tmp_path, 'sharded', {'geant4_shards': 4},
+                              delay=1.0)
+    assert time.perf_counter() - start < 3.0     # not 4 x 1 s back to back
+
+    field = module.field(ctx)
+    assert set(field) == {'dose', 'edep'}
+    for section in ('dose', 'edep'):
+        np.testing.assert_array_equal(field[section]['indices'],
+                                      expected[section]['indices'])
+        for key in ('values', 'sum_sq'):
+            np.testing.assert_allclose(field[section][key],
+                                       expected[section][key], rtol=1e-12)
+        np.testing.assert_array_equal(field[section]['entries'],
+                                      expected[section]['entries'])
+    assert module.extract(ctx, ['dose', 'peak_index']) == full.extract(
+        full_ctx, ['dose', 'peak_index'])
+    assert not [f for f in os.listdir(ctx.workdir) if f.startswith('shard_')]
+
+
+def test_geant4_shards_evaluate_inside_a_running_event_loop(tmp_path):
+    """A synchronous ``Workflow.evaluate`` of a sharded Geant4 chain, called
+    from a coroutine (a Jupyter cell), runs its shards rather than tripping
+    over asyncio.run."""
+    import asyncio
+    from lume_ace3p.workflow_graph import Workflow
+
+    wd = str(tmp_path / 'src')
+    input_path, psrc = _stage_adaptive_geant4(wd)
+    wf = Workflow([{'module': 'particle_source', 'file': psrc},
+                   {'module': 'geant4', 'geant4_input': input_path,
+                    'geant4_shards': 2}],
+                  workflow_params={
+                      'workdir': str(tmp_path / 'wd'),
+                      'paths': fake_tools.install(str(tmp_path / 'tools'))},
+                  output_spec={'dose': ['dose', 'total']})
+
+    async def cell():
+        return wf.evaluate()
+
+    full, full_ctx = _run_geant4(tmp_path, 'full', {})
+    assert asyncio.run(cell())['dose'] == pytest.approx(
+        full.extract(full_ctx, ['dose', 'total']))
+
+
+def test_geant4_shards_split_each_adaptive_round(tmp_path):
+    serial, serial_ctx = _run_geant4(tmp_path, 'serial',
+                                     {'adaptive': {'target_error': 0.05}})
+    split, split_ctx = _run_geant4(tmp_path, 'split',
+                                   {'adaptive': {'target_error': 0.05},
+                                    'geant4_shards': 3})
+    expected = serial.field(serial_ctx)
+    field = split.field(split_ctx)
+    assert field['convergence'] == pytest.approx(expected['convergence'])
+    np.testing.assert_allclose(field['dose']['values'],
+                               expected['dose']['values'], rtol=1e-12)
+
+
+def test_geant4_shard_without_output_raises_and_keeps_its_run(tmp_path):
+    with pytest.raises(RuntimeError, match=r"shard 1/2 wrote no 'dose.out'"), \
+            pytest.warns(RuntimeWarning, match='exited with status 127'):
+        _run_geant4(tmp_path, 'broken', {'geant4_shards': 2},
+                    paths={'geant4_app_exe': 'no_such_geant4'})
+    assert os.path.isfile(tmp_path / 'broken' / 'shard_000' / 'particles.data')
+
+
+@pytest.mark.parametrize('shards', [0, 1.5, True])
+def test_geant4_shards_is_validated(shards):
+    with pytest.raises(ValueError, match='geant4_shards'):
+        Geant4Module({'geant4_shards': shards})
+
+
+@pytest.mark.parametrize('block, match', [
+    ({}, 'target_error'),
+    ({'target_error': 0}, 'target_error'),
+    ({'target_error': 0.1, 'shards': 0}, 'shards'),
+    ({'target_error': 0.1, 'shards': 4, 'max_shards': 5}, 'max_shards'),
+    ({'target_error': 0.1, 'section': 'scoring'}, 'section'),
+    ({'target_error': 0.1, 'threshold': 2}, 'threshold'),
+    ({'target_error': 0.1, 'shard': 4}, 'unknown keys'),
+    (0.1, 'mapping'),
+])
+def test_geant4_adaptive_config_is_validated(block, match):
+    with pytest.raises(ValueError, match=match):
+        Geant4Module({'adaptive': block})
+
+
 # --------------------------------------------------------------------------- #
 # Staging modes (copy / symlink / hardlink) — storage-efficient staging.
 # --------------------------------------------------------------------------- #
@@ -0,0 +1,150 @@
+"""Tests for tool-path resolution (``lume_ace3p/paths.py``).
+
+* Environment variables still win over autodetection, which never runs for a
+  path already resolved.
+* The $HOME fallback search finds the shallowest match, skips hidden
+  directories and stops at ``SEARCH_DEPTH``.
+* Its result is cached per host, $HOME and PATH: a cached directory is reused
+  until it disappears, a cached miss for ``MISS_SECONDS`` or until
+  ``--detect-paths`` refreshes it. A search cut short by ``SEARCH_SECONDS`` is
+  not cached.
+"""
+
+import json
+import sys
+
+import pytest
+
+from lume_ace3p import paths, run_lume_ace3p
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """An empty $HOME with its own cache dir and no tool on PATH or in the
+    environment."""
+    home = tmp_path / 'home'
+    home.mkdir()
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setenv('PATH', str(tmp_path / 'empty_bin'))
+    for var in ('ACE3P_PATH', 'CUBIT_PATH', 'MPI_CALLER', 'GEANT4_APP_PATH',
+                'GEANT4_APP_EXE', 'NERSC_HOST'):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv('HOSTNAME', 'laptop')
+    return home
+
+
+def _count_searches(monkeypatch):
+    calls = []
+    search = paths._search_home
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(paths, '_search_home', counted)
+    return calls
+
+
+def test_search_result_is_cached_and_revalidated(home, monkeypatch):
+    (home / 'runs' / 'deep' / 'ace3p' / 'bin').mkdir(parents=True)
+    (home / 'opt' / 'ace3p' / 'bin').mkdir(parents=True)
+    (home / '.conda' / 'ace3p' / 'bin').mkdir(parents=True)
+    (home / 'tools' / 'Cubit-16.4').mkdir(parents=True)
+    calls = _count_searches(monkeypatch)
+
+    resolved = paths.resolve_paths()
+    assert resolved['ace3p'] == str(home / 'opt' / 'ace3p' / 'bin') + '/'
+    assert resolved['cubit'] == str(home / 'tools' / 'Cubit-16.4') + '/'
+    assert len(calls) == 2
+    with open(paths.paths_cache_file()) as f:
+        (key, entry), = json.load(f).items()
+    assert key.endswith('|' + str(home) + '|' + str(home.parent / 'empty_bin'))
+    assert entry == {'ace3p': resolved['ace3p'], 'cubit': resolved['cubit']}
+
+    assert paths.resolve_paths() == resolved
+    assert len(calls) == 2
+
+    # A cached directory that is gone is searched for again.
+    (home / 'opt' / 'ace3p' / 'bin').rmdir()
+    assert paths.resolve_paths()['ace3p'] == str(
+        home / 'runs' / 'deep' / 'ace3p' / 'bin') + '/'
+    assert len(calls) == 3
+
+    # So is anything under a different PATH.
+    monkeypatch.setenv('PATH', str(home))
+    paths.resolve_paths()
+    assert len(calls) == 5
+
+
+def test_environment_wins_and_skips_the_search(home, monkeypatch):
+    calls = _count_searches(monkeypatch)
+    monkeypatch.setenv('ACE3P_PATH', '/opt/ace3p/bin/')
+    monkeypatch.setenv('CUBIT_PATH', '/opt/cubit/')
+    resolved = paths.resolve_paths({'mpi': 'srun'})
+    assert (resolved['ace3p'], resolved['cubit'], resolved['mpi']) == (
+        '/opt/ace3p/bin/', '/opt/cubit/', 'srun')
+    assert calls == []
+
+
+def test_search_depth_bound_and_cached_miss(home, monkeypatch, capsys):
+    deep = home.joinpath(*['d'] * paths.SEARCH_DEPTH, 'ace3p', 'bin')
+    deep.mkdir(parents=True)
+    assert paths.resolve_paths()['ace3p'] == ''
+
+    # A fresh miss is cached even once a shallower install appears ...
+    (home / 'ace3p' / 'bin').mkdir(parents=True)
+    calls = _count_searches(monkeypatch)
+    assert paths.resolve_paths()['ace3p'] == ''
+    assert calls == []
+
+    # ... until --detect-paths refreshes it.
+    monkeypatch.setattr(sys, 'argv', ['run-lume-ace3p', '--detect-paths'])
+    run_lume_ace3p.main()
+    out = capsys.readouterr().out
+    assert f"ace3p            {home / 'ace3p' / 'bin'}/" in out
+    assert 'cubit            (not found)' in out
+    assert paths.paths_cache_file() in out
+    assert paths.resolve_paths()['ace3p'] == str(home / 'ace3p' / 'bin') + '/'
+
+
+def test_cached_miss_expires(home, monkeypatch):
+    assert paths.resolve_paths()['ace3p'] == ''
+    with open(paths.paths_cache_file()) as f:
+        cache = json.load(f)
+    (key, entry), = cache.items()
+    assert set(entry) == {'ace3p', 'cubit'}
+    assert set(entry['ace3p']) == {'missing'}
+
+    # The tool appears after the miss was cached; once the miss is older than
+    # MISS_SECONDS the next resolution searches again and finds it.
+    (home / 'ace3p' / 'bin').mkdir(parents=True)
+    entry['ace3p']['missing'] -= paths.MISS_SECONDS + 1
+    with open(paths.paths_cache_file(), 'w') as f:
+        json.dump(cache, f)
+    calls = _count_searches(monkeypatch)
+    assert paths.resolve_paths()['ace3p'] == str(home / 'ace3p' / 'bin') + '/'
+    assert len(calls) == 1
+    assert paths._read_cache()[key]['ace3p'] == str(
+        home / 'ace3p' / 'bin') + '/'
+
+    # A miss cached the old way, as an empty string, is searched for again.
+    cache = paths._read_cache()
+    cache[key]['cubit'] = ''
+    with open(paths.paths_cache_file(), 'w') as f:
+        json.dump(cache, f)
+    assert paths.resolve_paths()['cubit'] == ''
+    assert len(calls) == 2
+
+
+def test_search_time_budget(home, capsys):
+    (home / 'ace3p' / 'bin').mkdir(parents=True)
+    assert paths._search_home(paths._is_ace3p_bin, seconds=-1) is None
+    assert '--detect-paths' in capsys.readouterr().out
+
+    # A timed-out search is a miss for that call but is not cached.
+    assert paths._autodetect_ace3p(seconds=-1) == ''
+    assert paths._read_cache() == {}
+    assert paths._autodetect_ace3p() == str(home / 'ace3p' / 'bin') + '/'
+    assert paths._search_home(paths._is_ace3p_bin, seconds=None) == str(
+        home / 'ace3p' / 'bin') + '/'
@@ -32,12 +32,13 @@ import pytest
 import baseline_utils as bu
 from lume_ace3p import results
 from lume_ace3p.results import (
-    write_table, save_field, load_field, FIELD_ARTIFACT_COLUMN,
+    write_table, append_table_rows, read_table, save_field, load_field,
+    FIELD_ARTIFACT_COLUMN,
 )
 from lume_ace3p.modules import (
     RunContext, S3PModule, Geant4Module, PARTICLE_SOURCE,
 )
-from lume_ace3p.workflow_graph import Workflow
+from lume_ace3p.workflow_graph import Evaluation, Workflow
 from lume_ace3p.inputs import WorkflowInputs
 from lume_ace3p import modes
 
@@ -126,8 +127,9 @@ def test_save_load_field_s3p_spectrum(tmp_path):
     wd = str(tmp_path / 'wd')
     s3p = _make_s3p_solver(wd)
     module = S3PModule({'input': 'dummy.s3p'})
-    module._solver = s3p
-    field = module.field(RunContext(wd))
+    ctx = RunContext(wd)
+    ctx.handles[module.name] = s3p
+    field = module.field(ctx)
     assert field is not None
 
     handle = save_field(field, os.path.join(str(tmp_path), 'field_0'))
@@ -166,6 +168,28 @@ def test_save_load_field_geant4_grid(tmp_path):
         assert np.allclose(loaded[section]['values'], field[section]['values'])
 
 
+def test_save_load_field_geant4_scorer_columns(tmp_path):
+    """The scorer's total(val^2) / entry columns ride along as sum_sq /
+    entries, and a plain four-column grid carries neither."""
+    wd = str(tmp_path / 'wd')
+    input_path, psrc = _stage_geant4(wd)
+    with open(os.path.join(wd, 'dose.out'), 'w') as f:
+        f.write('# iX, iY, iZ, total(value) [Gy], total(val^2), entry\n'
+                '0,0,0,1.0,0.25,4\n0,0,1,2.0,1.5,3\n1,0,0,5.0,9.0,7\n')
+    ctx = RunContext(wd, inputs=WorkflowInputs(),
+                     artifacts={PARTICLE_SOURCE: psrc}, dry_run=True,
+                     paths={'ace3p': '', 'mpi': '', 'geant4_app_path': '',
+                            'geant4_app_exe': ''})
+    module = Geant4Module({'geant4_input': input_path})
+    module.run(ctx)
+    loaded = load_field(save_field(module.field(ctx),
+                                   os.path.join(str(tmp_path), 'g4')))
+    assert np.allclose(loaded['dose']['values'], [1.0, 2.0, 5.0])
+    assert np.allclose(loaded['dose']['sum_sq'], [0.25, 1.5, 9.0])
+    assert list(loaded['dose']['entries']) == [4, 3, 7]
+    assert set(loaded['edep']) == {'indices', 'values'}
+
+
 def test_save_field_empty_returns_none(tmp_path):
     assert save_field(None, str(tmp_path / 'x')) is None
     assert save_field({}, str(tmp_path / 'x')) is None
@@ -200,8 +224,8 @@ def test_parameter_sweep_writes_through_shared_path(tmp_path, monkeypatch):
     real = results.write_table
     monkeypatch.setattr(results, 'write_table',
                         lambda df, fn: calls.append((df, fn)) or real(df, fn))
-    # modes imported write_table by name; patch there too so the mode's call is
-    # observed.
+    # modes imported write_table by name; patch there too so any direct call
+    # is observed (the final table goes through replace_table).
     monkeypatch.setattr(modes, 'write_table',
                         lambda df, fn: calls.append((df, fn)) or real(df, fn))
 
@@ -216,7 +240,7 @@ def test_parameter_sweep_writes_through_shared_path(tmp_path, monkeypatch):
 def test_single_writes_through_shared_path(tmp_path, monkeypatch):
     calls = []
     real = results.write_table
-    monkeypatch.setattr(modes, 'write_table',
+    monkeypatch.setattr(results, 'write_table',
                         lambda df, fn: calls.append((df, fn)) or real(df, fn))
     wf = _s3p_workflow(tmp_path)
     out = str(tmp_path / 'single.txt')
@@ -226,21 +250,89 @@ def test_single_writes_through_shared_path(tmp_path, monkeypatch):
 
 def test_log_xopt_uses_shared_writer(tmp_path, monkeypatch):
     """The Xopt log path (scalar_optimize / gp_parameter_sweep) writes through
-    the same shared writer."""
+    the same shared writer. Full writes go through write_table (into a
+    temporary file renamed over the log); later steps only append."""
     calls = []
     real = results.write_table
-    monkeypatch.setattr(modes, 'write_table',
+    monkeypatch.setattr(results, 'write_table',
                         lambda df, fn: calls.append((df, fn)) or real(df, fn))
 
     class FakeX:
         data = pd.DataFrame({'a': [1, 2], 'obj': [0.1, 0.2]})
     out = str(tmp_path / 'sim.txt')
-    modes._log_xopt(out, FakeX())
+    log = results.TableLog(out)
+    modes._log_xopt(log, FakeX())
     assert len(calls) == 1
-    assert calls[0][1] == out
     ok = pd.read_csv(out, sep=r'\s+')
     assert list(ok.columns) == ['a', 'obj']
 
+    FakeX.data = pd.DataFrame({'a': [1, 2, 3], 'obj': [0.1, 0.2, 0.3]})
+    modes._log_xopt(log, FakeX())
+    assert len(calls) == 1                     # appended, not rewritten
+    pd.testing.assert_frame_equal(read_table(out), FakeX.data)
+
+
+def test_table_log_rewrites_once_for_a_new_column(tmp_path):
+    """A column that appears mid-run (Xopt's error string after a first failed
+    evaluation) rewrites the log once, atomically; a reordering does not."""
+    out = str(tmp_path / 'log.txt')
+    log = results.TableLog(out)
+    data = pd.DataFrame({'x': [0.5], 'f': [1.0]})
+    log.update(data)
+    data = pd.concat([data, pd.DataFrame({'x': [0.7], 'f': [2.0],
+                                          'err': ['boom']})],
+                     ignore_index=True)
+    log.update(data)
+    assert list(read_table(out).columns) == ['x', 'f', 'err']
+    assert len(read_table(out)) == 2
+
+    data = pd.concat([data, pd.DataFrame({'x': [0.9], 'f': [3.0],
+                                          'err': ['nan']})],
+                     ignore_index=True)[['err', 'f', 'x']]
+    log.update(data)
+    back = read_table(out)
+    assert list(back.columns) == ['x', 'f', 'err']
+    assert list(back['x']) == [0.5, 0.7, 0.9]
+    assert not [p for p in os.listdir(tmp_path) if p.startswith('.tmp-')]
+
+
+def test_streamed_table_reads_back_without_its_torn_row(tmp_path):
+    """append_table_rows grows a table in the write_table format; read_table
+    returns its complete rows exactly and ignores a final line cut short."""
+    out = str(tmp_path / 'stream.txt')
+    assert read_table(out) is None
+    append_table_rows([{'r': 0.1, 'v': 1.0 / 3}], ['r', 'v'], out)
+    append_table_rows([{'r': 0.2, 'v': float('nan')},
+                       {'r': 0.3, 'v': 2.0}], ['r', 'v'], out)
+    with open(out, 'a') as f:
+        f.write('0.4\t5')                      # a row the crash cut off
+
+    df = read_table(out)
+    assert list(df['r']) == [0.1, 0.2, 0.3]
+    assert df.loc[0, 'v'] == 1.0 / 3
+    assert np.isnan(df.loc[1, 'v'])
+    assert not [p for p in os.listdir(tmp_path) if p.startswith('.tmp-')]
+
+
+def test_replace_file_replaces_whole_or_not_at_all(tmp_path):
+    """The one replace-by-rename helper behind the tables, field artifacts,
+    dose files, checkpoints and path cache: a writer that fails part-way
+    leaves the old file and no temporary behind."""
+    replace_file = results.replace_file
+    out = tmp_path / 'sub' / 'state.json'
+    replace_file(str(out), lambda f: f.write('old\n'))
+
+    def fail(f):
+        f.write('half')
+        raise RuntimeError('disk full')
+
+    with pytest.raises(RuntimeError):
+        replace_file(str(out), fail)
+    assert out.read_text() == 'old\n'
+    replace_file(str(out), lambda f: f.write(b'new\n'), binary=True)
+    assert out.read_text() == 'new\n'
+    assert os.listdir(out.parent) == ['state.json']
+
 
 # --------------------------------------------------------------------------- #
 # Field-artifact column in a real (Geant4) sweep
@@ -264,26 +356,17 @@ def test_geant4_sweep_records_loadable_field_artifacts(tmp_path):
 
     class StubWorkflow:
         """Minimal Workflow surface the sweep modes use, with two grid points
-        and a fixed Geant4 field (the binary is absent, so we reuse the parsed
-        grid for each point)."""
+        and a fixed Geant4 field (the binary is absent, so every point returns
+        an Evaluation over the one parsed grid)."""
         output_spec = {}
 
-        def __init__(self):
-            self.workdir = wd
-
         def sweep_axes(self):
             def setter(materialized, scalar):
                 pass
             return [('p', np.array([1.0, 2.0]), setter)]
 
         def evaluate(self, scalars):
-            return {}
-
-        def field_index(self):
-            return None
-
-        def field(self):
-            return expected
+            return Evaluation({}, ctx, [g4])
 
     df = modes.parameter_sweep(StubWorkflow())
     assert FIELD_ARTIFACT_COLUMN in df.columns
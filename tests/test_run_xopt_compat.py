@@ -23,8 +23,10 @@ the MC-noise mode-config guards.
 
 Run:  python -m pytest tests/test_run_xopt_compat.py
 """
+import json
 import os
 import numpy as np
+import pandas as pd
 
 
 def _run_in_tmp(tmp_path, fn):
@@ -132,6 +134,224 @@ def test_generic_neldermead(tmp_path):
     assert (tmp_path / 'sim_output.txt').exists()
 
 
+# ---- checkpoint / resume_from ---------------------------------------------- #
+
+
+def test_resumed_neldermead_continues_the_interrupted_trajectory(tmp_path):
+    """A run stopped mid-way and resumed from its checkpoint re-runs none of
+    the saved points and lands on the uninterrupted run's trajectory."""
+    xopt = {'generator': 'NelderMeadGenerator', 'num_random': 0,
+            'num_step': 12}
+    full = _run_in_tmp(tmp_path, lambda: modes.scalar_optimize(
+        _single_obj_workflow(), _SINGLE_VOCS, dict(xopt),
+        log_file='full.txt'))
+
+    # The first job stops (its wall-clock limit) five steps in. The
+    # checkpoint points at the log table rather than copying the data.
+    ckpt = str(tmp_path / 'ckpt.json')
+    _run_in_tmp(tmp_path, lambda: modes.scalar_optimize(
+        _single_obj_workflow(), _SINGLE_VOCS,
+        dict(xopt, num_step=5, checkpoint=ckpt), log_file='sim_output.txt'))
+    saved = json.loads((tmp_path / 'ckpt.json').read_text())
+    assert 'data' not in saved
+    assert (saved['table'], saved['rows']) == (
+        str(tmp_path / 'sim_output.txt'), 5)
+
+    fresh = SynthWorkflow({'obj': ('S(0,0)', 12.0e9)})
+    calls = []
+    fresh_evaluate = fresh.evaluate
+    fresh.evaluate = lambda d: calls.append(d) or fresh_evaluate(d)
+    X = _run_in_tmp(tmp_path, lambda: modes.scalar_optimize(
+        fresh, _SINGLE_VOCS, dict(xopt, checkpoint=ckpt, resume_from=ckpt),
+        log_file='sim_output.txt'))
+
+    assert len(calls) == 12 - 5
+    cols = ['cornercut', 'rcorner1', 'obj']
+    np.testing.assert_allclose(X.data[cols].to_numpy(),
+                               full.data[cols].to_numpy())
+    logged = pd.read_csv(tmp_path / 'sim_output.txt', sep=r'\s+')
+    assert len(logged) == 12
+
+    # ... and needs its log table back.
+    lines = (tmp_path / 'sim_output.txt').read_text().splitlines(True)
+    (tmp_path / 'sim_output.txt').write_text(''.join(lines[:3]))
+    with pytest.raises(ValueError, match='log table is intact'):
+        modes.scalar_optimize(fresh, _SINGLE_VOCS,
+                              dict(xopt, resume_from=ckpt),
+                              log_file=str(tmp_path / 'other.txt'))
+
+    # A checkpoint only resumes the mode and generator that wrote it.
+    with pytest.raises(ValueError, match='resume_from'):
+        modes.scalar_optimize(fresh, _SINGLE_VOCS,
+                              {'generator': 'ExpectedImprovementGenerator',
+                               'num_step': 1, 'resume_from': ckpt})
+
+
+# ---- the gp_parameter_sweep posterior grid ---------------------------------- #
+
+
+def test_posterior_grid_batches_match_per_point_calls():
+    """The chunked posterior grid returns the per-point means and variances,
+    in one ``posterior`` call per chunk. An unfitted GP keeps this fast."""
+    import torch
+    from botorch.models import SingleTaskGP
+
+    rng = np.random.default_rng(0)
+    train_x = torch.as_tensor(rng.random((8, 2)), dtype=torch.double)
+    train_y = torch.stack([train_x.sum(-1), train_x[:, 0] ** 2], -1)
+    model = SingleTaskGP(train_x, train_y)
+    model.eval()
+    calls = []
+    posterior = model.posterior
+    model.posterior = lambda x: calls.append(len(x)) or posterior(x)
+
+    grid = np.stack(modes._legacy_meshorder([np.linspace(0, 1, 5),
+                                             np.linspace(0, 1, 3)]), axis=1)
+    columns = modes._posterior_grid(model, grid, ['a', 'b'], chunk_size=4,
+                                    variance=True)
+    assert list(columns) == ['a', 'b', 'a_variance', 'b_variance']
+    assert calls == [4, 4, 4, 3]
+
+    with torch.no_grad():
+        for i, point in enumerate(grid):
+            one = posterior(torch.as_tensor(point[None], dtype=torch.double))
+            np.testing.assert_allclose(
+                [columns['a'][i], columns['b'][i]], one.mean[0].numpy())
+            np.testing.assert_allclose(
+                [columns['a_variance'][i], columns['b_variance'][i]],
+                one.variance[0].numpy())
+
+
+# ---- batched candidates (n_candidates / max_workers) ---------------------- #
+
+
+class _SlowWorkflow(SynthWorkflow):
+    """SynthWorkflow whose evaluate takes a moment and records the workdir it
+    was given and how many evaluations were running when it started."""
+
+    def __init__(self, output_spec):
+        super().__init__(output_spec)
+        import threading
+        self.lock = threading.Lock()
+        self.running = 0
+        self.seen = []
+        self.workdirs = []
+
+    def evaluate(self, input_dict, workdir=None):
+        import time
+        with self.lock:
+            self.running += 1
+            self.seen.append(self.running)
+            self.workdirs.append(workdir)
+        time.sleep(0.05)
+        try:
+            return super().evaluate(input_dict)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def test_batched_candidates_run_concurrently_in_own_workdirs(tmp_path,
+                                                             monkeypatch):
+    """n_candidates points per step, max_workers of them at once, each in its
+    own candidate workdir. A random generator stands in for the Bayesian ones
+    (which propose q-batches the same way) so no GP is fitted."""
+    from xopt.generators.random import RandomGenerator
+    monkeypatch.setattr(modes, '_build_generator',
+                        lambda vocs, *args: RandomGenerator(vocs=vocs))
+    wf = _SlowWorkflow({'obj': ('S(0,0)', 12.0e9)})
+    X = _run_in_tmp(tmp_path, lambda: modes.scalar_optimize(
+        wf, _SINGLE_VOCS,
+        {'generator': 'UpperConfidenceBoundGenerator', 'num_random': 3,
+         'num_step': 2, 'n_candidates': 4, 'max_workers': 2},
+        log_file='sim_output.txt'))
+
+    assert len(X.data) == 3 + 2 * 4
+    assert max(wf.seen) == 2
+    assert len(set(wf.workdirs)) == len(wf.workdirs)
+    assert all(w.startswith('lume-ace3p_workflow_output_candidate_')
+               for w in wf.workdirs)
+
+    with pytest.raises(ValueError, match='NelderMeadGenerator'):
+        modes.scalar_optimize(wf, _SINGLE_VOCS,
+                              {'generator': 'NelderMeadGenerator',
+                               'num_step': 1, 'n_candidates': 2})
+    with pytest.raises(ValueError, match='max_workers'):
+        modes.scalar_optimize(wf, _SINGLE_VOCS,
+                              {'generator': 'NelderMeadGenerator',
+                               'num_step': 1, 'max_workers': 0})
+
+
+def test_tolerance_met_by_a_candidate_mid_batch_stops_the_run(tmp_path,
+                                                              monkeypatch):
+    """Every candidate a step adds is checked against the tolerance, not just
+    the last row: the second of four meets it, and the run stops after that
+    step instead of carrying on to ``max_iterations``."""
+    from xopt.generators.random import RandomGenerator
+    monkeypatch.setattr(modes, '_build_generator',
+                        lambda vocs, *args: RandomGenerator(vocs=vocs))
+    calls = []
+
+    class SecondCallConverges:
+        def evaluate(self, input_dict, workdir=None):
+            calls.append(input_dict)
+            return {'obj': 0.0 if len(calls) == 2 else 1.0}
+
+    X = _run_in_tmp(tmp_path, lambda: modes.scalar_optimize(
+        SecondCallConverges(), _SINGLE_VOCS,
+        {'generator': 'UpperConfidenceBoundGenerator', 'num_step': 0,
+         'max_iterations': 5, 'tolerance': 0.5, 'n_candidates': 4,
+         'max_workers': 1},
+        log_file='sim_output.txt'))
+    assert len(X.data) == 4
+    assert list(X.data['obj']) == [1.0, 0.0, 1.0, 1.0]
+
+
+def test_async_optimize_refills_as_each_evaluation_finishes(tmp_path,
+                                                            monkeypatch):
+    """One slow solve does not hold the others back: while it runs, the other
+    worker keeps taking fresh points, and every completion is logged."""
+    import threading
+    import time
+    from xopt.generators.random import RandomGenerator
+    monkeypatch.setattr(modes, '_build_generator',
+                        lambda vocs, *args: RandomGenerator(vocs=vocs))
+
+    class Uneven(SynthWorkflow):
+        def __init__(self):
+            super().__init__({'obj': ('S(0,0)', 12.0e9)})
+            self.lock = threading.Lock()
+            self.events = []
+
+        def evaluate(self, input_dict, workdir=None):
+            with self.lock:
+                n = sum(1 for e in self.events if e[0] == 'start')
+                self.events.append(('start', n))
+            time.sleep(0.6 if n == 0 else 0.05)
+            with self.lock:
+                self.events.append(('end', n))
+            return super().evaluate(input_dict)
+
+    wf = Uneven()
+    X = _run_in_tmp(tmp_path, lambda: modes.run_mode(
+        {'type': 'async_optimize'}, wf, vocs=_SINGLE_VOCS,
+        xopt={'generator': 'UpperConfidenceBoundGenerator', 'max_workers': 2,
+              'num_random': 2, 'max_evaluations': 6}))
+
+    assert len(X.data) == 6
+    assert wf.events.index(('end', 0)) > wf.events.index(('start', 5))
+    log = (tmp_path / 'sim_output.txt').read_text().splitlines()
+    assert len(log) == 1 + 6
+
+    assert _run_in_tmp(tmp_path, lambda: modes.async_optimize(
+        wf, _SINGLE_VOCS, {'generator': 'NelderMeadGenerator',
+                           'max_workers': 1})) is None
+    with pytest.raises(ValueError, match='max_workers'):
+        modes.async_optimize(wf, _SINGLE_VOCS,
+                             {'generator': 'NelderMeadGenerator',
+                              'max_evaluations': 4})
+
+
 # ---- Geant4 workflow as the objective (no S3P-specific code) ------------- #
 
 
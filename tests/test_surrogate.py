@@ -97,6 +97,15 @@ class _FakeModule:
                        'bin_edges': list(BIN_EDGES)}
 
 
+class _FakeEvaluation(dict):
+    """The slice of :class:`~lume_ace3p.workflow_graph.Evaluation` the
+    collection loop reads: an (empty) outputs dict carrying its field."""
+
+    def __init__(self, field):
+        super().__init__()
+        self.field = field
+
+
 class _SyntheticDoseWorkflow:
     """Emits the synthetic β→dose grid (with fixed per-sample MC noise) so a real
     training store can be collected and loaded locally without Geant4."""
@@ -110,10 +119,10 @@ class _SyntheticDoseWorkflow:
         self._last_beta = None
         self._call = 0
 
-    def evaluate(self, overrides):
+    def evaluate(self, overrides, workdir=None):
         self._last_beta = np.array([overrides[n] for n in BETA_NAMES])
         self._call += 1
-        return {}
+        return _FakeEvaluation(self.field())
 
     def field(self):
         # Deterministic per-sample noise seed so a resumed run is reproducible.
@@ -124,6 +133,22 @@ class _SyntheticDoseWorkflow:
         return {'dose': {'indices': indices, 'values': values}}
 
 
+class _ScoredNoiseWorkflow(_SyntheticDoseWorkflow):
+    """Heteroscedastic variant: about half the samples are 60x noisier than
+    the rest, and each grid carries the scorer's ``total(val^2)`` column
+    encoding its true noise variance at the store's 10000 primaries."""
+
+    def field(self):
+        seed = int(abs(self._last_beta.sum()) * 1000) % (2 ** 31)
+        noise = 0.3 if seed % 2 else 0.005
+        values = dose_of_beta(self._last_beta, noise=noise, seed=seed)
+        field = super().field()
+        field['dose']['values'] = values
+        field['dose']['sum_sq'] = noise ** 2 + values ** 2 / 10000.0
+        field['dose']['entries'] = np.full(_NZ, 10000)
+        return field
+
+
 def _mode_cfg(store, **overrides):
     cfg = {'type': 'collect_training_data', 'store': store,
            'num_samples': 40, 'sampler': 'sobol', 'seed': 0, 'fidelity': 10000,
@@ -132,10 +157,10 @@ def _mode_cfg(store, **overrides):
     return cfg
 
 
-def _collect_store(tmp_path, num_samples=40, noise=0.02):
+def _collect_store(tmp_path, num_samples=40, noise=0.02, workflow=None):
     store = str(tmp_path / 'store')
     collect_training_data(_mode_cfg(store, num_samples=num_samples),
-                          _SyntheticDoseWorkflow(noise=noise))
+                          workflow or _SyntheticDoseWorkflow(noise=noise))
     return store
 
 
@@ -399,6 +424,67 @@ def test_load_backcompat_defaults_to_linear(tmp_path):
     assert reloaded.floor == 0.0
 
 
+# --------------------------------------------------------------------------- #
+# Measured Monte-Carlo noise (the store's dose_variance).
+# --------------------------------------------------------------------------- #
+
+
+def test_measured_noise_fit_beats_fitted_on_heteroscedastic_noise(tmp_path):
+    """Given each sample's measured variance the GPs down-weight the noisy
+    samples, which one fitted WhiteKernel level cannot: held-out error drops,
+    and the WhiteKernel is left with (much) less to explain."""
+    store = _collect_store(tmp_path, num_samples=48,
+                           workflow=_ScoredNoiseWorkflow())
+    ts = surrogate_data.load_training_store(store)
+    assert ts.dose_variance.shape == ts.dose.shape
+    test_beta = np.random.default_rng(3).uniform(40.0, 60.0, (30, 8))
+    truth = dose_of_beta(test_beta)
+
+    errors, white = {}, {}
+    for dose_variance in (None, ts.dose_variance):
+        model = DoseSurrogate.fit(ts.beta, ts.dose, k=3, seed=0,
+                                  dose_variance=dose_variance)
+        pred, var = model.predict_dose(test_beta)
+        assert np.all(var > 0.0)                  # constraint #2 still holds
+        errors[model.noise] = np.linalg.norm(pred - truth)
+        white[model.noise] = sum(gp.kernel_.k2.noise_level for gp in model.gps)
+    assert errors['measured'] < errors['fitted']
+    assert white['measured'] < white['fitted']
+
+
+def test_fit_rejects_misaligned_dose_variance(tmp_path):
+    with pytest.raises(ValueError, match='dose_variance'):
+        DoseSurrogate.fit(np.zeros((4, 8)), np.zeros((4, 40)),
+                          dose_variance=np.zeros((4, 39)))
+    with pytest.raises(ValueError, match='total\\(val\\^2\\)'):
+        DoseSurrogate.fit(np.zeros((4, 8)), np.zeros((4, 40)),
+                          dose_variance=np.full((4, 40), np.nan))
+
+
+def test_train_surrogate_noise_key(tmp_path):
+    """``noise: auto`` uses a store's measured variance (recorded in the saved
+    model), ``fitted`` ignores it, and ``measured`` needs it."""
+    store = _collect_store(tmp_path, num_samples=16,
+                           workflow=_ScoredNoiseWorkflow())
+    model_dir = str(tmp_path / 'model')
+    surrogate = train_surrogate({'type': 'train_surrogate', 'store': store,
+                                 'model_dir': model_dir, 'holdout': 4})
+    assert surrogate.noise == 'measured'
+    assert DoseSurrogate.load(model_dir).noise == 'measured'
+    assert train_surrogate({'type': 'train_surrogate', 'store': store,
+                            'noise': 'fitted'}).noise == 'fitted'
+
+    plain = _collect_store(tmp_path / 'plain', num_samples=16)
+    assert train_surrogate({'type': 'train_surrogate',
+                            'store': plain}).noise == 'fitted'
+    with pytest.raises(ValueError, match='no measured dose variance'):
+        train_surrogate({'type': 'train_surrogate', 'store': plain,
+                         'noise': 'measured'})
+    with pytest.raises(ValueError, match="unknown noise 'loud'"):
+        train_surrogate({'type': 'train_surrogate', 'store': plain,
+                         'noise': 'loud'})
+
+
 # --------------------------------------------------------------------------- #
 # train_surrogate mode + dispatch.
 # --------------------------------------------------------------------------- #
@@ -317,11 +317,21 @@ class _FakeModule:
                        'bin_edges': list(BIN_EDGES)}
 
 
+class _FakeEvaluation(dict):
+    """The slice of :class:`~lume_ace3p.workflow_graph.Evaluation` the
+    collection loop reads: an (empty) outputs dict carrying its field."""
+
+    def __init__(self, field):
+        super().__init__()
+        self.field = field
+
+
 class _FakeWorkflow:
     """Minimal Workflow surface the collection loop drives: a particles module
-    with fixed bin_edges, and evaluate/field that emit a synthetic dose grid
-    which is a deterministic function of β (so the loader's β↔dose alignment is
-    checkable). Records evaluate() calls to prove resume skips re-evaluation."""
+    with fixed bin_edges, and an evaluate whose result carries a synthetic dose
+    grid which is a deterministic function of β (so the loader's β↔dose
+    alignment is checkable). Records evaluate() calls to prove resume skips
+    re-evaluation."""
 
     def __init__(self):
         self.modules = [_FakeModule()]
@@ -330,11 +340,13 @@ class _FakeWorkflow:
         self.dry_run = False
         self._last_beta = None
         self.eval_calls = []
+        self.workdirs = []
 
-    def evaluate(self, overrides):
+    def evaluate(self, overrides, workdir=None):
         self._last_beta = np.array([overrides[n] for n in BETA_NAMES])
         self.eval_calls.append(dict(overrides))
-        return {}
+        self.workdirs.append(workdir)
+        return _FakeEvaluation(self.field())
 
     def field(self):
         # A 4-voxel dose grid whose values encode the β sum, so each sample's
@@ -403,6 +415,83 @@ def test_resume_reproduces_same_design(tmp_path):
                        second[BETA_NAMES].to_numpy())
 
 
+class _TableWatchingWorkflow(_FakeWorkflow):
+    """Records how many rows the store table held at each evaluate()."""
+
+    def __init__(self, table):
+        super().__init__()
+        self.table = table
+        self.rows_seen = []
+
+    def evaluate(self, overrides, workdir=None):
+        lines = (len(open(self.table).read().splitlines())
+                 if os.path.isfile(self.table) else 0)
+        self.rows_seen.append(max(lines - 1, 0))
+        return super().evaluate(overrides, workdir)
+
+
+def test_rows_are_appended_as_samples_finish(tmp_path):
+    store = str(tmp_path / 'store')
+    wf = _TableWatchingWorkflow(os.path.join(store,
+                                             surrogate_data.TABLE_FILENAME))
+    collect_training_data(_mode_cfg(tmp_path, store=store, num_samples=4), wf)
+    assert wf.rows_seen == [0, 1, 2, 3]
+    assert wf.workdirs == [os.path.join(store, f'sample_{i:05d}')
+                           for i in range(4)]
+
+
+class _AsyncFakeWorkflow(_FakeWorkflow):
+    async def evaluate_async(self, overrides, workdir=None):
+        return self.evaluate(overrides, workdir)
+
+
+@pytest.mark.parametrize('backend', ['process', 'async'])
+def test_concurrent_collection_matches_serial(tmp_path, backend):
+    serial = collect_training_data(
+        _mode_cfg(tmp_path, store=str(tmp_path / 'serial'), num_samples=6),
+        _FakeWorkflow())
+    store = str(tmp_path / backend)
+    concurrent = collect_training_data(
+        _mode_cfg(tmp_path, store=store, num_samples=6, max_concurrent=3,
+                  backend=backend),
+        _AsyncFakeWorkflow())
+    cols = BETA_NAMES + [surrogate_data.FIDELITY_COLUMN]
+    pd.testing.assert_frame_equal(concurrent[cols], serial[cols])
+    loaded = surrogate_data.load_training_store(store)
+    assert np.allclose(loaded.dose[:, 0], loaded.beta.sum(axis=1))
+    # No temporary artifacts are left behind by the atomic field writes.
+    assert not [f for f in os.listdir(os.path.join(store, 'sample_00000'))
+                if f.startswith('.tmp-')]
+
+
+def test_failed_table_rewrite_keeps_the_streamed_rows(tmp_path, monkeypatch):
+    """The sorted store table replaces the streamed one atomically: a rewrite
+    that dies part-way keeps every streamed row and writes no manifest."""
+    from lume_ace3p import modes, results
+
+    def disk_full(df, filename):
+        df.iloc[:1].to_csv(filename, sep='\t', index=False)
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(results, 'write_table', disk_full)
+    monkeypatch.setattr(modes, 'write_table', disk_full)
+    store = str(tmp_path / 'store')
+    with pytest.raises(OSError, match='No space'):
+        collect_training_data(_mode_cfg(tmp_path, store=store), _FakeWorkflow())
+    monkeypatch.undo()
+    table = os.path.join(store, surrogate_data.TABLE_FILENAME)
+    assert len(pd.read_csv(table, sep='\t')) == 4
+    assert not os.path.exists(os.path.join(store,
+                                           surrogate_data.MANIFEST_FILENAME))
+    assert not [f for f in os.listdir(store) if f.startswith('.tmp-')]
+
+
+def test_bad_max_concurrent_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="'max_concurrent'"):
+        collect_training_data(_mode_cfg(tmp_path, max_concurrent=0),
+                              _FakeWorkflow())
+
+
 # --------------------------------------------------------------------------- #
 # Load-side mesh drift detection (constraint #3): same voxel count, different
 # voxel layout must be caught bin-for-bin; a manifest whose fingerprint disagrees
@@ -410,6 +499,103 @@ def test_resume_reproduces_same_design(tmp_path):
 # --------------------------------------------------------------------------- #
 
 
+class _ScoredNoiseWorkflow(_FakeWorkflow):
+    """Like _FakeWorkflow but each grid carries the scorer's total(val^2) /
+    entry columns, chosen so its per-voxel variance is 0.01·(voxel + 1) at the
+    store's fidelity of 1019 primaries."""
+
+    def field(self):
+        field = super().field()
+        dose = field['dose']
+        dose['sum_sq'] = (0.01 * np.arange(1, 5)
+                          + dose['values'] ** 2 / 1019.0)
+        dose['entries'] = np.full(4, 50)
+        return field
+
+
+def test_store_carries_measured_variance(tmp_path):
+    store = str(tmp_path / 'store')
+    collect_training_data(_mode_cfg(tmp_path, store=store, num_samples=3),
+                          _ScoredNoiseWorkflow())
+    loaded = surrogate_data.load_training_store(store)
+    assert loaded.dose_variance.shape == (3, 4)
+    assert np.allclose(loaded.dose_variance, 0.01 * np.arange(1, 5))
+    assert loaded.edep_variance is None
+
+    # Without the column the store has no measured variance at all.
+    plain = str(tmp_path / 'plain')
+    collect_training_data(_mode_cfg(tmp_path, store=plain, num_samples=3),
+                          _FakeWorkflow())
+    assert surrogate_data.load_training_store(plain).dose_variance is None
+
+
+class _FakeGeant4Module:
+    type = 'geant4'
+
+    def __init__(self, geant4_input):
+        self.geant4_input = geant4_input
+        self.adaptive = {'target_error': 0.05, 'shards': 10}
+
+
+class _AdaptiveWorkflow(_ScoredNoiseWorkflow):
+    """Like _ScoredNoiseWorkflow behind an adaptive geant4 module: sample k
+    (in evaluation order) converged after 100·(k + 1) primaries, with the
+    same per-voxel variance at that count."""
+
+    def __init__(self, geant4_input):
+        super().__init__()
+        self.modules.append(_FakeGeant4Module(geant4_input))
+
+    def field(self):
+        field = super().field()
+        events = 100 * len(self.eval_calls)
+        dose = field['dose']
+        dose['sum_sq'] = 0.01 * np.arange(1, 5) + dose['values'] ** 2 / events
+        field['convergence'] = {'events': events, 'source_events': 1019,
+                                'relative_error': 0.5 / events ** 0.5,
+                                'converged': True}
+        return field
+
+
+def test_store_records_adaptive_convergence(tmp_path):
+    store = str(tmp_path / 'store')
+    geant4_input = _write_geant4_input(tmp_path / 'input.geant4', nx=4, ny=1,
+                                       nz=1)
+    cfg = _mode_cfg(tmp_path, store=store, num_samples=3)
+    df = collect_training_data(cfg, _AdaptiveWorkflow(geant4_input))
+    # Fidelity keeps the configured value; the primaries run get a column.
+    assert list(df[surrogate_data.FIDELITY_COLUMN]) == [1019.0] * 3
+    assert list(df[surrogate_data.EVENTS_COLUMN]) == [100.0, 200.0, 300.0]
+    assert np.allclose(df[surrogate_data.RELATIVE_ERROR_COLUMN],
+                       0.5 / np.sqrt([100.0, 200.0, 300.0]))
+
+    loaded = surrogate_data.load_training_store(store)
+    assert loaded.manifest['adaptive'] == {'target_error': 0.05, 'shards': 10}
+    assert list(loaded.fidelity) == [1019.0] * 3
+    # Each sample's variance uses the primaries it actually ran.
+    assert np.allclose(loaded.dose_variance, 0.01 * np.arange(1, 5))
+
+    # A resumed sample's row is rebuilt from its stored convergence record.
+    os.remove(os.path.join(store, 'sample_00002', 'field.npz'))
+    resumed = collect_training_data(cfg, _AdaptiveWorkflow(geant4_input))
+    assert list(resumed[surrogate_data.EVENTS_COLUMN]) == [100.0, 200.0,
+                                                           100.0]
+    assert resumed[surrogate_data.RELATIVE_ERROR_COLUMN][0] == pytest.approx(
+        0.05)
+
+
+def test_scoring_variance():
+    values = np.array([2.0, 0.0, 3.0])
+    sum_sq = np.array([5.0, 0.0, np.nan])
+    assert np.allclose(surrogate_data.scoring_variance(values, sum_sq, 4.0),
+                       [4.0, 0.0, np.nan], equal_nan=True)
+    # Unknown primary count: total(val^2) itself, the many-event limit.
+    assert np.allclose(surrogate_data.scoring_variance(values, sum_sq, np.nan),
+                       [5.0, 0.0, np.nan], equal_nan=True)
+    # Round-off below zero is clipped.
+    assert surrogate_data.scoring_variance([2.0], [3.999999], 1.0)[0] == 0.0
+
+
 class _DriftingMeshWorkflow(_FakeWorkflow):
     """Like _FakeWorkflow but the voxel *index layout* changes after the first
     sample while the voxel *count* stays 4 — the exact same-count/different-mesh
@@ -456,3 +642,34 @@ def test_load_rejects_manifest_mesh_count_mismatch(tmp_path):
 
 if __name__ == '__main__':
     raise SystemExit(pytest.main([__file__, '-v']))
+
+
+def test_merge_write_and_relative_error(tmp_path):
+    indices = np.array([[0, 0, 0], [0, 0, 1], [1, 0, 0]])
+    a = {'indices': indices, 'values': np.array([1.0, 2.0, 0.01]),
+         'sum_sq': np.array([0.5, 1.0, 1e-4]), 'entries': np.array([3, 4, 1])}
+    # The same voxels listed in another order are summed voxel by voxel.
+    b = {key: value[::-1] for key, value in a.items()}
+    merged = surrogate_data.merge_dose_grids([a, b])
+    np.testing.assert_array_equal(merged['indices'], indices)
+    assert np.allclose(merged['values'], 2 * a['values'])
+    assert np.allclose(merged['sum_sq'], 2 * a['sum_sq'])
+    assert list(merged['entries']) == [6, 8, 2]
+    # A grid without total(val^2) leaves only the values.
+    assert set(surrogate_data.merge_dose_grids(
+        [a, {'indices': indices, 'values': a['values']}])) == {'indices',
+                                                                'values'}
+
+    path = str(tmp_path / 'dose.txt')
+    surrogate_data.write_dose_file(path, merged)
+    back = surrogate_data.read_dose_file(path, cache=False)
+    for key in ('indices', 'values', 'sum_sq', 'entries'):
+        np.testing.assert_array_equal(back[key], merged[key])
+
+    # Only voxels above 10% of the peak count: sqrt(0.5)/1, not the small
+    # voxel's sqrt(1e-4)/0.01 = 1.
+    assert surrogate_data.scoring_relative_error(
+        a['values'], a['sum_sq']) == pytest.approx(0.7071, abs=1e-4)
+    assert surrogate_data.scoring_relative_error(
+        a['values'], a['sum_sq'], threshold=0.0) == pytest.approx(1.0)
+    assert surrogate_data.scoring_relative_error([0.0], [0.0]) == float('inf')
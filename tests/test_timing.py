@@ -0,0 +1,90 @@
+"""Tests for the per-module timing (:mod:`lume_ace3p.timing`).
+
+* ``RunContext.measure`` records wall and child-process CPU time, accumulates
+  repeated calls, and feeds the workflow's totals.
+* ``timing: true`` adds ``timing_*`` columns to a sweep table and prints the
+  per-module summary; without it the table is unchanged.
+* A process-pool sweep's totals come back from the workers.
+"""
+
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from lume_ace3p.inputs import WorkflowInputs
+from lume_ace3p.modes import run_mode
+from lume_ace3p.modules import RunContext
+from lume_ace3p.timing import METRICS, TimingTotals, timing_columns
+from lume_ace3p.workflow_graph import Workflow
+
+
+def _s3p_workflow(tmp_path, name, timing=True):
+    entries = [{'module': 'cubit', 'journal': 'x.jou'},
+               {'module': 's3p', 'input': 'x.s3p'}]
+    return Workflow(entries,
+                    workflow_params={'workdir': str(tmp_path / name),
+                                     'workdir_mode': 'auto', 'dry_run': True,
+                                     'timing': timing},
+                    inputs=WorkflowInputs(cubit={'r': np.array([1.0, 2.0,
+                                                                3.0])}),
+                    output_spec={'refl': {'module': 's3p',
+                                          'quantity': 'S(0,0)'}})
+
+
+def test_measure_records_child_cpu_and_accumulates(tmp_path):
+    totals = TimingTotals()
+    ctx = RunContext(str(tmp_path), timing_totals=totals)
+    with ctx.measure('solver', 'run'):
+        subprocess.run([sys.executable, '-c', 'sum(range(3 * 10 ** 7))'],
+                       check=True)
+    first = dict(ctx.timing['solver']['run'])
+    assert set(first) == set(METRICS)
+    assert first['child_cpu'] > 0.05
+    assert first['wall'] >= first['child_cpu'] * 0.5
+    assert first['peak_rss'] > 0
+
+    with pytest.raises(RuntimeError):
+        with ctx.measure('solver', 'run'):
+            raise RuntimeError('a failed call is still measured')
+    assert ctx.timing['solver']['run']['wall'] > first['wall']
+    assert totals.totals[('solver', 'run')]['calls'] == 2
+
+    columns = timing_columns(ctx.timing)
+    assert list(columns)[0] == 'timing_solver_run_wall'
+    assert len(columns) == len(METRICS)
+
+    # A worker's totals travel back by pickle and merge.
+    merged = TimingTotals()
+    merged.merge(pickle.loads(pickle.dumps(totals)))
+    merged.merge(totals)
+    assert merged.totals[('solver', 'run')]['calls'] == 4
+    assert 'solver.run: 4 call(s)' in merged.summary()
+
+
+def test_sweep_table_gains_timing_columns_and_summary(tmp_path, capsys):
+    df = run_mode({'type': 'parameter_sweep'}, _s3p_workflow(tmp_path, 'on'))
+    timed = [c for c in df.columns if c.startswith('timing_')]
+    assert timed[:2] == ['timing_cubit_run_wall', 'timing_cubit_run_child_cpu']
+    assert 'timing_s3p_extract_wall' in timed
+    assert list(df.columns[:3]) == ['r', 'Frequency', 'refl']
+    assert (df[timed] >= 0).all().all()
+    report = capsys.readouterr().out
+    assert 'cubit.run: 3 call(s)' in report
+    assert 's3p.extract: 3 call(s)' in report
+
+    plain = run_mode({'type': 'parameter_sweep'},
+                     _s3p_workflow(tmp_path, 'off', timing=False))
+    assert list(plain.columns) == ['r', 'Frequency', 'refl']
+    assert 'Timing' not in capsys.readouterr().out
+
+
+def test_process_pool_totals_come_back_from_the_workers(tmp_path, capsys):
+    workflow = _s3p_workflow(tmp_path, 'pool')
+    df = run_mode({'type': 'parameter_sweep', 'parallel': {'workers': 2}},
+                  workflow)
+    assert 'timing_s3p_run_wall' in df.columns
+    assert workflow.timing_totals.totals[('cubit', 'run')]['calls'] == 3
+    assert 's3p.run: 3 call(s)' in capsys.readouterr().out
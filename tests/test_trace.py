@@ -0,0 +1,99 @@
+"""Tests for the JSONL event trace (:mod:`lume_ace3p.trace`).
+
+* A traced sweep writes paired begin/end events for the mode, each point, each
+  evaluation and each module call, tagged with the point index and workdir.
+* Subprocess launches are traced from inside the launcher helpers.
+* The Chrome conversion pairs events into per-point lanes and closes a span a
+  killed job never ended; process-pool workers append to the same file.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from lume_ace3p import trace
+from lume_ace3p.inputs import WorkflowInputs
+from lume_ace3p.launchers import run_command
+from lume_ace3p.modes import run_mode
+from lume_ace3p.workflow_graph import Workflow
+
+
+def _traced_workflow(tmp_path, name):
+    entries = [{'module': 'cubit', 'journal': 'x.jou'},
+               {'module': 's3p', 'input': 'x.s3p'}]
+    return Workflow(entries,
+                    workflow_params={'workdir': str(tmp_path / name),
+                                     'workdir_mode': 'auto', 'dry_run': True,
+                                     'trace': str(tmp_path / f'{name}.jsonl')},
+                    inputs=WorkflowInputs(cubit={'r': np.array([1.0, 2.0,
+                                                                3.0])}),
+                    output_spec={'refl': {'module': 's3p',
+                                          'quantity': 'S(0,0)'}})
+
+
+def _spans(path):
+    """``[(begin, end)]`` for every span in a trace file."""
+    events = trace.read_events(path)
+    ends = {e['id']: e for e in events if e['ph'] == 'E'}
+    return [(e, ends[e['id']]) for e in events if e['ph'] == 'B']
+
+
+def test_sweep_trace_pairs_events_per_point_and_workdir(tmp_path):
+    run_mode({'type': 'parameter_sweep'}, _traced_workflow(tmp_path, 'serial'))
+    spans = _spans(tmp_path / 'serial.jsonl')
+    assert all(end['ts'] >= begin['ts'] for begin, end in spans)
+    names = [begin['name'] for begin, _end in spans]
+    assert names[:5] == ['parameter_sweep', 'point', 'evaluate', 'cubit.run',
+                         's3p.run']
+    assert names.count('point') == 3 and names.count('s3p.extract') == 3
+
+    for begin, _end in spans:
+        if begin['name'] == 's3p.run':
+            point = begin['args']['point']
+            assert begin['args']['workdir'] == str(
+                tmp_path / f'serial_{point + 1:.1f}')
+    assert sorted(b['args']['point'] for b, _e in spans
+                  if b['name'] == 'point') == [0, 1, 2]
+
+
+def test_subprocess_launch_is_traced(tmp_path):
+    path = tmp_path / 't.jsonl'
+    with trace.scope(trace.Tracer(path), point=7):
+        run_command('true', str(tmp_path))
+    (begin, end), = _spans(path)
+    assert (begin['name'], begin['cat']) == ('subprocess', 'subprocess')
+    assert begin['args'] == {'point': 7, 'command': 'true'}
+    # Outside any scope nothing is written.
+    run_command('true', str(tmp_path))
+    assert len(trace.read_events(path)) == 2
+
+
+def test_chrome_trace_lanes_and_unfinished_spans(tmp_path):
+    run_mode({'type': 'parameter_sweep', 'parallel': {'workers': 2}},
+             _traced_workflow(tmp_path, 'pool'))
+    path = tmp_path / 'pool.jsonl'
+    pids = {e['pid'] for e in trace.read_events(path)}
+    assert len(pids) >= 2                       # the parent and its workers
+    # A job killed mid-solve leaves a begin without an end, and a torn line.
+    with open(path, 'a') as f:
+        f.write(json.dumps({'name': 's3p.run', 'cat': 'run', 'ph': 'B',
+                            'ts': 0, 'pid': 1, 'tid': 1, 'id': 'killed',
+                            'args': {'point': 9}}) + '\n')
+        f.write('{"name": "torn')
+
+    out = tmp_path / 'pool.json'
+    trace.main([str(path), str(out)])
+    events = json.loads(out.read_text())['traceEvents']
+    complete = [e for e in events if e['ph'] == 'X']
+    lanes = {e['args']['name'] for e in events if e['ph'] == 'M'}
+    assert {'point 0', 'point 1', 'point 2', 'point 9'} <= lanes
+    assert all(e['dur'] >= 0 for e in complete)
+    killed, = [e for e in complete if e['args'].get('unfinished')]
+    assert killed['args']['point'] == 9
+
+
+def test_bad_trace_value_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="'trace'"):
+        Workflow([{'module': 'cubit', 'journal': 'x.jou'}],
+                 workflow_params={'trace': 3, 'dry_run': True})
@@ -30,7 +30,7 @@ import baseline_utils as bu
 from test_modules import _make_acdtool, _make_s3p_solver
 from lume_ace3p.modes import _rows_for_point
 from lume_ace3p.workflow_graph import (
-    Workflow, WorkflowValidationError, _resolve_order, _build_entry,
+    Evaluation, Workflow, WorkflowValidationError, _resolve_order, _build_entry,
 )
 from lume_ace3p.modules import (
     build_module, MESH, EM_SOLUTION, TD_SOLUTION, RF_POST, TRACK3P_PARTICLES,
@@ -128,6 +128,14 @@ def test_geant4_no_particle_source():
                  workflow_params={'dry_run': True})
 
 
+def test_duplicate_module_name_rejected():
+    # Per-run handles are keyed by module name, so names must be unique.
+    with pytest.raises(WorkflowValidationError, match="named 'solver'"):
+        Workflow([{'module': 'cubit', 'journal': 'x.jou', 'name': 'solver'},
+                  {'module': 's3p', 'input': 'x.s3p', 'name': 'solver'}],
+                 workflow_params={'dry_run': True})
+
+
 def test_order_cubit_t3p():
     """The T3P chain: declared out of order, must sort to cubit -> t3p."""
     entries = [{'module': 't3p', 'input': 'x.t3p'},
@@ -480,6 +488,151 @@ def test_geant4_output_specs_route_to_geant4(tmp_path):
                       'd': 'geant4'}
 
 
+def test_evaluations_are_self_contained(tmp_path):
+    """Each ``evaluate`` returns its own :class:`Evaluation`; a later run through
+    the same Workflow does not disturb an earlier result, because the per-run
+    solver handles live on each result's RunContext rather than on the
+    modules."""
+    entries = [{'module': 'cubit', 'journal': 'x.jou'},
+               {'module': 's3p', 'input': 'x.s3p'}]
+    wf = Workflow(entries,
+                  workflow_params={'workdir': str(tmp_path / 'wd'),
+                                   'workdir_mode': 'auto', 'dry_run': True},
+                  inputs=WorkflowInputs(cubit={'r': np.array([1.0, 2.0])}),
+                  output_spec={'refl': {'module': 's3p',
+                                        'quantity': 'S(0,0)'}})
+    first = wf.evaluate([1.0])
+    s3p = next(m for m in wf.modules if m.type == 's3p')
+    first.context.handles[s3p.name] = _make_s3p_solver(first.workdir)
+    second = wf.evaluate([2.0])
+
+    assert isinstance(first, Evaluation)
+    assert np.isnan(second['refl']).all()            # a plain outputs dict too
+    assert first.workdir == str(tmp_path / 'wd') + '_1.0'
+    assert second.workdir == str(tmp_path / 'wd') + '_2.0'
+    # The first run still sees its own parsed spectrum, the second the dry-run
+    # sentinel, and the workflow's convenience accessors track the latest run.
+    assert len(first.field_index[1]) == 3
+    assert list(second.field_index[1]) == [0.0]
+    assert wf.field_index() is second.field_index
+    assert s3p.handle(second.context) is None
+
+
+def _count_runs(wf, monkeypatch, fake=False):
+    """Wrap each module's ``run`` to record its name per call. With ``fake``
+    the module is not run at all; it just records its provided artifacts."""
+    calls = []
+    for module in wf.modules:
+        def run(ctx, module=module, real=module.run):
+            calls.append(module.name)
+            if not fake:
+                return real(ctx)
+            for kind in module.provides:
+                ctx.artifacts[kind] = os.path.join(ctx.workdir, kind)
+        monkeypatch.setattr(module, 'run', run)
+    return calls
+
+
+def test_incremental_reruns_only_what_an_input_change_reaches(tmp_path,
+                                                              monkeypatch):
+    """cubit -> omega3p -> acdtool in one workdir: a repeat reuses everything,
+    an edited .rfpost re-runs acdtool alone, a cubit change re-runs the chain."""
+    for name in ('x.jou', 'x.omega3p', 'x.rfpost'):
+        (tmp_path / name).write_text(name + '\n')
+    entries = [{'module': 'cubit', 'journal': str(tmp_path / 'x.jou')},
+               {'module': 'omega3p', 'input': str(tmp_path / 'x.omega3p')},
+               {'module': 'acdtool', 'input': str(tmp_path / 'x.rfpost')}]
+    wf = Workflow(entries,
+                  workflow_params={'workdir': str(tmp_path / 'wd'),
+                                   'dry_run': True, 'incremental': True},
+                  inputs=WorkflowInputs(cubit={'r': np.array([1.0, 2.0])}))
+    calls = _count_runs(wf, monkeypatch)
+
+    wf.evaluate([1.0])
+    assert calls == ['cubit', 'omega3p', 'acdtool']
+    again = wf.evaluate([1.0])
+    assert len(calls) == 3
+    assert again.context.reused == {'cubit': True, 'omega3p': True,
+                                    'acdtool': True}
+    # Carried-over modules still hand their artifacts and job names on.
+    assert {MESH, EM_SOLUTION, RF_POST} <= set(again.context.artifacts)
+    assert again.context.job_names[EM_SOLUTION] == 'omega3p_results'
+
+    (tmp_path / 'x.rfpost').write_text('RoverQ: {}\n')
+    wf.evaluate([1.0])
+    assert calls[3:] == ['acdtool']
+    wf.evaluate([2.0])
+    assert calls[4:] == ['cubit', 'omega3p', 'acdtool']
+
+
+def test_incremental_with_auto_workdirs_warns_and_reuses_only_repeats(
+        tmp_path, monkeypatch):
+    """With workdir_mode 'auto' each sweep point has its own workdir, so an
+    incremental workflow warns when built and re-runs every module at a new
+    point; returning to a point's workdir still reuses it."""
+    for name in ('x.jou', 'x.omega3p'):
+        (tmp_path / name).write_text(name + '\n')
+    entries = [{'module': 'cubit', 'journal': str(tmp_path / 'x.jou')},
+               {'module': 'omega3p', 'input': str(tmp_path / 'x.omega3p')}]
+    with pytest.warns(UserWarning, match="workdir_mode 'auto'"):
+        wf = Workflow(entries,
+                      workflow_params={'workdir': str(tmp_path / 'wd'),
+                                       'workdir_mode': 'auto',
+                                       'dry_run': True, 'incremental': True},
+                      inputs=WorkflowInputs(
+                          cubit={'r': np.array([1.0, 2.0])},
+                          particles={'b': np.array([3.0, 4.0])}))
+    calls = _count_runs(wf, monkeypatch)
+
+    first = wf.evaluate([1.0, 3.0])
+    # Neither module reads the particles bucket, but the point runs in a new
+    # workdir.
+    other = wf.evaluate([1.0, 4.0])
+    assert other.workdir != first.workdir
+    assert calls == ['cubit', 'omega3p', 'cubit', 'omega3p']
+    assert other.context.reused == {'cubit': False, 'omega3p': False}
+
+    again = wf.evaluate([1.0, 4.0])
+    assert len(calls) == 4
+    assert again.context.reused == {'cubit': True, 'omega3p': True}
+
+
+def test_incremental_particles_change_keeps_the_track3p_dump(tmp_path,
+                                                             monkeypatch):
+    """A particles-only change in track3p_source -> particles -> geant4 re-runs
+    the weighting and Geant4 but not the source, and the sweep table flags
+    which modules were carried over. A mutating consumer drags its producer."""
+    entries = [{'module': 'track3p_source', 'file': 'dump.txt'},
+               {'module': 'particles', 'beta_input': 'b', 'num_bins': 1},
+               {'module': 'geant4', 'geant4_input': 'g4.in'}]
+    wf = Workflow(entries,
+                  workflow_params={'workdir': str(tmp_path / 'wd'),
+                                   'dry_run': True, 'incremental': True},
+                  inputs=WorkflowInputs(particles={'b': np.array([1.0, 2.0])}))
+    calls = _count_runs(wf, monkeypatch, fake=True)
+
+    first = wf.evaluate([1.0])
+    second = wf.evaluate([2.0])
+    assert calls == ['track3p_source', 'particles', 'geant4',
+                     'particles', 'geant4']
+    assert second.context.reused == {'track3p_source': True,
+                                     'particles': False, 'geant4': False}
+    row, = _rows_for_point(wf, ['b'], [2.0], second)
+    assert row['reused_track3p_source'] and not row['reused_geant4']
+    assert first.context.reused == {'track3p_source': False,
+                                    'particles': False, 'geant4': False}
+
+    # Were geant4 to rewrite the particle source in place, a re-run of it
+    # could not sit on top of a carried-over particles step.
+    geant4 = next(m for m in wf.modules if m.type == 'geant4')
+    monkeypatch.setattr(geant4, 'mutates', frozenset({PARTICLE_SOURCE}))
+    wf.evaluate([2.0])
+    (tmp_path / 'g4.in').write_text('changed\n')
+    geant4.config['geant4_input'] = str(tmp_path / 'g4.in')
+    wf.evaluate([2.0])
+    assert calls[5:] == ['particles', 'geant4']
+
+
 def test_s3p_acdtool_table_indexes_on_s3p_frequency(tmp_path):
     """Cross-module index collision (the CW23 ``window`` case): ``Frequency`` vs
     ``ModeID``. ``Workflow.field_index`` takes the first producer in resolved DAG
@@ -500,9 +653,10 @@ def test_s3p_acdtool_table_indexes_on_s3p_frequency(tmp_path):
 
     # Give both modules real parsed results (the dry-run above ran no binary).
     s3p = next(m for m in wf.modules if m.type == 's3p')
-    s3p._solver = _make_s3p_solver(wf.workdir)
+    handles = wf.last_context.handles
+    handles[s3p.name] = _make_s3p_solver(wf.workdir)
     acdtool = _acdtool_of(wf)
-    acdtool._acdtool = _make_acdtool(wf.workdir)
+    handles[acdtool.name] = _make_acdtool(wf.workdir)
 
     label, values = wf.field_index()
     assert label == 'Frequency'
@@ -533,7 +687,7 @@ def test_omega3p_acdtool_table_indexes_on_modeid(tmp_path):
                   output_spec=output_spec)
     wf.evaluate()
     acdtool = _acdtool_of(wf)
-    acdtool._acdtool = _make_acdtool(wf.workdir)
+    wf.last_context.handles[acdtool.name] = _make_acdtool(wf.workdir)
 
     label, ids = wf.field_index()
     assert label == 'ModeID'